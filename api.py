@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Programmatic interface to the estimator.
+
+estimate() costs any number of LWE or NTRU parameter sets in a single pooled
+batch of estimator calls, as main() does for the schemes, without printing or
+writing any file. Results are flat Estimate tuples, one per parameter set,
+cost model, attack and number of samples.
+
+    sage: from api import estimate
+    sage: params = [{"n": 512, "sd": 1.5, "q": 7681, "secret_distribution": "normal"}]
+    sage: estimate(params, models=["Q‑Core‑Sieve"], attacks=["primal"], ms=["n"])
+    [Estimate(param=0, model='Q‑Core‑Sieve', attack='primal', m='n', ...)]
+
+"""
+
+
+from collections import namedtuple
+from estimates import cost_tasks, plan_tasks, task_selected, task_results, task_weight, cheapest_result
+from estimates import execute_tasks, run_task
+from cost_asymptotics import BKZ_COST_ASYMPTOTICS
+
+
+class Estimate(namedtuple("Estimate", ["param", "model", "attack", "m", "dim", "beta", "lrop", "drop", "error",
+                                       "partial"])):
+    """ Cost of an attack on a parameter set under a cost model.
+
+        param       index of the parameter set in the list passed to estimate
+        model       cost model name
+        attack      "primal" or "dual"
+        m           number of samples, "n" or "2n"
+        dim         lattice dimension
+        beta        block size
+        lrop        log_2 of the cost of the attack
+        drop        True if guessing secret entries by dropping columns was cheaper
+        error       None, or "Type: message" if the estimator failed
+        partial     None, or the failures of the estimator calls left out of
+                    the estimate, e.g. when dropping columns timed out
+    """
+    __slots__ = ()
+
+
+def _scheme(param):
+    # each parameter set is costed as a scheme with a single instance
+    for entry in ["n", "sd", "q"]:
+        if entry not in param:
+            raise ValueError("parameter set without %s: %s"%(entry, param))
+    param = dict(param)
+    param.setdefault("secret_distribution", "normal")
+    return {
+        "name": "",
+        "params": [param],
+        "assumption": ["NTRU" if param.pop("ntru", False) else "LWE"],
+    }
+
+
+def estimate_tasks(params, models=None, attacks=None, ms=None, drop=True):
+    """ Plans the estimator calls costing parameter sets, see estimate.
+
+    :returns:           the unique tasks, and the copies of each
+    """
+    cnames = [cost_model["name"] for cost_model in BKZ_COST_ASYMPTOTICS]
+    for cname in models or []:
+        if cname not in cnames:
+            raise ValueError("unknown cost model %s"%cname)
+    selection = {"drop": drop}
+    if models is not None:
+        selection["model"] = models
+    if attacks is not None:
+        selection["attack"] = attacks
+    if ms is not None:
+        selection["m"] = ms
+
+    tasks = []
+    for sid, param in enumerate(params):
+        scheme = _scheme(param)
+        tasks += [task for task in cost_tasks(sid, scheme) if task_selected(task, scheme, selection)]
+    return plan_tasks(tasks)
+
+
+def task_estimates(results, models=None):
+    """ Turns the results of estimator calls into Estimate tuples, keeping the
+        cheaper of dropping columns or not.
+
+    :params results:    dictionary mapping task keys to results
+    :params models:     list of cost model names to report, defaults to all
+
+    :returns:           list of Estimate tuples, ordered by parameter set,
+                        cost model, attack and number of samples
+    """
+    cnames = [cost_model["name"] for cost_model in BKZ_COST_ASYMPTOTICS]
+    grouped = {}
+    for key, result in results.items():
+        sid, i, j, cname, m, atk, dropped = key
+        if models is None or cname in models:
+            grouped.setdefault((sid, cnames.index(cname), m, atk), {})[(cname, m, atk, dropped)] = result
+
+    estimates = []
+    for (sid, c, m, atk) in sorted(grouped, key=lambda k: (k[0], k[1], k[3], ["n", "2n"].index(k[2]))):
+        cname = cnames[c]
+        cost, dropped = cheapest_result(grouped[(sid, c, m, atk)], (cname, m, atk))
+        if "error" in cost:
+            estimates += [Estimate(sid, cname, atk, m, None, None, None, dropped, "%s: %s"%(cost["type"], cost["error"]),
+                                   None)]
+        else:
+            estimates += [Estimate(sid, cname, atk, m, int(cost["dim"]), int(cost["beta"]), float(cost["lrop"]),
+                                   dropped, None, cost.get("partial"))]
+    return estimates
+
+
+def estimate(params, models=None, attacks=None, ms=None, drop=True, parallel=True, cache=False, memo=None):
+    """ Costs LWE and NTRU parameter sets.
+
+    :params params:     list of parameter sets, dictionaries with entries "n",
+                        "sd", "q" and optionally "secret_distribution"
+                        (default "normal") and "ntru" (default False)
+    :params models:     list of cost model names, defaults to all of BKZ_COST_ASYMPTOTICS
+    :params attacks:    list of attacks among "primal" and "dual", defaults to
+                        both; NTRU parameter sets are only costed against the primal attack
+    :params ms:         list of numbers of samples among "n" and "2n",
+                        defaults to both; NTRU parameter sets only use "n"
+    :params drop:       if False, secret entries are never guessed by dropping columns
+    :params parallel:   if True, the estimator calls are run by a pool of NCPUS
+                        processes, each killed after TASKTIMEOUT seconds
+    :params cache:      if True, the estimator cache at CACHEPATH is used
+    :params memo:       None, or a dictionary mapping task ids to results,
+                        used to skip the calls it covers and filled with the
+                        results of the others
+
+    :returns:           list of Estimate tuples, ordered by parameter set,
+                        cost model, attack and number of samples
+    """
+    unique, copies = estimate_tasks(params, models, attacks, ms, drop)
+
+    results = {}
+    if memo is None:
+        memo = {}
+
+    def done(task, result):
+        if "error" not in result:
+            memo[task["id"]] = result
+        for copy in copies[task["id"]]:
+            results.update(task_results(copy, result))
+
+    for task in unique:
+        task["cache"] = cache
+        if task["id"] in memo:
+            done(task, memo[task["id"]])
+    unique = [task for task in unique if task["id"] not in memo]
+
+    if parallel and len(unique) > 1:
+        unique.sort(key=task_weight, reverse=True)
+        execute_tasks(unique, done=done, verbose=False)
+    else:
+        for task in unique:
+            done(task, run_task(task, use_cache=cache))
+
+    return task_estimates(results, models)
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the costing pipeline.
+
+Times cost_scheme on a fixed subset of parameter sets, the evaluation of every
+cost model, and writing and reading back the results stream the website is
+generated from, on synthetic estimates of every instance of every scheme under
+every cost model. The timings are written to a JSON file. Comparing the files of two commits shows performance regressions
+before a full run. The estimator cache is disabled while benchmarking.
+
+USAGE:
+
+    sage -python benchmarks/bench.py [--output FILE] [--repeat R] [--quick]
+    python benchmarks/bench.py --compare BASE.json NEW.json [--threshold T]
+
+"""
+
+
+from subprocess import check_output
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# block sizes and dimensions the cost models are evaluated on
+BETAS = range(60, 1001, 10)
+
+
+def _sparse(sd):
+    return type(sd) == tuple and type(sd[0]) == tuple
+
+
+def _bounded(sd):
+    return type(sd) == tuple and not _sparse(sd)
+
+
+# the subset of instances costed, as (label, schemes list, filter on the first
+# parameter set, pick the smallest or the largest n)
+SUBSET = [
+    ("small n, normal secret", "LWE", lambda p: p["secret_distribution"] == "normal", min),
+    ("large n, normal secret", "LWE", lambda p: p["secret_distribution"] == "normal", max),
+    ("small n, sparse ternary secret, drop", "LWE", lambda p: _sparse(p["secret_distribution"]), min),
+    ("large n, sparse ternary secret, drop", "LWE", lambda p: _sparse(p["secret_distribution"]), max),
+    ("small n, bounded uniform secret, drop", "LWE", lambda p: _bounded(p["secret_distribution"]), min),
+    ("small n, NTRU", "NTRU", lambda p: True, min),
+]
+
+
+def git_commit():
+    """ Returns the commit of the repository being benchmarked, or None.
+    """
+    try:
+        return check_output(["git", "rev-parse", "HEAD"], cwd=ROOT).strip()
+    except Exception:
+        return None
+
+
+def benchmark_subset(lwe_schemes, ntru_schemes, instances):
+    """ Picks the instances costed by the benchmark. Each is returned as a
+        scheme with that single instance, so it can be passed to cost_scheme.
+
+    :params lwe_schemes:    LWE_SCHEMES
+    :params ntru_schemes:   NTRU_SCHEMES
+    :params instances:      estimates.instances
+
+    :returns:               list of (label, scheme) pairs
+    """
+    subset = []
+    for label, family, keep, pick in SUBSET:
+        schemes = lwe_schemes if family == "LWE" else ntru_schemes
+        candidates = [(inst[0]["n"], i, scheme, inst)
+                      for scheme in schemes
+                      for i, inst in enumerate(instances(scheme)) if keep(inst[0])]
+        if not candidates:
+            continue
+        n = pick(c[0] for c in candidates)
+        n, i, scheme, inst = [c for c in candidates if c[0] == n][0]
+        subset += [(label, dict(scheme, params=[inst]))]
+    return subset
+
+
+def synthetic_estimates(lwe_schemes, ntru_schemes, instances, model_names):
+    """ Makes up estimates of every instance of every scheme under every cost
+        model, shaped like those of estimates.py, curves of the primal attack
+        included, so the website can be generated from a store of the size of
+        a full run without running one. The costs are not meaningful.
+
+    :params lwe_schemes:    LWE_SCHEMES
+    :params ntru_schemes:   NTRU_SCHEMES
+    :params instances:      estimates.instances
+    :params model_names:    names of the cost models of the catalogue
+
+    :returns:               list of estimates
+    """
+    estimates_list = []
+    for schemes, ntru in [(lwe_schemes, False), (ntru_schemes, True)]:
+        for scheme in schemes:
+            for i, instance in enumerate(instances(scheme)):
+                ms = ["n"] if ntru else ["n", "2n"]
+                cost = {}
+                for k, name in enumerate(model_names):
+                    cost[name] = {}
+                    for m in ms:
+                        n = int(instance[0]["n"])
+                        beta = n // 3 + k
+                        cost[name][m] = {"dim": 2 * n, "beta": beta, "rop": beta // 4 + 20,
+                                         "lrop": beta / 4. + 19.5, "drop": k % 2 == 1, "inst": 0}
+                curves = {}
+                for m in ms:
+                    curves[m] = []
+                    for params in instance:
+                        n = int(params["n"])
+                        # dense up to a little past the minima, then every 4th block size
+                        betas = range(n // 4, n // 4 + 30) + range(n // 4 + 30, 2 * n + 1, 4)
+                        curves[m] += [{"success_probability": 0.99, "beta": [float(b) for b in betas],
+                                       "d": [float(n + b) for b in betas], "B": 12., "repeat": 0.,
+                                       "dense": 30, "step": 4}]
+                scheme_entry = {"name": scheme["name"], "primitive": scheme["primitive"],
+                                "assumption": scheme["assumption"]}
+                for attack in ["primal"] if ntru else ["primal", "dual"]:
+                    estimate = {"attack": attack, "key": "%s-%d"%(scheme["name"], i), "scheme": scheme_entry,
+                                "param": instance, "cost": cost}
+                    if attack == "primal":
+                        estimate["curves"] = curves
+                    estimates_list += [estimate]
+    return estimates_list
+
+
+def timed(func, repeat=1):
+    """ Times a function, keeping the fastest of several runs.
+
+    :params func:       function taking no arguments
+    :params repeat:     number of runs
+
+    :returns:           seconds taken by the fastest run
+    """
+    best = None
+    for r in range(repeat):
+        start = time.time()
+        func()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(repeat=1, quick=False):
+    """ Runs the benchmarks.
+
+    :params repeat:     number of runs of each benchmark, the fastest is kept
+    :params quick:      if True, cost_scheme is only timed on the first
+                        instance of the subset
+
+    :returns:           dictionary of timings and of the setup they ran in
+    """
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    import numpy
+    from sage.all import RR
+    import cache
+    import html
+    import estimates
+    from schemes import LWE_SCHEMES, NTRU_SCHEMES
+    from cost_asymptotics import BKZ_COST_ASYMPTOTICS, log2_costs
+
+    cache.CACHEPATH = None
+    results = {}
+
+    subset = benchmark_subset(LWE_SCHEMES, NTRU_SCHEMES, estimates.instances)
+    for label, scheme in subset[:1] if quick else subset:
+        tasks = estimates.plan_tasks(estimates.cost_tasks(0, scheme))[0]
+        results["cost_scheme: %s"%label] = {
+            "seconds": timed(lambda: estimates.cost_scheme(scheme), repeat),
+            "scheme": scheme["name"],
+            "n": int(scheme["params"][0][0]["n"]),
+            "tasks": len(tasks),
+        }
+
+    betas = [float(beta) for beta in BETAS]
+    for model in BKZ_COST_ASYMPTOTICS:
+        name = model["name"]
+        sage_cost = model["reduction_cost_model"]
+        log_cost = model["log_reduction_cost_model"]
+        results["cost model: %s"%name] = {
+            "seconds": timed(lambda: [sage_cost(RR(beta), RR(2 * beta), None) for beta in betas], repeat),
+            "log_seconds": timed(lambda: [log_cost(beta, 2 * beta, None) for beta in betas], repeat),
+            "points": len(betas),
+        }
+    beta = numpy.array(betas)
+    results["cost models: vectorized"] = {
+        "seconds": timed(lambda: log2_costs(beta, 2 * beta), repeat),
+        "points": len(betas) * len(BKZ_COST_ASYMPTOTICS),
+    }
+
+    model_names = [model["name"].encode("utf-8") for model in json.loads(html.generate_costs_json())]
+    estimates_list = synthetic_estimates(LWE_SCHEMES, NTRU_SCHEMES, estimates.instances, model_names)
+    # the stream, the manifest and the shards are written to a scratch directory
+    scratch = tempfile.mkdtemp()
+    stream = os.path.join(scratch, "results.jsonl")
+    jsonpath = html.JSONPATH
+    html.JSONPATH = os.path.join(scratch, "manifest.js")
+
+    def write_stream():
+        with open(stream, "w") as f:
+            html.stream_estimates(f, estimates_list)
+
+    try:
+        results["stream_estimates"] = {
+            "seconds": timed(write_stream, repeat),
+            "estimates": len(estimates_list),
+        }
+        results["generate_json_from_stream"] = {
+            "seconds": timed(lambda: html.generate_json_from_stream(stream), repeat),
+            "estimates": len(estimates_list),
+            "bytes": os.path.getsize(stream),
+        }
+    finally:
+        shutil.rmtree(scratch)
+        html.JSONPATH = jsonpath
+
+    return {
+        "commit": git_commit(),
+        "estimator": cache.estimator_fingerprint(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "host": os.uname()[1],
+        "repeat": repeat,
+        "profile_reduction": estimates.PROFILE_REDUCTION,
+        "log_cost_models": estimates.LOG_COST_MODELS,
+        "results": results,
+    }
+
+
+def compare(base, new, threshold=0.1):
+    """ Compares two benchmark runs, printing the change of every timing.
+
+    :params base:       dictionary returned by run for the reference
+    :params new:        dictionary returned by run for the candidate
+    :params threshold:  relative slowdown above which a benchmark is reported
+                        as a regression
+
+    :returns:           list of the names of regressed benchmarks
+    """
+    print "%s -> %s"%(base["commit"], new["commit"])
+    if base["estimator"] != new["estimator"]:
+        print "Warning: the estimator changed, %s -> %s"%(base["estimator"], new["estimator"])
+    if base["host"] != new["host"]:
+        print "Warning: the runs are on different hosts, %s and %s"%(base["host"], new["host"])
+
+    regressions = []
+    for name in sorted(set(base["results"]) | set(new["results"])):
+        if name not in base["results"] or name not in new["results"]:
+            print "    %-55s only in %s"%(name, "base" if name in base["results"] else "new")
+            continue
+        b, n = base["results"][name], new["results"][name]
+        if b.get("scheme") != n.get("scheme") or b.get("n") != n.get("n"):
+            print "    %-55s different instance, %s and %s"%(name, b.get("scheme"), n.get("scheme"))
+            continue
+        change = n["seconds"] / b["seconds"] - 1 if b["seconds"] else 0.
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += [name]
+        print "    %-55s %10.3fs %10.3fs %+7.1f%%%s"%(name, b["seconds"], n["seconds"], 100 * change, flag)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the costing pipeline.")
+    parser.add_argument("--output", default=None,
+                        help="file the timings are written to, defaults to benchmarks/results-COMMIT.json")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="number of runs of each benchmark, the fastest is kept")
+    parser.add_argument("--quick", action="store_true",
+                        help="only time cost_scheme on the first instance of the subset")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"),
+                        help="compare two files of timings instead of benchmarking")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative slowdown reported as a regression by --compare")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            base = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        sys.exit(1 if compare(base, new, args.threshold) else 0)
+
+    output = args.output
+    if output is None:
+        output = os.path.join(ROOT, "benchmarks", "results-%s.json"%(git_commit() or "unknown")[:7])
+    else:
+        output = os.path.abspath(output)
+    bench = run(repeat=args.repeat, quick=args.quick)
+    with open(output, "w") as f:
+        json.dump(bench, f, indent=2, sort_keys=True)
+    print "Timings written to %s"%output
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent content-addressed cache for estimator calls.
+
+Entries are JSON files stored under CACHEPATH, named after the SHA-256 hash of
+a canonical encoding of everything the result depends on. The cache is bounded
+to CACHESIZE bytes, least recently used entries are evicted first.
+
+"""
+
+
+from hashlib import sha256
+import json
+import os
+
+try:
+    from config import CACHEPATH
+except ImportError:
+    CACHEPATH = "cache"
+try:
+    from config import CACHESIZE
+except ImportError:
+    CACHESIZE = 256 * 1024**2
+
+
+def canonical(obj):
+    """ Converts an object into a structure of Python types with a unique JSON
+        encoding. Integral values become ints, other numbers become the repr
+        of their double precision value.
+
+    :params obj:        (nested) dict, list, tuple, string or number
+
+    :returns:           canonical version of obj
+    """
+    if obj is None or isinstance(obj, (bool, basestring)):
+        return obj
+    if isinstance(obj, dict):
+        return dict((str(k), canonical(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return [canonical(x) for x in obj]
+    try:
+        if int(obj) == obj:
+            return int(obj)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    return repr(float(obj))
+
+
+def _str(obj):
+    """ Converts the unicode strings in a decoded JSON object back to utf-8 str.
+    """
+    if isinstance(obj, unicode):
+        return obj.encode("utf-8")
+    if isinstance(obj, dict):
+        return dict((_str(k), _str(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return [_str(x) for x in obj]
+    return obj
+
+
+def from_json(s):
+    """ Decodes a JSON string, with strings as str like the rest of the code.
+
+    :params s:          JSON string
+
+    :returns:           decoded object
+    """
+    return _str(json.loads(s))
+
+
+def fingerprint(obj):
+    """ Returns a stable hash of an object.
+
+    :params obj:        object accepted by canonical
+
+    :returns:           hex digest
+    """
+    return sha256(json.dumps(canonical(obj), sort_keys=True)).hexdigest()
+
+
+def estimator_fingerprint():
+    """ Identifies the version of the estimator in use by the hash of its
+        Python sources, so that uncommitted edits count as well, whatever
+        repository the estimator is checked out in.
+
+    :returns:           hex digest
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "estimator")
+    h = sha256()
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                with open(os.path.join(root, name), "rb") as f:
+                    h.update("%s\0%s\0"%(os.path.relpath(os.path.join(root, name), path), f.read()))
+    return h.hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(CACHEPATH, key[:2], "%s.json"%key)
+
+
+def cache_get(key):
+    """ Looks up a cache entry, marking it as recently used.
+
+    :params key:        hex digest, as returned by fingerprint
+
+    :returns:           the cached value, or None on a miss
+    """
+    if not CACHEPATH:
+        return None
+    path = _entry_path(key)
+    try:
+        with open(path) as f:
+            value = from_json(f.read())
+        os.utime(path, None)
+        return value
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def cache_put(key, value):
+    """ Stores a cache entry. The write is atomic, so concurrent workers may
+        store the same entry.
+
+    :params key:        hex digest, as returned by fingerprint
+    :params value:      JSON serialisable value
+    """
+    if not CACHEPATH:
+        return
+    path = _entry_path(key)
+    try:
+        os.makedirs(os.path.dirname(path))
+    except OSError:
+        pass
+    tmp = "%s.%d.tmp"%(path, os.getpid())
+    with open(tmp, "w") as f:
+        json.dump(value, f)
+    os.rename(tmp, path)
+
+
+def cache_evict(size=None):
+    """ Deletes the least recently used entries until the cache fits the size
+        cap.
+
+    :params size:       cap in bytes, defaults to CACHESIZE
+
+    :returns:           number of evicted entries
+    """
+    if not CACHEPATH or not os.path.isdir(CACHEPATH):
+        return 0
+    if size is None:
+        size = CACHESIZE
+
+    entries = []
+    for root, dirs, files in os.walk(CACHEPATH):
+        for name in files:
+            path = os.path.join(root, name)
+            st = os.stat(path)
+            entries += [(st.st_mtime, st.st_size, path)]
+    total = sum(e[1] for e in entries)
+
+    evicted = 0
+    for mtime, esize, path in sorted(entries):
+        if total <= size:
+            break
+        os.remove(path)
+        total -= esize
+        evicted += 1
+    return evicted
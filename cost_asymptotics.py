@@ -15,6 +15,23 @@ NOTATION:
     sd      lwe secret standard deviation (if normal form)
     m       number of lwe samples
 
+    COST MODELS
+    Each cost model gives log_2 of the cost of BKZ-beta as a sum of terms,
+    stored as a dictionary of coefficients under "cost":
+    beta_squared    beta^2
+    beta_log_beta   beta log_2(beta)
+    beta            beta
+    log_beta        log_2(beta)
+    log_d           log_2(d)
+    constant        1
+    root            if present, the sum is divided by it (e.g. 2 for Grover speedups)
+    svp_repeat      if True, the cost is multiplied by the BKZ.svp_repeat(beta, d) = 8d
+                    SVP calls in a BKZ tour
+
+    The specification is compiled into a Sage reduction_cost_model for the
+    estimator, log-domain scalar and NumPy functions, and JavaScript for the
+    website, see compile_cost_model.
+
 AUTHOR:
 
     Fernando Virdia - 2017, 2018
@@ -24,99 +41,108 @@ AUTHOR:
 
 from sage.all import RR, ZZ, log, gamma, pi
 from estimator.estimator import BKZ
+import numpy
+import math
+
+
+def log2(x):
+    """ Base 2 logarithm as a Python float, used by the log-domain cost models.
+    """
+    return math.log(x, 2)
 
 
 # List of proposed cost models for BKZ
 # Q-Sieving | Sieving | Q-Enum | Enum
 # with Rounds = Core  | beta | 8d
+# Each model is specified as described under COST MODELS above.
 BKZ_COST_ASYMPTOTICS = [
     {
         "name": "Q‑Core‑Sieve",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.265*beta),
+        "cost": {"beta": 0.265},
         "success_probability": 0.99,
         "human_friendly": "2<sup>0.265 β</sup>",
         "group": "Quantum sieving",
     },
     {
         "name": "Q‑Core‑Sieve + O(1)",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.265*beta + 16),
+        "cost": {"beta": 0.265, "constant": 16},
         "success_probability": 0.99,
         "human_friendly": "2<sup>0.265 β + O(1)</sup>",
         "group": "Quantum sieving",
     },
     {
         "name": "Q‑Core‑Sieve (min space)",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.2975*beta),
+        "cost": {"beta": 0.2975},
         "success_probability": 0.99,
         "human_friendly": "2<sup>0.298 β</sup>",
         "group": "Quantum sieving",
     },
     {
         "name": "Q‑β‑Sieve",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.265*beta + log(beta,2)),
+        "cost": {"beta": 0.265, "log_beta": 1},
         "success_probability": 0.99,
         "human_friendly": "β 2<sup>0.265 β</sup>",
         "group": "Quantum sieving",
     },
     {
         "name": "Q‑8d‑Sieve + O(1)",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.265*beta + 16.4 + log(8*d,2)),
+        "cost": {"beta": 0.265, "log_d": 1, "constant": 16.4 + 3},
         "success_probability": 0.99,
         "human_friendly": "8d 2<sup>0.265 β + O(1)</sup>",
         "group": "Quantum sieving",
     },
     {
         "name": "Core‑Sieve",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.292*beta),
+        "cost": {"beta": 0.292},
         "success_probability": 0.99,
         "human_friendly": "2<sup>0.292 β</sup>",
         "group": "Classical sieving",
     },
     {
         "name": "Core‑Sieve + O(1)",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.292*beta + 16),
+        "cost": {"beta": 0.292, "constant": 16},
         "success_probability": 0.99,
         "human_friendly": "2<sup>292 β + O(1)</sup>",
         "group": "Classical sieving",
     },
     {
         "name": "Core‑Sieve (min space)",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.368*beta),
+        "cost": {"beta": 0.368},
         "success_probability": 0.99,
         "human_friendly": "2<sup>0.368 β</sup>",
         "group": "Classical sieving",
     },
     {
         "name": "β‑Sieve",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.292*beta + log(beta,2)),
+        "cost": {"beta": 0.292, "log_beta": 1},
         "success_probability": 0.99,
         "human_friendly": "β 2<sup>0.292 β</sup>",
         "group": "Classical sieving",
     },
     {
         "name": "8d‑Sieve + O(1)",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.292*beta + 16.4 + log(8*d,2)),
+        "cost": {"beta": 0.292, "log_d": 1, "constant": 16.4 + 3},
         "success_probability": 0.99,
         "human_friendly": "8d 2<sup>0.292 β + O(1)</sup>",
         "group": "Classical sieving",
     },
     {
         "name": "Q‑Core‑Enum + O(1)",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR((0.18728*beta*log(beta, 2) - 1.0192*beta + 16.1)/2),
+        "cost": {"beta_log_beta": 0.18728, "beta": -1.0192, "constant": 16.1, "root": 2},
         "success_probability": 0.99,
         "human_friendly": "2<sup>(0.18728 β ㏒ β - 1.0192 β + O(1))/2</sup>",
         "group": "Quantum enumeration",
     },
     {
         "name": "Lotus",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(-0.7550818937366788*beta + 0.12472525302110621*beta*log(beta,2) + 2.254440896969337),
+        "cost": {"beta_log_beta": 0.12472525302110621, "beta": -0.7550818937366788, "constant": 2.254440896969337},
         "success_probability": 0.99,
         "human_friendly": "2<sup>0.125 β ㏒ β -0.755 β + O(1)</sup>",
         "group": "Classical enumeration",
     },
     {
         "name": "Core‑Enum + O(1)",
-        "reduction_cost_model": lambda beta, d, B: ZZ(2)**RR(0.18728*beta*log(beta, 2) - 1.0192*beta + 16.1),
+        "cost": {"beta_log_beta": 0.18728, "beta": -1.0192, "constant": 16.1},
         "success_probability": 0.99,
         "human_friendly": "2<sup>0.18728 β ㏒ β - 1.0192 β + O(1)</sup>",
         "group": "Classical enumeration",
@@ -130,9 +156,114 @@ BKZ_COST_ASYMPTOTICS = [
     # },
     {
         "name": "8d‑Enum (quadratic fit) + O(1)",
-        "reduction_cost_model": lambda beta, d, B: BKZ.svp_repeat(beta, d) * ZZ(2)**RR(0.000784314*beta**2 + 0.366078*beta - 6.125 + 7),
+        "cost": {"beta_squared": 0.000784314, "beta": 0.366078, "constant": -6.125 + 7, "svp_repeat": True},
         "success_probability": 0.99,
         "human_friendly": "8d 2<sup>0.000784 β² + 0.366 β + O(1)</sup>",
         "group": "Classical enumeration",
     },
 ]
+
+
+def _cost_expression(cost, log2, square):
+    """ Writes log_2 of the cost of a model as an expression in beta and d,
+        leaving out the svp_repeat factor.
+
+    :params cost:       "cost" entry of a cost model
+    :params log2:       function formatting log_2(x) in the target language
+    :params square:     function formatting x^2 in the target language
+
+    :returns:           the expression as a string
+    """
+    terms = [
+        ("beta_squared", square("beta")),
+        ("beta_log_beta", "beta*%s"%log2("beta")),
+        ("beta", "beta"),
+        ("log_beta", log2("beta")),
+        ("log_d", log2("d")),
+    ]
+    expr = []
+    for term, x in terms:
+        if cost.get(term, 0) == 1:
+            expr += [x]
+        elif cost.get(term, 0) != 0:
+            expr += ["%r*%s"%(cost[term], x)]
+    if cost.get("constant", 0) != 0 or not expr:
+        expr += ["%r"%cost.get("constant", 0)]
+    expr = " + ".join(expr).replace("+ -", "- ")
+    if "root" in cost:
+        expr = "(%s)/%r"%(expr, cost["root"])
+    return expr
+
+
+def compile_cost_model(model):
+    """ Compiles the specification of a cost model, adding to it:
+        "source"                                Sage code of the reduction cost model
+        "reduction_cost_model"                  the reduction cost model for the estimator
+        "log_reduction_cost_model"              log_2 of the cost, using Python floats
+        "vectorized_log_reduction_cost_model"   log_2 of the cost, on NumPy arrays of beta and d
+        "js"                                    JavaScript expression in beta, d and B for log_2
+                                                of the cost, as custom cost models are written
+
+    :params model:      entry of BKZ_COST_ASYMPTOTICS, with a "cost" specification
+
+    :returns:           the model
+    """
+    cost = model["cost"]
+    svp_repeat = cost.get("svp_repeat", False)
+
+    sage = "ZZ(2)**RR(%s)"%_cost_expression(cost, lambda x: "log(%s, 2)"%x, lambda x: "%s**2"%x)
+    if svp_repeat:
+        sage = "BKZ.svp_repeat(beta, d) * " + sage
+    model["source"] = "lambda beta, d, B: %s"%sage
+    # named so that profiles attribute the time spent in the cost models
+    filename = "<cost model %s>"%model["name"]
+    model["reduction_cost_model"] = eval(compile(model["source"], filename, "eval"),
+                                         {"ZZ": ZZ, "RR": RR, "log": log, "BKZ": BKZ})
+
+    python = _cost_expression(cost, lambda x: "log2(%s)"%x, lambda x: "%s**2"%x)
+    if svp_repeat:
+        python = "log2(8*d) + " + python
+    python = compile("lambda beta, d, B: %s"%python, filename, "eval")
+    model["log_reduction_cost_model"] = eval(python, {"log2": log2})
+    model["vectorized_log_reduction_cost_model"] = eval(python, {"log2": numpy.log2})
+
+    js = _cost_expression(cost, lambda x: "Math.log2(%s)"%x, lambda x: "%s*%s"%(x, x))
+    if svp_repeat:
+        js = "Math.log2(8*d) + " + js
+    model["js"] = js
+    return model
+
+
+for _model in BKZ_COST_ASYMPTOTICS:
+    compile_cost_model(_model)
+
+
+def log_domain(log_reduction_cost_model):
+    """ Adapts a log-domain cost model to the interface the estimator expects.
+        The cost is returned as a 53-bit real, avoiding Sage big numbers.
+
+    :params log_reduction_cost_model:   function returning log_2 of the cost
+
+    :returns:                           reduction_cost_model for the estimator
+    """
+    return lambda beta, d, B: RR(2)**log_reduction_cost_model(float(beta), float(d), float(B))
+
+
+def log2_costs(beta, d, B=None, models=BKZ_COST_ASYMPTOTICS):
+    """ Evaluates log_2 of the cost of several cost models over many points at
+        once, using their vectorized version.
+
+    :params beta:       array of block sizes
+    :params d:          array of lattice dimensions, or a single dimension
+    :params B:          bitsize of entries
+    :params models:     list of cost models, defaults to all of BKZ_COST_ASYMPTOTICS
+
+    :returns costs:     NumPy array of shape (len(models), number of points),
+                        costs[i, j] is the cost under models[i] at point j
+    """
+    beta, d = numpy.broadcast_arrays(numpy.asarray(beta, dtype=float).ravel(),
+                                     numpy.asarray(d, dtype=float).ravel())
+    costs = numpy.empty((len(models), len(beta)))
+    for i, model in enumerate(models):
+        costs[i] = model["vectorized_log_reduction_cost_model"](beta, d, B)
+    return costs
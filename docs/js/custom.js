@@ -0,0 +1,45 @@
+// Custom cost models, minimised over the curves of the primal attack exported
+// by estimates.py (see profile_curve). Curves have every block size up to a
+// little past the minima of the built-in cost models, their first "dense"
+// points, and every "step"-th one after that. Loaded by the page and by
+// worker.js.
+
+// compile a JavaScript expression in beta, d and B giving log_2 of the cost of BKZ
+var compileCostModel = function (formula) {
+  return new Function("beta", "d", "B", "return (" + formula + ");");
+};
+
+// cheapest primal attack of every row under a cost model, null for rows without
+// curves. The result is flagged approx when the minimum may be missed at a lower
+// cost, between sparse points or past the end of a curve without any.
+var minimiseCurves = function (formula, rows) {
+  var cost = compileCostModel(formula);
+  var results = [];
+  for (var r = 0; r < rows.length; r++) {
+    var curves = rows[r] || [];
+    var best = null;
+    // the cheapest parameter set of the instance is attacked
+    for (var inst = 0; inst < curves.length; inst++) {
+      var curve = curves[inst];
+      if (!curve) {
+        continue;
+      }
+      for (var i = 0; i < curve.beta.length; i++) {
+        var lrop = cost(curve.beta[i], curve.d[i], curve.B) + curve.repeat;
+        if (isFinite(lrop) && (best === null || lrop < best.lrop)) {
+          best = {lrop: lrop, beta: curve.beta[i], dim: curve.d[i], inst: inst};
+          if (curve.dense === undefined) {
+            best.approx = i === curve.beta.length - 1;
+          } else {
+            best.approx = curve.dense < curve.beta.length && i >= curve.dense - 1;
+          }
+        }
+      }
+    }
+    if (best !== null) {
+      best.rop = Math.ceil(best.lrop);
+    }
+    results.push(best);
+  }
+  return results;
+};
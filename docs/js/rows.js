@@ -0,0 +1,287 @@
+// Data side of the estimates tables: decoding the shards written by html.py,
+// building the rows of the tables and answering their filter and sort queries
+// with lists of row indices. Run by worker.js, or by the page where workers
+// are not allowed.
+
+if (!String.prototype.format) {
+  String.prototype.format = function() {
+    var args = arguments;
+    return this.replace(/{(\d+)}/g, function(match, number) {
+      return typeof args[number] != 'undefined'
+        ? args[number]
+        : match
+      ;
+    });
+  };
+}
+
+// flags of the cells of the columnar table, see html.py
+var CELL_ESTIMATE = 0, CELL_DROP = 1, CELL_ERROR = 2, CELL_MISSING = 3;
+
+// decode the columnar table written by html.py into a list of estimates
+var decodeTable = function (t) {
+  var str = t.strings;
+  var names = function (idx) {
+    return idx.map(function (i) { return str[i]; });
+  };
+  var nmodels = t.models.length;
+  var nms = t.ms.length;
+  var cost = t.cost;
+  var estimates = [];
+  for (var r = 0; r < t.rows.scheme.length; r++) {
+    var estimate = {
+      attack: str[t.rows.attack[r]],
+      key: str[t.rows.key[r]],
+      scheme: {
+        name: str[t.rows.scheme[r]],
+        primitive: names(t.rows.primitive[r]),
+        assumption: names(t.rows.assumption[r])
+      },
+      param: t.rows.param[r].map(function (i) { return t.params[i]; }),
+      cost: {}
+    };
+    for (var j = 0; j < nmodels; j++) {
+      var name = str[t.models[j]];
+      var cells = {};
+      for (var k = 0; k < nms; k++) {
+        var idx = (r * nmodels + j) * nms + k;
+        var flag = cost.flag[idx];
+        if (flag === CELL_MISSING) {
+          continue;
+        }
+        if (flag === CELL_ERROR) {
+          var error = t.errors[idx];
+          cells[t.ms[k]] = {name: name, inst: cost.inst[idx], type: str[error[0]], error: str[error[1]], attempts: error[2]};
+        } else {
+          cells[t.ms[k]] = {
+            name: name,
+            rop: cost.rop[idx],
+            beta: cost.beta[idx],
+            dim: cost.dim[idx],
+            drop: flag === CELL_DROP,
+            inst: cost.inst[idx]
+          };
+          // failures left out of the estimate
+          if (t.partial && idx in t.partial) {
+            cells[t.ms[k]].partial = names(t.partial[idx]);
+          }
+        }
+      }
+      estimate.cost[name] = cells;
+    }
+    estimates.push(estimate);
+  }
+  return estimates;
+};
+
+var escapeHtml = function (text) {
+  return String(text).replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+};
+
+// typeset a ring given in LaTeX
+var ringHtml = function (ring) {
+  // ring = ring.replace("\\ZZ_q", "ℤ<sub>q</sub>");
+  ring = ring.replace("\\sum_{i=0}^n", "∑<span class='supsub'><sup class='sup'>n</sup><sub class='sub'>i = 0</sub></span>");
+  ring = ring.replace("\\sum^n_{i=0}", "∑<span class='supsub'><sup class='sup'>n</sup><sub class='sub'>i = 0</sub></span>");
+  ring = ring.replace("\\sum_{i=0}^{n-1}", "∑<span class='supsub'><sup class='sup'>n-1</sup><sub class='sub'>i = 0</sub></span>");
+  ring = ring.replace("\\sum^{n-1}_{i=0}", "∑<span class='supsub'><sup class='sup'>n-1</sup><sub class='sub'>i = 0</sub></span>");
+  ring = ring.replace("\\sum_{i=1}^{n-1}", "∑<span class='supsub'><sup class='sup'>n-1</sup><sub class='sub'>i = 1</sub></span>");
+  ring = ring.replace("\\sum^{n-1}_{i=1}", "∑<span class='supsub'><sup class='sup'>n-1</sup><sub class='sub'>i = 1</sub></span>");
+  ring = ring.replace("^n", "<sup>n</sup>");
+  ring = ring.replace("^p", "<sup>p</sup>");
+  ring = ring.replace("^{n/k}", "<sup>n/k</sup>");
+  ring = ring.replace("^{n/(2k)}", "<sup>n/(2k)</sup>");
+  ring = ring.replace("^i", "<sup>i</sup>");
+  ring = ring.replace("_i", "<sub>i</sub>");
+  ring = ring.replace("_0", "<sub>0</sub>");
+  ring = ring.replace("\\text{ *}", "");
+  ring = ring.replace("\\text{ \\textdagger}", "");
+  return ring;
+};
+
+// describe the parameter sets of an estimate
+var paramsHtml = function (param, m) {
+  var html = "";
+  for (var j = 0; j < param.length; j++) {
+    if (m === "ntru") {
+      html += "n = {0}, q = {1}, ⌈log<sub>2</sub> q⌉ = {2},<br>‖f‖<sub>2</sub> = {3}, ‖g‖<sub>2</sub> = {4}".format(
+        param[j].n,
+        param[j].q,
+        Math.ceil(Math.log2(param[j].q)),
+        param[j].norm_f.toFixed(2),
+        param[j].norm_g.toFixed(2)
+      );
+    } else {
+      html += "n = {0}, ".format(param[j].n);
+      if ("k" in param[j]) {
+        html += "k = {0}, ".format(param[j].k);
+      }
+      html += "q = {0}, ⌈log<sub>2</sub> q⌉ = {1},<br>σ = {2}, secret = {3}".format(
+        param[j].q,
+        Math.ceil(Math.log2(param[j].q)),
+        param[j].sd.toFixed(2),
+        param[j].secret_distribution
+      );
+    }
+    if ("ring" in param[j]) {
+      html += ",<br>𝜙 = {0}".format(ringHtml(param[j].ring));
+    }
+    if (j < param.length - 1) {
+      html += '<br><div class="par-sep"></div>';
+    }
+  }
+  return html;
+};
+
+// columns before the cost models, the columns with a filter <select> and the claimed security
+var MODEL_COL = 7;
+var SELECT_COLS = [0, 1, 2, 5, 6];
+var CLAIM_COL = 4;
+
+// decoded estimates, rows and sort keys of every loaded table
+var rowTables = {};
+
+var stripHtml = function (html) {
+  return String(html).replace(/<[^>]*>/g, "");
+};
+
+// value of a cell that is searched and sorted
+var cellValue = function (value) {
+  if (value === null || typeof value !== "object") {
+    return value === null ? "" : value;
+  }
+  // costs of the cost models
+  return "error" in value ? "" : value.rop;
+};
+
+// build the rows of a table from its estimates, each ending with the index of its estimate
+var tableLoaded = function (table, estimates, names, m, custom) {
+  var rows = [];
+  for (var i = 0; i < estimates.length; i++) {
+    var attack = estimates[i];
+    // NOTE: we pick as claim the lowest taken across parameters for the single instance
+    var claim = 9999;
+    for (var j = 0; j < attack.param.length; j++) {
+      claim = Math.min(claim, attack.param[j].claimed);
+    }
+    var row = [
+      escapeHtml(attack.scheme.name),
+      escapeHtml(attack.scheme.assumption.join(", ")),
+      escapeHtml(attack.scheme.primitive.join(", ")),
+      paramsHtml(attack.param, m),
+      claim,
+      // NOTE: we assume an instance with multiple parameter sets
+      // will have them all aim at the same category
+      attack.param[0].category.join(", "),
+      attack.attack
+    ];
+    for (var j = 0; j < names.length; j++) {
+      var cells = attack.cost[names[j]];
+      row.push(cells ? cells[m === "ntru" ? "n" : m] || null : null);
+    }
+    if (custom) {
+      row.push(null);
+    }
+    row.push(i);
+    rows.push(row);
+  }
+
+  // text searched by the search box, and options of the filters
+  var text = [];
+  for (var r = 0; r < rows.length; r++) {
+    var values = [];
+    for (var c = 0; c < rows[r].length - 1; c++) {
+      values.push(stripHtml(cellValue(rows[r][c])));
+    }
+    text.push(values.join(" ").toLowerCase());
+  }
+  var filters = {};
+  for (var k = 0; k < SELECT_COLS.length; k++) {
+    var col = SELECT_COLS[k];
+    var unique = [];
+    for (var r = 0; r < rows.length; r++) {
+      if (unique.indexOf(rows[r][col]) < 0) {
+        unique.push(rows[r][col]);
+      }
+    }
+    filters[col] = [];
+    unique.sort().forEach(function (d) {
+      var dd = String(d).split(",");
+      for (var i = 0; i < dd.length; i++) {
+        var en = dd[i].trim();
+        if (filters[col].indexOf(en) < 0) {
+          filters[col].push(en);
+        }
+      }
+    });
+  }
+
+  rowTables[table] = {estimates: estimates, rows: rows, text: text, ncols: rows.length ? rows[0].length - 1 : 0};
+  return {rows: rows, filters: filters};
+};
+
+// sort key of a cell, numbers for the claims and the costs, null for empty or
+// failed ones, lower case text otherwise
+var sortKey = function (row, col) {
+  var value = cellValue(row[col]);
+  if (col === CLAIM_COL || col >= MODEL_COL) {
+    return value === "" || isNaN(Number(value)) ? null : Number(value);
+  }
+  return stripHtml(value).toLowerCase();
+};
+
+// indices of the rows of a table matching a search, in order
+//   search     text of the search box, every word of which must appear in the row
+//   columns    list of [column, regex] searches of single columns
+//   order      list of [column, "asc" or "desc"]
+var tableQuery = function (table, search, columns, order) {
+  var t = rowTables[table];
+  var words = search.toLowerCase().split(/\s+/).filter(function (w) { return w; });
+  var regexes = columns.map(function (c) { return [c[0], new RegExp(c[1], "i")]; });
+  var indices = [];
+  for (var r = 0; r < t.rows.length; r++) {
+    var match = true;
+    for (var i = 0; match && i < words.length; i++) {
+      match = t.text[r].indexOf(words[i]) >= 0;
+    }
+    for (var i = 0; match && i < regexes.length; i++) {
+      match = regexes[i][1].test(String(cellValue(t.rows[r][regexes[i][0]])));
+    }
+    if (match) {
+      indices.push(r);
+    }
+  }
+
+  var keys = order.map(function (o) {
+    return t.rows.map(function (row) { return sortKey(row, o[0]); });
+  });
+  indices.sort(function (a, b) {
+    for (var i = 0; i < order.length; i++) {
+      var x = keys[i][a], y = keys[i][b];
+      if (x !== y) {
+        // cells without a number go last in both directions
+        if (x === null || y === null) {
+          return x === null ? 1 : -1;
+        }
+        return (x < y ? -1 : 1) * (order[i][1] === "desc" ? -1 : 1);
+      }
+    }
+    // stable
+    return a - b;
+  });
+  return indices;
+};
+
+var tableEstimate = function (table, row) {
+  return rowTables[table].estimates[row];
+};
+
+// minimise a custom cost model over the curves of a table, whose costs are then sorted on
+var tableMinimise = function (table, curves, formula) {
+  var t = rowTables[table];
+  var results = minimiseCurves(formula, curves);
+  for (var r = 0; r < t.rows.length; r++) {
+    t.rows[r][t.ncols - 1] = results[r];
+  }
+  return results;
+};
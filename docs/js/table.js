@@ -1,18 +1,191 @@
-if (!String.prototype.format) {
-  String.prototype.format = function() {
-    var args = arguments;
-    return this.replace(/{(\d+)}/g, function(match, number) {
-      return typeof args[number] != 'undefined'
-        ? args[number]
-        : match
-      ;
-    });
-  };
-}
-
 var tables = {};
+// rows of the drawn tables, as built by tableLoaded
+var tableRows = {};
+// callbacks waiting for each data shard, see fetchData
+var pending = {};
+
+// name of the column of the custom cost model
+var CUSTOM = "Custom";
+
+// worker holding the data of the tables, null where workers are not allowed
+var dataWorker;
+var dataCalls = {};
+var dataCallId = 0;
+
+// pass the data of a shard to the callbacks waiting for it
+var resolveData = function (key, data) {
+  var callbacks = pending[key];
+  pending[key] = [];
+  for (var i = 0; i < callbacks.length; i++) {
+    callbacks[i](data);
+  }
+};
+
+// called by the data shards listed in the manifest written by html.py
+var loadShard = function (table, data) {
+  resolveData(table, decodeTable(data));
+};
+
+var loadCurves = function (table, curves) {
+  resolveData("curves-" + table, curves);
+};
+
+// load a data shard, the hash makes browsers refetch it only when it changes
+var fetchData = function (key, shard, cb) {
+  if (key in pending) {
+    pending[key].push(cb);
+    return;
+  }
+  pending[key] = [cb];
+  var script = document.createElement("script");
+  script.type = "text/javascript";
+  script.src = "res/{0}?v={1}".format(shard.file, shard.hash);
+  document.head.appendChild(script);
+};
+
+// answer a message of worker.js on the page
+var localCall = function (msg, cb) {
+  try {
+    if (msg.type === "load") {
+      fetchData(msg.table, msg.shard, function (estimates) {
+        cb(tableLoaded(msg.table, estimates, msg.names, msg.m, msg.custom));
+      });
+    } else if (msg.type === "query") {
+      cb(tableQuery(msg.table, msg.search, msg.columns, msg.order));
+    } else if (msg.type === "estimate") {
+      cb(tableEstimate(msg.table, msg.row));
+    } else if (msg.type === "minimise") {
+      fetchData("curves-" + msg.table, msg.curves, function (curves) {
+        try {
+          cb(tableMinimise(msg.table, curves, msg.formula));
+        } catch (e) {
+          cb(null, e.toString());
+        }
+      });
+    }
+  } catch (e) {
+    cb(null, e.toString());
+  }
+};
+
+// send a message to the worker holding the data, cb is called with its reply and error
+var dataCall = function (msg, cb) {
+  if (dataWorker === undefined) {
+    try {
+      dataWorker = new Worker("js/worker.js");
+      dataWorker.onmessage = function (ev) {
+        var call = dataCalls[ev.data.id];
+        delete dataCalls[ev.data.id];
+        call.cb(ev.data.reply, ev.data.error);
+      };
+      dataWorker.onerror = function (ev) {
+        // e.g. workers are not allowed for pages opened from disk,
+        // the calls left are answered on the page
+        ev.preventDefault();
+        dataWorker = null;
+        var calls = dataCalls;
+        dataCalls = {};
+        Object.keys(calls).sort(function (a, b) { return a - b; }).forEach(function (id) {
+          localCall(calls[id].msg, calls[id].cb);
+        });
+      };
+    } catch (e) {
+      dataWorker = null;
+    }
+  }
+  if (dataWorker) {
+    msg.id = ++dataCallId;
+    dataCalls[msg.id] = {msg: msg, cb: cb};
+    dataWorker.postMessage(msg);
+  } else {
+    localCall(msg, cb);
+  }
+};
+
+// show the costs of the custom cost model in the visible table
+var applyCustom = function () {
+  var id = $(".dataTables_wrapper:visible")[0].id.split("_")[0];
+  var formula = $("#custom-formula").val().trim();
+  if (!formula) {
+    return;
+  }
+  try {
+    compileCostModel(formula);
+  } catch (e) {
+    $("#custom-status").text(e.toString());
+    return;
+  }
+  var start = Date.now();
+  $("#custom-status").text("Minimising…");
+  dataCall({type: "minimise", table: id, curves: manifest.shards[id].curves, formula: formula}, function (results, error) {
+    if (error) {
+      $("#custom-status").text(error);
+      return;
+    }
+    var rows = tableRows[id];
+    var col = MODEL_COL + models.length;
+    for (var r = 0; r < rows.length; r++) {
+      rows[r][col] = results[r];
+    }
+    tables[id].column(col).visible(true, false);
+    tables[id].draw(false);
+    tables[id].columns.adjust();
+    $("#custom-status").text("Minimised over {0} rows in {1} ms".format(results.length, Date.now() - start));
+  });
+};
+
+// offer the formulas of the cost models as starting points for custom ones
+var drawCustomPresets = function () {
+  var sel = document.getElementById("custom-preset");
+  for (var i = 0; i < models.length; i++) {
+    var opt = document.createElement("option");
+    opt.value = i;
+    opt.innerText = models[i].name;
+    sel.appendChild(opt);
+  }
+  $(sel).change(function () {
+    if (this.value !== "") {
+      $("#custom-formula").val(models[this.value].js);
+    }
+  });
+};
+
+// fill in the {name} fields of a snippet template from html.py
+var fillTemplate = function (name, values) {
+  return manifest.snippets[name].replace(/{(\w+)}/g, function (match, field) {
+    return field in values ? values[field] : match;
+  });
+};
+
+// Sage snippet reproducing the cost of an attack under a cost model
+var reproduceSnippet = function (attack, model, cost, m) {
+  var param = attack.param[cost.inst];
+  var content = fillTemplate("header", cost);
+  if (attack.param.length > 1) {
+    content += manifest.snippets.multiple;
+  }
+  content += fillTemplate("setup", {
+    n: param.n,
+    sd: param.sd,
+    q: param.q,
+    m: m == "2n" ? "2*n" : "n",
+    secret_distribution: param.secret_distribution == "normal" ? '"normal"' : param.secret_distribution,
+    lambda: model.lambda
+  });
+  content += fillTemplate(attack.attack + (cost.drop ? "-drop" : ""), {
+    rotations: m === "ntru" ? ", rotations=True" : ""
+  });
+  return content;
+};
+
+// tables with more rows than this are paged
+var PAGE_ROWS = 250;
+
+var drawTable = function (tableid, m, loaded, cb) {
+  var table = tableid.substr(1);
+  var rows = loaded.rows;
+  tableRows[table] = rows;
 
-var drawTable = function (tableid, m, cb) {
   // draw the head
   var thead0 = $(tableid + " > thead > tr")[0];
   var hscheme = document.createElement("th");
@@ -50,7 +223,9 @@ var drawTable = function (tableid, m, cb) {
   thead0.appendChild(hatk);
   var hmodels = document.createElement("th");
   hmodels.innerText = "Proposed BKZ cost models";
-  hmodels.colSpan = models.length;
+  // tables with curves have a column for a custom cost model
+  var custom = "curves" in manifest.shards[tableid.substr(1)];
+  hmodels.colSpan = models.length + (custom ? 1 : 0);
   thead0.appendChild(hmodels);
 
   var thead1 = $(tableid + " > thead > tr")[1];
@@ -59,194 +234,157 @@ var drawTable = function (tableid, m, cb) {
     th.innerText = models[j].name;
     thead1.appendChild(th);
   }
+  if (custom) {
+    var th = document.createElement("th");
+    th.innerText = CUSTOM;
+    thead1.appendChild(th);
+  }
 
-  // draw the body
-  var tbody = $(tableid + " > tbody")[0];
-  for (var i = 0; i < estimates.length; i++) {
-    var attack = estimates[i];
-
-    // only parse estimates for this table
-
-    if ((attack.scheme.assumption[0] === "NTRU" && m !== "ntru")
-        || (attack.scheme.assumption[0] !== "NTRU" && m === "ntru")) {
-      continue;
-    }
-
-    var tr = document.createElement("tr");
-    var scheme = document.createElement("td");
-    scheme.innerText = attack.scheme.name;
-    tr.appendChild(scheme);
-    var assumption = document.createElement("td");
-    assumption.className = "ra";
-    assumption.innerText = attack.scheme.assumption.join(", ");
-    tr.appendChild(assumption);
-    var primitive = document.createElement("td");
-    primitive.className = "ra";
-    primitive.innerText = attack.scheme.primitive.join(", ");
-    tr.appendChild(primitive);
-    var parameters = document.createElement("td");
-    parameters.className = "cell-overflow";
-    var subparams = document.createElement("div");
-    subparams.className = "cell-overflow";
-    
-    for (var j = 0; j < attack.param.length; j++) {
-      if (m === "ntru") {
-        subparams.innerHTML += "n = {0}, q = {1}, ⌈log<sub>2</sub> q⌉ = {2},<br>‖f‖<sub>2</sub> = {3}, ‖g‖<sub>2</sub> = {4}".format(
-          attack.param[j].n,
-          attack.param[j].q,
-          Math.ceil(Math.log2(attack.param[j].q)),
-          attack.param[j].norm_f.toFixed(2),
-          attack.param[j].norm_g.toFixed(2)
-        );
-      } else {
-        subparams.innerHTML += "n = {0}, ".format(
-          attack.param[j].n
-        );
-        if ("k" in attack.param[j]) {
-          subparams.innerHTML += "k = {0}, ".format(
-            attack.param[j].k
-          );
-        }
-        subparams.innerHTML += "q = {0}, ⌈log<sub>2</sub> q⌉ = {1},<br>σ = {2}, secret = {3}".format(
-          attack.param[j].q,
-          Math.ceil(Math.log2(attack.param[j].q)),
-          attack.param[j].sd.toFixed(2),
-          attack.param[j].secret_distribution
-        );
+  var columns = [
+    {},
+    {className: "ra"},
+    {className: "ra"},
+    {
+      className: "cell-overflow",
+      render: function (params) {
+        return '<div class="cell-overflow">' + params + '</div>';
       }
-      if ("ring" in attack.param[j]) {
-        var ring = attack.param[j].ring;
-        // ring = ring.replace("\\ZZ_q", "ℤ<sub>q</sub>");
-        ring = ring.replace("\\sum_{i=0}^n", "∑<span class='supsub'><sup class='sup'>n</sup><sub class='sub'>i = 0</sub></span>");
-        ring = ring.replace("\\sum^n_{i=0}", "∑<span class='supsub'><sup class='sup'>n</sup><sub class='sub'>i = 0</sub></span>");
-        ring = ring.replace("\\sum_{i=0}^{n-1}", "∑<span class='supsub'><sup class='sup'>n-1</sup><sub class='sub'>i = 0</sub></span>");
-        ring = ring.replace("\\sum^{n-1}_{i=0}", "∑<span class='supsub'><sup class='sup'>n-1</sup><sub class='sub'>i = 0</sub></span>");
-        ring = ring.replace("\\sum_{i=1}^{n-1}", "∑<span class='supsub'><sup class='sup'>n-1</sup><sub class='sub'>i = 1</sub></span>");
-        ring = ring.replace("\\sum^{n-1}_{i=1}", "∑<span class='supsub'><sup class='sup'>n-1</sup><sub class='sub'>i = 1</sub></span>");
-        ring = ring.replace("^n", "<sup>n</sup>");
-        ring = ring.replace("^p", "<sup>p</sup>");
-        ring = ring.replace("^{n/k}", "<sup>n/k</sup>");
-        ring = ring.replace("^{n/(2k)}", "<sup>n/(2k)</sup>");
-        ring = ring.replace("^i", "<sup>i</sup>");
-        ring = ring.replace("_i", "<sub>i</sub>");
-        ring = ring.replace("_0", "<sub>0</sub>");
-        ring = ring.replace("\\text{ *}", "");
-        ring = ring.replace("\\text{ \\textdagger}", "");
-        subparams.innerHTML += ",<br>𝜙 = {0}".format(ring);
-      }
-      if (j < attack.param.length - 1) {
-        subparams.innerHTML += '<br><div class="par-sep"></div>';
-      }
-    }
-    parameters.appendChild(subparams);
-    tr.appendChild(parameters);
-    var claimed = document.createElement("td");
-    claimed.className = "ra";
-    // NOTE: we pick as claim the lowest taken across parameters for the single instance
-    _claim = 9999;
-    for (var j = 0; j < attack.param.length; j++) {
-      _claim = Math.min(_claim, attack.param[j].claimed);
-    }
-    claimed.innerText = _claim;
-    tr.appendChild(claimed);
-    var category = document.createElement("td");
-    category.className = "ra";
-    // NOTE: we assume an instance with multiple parameter sets
-    // will have them all aim at the same category
-    category.innerText = attack.param[0].category.join(", ");
-    tr.appendChild(category);
-    var atk = document.createElement("td");
-    atk.className = "ra";
-    atk.innerText = attack.attack;
-    tr.appendChild(atk);
-
-    for (var j = 0; j < models.length; j++) {
-      var cell = document.createElement("td");
-      if (models[j].name in attack.cost) {
-        var cost = m === "ntru" ? (
-          "n" in attack.cost[models[j].name] ? attack.cost[models[j].name]["n"] : attack.cost[models[j].name]
-        ) : attack.cost[models[j].name][m];
-        var cell = document.createElement("td");
-        cell.className = "data-entry";
-        cell.innerText = cost.rop;
-        var inst = cost.inst;
-
-        // add reproducible result
-        var content = "# To reproduce the estimate run this snippet on http://aleph.sagemath.org/\n";
-        content += "# Ring ops: {0}\n".format(cost.rop);
-        content += "# Block size: {0}\n".format(cost.beta);
-        content += "# Dimension: {0}\n".format(cost.dim);
-        if (attack.param.length > 1) {
-          content += "# NOTE: This scheme relies on different hard problem instances for key recovery and message recovery.\n# The code below gives the cost of the cheaper of the two attacks under the chosen cost model.\n"
+    },
+    {className: "ra"},
+    {className: "ra"},
+    {className: "ra"}
+  ];
+  for (var j = 0; j < models.length; j++) {
+    columns.push({
+      render: function (cost, type) {
+        if (!cost) {
+          return "";
         }
-        content += "load('https://bitbucket.org/malb/lwe-estimator/raw/HEAD/estimator.py')\n";
-        content += "n = {0}\n".format(attack.param[inst].n);
-        // if ("k" in attack.param) {
-        //   content += "k = {0}\n".format(attack.param.k);
-        // }
-        content += "sd = {0}\n".format(attack.param[inst].sd);
-        content += "q = {0}\n".format(attack.param[inst].q);
-        content += "alpha = sqrt(2*pi)*sd/RR(q)\n";
-        // content += "m = {0}\n".format(m == "2n"? "2*n/k" : "n/k");
-        content += "m = {0}\n".format(m == "2n"? "2*n" : "n");
-        content += "secret_distribution = {0}\n".format(attack.param[inst].secret_distribution == "normal" ? '"normal"' : attack.param[inst].secret_distribution);
-        content += "success_probability = 0.99\n";
-        content += "reduction_cost_model = {0}\n".format(models[j].lambda);
-
-        if (attack.attack === "primal" && cost.drop == false) {
-          content += "primal_usvp(n, alpha, q, secret_distribution=secret_distribution, m=m, ";
-          content += "success_probability=success_probability, reduction_cost_model=reduction_cost_model)";
-        } else if (attack.attack === "primal" && cost.drop == true) {
-          content += "primald = partial(drop_and_solve, primal_usvp, postprocess=False, decision=False)\n";
-          content += "primald(n, alpha, q, secret_distribution=secret_distribution, ";
-          content += "m=m,  success_probability=success_probability, reduction_cost_model=reduction_cost_model";
-          content += m === "ntru" ? ", rotations=True)" : ")";
-        } else if (attack.attack === "dual" && cost.drop == false) {
-          content += "dual_scale(n, alpha, q, secret_distribution=secret_distribution, ";
-          content += "m=m, success_probability=success_probability, reduction_cost_model=reduction_cost_model)";
-        } else if (attack.attack === "dual" && cost.drop == true) {
-          content += "duald = partial(drop_and_solve, dual_scale, postprocess=True)\n";
-          content += "duald(n, alpha, q, secret_distribution=secret_distribution, ";
-          content += "m=m, success_probability=success_probability, reduction_cost_model=reduction_cost_model)";
+        if ("error" in cost) {
+          return type === "display" ? "–" : "";
         }
-        cell.pqcContent = content;
-        cell.pqcTitle = "{0} – {1}".format(attack.scheme.name, cost.name);
-        cell.onclick = function (ev) {
-          var self = this;
-          new Dialog(self.pqcContent, "0", {
-            t: ev.pageY - 10,
-            l: ev.pageX - 100,
-            h: 350,
-            w: 620,
-            title: self.pqcTitle,
-            multi: true
-          }, function (content) {
-            self.myCodeMirror = CodeMirror(content, {
-              value: self.pqcContent,
-              mode: "python",
-              readOnly: true,
-              lineWrapping: true,
-              lineNumbers: true,
-              theme: "mdn-like"
-              // theme: "neo"
-            });
-          });
+        // part of the estimate failed, it may be too high
+        if (cost.partial && type === "display") {
+          return cost.rop + "*";
+        }
+        return cost.rop;
+      },
+      createdCell: (function (j) {
+        return function (cell, cost, row) {
+          if (!cost) {
+            return;
+          }
+          if ("error" in cost) {
+            // costing failed for this cell only
+            cell.className = "error-entry";
+            cell.title = "{0}: {1}".format(cost.type || "Error", cost.error);
+            return;
+          }
+          cell.className = "data-entry";
+          if (cost.partial) {
+            cell.className += " partial-entry";
+            cell.title = "Partial estimate, failed: {0}".format(cost.partial.join("; "));
+          }
+          // the snippet is only built when the estimate is clicked
+          cell.dataset.row = row[row.length - 1];
+          cell.dataset.model = j;
         };
+      })(j)
+    });
+  }
+  if (custom) {
+    // only shown once a custom cost model is applied
+    columns.push({
+      visible: false,
+      className: "custom-entry",
+      render: function (cost, type) {
+        if (!cost) {
+          return "";
+        }
+        // the minimum may be lower, see minimiseCurves
+        if (cost.approx && type === "display") {
+          return "≤ " + cost.rop;
+        }
+        return cost.rop;
+      },
+      createdCell: function (cell, cost) {
+        cell.title = cost && cost.approx ?
+          "Minimum near block size {0}, where block sizes are sampled sparsely".format(cost.beta) : "";
       }
-      tr.appendChild(cell);
-    }
-    tbody.appendChild(tr);
+    });
   }
 
-  // enable sortable table
+  // show the snippet reproducing an estimate when clicked
+  $(tableid + " > tbody").on("click", "td.data-entry", function (ev) {
+    var model = models[this.dataset.model];
+    dataCall({type: "estimate", table: table, row: Number(this.dataset.row)}, function (attack, error) {
+      if (error) {
+        alert("Could not load the estimate: " + error);
+        return;
+      }
+      var cost = attack.cost[model.name][m === "ntru" ? "n" : m];
+      var content = reproduceSnippet(attack, model, cost, m);
+      new Dialog(content, "0", {
+        t: ev.pageY - 10,
+        l: ev.pageX - 100,
+        h: 350,
+        w: 620,
+        title: "{0} – {1}".format(attack.scheme.name, model.name),
+        multi: true
+      }, function (el) {
+        CodeMirror(el, {
+          value: content,
+          mode: "python",
+          readOnly: true,
+          lineWrapping: true,
+          lineNumbers: true,
+          theme: "mdn-like"
+          // theme: "neo"
+        });
+      });
+    });
+  });
+
+  // enable sortable table, searched and sorted by the worker holding the data
   var tab = $(tableid).DataTable({
+    serverSide: true,
+    ajax: function (request, callback) {
+      var columns = [];
+      for (var i = 0; i < request.columns.length; i++) {
+        if (request.columns[i].search.value) {
+          columns.push([i, request.columns[i].search.value]);
+        }
+      }
+      var order = request.order.map(function (o) { return [o.column, o.dir]; });
+      dataCall({type: "query", table: table, search: request.search.value, columns: columns, order: order},
+               function (indices, error) {
+        if (error) {
+          // an empty page, whose placeholder row shows the error
+          callback({draw: request.draw, recordsTotal: rows.length, recordsFiltered: 0, data: []});
+          $(tableid + " td.dataTables_empty").text("Could not query the estimates: " + error);
+          return;
+        }
+        // large tables are paged, so only a page of rows is ever in the DOM
+        var page = request.length < 0 ? indices.slice(request.start) :
+                                        indices.slice(request.start, request.start + request.length);
+        callback({
+          draw: request.draw,
+          recordsTotal: rows.length,
+          recordsFiltered: indices.length,
+          data: page.map(function (r) { return rows[r]; })
+        });
+      });
+    },
+    columns: columns,
+    paging: rows.length > PAGE_ROWS,
+    pageLength: PAGE_ROWS,
+    lengthChange: false,
     order: [[0, "asc"]],
     scrollY: "calc(100vh - 420px)",
     scrollX: true,
     scrollCollapse: true,
-    paging: false,
     initComplete: function () {
-      this.api().columns().every( function () {
+      this.api().columns().every(function (col) {
         var column = this;
         if ($(column.header()).data("select") == 1) {
           var select = $('<select><option value=""></option></select>')
@@ -259,27 +397,21 @@ var drawTable = function (tableid, m, cb) {
           select.on('click', function (ev) {
             ev.stopImmediatePropagation();
           });
-          filters = []
-          column.data().unique().sort().each(function (d, j) {
-            var dd = d.split(',');
-            for (i in dd) {
-              var en = dd[i].trim();
-              if (filters.indexOf(en) < 0) {
-                filters.push(en);
-                select.append('<option value="'+en+'">'+en+'</option>');
-              }
-            }
+          // the options are built by the worker
+          loaded.filters[col].forEach(function (en) {
+            select.append('<option value="'+en+'">'+en+'</option>');
           });
         }
       });
+
+      // callback, once the first rows are drawn
+      tables[table] = this.api();
+      if (cb) {
+        cb();
+      }
     }
   });
-  tables[tableid.substr(1)] = tab;
-
-  // callback
-  if (cb) {
-    cb();
-  }
+  tables[table] = tab;
 };
 
 var drawColSel = function (cb) {
@@ -311,47 +443,91 @@ var drawColSel = function (cb) {
 var filterCols = function () {
   // loop opts looking for selected ones
   var counter = 6; // skip first few columns, go to cost models
+  var id = $(".dataTables_wrapper:visible")[0].id.split("_")[0];
   var sel = document.getElementById("select-cols-wrap").children[0];
   for (var i = 0; i < sel.children.length; i++) {
     var grp = sel.children[i];
     for (var j = 0; j < grp.children.length; j++) {
       var opt = grp.children[j];
       counter++;
-      var id = $(".dataTables_wrapper:visible")[0].id.split("_")[0];
-      tables[id].column(counter).visible(opt.selected);
+      var column = tables[id].column(counter);
+      // redrawn once below, not for every column
+      if (column.visible() !== opt.selected) {
+        column.visible(opt.selected, false);
+      }
     }
   }
+  tables[id].columns.adjust();
 };
 
-$(document).ready(function () {
-  // enable radio buttons
-  $("input[name='radio-m']").checkboxradio().change(function (ev) {
-    tableid = $("input[name='radio-m']:checked").val();
+// tables being fetched and drawn
+var loading = {};
+
+// show a table, fetching and drawing it the first time
+var showTable = function (tableid) {
+  var show = function () {
     $("#lwe-n_wrapper").hide();
     $("#lwe-2n_wrapper").hide();
     $("#ntru_wrapper").hide();
-    $(tableid+"_wrapper").show();
-    // adjust column widths
-    var id = $(".dataTables_wrapper:visible")[0]
-    if (id) {
-      id = id.id.split("_")[0];
-      tables[id].columns.adjust();
-    }
+    $(tableid + "_wrapper").show();
+    $("#spinner").hide();
+    $("#tables").show();
+    // custom cost models need the curves of the primal attack
+    $("#custom-model").toggle("curves" in manifest.shards[tableid.substr(1)]);
+    // also adjusts the column widths
     filterCols();
+  };
+  if (tableid.substr(1) in tables) {
+    show();
+    return;
+  }
+  $("#spinner").show();
+  if (tableid in loading) {
+    return;
+  }
+  loading[tableid] = true;
+  var table = tableid.substr(1);
+  var m = {"#lwe-n": "n", "#lwe-2n": "2n", "#ntru": "ntru"}[tableid];
+  dataCall({
+    type: "load",
+    table: table,
+    shard: manifest.shards[table],
+    names: models.map(function (model) { return model.name; }),
+    m: m,
+    custom: "curves" in manifest.shards[table]
+  }, function (loaded, error) {
+    if (error) {
+      $("#spinner").hide();
+      alert("Could not load the estimates: " + error);
+      return;
+    }
+    drawTable(tableid, m, loaded, function () {
+      // only show it if it is still the selected table
+      if ($("input[name='radio-m']:checked").val() === tableid) {
+        show();
+      } else {
+        $(tableid + "_wrapper").hide();
+      }
+    });
   });
+};
 
-  // render the tables
-  drawTable("#lwe-n", "n", function () {
-    drawTable("#lwe-2n", "2n", function () {
-      drawTable("#ntru", "ntru", function () {
-        // select lwe-n after giving a chance for everything to render
-        $("#radio-n").click();
-        $("#spinner").hide();
-        $("#tables").show();
-        var id = $(".dataTables_wrapper:visible")[0].id.split("_")[0];
-        tables[id].columns.adjust();
-      });
-    });
+$(document).ready(function () {
+  // enable radio buttons
+  $("input[name='radio-m']").checkboxradio().change(function (ev) {
+    showTable($("input[name='radio-m']:checked").val());
+  });
+
+  // render the first table, the others are loaded when selected
+  $("#radio-n").prop("checked", true).checkboxradio("refresh");
+  showTable("#lwe-n");
+
+  $("#custom-apply").click(applyCustom);
+  drawCustomPresets();
+  $("#custom-formula").keyup(function (ev) {
+    if (ev.key === "Enter") {
+      applyCustom();
+    }
   });
 
   // draw column select
@@ -378,9 +554,13 @@ $(document).ready(function () {
       if (el[0].localName == "th") {
         for (var i = 0; i < models.length; i++) {
           if (models[i].name === el.text()) {
-            return models[i].human;
+            // sites generated before the catalogue had human names only have the Sage lambda
+            return "human" in models[i] ? models[i].human : escapeHtml(models[i].lambda.trim());
           }
         }
+        if (el.text() === CUSTOM) {
+          return "Primal attack without guessing secret entries, minimised over the block size in your browser";
+        }
       } else {
         return el.children(":first").html();
       }
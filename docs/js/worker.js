@@ -0,0 +1,45 @@
+// Web Worker holding the data of the estimates tables, see rows.js. Every
+// message is answered with the same id and its reply, or an error.
+
+importScripts("rows.js", "custom.js");
+
+// data of the shards, set when they are imported
+var shards = {};
+var curves = {};
+
+var loadShard = function (table, data) {
+  shards[table] = data;
+};
+
+var loadCurves = function (table, data) {
+  curves[table] = data;
+};
+
+var importShard = function (shard) {
+  importScripts("../res/{0}?v={1}".format(shard.file, shard.hash));
+};
+
+onmessage = function (ev) {
+  var msg = ev.data;
+  var reply;
+  try {
+    if (msg.type === "load") {
+      importShard(msg.shard);
+      reply = tableLoaded(msg.table, decodeTable(shards[msg.table]), msg.names, msg.m, msg.custom);
+      delete shards[msg.table];
+    } else if (msg.type === "query") {
+      reply = tableQuery(msg.table, msg.search, msg.columns, msg.order);
+    } else if (msg.type === "estimate") {
+      reply = tableEstimate(msg.table, msg.row);
+    } else if (msg.type === "minimise") {
+      if (!(msg.table in curves)) {
+        importShard(msg.curves);
+      }
+      reply = tableMinimise(msg.table, curves[msg.table], msg.formula);
+    }
+  } catch (e) {
+    postMessage({id: msg.id, error: e.toString()});
+    return;
+  }
+  postMessage({id: msg.id, reply: reply});
+};
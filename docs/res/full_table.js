@@ -1,2 +0,0 @@
-var models = [{"group": "Quantum sieving", "name": "0.265\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.265*beta)"}, {"group": "Quantum sieving", "name": "0.265\u00a0\u03b2 +\u00a016.4", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.265*beta + 16.4)"}, {"group": "Quantum sieving", "name": "0.2975\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.2975*beta)"}, {"group": "Quantum sieving", "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.265*beta + log(beta,2))"}, {"group": "Quantum sieving", "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.265*beta + 16.4 + log(8*d,2))"}, {"group": "Classical sieving", "name": "0.292\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.292*beta)"}, {"group": "Classical sieving", "name": "292\u00a0\u03b2 +\u00a016.4", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.292*beta + 16.4)"}, {"group": "Classical sieving", "name": "0.368\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.368*beta)"}, {"group": "Classical sieving", "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.292*beta + log(beta,2))"}, {"group": "Classical sieving", "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.292*beta + 16.4 + log(8*d,2))"}, {"group": "Quantum enumeration", "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "lambda": " lambda beta, d, B: ZZ(2)**RR((0.18728*beta*log(beta, 2) - 1.0192*beta + 16.1)/2)"}, {"group": "Quantum enumeration", "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "lambda": " lambda beta, d, B: ZZ(2)**RR(-0.7550818937366788*beta + 0.12472525302110621*beta*log(beta,2) + 2.254440896969337)"}, {"group": "Classical enumeration", "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.18728*beta*log(beta, 2) - 1.0192*beta + 16.1)"}, {"group": "Classical enumeration", "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "lambda": " lambda beta, d, B: BKZ.svp_repeat(beta, d) * ZZ(2)**RR(0.000784314*beta**2 + 0.366078*beta - 6.125 + 7)"}];
-var estimates = [{"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWE"], "name": "KCL\u2011RLWE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 293}, "n": {"dim": 2033, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 294}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 257}, "n": {"dim": 2033, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 258}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2101, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 300}, "n": {"dim": 2033, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 971, "inst": 0, "rop": 300}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 357}, "n": {"dim": 2033, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 358}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2101, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 273}, "n": {"dim": 2033, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 971, "inst": 0, "rop": 274}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2101, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 968, "inst": 0, "rop": 469}, "n": {"dim": 2033, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 971, "inst": 0, "rop": 471}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2101, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 968, "inst": 0, "rop": 828}, "n": {"dim": 2033, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 971, "inst": 0, "rop": 832}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 288}, "n": {"dim": 2033, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 289}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 267}, "n": {"dim": 2033, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 268}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2101, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 1105}, "n": {"dim": 2033, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 971, "inst": 0, "rop": 1110}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2101, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 314}, "n": {"dim": 2033, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 971, "inst": 0, "rop": 314}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2101, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 968, "inst": 0, "rop": 414}, "n": {"dim": 2033, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 971, "inst": 0, "rop": 416}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2101, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 287}, "n": {"dim": 2033, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 971, "inst": 0, "rop": 288}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 283}, "n": {"dim": 2033, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 284}}}, "key": "KCL\u2011RLWE-1024-2.83-12289", "param": [{"category": [5], "n": 1024, "q": 12289, "secret_distribution": "normal", "claimed": 255, "ring": "x^n+1", "sd": 2.8284271247461903}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWE"], "name": "KCL\u2011RLWE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 347}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1135, "inst": 0, "rop": 342}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 306}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1191, "inst": 0, "rop": 316}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2263, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1113, "inst": 0, "rop": 348}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1135, "inst": 0, "rop": 348}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2260, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1109, "inst": 0, "rop": 409}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1123, "inst": 0, "rop": 414}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2294, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1153, "inst": 0, "rop": 322}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1149, "inst": 0, "rop": 322}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2204, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1038, "inst": 0, "rop": 523}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1058, "inst": 0, "rop": 530}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2143, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 963, "inst": 0, "rop": 838}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 968, "inst": 0, "rop": 830}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 344}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1135, "inst": 0, "rop": 339}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 316}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1149, "inst": 0, "rop": 319}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2117, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 933, "inst": 0, "rop": 1040}, "n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 931, "inst": 0, "rop": 1052}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2263, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1113, "inst": 0, "rop": 356}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1135, "inst": 0, "rop": 362}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2244, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1088, "inst": 0, "rop": 482}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1085, "inst": 0, "rop": 480}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2294, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1153, "inst": 0, "rop": 337}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1149, "inst": 0, "rop": 335}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 337}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1135, "inst": 0, "rop": 338}}}, "key": "KCL\u2011RLWE-1024-2.83-12289", "param": [{"category": [5], "n": 1024, "q": 12289, "secret_distribution": "normal", "claimed": 255, "ring": "x^n+1", "sd": 2.8284271247461903}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "BabyBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1164, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 178}, "n": {"dim": 1164, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 178}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1164, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 153}, "n": {"dim": 1164, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 153}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1164, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 577, "inst": 0, "rop": 185}, "n": {"dim": 1164, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 577, "inst": 0, "rop": 185}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1164, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 213}, "n": {"dim": 1164, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 213}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1164, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 577, "inst": 0, "rop": 170}, "n": {"dim": 1164, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 577, "inst": 0, "rop": 170}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1164, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 577, "inst": 0, "rop": 227}, "n": {"dim": 1164, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 577, "inst": 0, "rop": 227}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1164, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 577, "inst": 0, "rop": 420}, "n": {"dim": 1164, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 577, "inst": 0, "rop": 420}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1164, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 172}, "n": {"dim": 1164, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 172}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1164, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 163}, "n": {"dim": 1164, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 163}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1164, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 577, "inst": 0, "rop": 487}, "n": {"dim": 1164, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 577, "inst": 0, "rop": 487}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1164, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 577, "inst": 0, "rop": 199}, "n": {"dim": 1164, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 577, "inst": 0, "rop": 199}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1164, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 577, "inst": 0, "rop": 210}, "n": {"dim": 1164, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 577, "inst": 0, "rop": 210}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1164, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 577, "inst": 0, "rop": 183}, "n": {"dim": 1164, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 577, "inst": 0, "rop": 183}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1164, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 169}, "n": {"dim": 1164, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 577, "inst": 0, "rop": 169}}}, "key": "BabyBear-0624-1.00-1024", "param": [{"category": [2], "k": 2, "n": 624, "q": 1024, "secret_distribution": "normal", "claimed": 152, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 1.0}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "BabyBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1277, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 705, "inst": 0, "rop": 216}, "n": {"dim": 1248, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 216}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1290, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 724, "inst": 0, "rop": 192}, "n": {"dim": 1248, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 726, "inst": 0, "rop": 193}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1277, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 705, "inst": 0, "rop": 223}, "n": {"dim": 1248, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 707, "inst": 0, "rop": 223}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1264, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 685, "inst": 0, "rop": 253}, "n": {"dim": 1248, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 685, "inst": 0, "rop": 253}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1277, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 705, "inst": 0, "rop": 207}, "n": {"dim": 1248, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 707, "inst": 0, "rop": 206}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1238, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 647, "inst": 0, "rop": 297}, "n": {"dim": 1238, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 647, "inst": 0, "rop": 297}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1204, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 600, "inst": 0, "rop": 442}, "n": {"dim": 1204, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 600, "inst": 0, "rop": 442}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1277, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 705, "inst": 0, "rop": 210}, "n": {"dim": 1248, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 211}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1290, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 724, "inst": 0, "rop": 202}, "n": {"dim": 1248, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 726, "inst": 0, "rop": 202}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1179, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 566, "inst": 0, "rop": 553}, "n": {"dim": 1179, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 566, "inst": 0, "rop": 553}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1266, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 688, "inst": 0, "rop": 231}, "n": {"dim": 1248, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 689, "inst": 0, "rop": 231}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1238, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 647, "inst": 0, "rop": 297}, "n": {"dim": 1238, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 647, "inst": 0, "rop": 297}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1277, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 705, "inst": 0, "rop": 217}, "n": {"dim": 1248, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 707, "inst": 0, "rop": 218}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1277, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 705, "inst": 0, "rop": 208}, "n": {"dim": 1248, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 207}}}, "key": "BabyBear-0624-1.00-1024", "param": [{"category": [2], "k": 2, "n": 624, "q": 1024, "secret_distribution": "normal", "claimed": 152, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 1.0}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "BabyBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1115, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 166}, "n": {"dim": 1115, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 166}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1115, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 143}, "n": {"dim": 1115, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 143}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1115, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 536, "inst": 0, "rop": 173}, "n": {"dim": 1115, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 536, "inst": 0, "rop": 173}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1115, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 198}, "n": {"dim": 1115, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 198}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1115, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 536, "inst": 0, "rop": 159}, "n": {"dim": 1115, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 536, "inst": 0, "rop": 159}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1115, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 536, "inst": 0, "rop": 204}, "n": {"dim": 1115, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 536, "inst": 0, "rop": 204}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1115, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 536, "inst": 0, "rop": 380}, "n": {"dim": 1115, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 536, "inst": 0, "rop": 380}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1115, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 160}, "n": {"dim": 1115, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 160}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1115, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 152}, "n": {"dim": 1115, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 152}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1115, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 536, "inst": 0, "rop": 436}, "n": {"dim": 1115, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 536, "inst": 0, "rop": 436}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1115, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 536, "inst": 0, "rop": 187}, "n": {"dim": 1115, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 536, "inst": 0, "rop": 187}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1115, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 536, "inst": 0, "rop": 190}, "n": {"dim": 1115, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 536, "inst": 0, "rop": 190}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1115, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 536, "inst": 0, "rop": 172}, "n": {"dim": 1115, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 536, "inst": 0, "rop": 172}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1115, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 157}, "n": {"dim": 1115, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 157}}}, "key": "BabyBear-0624-0.79-1024", "param": [{"category": [2], "k": 2, "n": 624, "q": 1024, "secret_distribution": "normal", "claimed": 141, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.7905694150420949}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "BabyBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1246, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 660, "inst": 0, "rop": 203}, "n": {"dim": 1246, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 660, "inst": 0, "rop": 203}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1258, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 676, "inst": 0, "rop": 180}, "n": {"dim": 1248, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 676, "inst": 0, "rop": 180}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1235, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 644, "inst": 0, "rop": 206}, "n": {"dim": 1235, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 644, "inst": 0, "rop": 206}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1225, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 629, "inst": 0, "rop": 232}, "n": {"dim": 1225, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 629, "inst": 0, "rop": 232}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1246, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 660, "inst": 0, "rop": 192}, "n": {"dim": 1246, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 660, "inst": 0, "rop": 192}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1200, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 594, "inst": 0, "rop": 289}, "n": {"dim": 1200, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 594, "inst": 0, "rop": 289}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1168, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 551, "inst": 0, "rop": 409}, "n": {"dim": 1168, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 551, "inst": 0, "rop": 409}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1246, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 660, "inst": 0, "rop": 197}, "n": {"dim": 1246, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 660, "inst": 0, "rop": 197}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1246, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 660, "inst": 0, "rop": 186}, "n": {"dim": 1246, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 660, "inst": 0, "rop": 186}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1155, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 535, "inst": 0, "rop": 473}, "n": {"dim": 1155, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 535, "inst": 0, "rop": 473}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1235, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 644, "inst": 0, "rop": 218}, "n": {"dim": 1235, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 644, "inst": 0, "rop": 218}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1212, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 610, "inst": 0, "rop": 257}, "n": {"dim": 1212, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 610, "inst": 0, "rop": 257}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1235, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 644, "inst": 0, "rop": 205}, "n": {"dim": 1235, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 644, "inst": 0, "rop": 205}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1246, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 660, "inst": 0, "rop": 193}, "n": {"dim": 1246, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 660, "inst": 0, "rop": 193}}}, "key": "BabyBear-0624-0.79-1024", "param": [{"category": [2], "k": 2, "n": 624, "q": 1024, "secret_distribution": "normal", "claimed": 141, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.7905694150420949}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "NewHope"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1040, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 122}, "n": {"dim": 1022, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 122}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1040, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 103}, "n": {"dim": 1022, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 103}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1040, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 386, "inst": 0, "rop": 130}, "n": {"dim": 1022, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 386, "inst": 0, "rop": 130}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1040, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 143}, "n": {"dim": 1022, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 143}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1040, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 386, "inst": 0, "rop": 119}, "n": {"dim": 1022, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 386, "inst": 0, "rop": 119}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1040, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 386, "inst": 0, "rop": 125}, "n": {"dim": 1022, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 386, "inst": 0, "rop": 125}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1040, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 386, "inst": 0, "rop": 244}, "n": {"dim": 1022, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 386, "inst": 0, "rop": 244}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1040, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 115}, "n": {"dim": 1022, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 115}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1040, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 111}, "n": {"dim": 1022, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 111}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1040, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 273}, "n": {"dim": 1022, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 273}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1040, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 143}, "n": {"dim": 1022, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 143}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1040, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 386, "inst": 0, "rop": 122}, "n": {"dim": 1022, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 386, "inst": 0, "rop": 122}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1040, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 132}, "n": {"dim": 1022, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 132}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1040, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 113}, "n": {"dim": 1022, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 113}}}, "key": "NewHope-0512-2.00-12289", "param": [{"category": [1], "n": 512, "q": 12289, "secret_distribution": "normal", "claimed": 101, "ring": "x^n+1", "sd": 2.0}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "NewHope"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1163, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 146}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 471, "inst": 0, "rop": 148}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1175, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 482, "inst": 0, "rop": 128}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 480, "inst": 0, "rop": 137}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1155, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 459, "inst": 0, "rop": 151}, "n": {"dim": 1024, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 471, "inst": 0, "rop": 154}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1144, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 447, "inst": 0, "rop": 168}, "n": {"dim": 1024, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 454, "inst": 0, "rop": 169}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1167, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 472, "inst": 0, "rop": 142}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 480, "inst": 0, "rop": 144}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1143, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 446, "inst": 0, "rop": 169}, "n": {"dim": 1024, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 454, "inst": 0, "rop": 169}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1109, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 408, "inst": 0, "rop": 263}, "n": {"dim": 1024, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 402, "inst": 0, "rop": 289}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1163, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 140}, "n": {"dim": 1024, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 480, "inst": 0, "rop": 143}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1167, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 472, "inst": 0, "rop": 135}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 480, "inst": 0, "rop": 138}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1104, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 403, "inst": 0, "rop": 289}, "n": {"dim": 1024, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 402, "inst": 0, "rop": 290}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1147, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 450, "inst": 0, "rop": 163}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 462, "inst": 0, "rop": 165}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1148, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 450, "inst": 0, "rop": 161}, "n": {"dim": 1024, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 454, "inst": 0, "rop": 169}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1159, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 463, "inst": 0, "rop": 153}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 471, "inst": 0, "rop": 155}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1163, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 138}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 480, "inst": 0, "rop": 141}}}, "key": "NewHope-0512-2.00-12289", "param": [{"category": [1], "n": 512, "q": 12289, "secret_distribution": "normal", "claimed": 101, "ring": "x^n+1", "sd": 2.0}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "NewHope"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2049, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 269}, "n": {"dim": 2049, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 269}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2049, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 235}, "n": {"dim": 2049, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 235}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2049, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 886, "inst": 0, "rop": 276}, "n": {"dim": 2049, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 886, "inst": 0, "rop": 276}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2049, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 327}, "n": {"dim": 2049, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 327}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 886, "inst": 0, "rop": 252}, "n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 886, "inst": 0, "rop": 252}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2049, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 886, "inst": 0, "rop": 416}, "n": {"dim": 2049, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 886, "inst": 0, "rop": 416}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2049, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 886, "inst": 0, "rop": 738}, "n": {"dim": 2049, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 886, "inst": 0, "rop": 738}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2049, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 264}, "n": {"dim": 2049, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 264}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 245}, "n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 245}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2049, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 886, "inst": 0, "rop": 955}, "n": {"dim": 2049, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 886, "inst": 0, "rop": 955}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2049, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 886, "inst": 0, "rop": 290}, "n": {"dim": 2049, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 886, "inst": 0, "rop": 290}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2049, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 886, "inst": 0, "rop": 369}, "n": {"dim": 2049, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 886, "inst": 0, "rop": 369}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 886, "inst": 0, "rop": 266}, "n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 886, "inst": 0, "rop": 266}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2049, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 259}, "n": {"dim": 2049, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 886, "inst": 0, "rop": 259}}}, "key": "NewHope-1024-2.00-12289", "param": [{"category": [5], "n": 1024, "q": 12289, "secret_distribution": "normal", "claimed": 233, "ring": "x^n+1", "sd": 2.0}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "NewHope"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2204, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1038, "inst": 0, "rop": 314}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1049, "inst": 0, "rop": 317}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2227, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1066, "inst": 0, "rop": 283}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1049, "inst": 0, "rop": 280}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2204, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1038, "inst": 0, "rop": 320}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1049, "inst": 0, "rop": 323}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2185, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1015, "inst": 0, "rop": 374}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1007, "inst": 0, "rop": 371}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2199, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1031, "inst": 0, "rop": 295}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1049, "inst": 0, "rop": 295}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2157, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 980, "inst": 0, "rop": 477}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 977, "inst": 0, "rop": 475}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2089, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 900, "inst": 0, "rop": 753}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 901, "inst": 0, "rop": 755}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2204, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1038, "inst": 0, "rop": 309}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1049, "inst": 0, "rop": 313}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2227, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1066, "inst": 0, "rop": 293}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1049, "inst": 0, "rop": 289}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2067, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 875, "inst": 0, "rop": 936}, "n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 875, "inst": 0, "rop": 936}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2204, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1038, "inst": 0, "rop": 334}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1015, "inst": 0, "rop": 333}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2169, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 995, "inst": 0, "rop": 429}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 970, "inst": 0, "rop": 429}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2199, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1031, "inst": 0, "rop": 304}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1049, "inst": 0, "rop": 309}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2204, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1038, "inst": 0, "rop": 304}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1049, "inst": 0, "rop": 307}}}, "key": "NewHope-1024-2.00-12289", "param": [{"category": [5], "n": 1024, "q": 12289, "secret_distribution": "normal", "claimed": 233, "ring": "x^n+1", "sd": 2.0}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "MamaBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1681, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 273}, "n": {"dim": 1681, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 273}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1681, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 239}, "n": {"dim": 1681, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 239}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1681, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 901, "inst": 0, "rop": 280}, "n": {"dim": 1681, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 901, "inst": 0, "rop": 280}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1681, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 332}, "n": {"dim": 1681, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 332}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1681, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 901, "inst": 0, "rop": 256}, "n": {"dim": 1681, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 901, "inst": 0, "rop": 256}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1681, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 901, "inst": 0, "rop": 425}, "n": {"dim": 1681, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 901, "inst": 0, "rop": 425}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1681, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 901, "inst": 0, "rop": 755}, "n": {"dim": 1681, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 901, "inst": 0, "rop": 755}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1681, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 269}, "n": {"dim": 1681, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 269}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1681, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 249}, "n": {"dim": 1681, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 249}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1681, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 901, "inst": 0, "rop": 982}, "n": {"dim": 1681, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 901, "inst": 0, "rop": 982}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1681, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 901, "inst": 0, "rop": 294}, "n": {"dim": 1681, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 901, "inst": 0, "rop": 294}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1681, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 901, "inst": 0, "rop": 378}, "n": {"dim": 1681, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 901, "inst": 0, "rop": 378}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1681, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 901, "inst": 0, "rop": 269}, "n": {"dim": 1681, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 901, "inst": 0, "rop": 269}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1681, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 264}, "n": {"dim": 1681, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 901, "inst": 0, "rop": 264}}}, "key": "MamaBear-0936-0.94-1024", "param": [{"category": [5], "k": 3, "n": 936, "q": 1024, "secret_distribution": "normal", "claimed": 237, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.9354143466934853}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "MamaBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1823, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1062, "inst": 0, "rop": 331}, "n": {"dim": 1823, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1062, "inst": 0, "rop": 331}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1852, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1106, "inst": 0, "rop": 294}, "n": {"dim": 1852, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1106, "inst": 0, "rop": 294}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1823, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1062, "inst": 0, "rop": 331}, "n": {"dim": 1823, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1062, "inst": 0, "rop": 331}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1815, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1049, "inst": 0, "rop": 387}, "n": {"dim": 1815, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1049, "inst": 0, "rop": 387}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1852, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1106, "inst": 0, "rop": 310}, "n": {"dim": 1852, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1106, "inst": 0, "rop": 310}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1775, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 989, "inst": 0, "rop": 483}, "n": {"dim": 1775, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 989, "inst": 0, "rop": 483}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1727, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 919, "inst": 0, "rop": 774}, "n": {"dim": 1727, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 919, "inst": 0, "rop": 774}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1847, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 327}, "n": {"dim": 1847, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 327}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1852, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1106, "inst": 0, "rop": 304}, "n": {"dim": 1852, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1106, "inst": 0, "rop": 304}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1682, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 857, "inst": 0, "rop": 994}, "n": {"dim": 1682, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 857, "inst": 0, "rop": 994}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1823, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1062, "inst": 0, "rop": 341}, "n": {"dim": 1823, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1062, "inst": 0, "rop": 341}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1787, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1007, "inst": 0, "rop": 436}, "n": {"dim": 1787, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1007, "inst": 0, "rop": 436}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1828, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1069, "inst": 0, "rop": 321}, "n": {"dim": 1828, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1069, "inst": 0, "rop": 321}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1847, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 321}, "n": {"dim": 1847, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 321}}}, "key": "MamaBear-0936-0.94-1024", "param": [{"category": [5], "k": 3, "n": 936, "q": 1024, "secret_distribution": "normal", "claimed": 237, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.9354143466934853}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "MamaBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1640, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 253}, "n": {"dim": 1640, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 253}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1640, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 220}, "n": {"dim": 1640, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 220}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1640, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 830, "inst": 0, "rop": 259}, "n": {"dim": 1640, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 830, "inst": 0, "rop": 259}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1640, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 306}, "n": {"dim": 1640, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 306}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1640, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 830, "inst": 0, "rop": 237}, "n": {"dim": 1640, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 830, "inst": 0, "rop": 237}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1640, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 830, "inst": 0, "rop": 380}, "n": {"dim": 1640, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 830, "inst": 0, "rop": 380}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1640, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 830, "inst": 0, "rop": 678}, "n": {"dim": 1640, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 830, "inst": 0, "rop": 678}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1640, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 247}, "n": {"dim": 1640, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 247}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1640, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 230}, "n": {"dim": 1640, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 230}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1640, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 830, "inst": 0, "rop": 859}, "n": {"dim": 1640, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 830, "inst": 0, "rop": 859}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1640, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 830, "inst": 0, "rop": 273}, "n": {"dim": 1640, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 830, "inst": 0, "rop": 273}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1640, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 830, "inst": 0, "rop": 339}, "n": {"dim": 1640, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 830, "inst": 0, "rop": 339}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1640, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 830, "inst": 0, "rop": 251}, "n": {"dim": 1640, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 830, "inst": 0, "rop": 251}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1640, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 243}, "n": {"dim": 1640, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 243}}}, "key": "MamaBear-0936-0.71-1024", "param": [{"category": [4], "k": 3, "n": 936, "q": 1024, "secret_distribution": "normal", "claimed": 219, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.7071067811865476}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "MamaBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1782, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 302}, "n": {"dim": 1782, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 302}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1782, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 273}, "n": {"dim": 1782, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 273}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1782, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 999, "inst": 0, "rop": 309}, "n": {"dim": 1782, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 999, "inst": 0, "rop": 309}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1751, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 955, "inst": 0, "rop": 352}, "n": {"dim": 1751, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 955, "inst": 0, "rop": 352}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1782, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 999, "inst": 0, "rop": 282}, "n": {"dim": 1782, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 999, "inst": 0, "rop": 282}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1721, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 911, "inst": 0, "rop": 432}, "n": {"dim": 1721, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 911, "inst": 0, "rop": 432}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1671, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 842, "inst": 0, "rop": 691}, "n": {"dim": 1671, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 842, "inst": 0, "rop": 691}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1782, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 298}, "n": {"dim": 1782, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 298}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1782, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 275}, "n": {"dim": 1782, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 275}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1645, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 808, "inst": 0, "rop": 823}, "n": {"dim": 1645, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 808, "inst": 0, "rop": 823}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1761, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 317}, "n": {"dim": 1761, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 317}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1748, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 949, "inst": 0, "rop": 404}, "n": {"dim": 1748, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 949, "inst": 0, "rop": 404}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1782, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 999, "inst": 0, "rop": 295}, "n": {"dim": 1782, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 999, "inst": 0, "rop": 295}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1782, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 292}, "n": {"dim": 1782, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 999, "inst": 0, "rop": 292}}}, "key": "MamaBear-0936-0.71-1024", "param": [{"category": [4], "k": 3, "n": 936, "q": 1024, "secret_distribution": "normal", "claimed": 219, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.7071067811865476}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "PapaBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2167, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 367}, "n": {"dim": 2167, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 367}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2167, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 324}, "n": {"dim": 2167, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 324}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2167, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1219, "inst": 0, "rop": 373}, "n": {"dim": 2167, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1219, "inst": 0, "rop": 373}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2167, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 449}, "n": {"dim": 2167, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 449}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2167, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1219, "inst": 0, "rop": 340}, "n": {"dim": 2167, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1219, "inst": 0, "rop": 340}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2167, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1219, "inst": 0, "rop": 641}, "n": {"dim": 2167, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1219, "inst": 0, "rop": 641}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2167, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1219, "inst": 0, "rop": 1115}, "n": {"dim": 2167, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1219, "inst": 0, "rop": 1115}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2167, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 363}, "n": {"dim": 2167, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 363}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2167, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 334}, "n": {"dim": 2167, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 334}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2167, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1219, "inst": 0, "rop": 1627}, "n": {"dim": 2167, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1219, "inst": 0, "rop": 1627}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2167, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1219, "inst": 0, "rop": 387}, "n": {"dim": 2167, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1219, "inst": 0, "rop": 387}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2167, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1219, "inst": 0, "rop": 558}, "n": {"dim": 2167, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1219, "inst": 0, "rop": 558}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2167, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1219, "inst": 0, "rop": 354}, "n": {"dim": 2167, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1219, "inst": 0, "rop": 354}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2167, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 356}, "n": {"dim": 2167, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1219, "inst": 0, "rop": 356}}}, "key": "PapaBear-1248-0.87-1024", "param": [{"category": [5], "k": 4, "n": 1248, "q": 1024, "secret_distribution": "normal", "claimed": 320, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.8660254037844386}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "PapaBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2385, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 440}, "n": {"dim": 2385, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 440}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2385, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 390}, "n": {"dim": 2385, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 390}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2385, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1468, "inst": 0, "rop": 446}, "n": {"dim": 2385, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1468, "inst": 0, "rop": 446}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2358, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1425, "inst": 0, "rop": 525}, "n": {"dim": 2358, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1425, "inst": 0, "rop": 525}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2385, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1468, "inst": 0, "rop": 406}, "n": {"dim": 2385, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1468, "inst": 0, "rop": 406}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2287, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1316, "inst": 0, "rop": 710}, "n": {"dim": 2287, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1316, "inst": 0, "rop": 710}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2232, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1236, "inst": 0, "rop": 1134}, "n": {"dim": 2232, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1236, "inst": 0, "rop": 1134}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2385, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 437}, "n": {"dim": 2385, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 437}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2385, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 400}, "n": {"dim": 2385, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 400}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2155, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1128, "inst": 0, "rop": 1579}, "n": {"dim": 2155, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1128, "inst": 0, "rop": 1579}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2347, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1408, "inst": 0, "rop": 456}, "n": {"dim": 2347, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1408, "inst": 0, "rop": 456}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2313, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1356, "inst": 0, "rop": 639}, "n": {"dim": 2313, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1356, "inst": 0, "rop": 639}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2385, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1468, "inst": 0, "rop": 420}, "n": {"dim": 2385, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1468, "inst": 0, "rop": 420}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2385, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 429}, "n": {"dim": 2385, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1468, "inst": 0, "rop": 429}}}, "key": "PapaBear-1248-0.87-1024", "param": [{"category": [5], "k": 4, "n": 1248, "q": 1024, "secret_distribution": "normal", "claimed": 320, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.8660254037844386}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "PapaBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2095, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 333}, "n": {"dim": 2095, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 333}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2095, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 293}, "n": {"dim": 2095, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 293}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2095, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1104, "inst": 0, "rop": 339}, "n": {"dim": 2095, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1104, "inst": 0, "rop": 339}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2095, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 407}, "n": {"dim": 2095, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 407}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2095, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1104, "inst": 0, "rop": 309}, "n": {"dim": 2095, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1104, "inst": 0, "rop": 309}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2095, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1104, "inst": 0, "rop": 561}, "n": {"dim": 2095, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1104, "inst": 0, "rop": 561}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2095, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1104, "inst": 0, "rop": 981}, "n": {"dim": 2095, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1104, "inst": 0, "rop": 981}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2095, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 329}, "n": {"dim": 2095, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 329}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2095, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 303}, "n": {"dim": 2095, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 303}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2095, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1104, "inst": 0, "rop": 1375}, "n": {"dim": 2095, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1104, "inst": 0, "rop": 1375}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2095, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1104, "inst": 0, "rop": 353}, "n": {"dim": 2095, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1104, "inst": 0, "rop": 353}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2095, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1104, "inst": 0, "rop": 491}, "n": {"dim": 2095, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1104, "inst": 0, "rop": 491}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2095, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1104, "inst": 0, "rop": 323}, "n": {"dim": 2095, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1104, "inst": 0, "rop": 323}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2095, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 323}, "n": {"dim": 2095, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1104, "inst": 0, "rop": 323}}}, "key": "PapaBear-1248-0.61-1024", "param": [{"category": [5], "k": 4, "n": 1248, "q": 1024, "secret_distribution": "normal", "claimed": 292, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.6123724356957945}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["ILWE"], "name": "PapaBear"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2278, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1304, "inst": 0, "rop": 392}, "n": {"dim": 2278, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1304, "inst": 0, "rop": 392}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2288, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1318, "inst": 0, "rop": 350}, "n": {"dim": 2288, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1318, "inst": 0, "rop": 350}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2278, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1304, "inst": 0, "rop": 398}, "n": {"dim": 2278, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1304, "inst": 0, "rop": 398}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2245, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1255, "inst": 0, "rop": 462}, "n": {"dim": 2245, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1255, "inst": 0, "rop": 462}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2288, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1318, "inst": 0, "rop": 366}, "n": {"dim": 2288, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1318, "inst": 0, "rop": 366}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2210, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1206, "inst": 0, "rop": 632}, "n": {"dim": 2210, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1206, "inst": 0, "rop": 632}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2126, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1089, "inst": 0, "rop": 994}, "n": {"dim": 2126, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1089, "inst": 0, "rop": 994}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2278, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1304, "inst": 0, "rop": 388}, "n": {"dim": 2278, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1304, "inst": 0, "rop": 388}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2288, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1318, "inst": 0, "rop": 360}, "n": {"dim": 2288, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1318, "inst": 0, "rop": 360}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2091, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1043, "inst": 0, "rop": 1291}, "n": {"dim": 2091, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1043, "inst": 0, "rop": 1291}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2278, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1304, "inst": 0, "rop": 412}, "n": {"dim": 2278, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1304, "inst": 0, "rop": 412}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2232, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1236, "inst": 0, "rop": 567}, "n": {"dim": 2232, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1236, "inst": 0, "rop": 567}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2288, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1318, "inst": 0, "rop": 380}, "n": {"dim": 2288, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1318, "inst": 0, "rop": 380}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2278, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1304, "inst": 0, "rop": 381}, "n": {"dim": 2278, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1304, "inst": 0, "rop": 381}}}, "key": "PapaBear-1248-0.61-1024", "param": [{"category": [5], "k": 4, "n": 1248, "q": 1024, "secret_distribution": "normal", "claimed": 292, "ring": "q^{n/k} - q^{n/(2k)} - 1", "sd": 0.6123724356957945}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["MLWE"], "name": "KCL\u2011MLWE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1430, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 173}, "n": {"dim": 1430, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 173}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1430, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 149}, "n": {"dim": 1430, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 149}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1430, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 561, "inst": 0, "rop": 181}, "n": {"dim": 1430, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 561, "inst": 0, "rop": 181}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1430, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 207}, "n": {"dim": 1430, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 207}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1430, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 561, "inst": 0, "rop": 166}, "n": {"dim": 1430, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 561, "inst": 0, "rop": 166}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1430, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 561, "inst": 0, "rop": 218}, "n": {"dim": 1430, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 561, "inst": 0, "rop": 218}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1430, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 561, "inst": 0, "rop": 404}, "n": {"dim": 1430, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 561, "inst": 0, "rop": 404}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1430, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 167}, "n": {"dim": 1430, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 167}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1430, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 158}, "n": {"dim": 1430, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 158}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1430, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 561, "inst": 0, "rop": 467}, "n": {"dim": 1430, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 561, "inst": 0, "rop": 467}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1430, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 561, "inst": 0, "rop": 194}, "n": {"dim": 1430, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 561, "inst": 0, "rop": 194}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1430, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 561, "inst": 0, "rop": 202}, "n": {"dim": 1430, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 561, "inst": 0, "rop": 202}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1430, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 561, "inst": 0, "rop": 179}, "n": {"dim": 1430, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 561, "inst": 0, "rop": 179}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1430, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 164}, "n": {"dim": 1430, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 561, "inst": 0, "rop": 164}}}, "key": "KCL\u2011MLWE-0768-1.00-7681", "param": [{"category": [4], "k": 3, "n": 768, "q": 7681, "secret_distribution": "normal", "claimed": 147, "ring": "x^{n/k}+1", "sd": 1.0}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["MLWE"], "name": "KCL\u2011MLWE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1573, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 662, "inst": 0, "rop": 203}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 663, "inst": 0, "rop": 203}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1585, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 676, "inst": 0, "rop": 180}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 677, "inst": 0, "rop": 180}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1573, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 662, "inst": 0, "rop": 210}, "n": {"dim": 1536, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 663, "inst": 0, "rop": 210}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1559, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 646, "inst": 0, "rop": 238}, "n": {"dim": 1536, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 647, "inst": 0, "rop": 239}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1585, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 676, "inst": 0, "rop": 196}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 661, "inst": 0, "rop": 195}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1541, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 625, "inst": 0, "rop": 259}, "n": {"dim": 1536, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 625, "inst": 0, "rop": 259}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1501, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 582, "inst": 0, "rop": 425}, "n": {"dim": 1501, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 582, "inst": 0, "rop": 425}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1573, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 662, "inst": 0, "rop": 197}, "n": {"dim": 1536, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 663, "inst": 0, "rop": 198}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1579, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 668, "inst": 0, "rop": 187}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 190}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1492, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 573, "inst": 0, "rop": 482}, "n": {"dim": 1492, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 573, "inst": 0, "rop": 482}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1559, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 646, "inst": 0, "rop": 220}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 647, "inst": 0, "rop": 220}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1558, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 645, "inst": 0, "rop": 244}, "n": {"dim": 1536, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 641, "inst": 0, "rop": 242}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1571, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 659, "inst": 0, "rop": 205}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 661, "inst": 0, "rop": 206}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1573, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 662, "inst": 0, "rop": 194}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 663, "inst": 0, "rop": 194}}}, "key": "KCL\u2011MLWE-0768-1.00-7681", "param": [{"category": [4], "k": 3, "n": 768, "q": 7681, "secret_distribution": "normal", "claimed": 147, "ring": "x^{n/k}+1", "sd": 1.0}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["MLWE"], "name": "KCL\u2011MLWE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1566, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 213}, "n": {"dim": 1519, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 696, "inst": 0, "rop": 213}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1566, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 185}, "n": {"dim": 1519, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 696, "inst": 0, "rop": 185}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1566, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 695, "inst": 0, "rop": 220}, "n": {"dim": 1519, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 696, "inst": 0, "rop": 220}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1566, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 256}, "n": {"dim": 1519, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 696, "inst": 0, "rop": 257}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1566, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 695, "inst": 0, "rop": 201}, "n": {"dim": 1519, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 696, "inst": 0, "rop": 201}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1566, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 695, "inst": 0, "rop": 296}, "n": {"dim": 1519, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 696, "inst": 0, "rop": 297}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1566, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 695, "inst": 0, "rop": 537}, "n": {"dim": 1519, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 696, "inst": 0, "rop": 538}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1566, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 207}, "n": {"dim": 1519, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 696, "inst": 0, "rop": 208}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1566, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 194}, "n": {"dim": 1519, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 696, "inst": 0, "rop": 194}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1566, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 695, "inst": 0, "rop": 648}, "n": {"dim": 1519, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 696, "inst": 0, "rop": 650}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1566, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 695, "inst": 0, "rop": 233}, "n": {"dim": 1519, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 696, "inst": 0, "rop": 234}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1566, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 695, "inst": 0, "rop": 269}, "n": {"dim": 1519, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 696, "inst": 0, "rop": 269}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1566, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 695, "inst": 0, "rop": 215}, "n": {"dim": 1519, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 696, "inst": 0, "rop": 215}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1566, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 203}, "n": {"dim": 1519, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 696, "inst": 0, "rop": 204}}}, "key": "KCL\u2011MLWE-0768-2.24-7681", "param": [{"category": [4], "k": 3, "n": 768, "q": 7681, "secret_distribution": "normal", "claimed": 183, "ring": "x^{n/k}+1", "sd": 2.23606797749979}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["MLWE"], "name": "KCL\u2011MLWE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1712, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 832, "inst": 0, "rop": 253}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 838, "inst": 0, "rop": 255}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1712, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 832, "inst": 0, "rop": 224}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 854, "inst": 0, "rop": 227}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1694, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 809, "inst": 0, "rop": 258}, "n": {"dim": 1536, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 838, "inst": 0, "rop": 262}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1688, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 801, "inst": 0, "rop": 295}, "n": {"dim": 1536, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 814, "inst": 0, "rop": 300}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1712, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 832, "inst": 0, "rop": 237}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 854, "inst": 0, "rop": 243}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1659, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 765, "inst": 0, "rop": 345}, "n": {"dim": 1536, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 773, "inst": 0, "rop": 344}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1621, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 718, "inst": 0, "rop": 561}, "n": {"dim": 1536, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 712, "inst": 0, "rop": 554}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1712, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 832, "inst": 0, "rop": 248}, "n": {"dim": 1536, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 838, "inst": 0, "rop": 250}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1712, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 832, "inst": 0, "rop": 231}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 854, "inst": 0, "rop": 237}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1594, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 687, "inst": 0, "rop": 637}, "n": {"dim": 1536, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 679, "inst": 0, "rop": 683}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1694, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 809, "inst": 0, "rop": 267}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 814, "inst": 0, "rop": 269}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1676, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 786, "inst": 0, "rop": 316}, "n": {"dim": 1536, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 795, "inst": 0, "rop": 321}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1712, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 832, "inst": 0, "rop": 251}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 829, "inst": 0, "rop": 250}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1712, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 832, "inst": 0, "rop": 243}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 838, "inst": 0, "rop": 245}}}, "key": "KCL\u2011MLWE-0768-2.24-7681", "param": [{"category": [4], "k": 3, "n": 768, "q": 7681, "secret_distribution": "normal", "claimed": 183, "ring": "x^{n/k}+1", "sd": 2.23606797749979}]}, {"attack": "primal", "scheme": {"primitive": ["KE"], "assumption": ["RLWE"], "name": "HILA5"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 293}, "n": {"dim": 2033, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 294}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 257}, "n": {"dim": 2033, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 258}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2101, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 300}, "n": {"dim": 2033, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 971, "inst": 0, "rop": 300}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 357}, "n": {"dim": 2033, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 358}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2101, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 273}, "n": {"dim": 2033, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 971, "inst": 0, "rop": 274}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2101, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 968, "inst": 0, "rop": 469}, "n": {"dim": 2033, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 971, "inst": 0, "rop": 471}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2101, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 968, "inst": 0, "rop": 828}, "n": {"dim": 2033, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 971, "inst": 0, "rop": 832}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 288}, "n": {"dim": 2033, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 289}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 267}, "n": {"dim": 2033, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 268}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2101, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 1105}, "n": {"dim": 2033, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 971, "inst": 0, "rop": 1110}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2101, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 314}, "n": {"dim": 2033, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 971, "inst": 0, "rop": 314}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2101, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 968, "inst": 0, "rop": 414}, "n": {"dim": 2033, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 971, "inst": 0, "rop": 416}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2101, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 287}, "n": {"dim": 2033, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 971, "inst": 0, "rop": 288}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2101, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 283}, "n": {"dim": 2033, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 284}}}, "key": "HILA5-1024-2.83-12289", "param": [{"category": [5], "n": 1024, "q": 12289, "secret_distribution": "normal", "claimed": 255, "ring": "x^n+1", "sd": 2.8284271247461903}]}, {"attack": "dual", "scheme": {"primitive": ["KE"], "assumption": ["RLWE"], "name": "HILA5"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 347}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1135, "inst": 0, "rop": 342}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 306}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1191, "inst": 0, "rop": 316}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2263, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1113, "inst": 0, "rop": 348}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1135, "inst": 0, "rop": 348}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2260, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1109, "inst": 0, "rop": 409}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1123, "inst": 0, "rop": 414}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2294, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1153, "inst": 0, "rop": 322}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1149, "inst": 0, "rop": 322}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2204, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1038, "inst": 0, "rop": 523}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1058, "inst": 0, "rop": 530}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2143, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 963, "inst": 0, "rop": 838}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 968, "inst": 0, "rop": 830}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 344}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1135, "inst": 0, "rop": 339}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 316}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1149, "inst": 0, "rop": 319}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2117, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 933, "inst": 0, "rop": 1040}, "n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 931, "inst": 0, "rop": 1052}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2263, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1113, "inst": 0, "rop": 356}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1135, "inst": 0, "rop": 362}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2244, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1088, "inst": 0, "rop": 482}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1085, "inst": 0, "rop": 480}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2294, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1153, "inst": 0, "rop": 337}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1149, "inst": 0, "rop": 335}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2294, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1153, "inst": 0, "rop": 337}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1135, "inst": 0, "rop": 338}}}, "key": "HILA5-1024-2.83-12289", "param": [{"category": [5], "n": 1024, "q": 12289, "secret_distribution": "normal", "claimed": 255, "ring": "x^n+1", "sd": 2.8284271247461903}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWE"], "name": "Ding Key Exchange"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1143, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 337, "inst": 0, "rop": 107}, "n": {"dim": 1020, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 345, "inst": 0, "rop": 110}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1143, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 337, "inst": 0, "rop": 90}, "n": {"dim": 1020, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 345, "inst": 0, "rop": 92}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1143, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 337, "inst": 0, "rop": 115}, "n": {"dim": 1020, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 345, "inst": 0, "rop": 118}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1143, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 337, "inst": 0, "rop": 125}, "n": {"dim": 1020, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 345, "inst": 0, "rop": 127}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1143, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 337, "inst": 0, "rop": 106}, "n": {"dim": 1020, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 345, "inst": 0, "rop": 108}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1143, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 337, "inst": 0, "rop": 101}, "n": {"dim": 1020, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 345, "inst": 0, "rop": 105}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1143, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 337, "inst": 0, "rop": 203}, "n": {"dim": 1020, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 345, "inst": 0, "rop": 210}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1143, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 337, "inst": 0, "rop": 101}, "n": {"dim": 1020, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 345, "inst": 0, "rop": 103}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1143, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 337, "inst": 0, "rop": 98}, "n": {"dim": 1020, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 345, "inst": 0, "rop": 100}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1143, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 337, "inst": 0, "rop": 227}, "n": {"dim": 1020, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 345, "inst": 0, "rop": 234}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1143, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 337, "inst": 0, "rop": 128}, "n": {"dim": 1020, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 345, "inst": 0, "rop": 131}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1143, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 337, "inst": 0, "rop": 102}, "n": {"dim": 1020, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 345, "inst": 0, "rop": 105}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1143, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 337, "inst": 0, "rop": 119}, "n": {"dim": 1020, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 345, "inst": 0, "rop": 121}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1143, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 337, "inst": 0, "rop": 99}, "n": {"dim": 1020, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 345, "inst": 0, "rop": 101}}}, "key": "Ding Key Exchange-0512-4.19-120883", "param": [{"category": [1], "n": 512, "q": 120883, "secret_distribution": "normal", "claimed": "", "ring": "x^n+1", "sd": 4.19}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWE"], "name": "Ding Key Exchange"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1228, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 401, "inst": 0, "rop": 127}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 420, "inst": 0, "rop": 132}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1244, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 416, "inst": 0, "rop": 111}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 436, "inst": 0, "rop": 116}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1228, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 401, "inst": 0, "rop": 134}, "n": {"dim": 1024, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 412, "inst": 0, "rop": 139}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1220, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 394, "inst": 0, "rop": 145}, "n": {"dim": 1024, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 405, "inst": 0, "rop": 150}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1228, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 401, "inst": 0, "rop": 125}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 420, "inst": 0, "rop": 129}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1218, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 391, "inst": 0, "rop": 138}, "n": {"dim": 1024, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 392, "inst": 0, "rop": 163}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1186, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 362, "inst": 0, "rop": 224}, "n": {"dim": 1024, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 368, "inst": 0, "rop": 229}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1236, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 408, "inst": 0, "rop": 122}, "n": {"dim": 1024, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 128}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1236, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 408, "inst": 0, "rop": 118}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 123}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1175, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 352, "inst": 0, "rop": 241}, "n": {"dim": 1024, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 362, "inst": 0, "rop": 250}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1220, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 394, "inst": 0, "rop": 145}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 405, "inst": 0, "rop": 149}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1218, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 391, "inst": 0, "rop": 138}, "n": {"dim": 1024, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 401, "inst": 0, "rop": 154}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1220, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 394, "inst": 0, "rop": 136}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 412, "inst": 0, "rop": 140}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1236, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 408, "inst": 0, "rop": 120}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 126}}}, "key": "Ding Key Exchange-0512-4.19-120883", "param": [{"category": [1], "n": 512, "q": 120883, "secret_distribution": "normal", "claimed": "", "ring": "x^n+1", "sd": 4.19}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWE"], "name": "Ding Key Exchange"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2133, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 716, "inst": 0, "rop": 219}, "n": {"dim": 2042, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 718, "inst": 0, "rop": 220}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2133, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 716, "inst": 0, "rop": 190}, "n": {"dim": 2042, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 718, "inst": 0, "rop": 191}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2133, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 716, "inst": 0, "rop": 226}, "n": {"dim": 2042, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 718, "inst": 0, "rop": 227}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2133, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 716, "inst": 0, "rop": 264}, "n": {"dim": 2042, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 718, "inst": 0, "rop": 265}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2133, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 716, "inst": 0, "rop": 207}, "n": {"dim": 2042, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 718, "inst": 0, "rop": 207}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2133, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 716, "inst": 0, "rop": 309}, "n": {"dim": 2042, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 718, "inst": 0, "rop": 310}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2133, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 716, "inst": 0, "rop": 559}, "n": {"dim": 2042, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 718, "inst": 0, "rop": 561}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2133, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 716, "inst": 0, "rop": 214}, "n": {"dim": 2042, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 718, "inst": 0, "rop": 214}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2133, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 716, "inst": 0, "rop": 200}, "n": {"dim": 2042, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 718, "inst": 0, "rop": 200}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2133, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 716, "inst": 0, "rop": 680}, "n": {"dim": 2042, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 718, "inst": 0, "rop": 683}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2133, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 716, "inst": 0, "rop": 240}, "n": {"dim": 2042, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 718, "inst": 0, "rop": 241}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2133, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 716, "inst": 0, "rop": 280}, "n": {"dim": 2042, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 718, "inst": 0, "rop": 281}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2133, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 716, "inst": 0, "rop": 221}, "n": {"dim": 2042, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 718, "inst": 0, "rop": 221}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2133, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 716, "inst": 0, "rop": 210}, "n": {"dim": 2042, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 718, "inst": 0, "rop": 210}}}, "key": "Ding Key Exchange-1024-2.60-120883", "param": [{"category": [3, 5], "n": 1024, "q": 120883, "secret_distribution": "normal", "claimed": "", "ring": "x^n+1", "sd": 2.6}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWE"], "name": "Ding Key Exchange"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2243, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 815, "inst": 0, "rop": 248}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 253}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2257, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 828, "inst": 0, "rop": 222}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 854, "inst": 0, "rop": 227}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2243, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 815, "inst": 0, "rop": 255}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 830, "inst": 0, "rop": 259}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2220, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 792, "inst": 0, "rop": 296}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 807, "inst": 0, "rop": 297}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2257, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 828, "inst": 0, "rop": 236}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 830, "inst": 0, "rop": 238}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2206, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 779, "inst": 0, "rop": 348}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 780, "inst": 0, "rop": 350}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2156, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 732, "inst": 0, "rop": 575}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 736, "inst": 0, "rop": 579}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2243, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 815, "inst": 0, "rop": 246}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 247}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2257, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 828, "inst": 0, "rop": 230}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 854, "inst": 0, "rop": 237}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2130, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 709, "inst": 0, "rop": 670}, "n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 710, "inst": 0, "rop": 673}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2243, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 815, "inst": 0, "rop": 269}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 830, "inst": 0, "rop": 273}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2225, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 797, "inst": 0, "rop": 322}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 790, "inst": 0, "rop": 320}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2257, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 828, "inst": 0, "rop": 250}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 830, "inst": 0, "rop": 251}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2267, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 838, "inst": 0, "rop": 245}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 830, "inst": 0, "rop": 243}}}, "key": "Ding Key Exchange-1024-2.60-120883", "param": [{"category": [3, 5], "n": 1024, "q": 120883, "secret_distribution": "normal", "claimed": "", "ring": "x^n+1", "sd": 2.6}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "Frodo"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1375, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 481, "inst": 0, "rop": 150}, "n": {"dim": 1276, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 485, "inst": 0, "rop": 151}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1375, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 481, "inst": 0, "rop": 128}, "n": {"dim": 1276, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 485, "inst": 0, "rop": 129}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1375, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 481, "inst": 0, "rop": 157}, "n": {"dim": 1276, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 485, "inst": 0, "rop": 159}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1375, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 481, "inst": 0, "rop": 178}, "n": {"dim": 1276, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 485, "inst": 0, "rop": 179}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1375, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 481, "inst": 0, "rop": 144}, "n": {"dim": 1276, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 485, "inst": 0, "rop": 145}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1375, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 481, "inst": 0, "rop": 174}, "n": {"dim": 1276, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 485, "inst": 0, "rop": 176}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1375, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 481, "inst": 0, "rop": 329}, "n": {"dim": 1276, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 485, "inst": 0, "rop": 333}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1375, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 481, "inst": 0, "rop": 144}, "n": {"dim": 1276, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 485, "inst": 0, "rop": 145}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1375, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 481, "inst": 0, "rop": 137}, "n": {"dim": 1276, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 485, "inst": 0, "rop": 138}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1375, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 481, "inst": 0, "rop": 372}, "n": {"dim": 1276, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 485, "inst": 0, "rop": 377}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1375, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 481, "inst": 0, "rop": 171}, "n": {"dim": 1276, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 485, "inst": 0, "rop": 172}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1375, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 481, "inst": 0, "rop": 165}, "n": {"dim": 1276, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 485, "inst": 0, "rop": 167}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1375, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 481, "inst": 0, "rop": 158}, "n": {"dim": 1276, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 485, "inst": 0, "rop": 159}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1375, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 481, "inst": 0, "rop": 141}, "n": {"dim": 1276, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 485, "inst": 0, "rop": 142}}}, "key": "Frodo-0640-2.75-32768", "param": [{"category": [1], "n": 640, "q": 32768, "secret_distribution": "normal", "claimed": 103, "sd": 2.75}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "Frodo"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1462, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 566, "inst": 0, "rop": 175}, "n": {"dim": 1280, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 583, "inst": 0, "rop": 180}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1474, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 155}, "n": {"dim": 1280, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 597, "inst": 0, "rop": 159}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1462, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 566, "inst": 0, "rop": 182}, "n": {"dim": 1280, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 583, "inst": 0, "rop": 187}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1445, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 547, "inst": 0, "rop": 204}, "n": {"dim": 1280, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 558, "inst": 0, "rop": 208}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1474, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 579, "inst": 0, "rop": 170}, "n": {"dim": 1280, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 584, "inst": 0, "rop": 172}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1440, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 542, "inst": 0, "rop": 214}, "n": {"dim": 1280, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 543, "inst": 0, "rop": 234}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1399, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 500, "inst": 0, "rop": 347}, "n": {"dim": 1280, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 507, "inst": 0, "rop": 353}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1462, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 566, "inst": 0, "rop": 172}, "n": {"dim": 1280, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 583, "inst": 0, "rop": 174}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1474, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 163}, "n": {"dim": 1280, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 597, "inst": 0, "rop": 168}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1389, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 490, "inst": 0, "rop": 383}, "n": {"dim": 1280, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 497, "inst": 0, "rop": 390}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1451, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 554, "inst": 0, "rop": 193}, "n": {"dim": 1280, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 570, "inst": 0, "rop": 197}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1451, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 554, "inst": 0, "rop": 199}, "n": {"dim": 1280, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 570, "inst": 0, "rop": 207}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1462, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 566, "inst": 0, "rop": 180}, "n": {"dim": 1280, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 584, "inst": 0, "rop": 185}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1474, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 170}, "n": {"dim": 1280, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 583, "inst": 0, "rop": 172}}}, "key": "Frodo-0640-2.75-32768", "param": [{"category": [1], "n": 640, "q": 32768, "secret_distribution": "normal", "claimed": 103, "sd": 2.75}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "Frodo"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1968, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 216}, "n": {"dim": 1937, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 216}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1968, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 188}, "n": {"dim": 1937, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 188}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1968, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 707, "inst": 0, "rop": 223}, "n": {"dim": 1937, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 707, "inst": 0, "rop": 223}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1968, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 261}, "n": {"dim": 1937, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 261}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1968, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 707, "inst": 0, "rop": 204}, "n": {"dim": 1937, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 707, "inst": 0, "rop": 204}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1968, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 707, "inst": 0, "rop": 304}, "n": {"dim": 1937, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 707, "inst": 0, "rop": 304}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1968, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 707, "inst": 0, "rop": 549}, "n": {"dim": 1937, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 707, "inst": 0, "rop": 549}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1968, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 211}, "n": {"dim": 1937, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 211}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1968, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 197}, "n": {"dim": 1937, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 197}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1968, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 707, "inst": 0, "rop": 666}, "n": {"dim": 1937, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 707, "inst": 0, "rop": 666}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1968, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 707, "inst": 0, "rop": 237}, "n": {"dim": 1937, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 707, "inst": 0, "rop": 237}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1968, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 707, "inst": 0, "rop": 275}, "n": {"dim": 1937, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 707, "inst": 0, "rop": 275}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1968, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 707, "inst": 0, "rop": 218}, "n": {"dim": 1937, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 707, "inst": 0, "rop": 218}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1968, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 207}, "n": {"dim": 1937, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 707, "inst": 0, "rop": 207}}}, "key": "Frodo-0976-2.30-65536", "param": [{"category": [3], "n": 976, "q": 65536, "secret_distribution": "normal", "claimed": 150, "sd": 2.3}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "Frodo"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2126, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 809, "inst": 0, "rop": 246}, "n": {"dim": 1952, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 822, "inst": 0, "rop": 250}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2155, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 839, "inst": 0, "rop": 223}, "n": {"dim": 1952, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 846, "inst": 0, "rop": 225}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2126, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 809, "inst": 0, "rop": 253}, "n": {"dim": 1952, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 822, "inst": 0, "rop": 257}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2104, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 787, "inst": 0, "rop": 290}, "n": {"dim": 1952, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 799, "inst": 0, "rop": 295}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2132, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 815, "inst": 0, "rop": 233}, "n": {"dim": 1952, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 822, "inst": 0, "rop": 235}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2081, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 763, "inst": 0, "rop": 351}, "n": {"dim": 1952, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 787, "inst": 0, "rop": 353}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2038, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 722, "inst": 0, "rop": 565}, "n": {"dim": 1952, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 725, "inst": 0, "rop": 568}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2126, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 809, "inst": 0, "rop": 242}, "n": {"dim": 1952, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 822, "inst": 0, "rop": 245}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2132, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 815, "inst": 0, "rop": 229}, "n": {"dim": 1952, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 822, "inst": 0, "rop": 233}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2011, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 696, "inst": 0, "rop": 671}, "n": {"dim": 1952, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 699, "inst": 0, "rop": 657}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2126, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 809, "inst": 0, "rop": 267}, "n": {"dim": 1952, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 822, "inst": 0, "rop": 271}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2106, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 789, "inst": 0, "rop": 318}, "n": {"dim": 1952, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 780, "inst": 0, "rop": 316}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2132, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 815, "inst": 0, "rop": 247}, "n": {"dim": 1952, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 822, "inst": 0, "rop": 249}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2126, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 809, "inst": 0, "rop": 241}, "n": {"dim": 1952, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 822, "inst": 0, "rop": 241}}}, "key": "Frodo-0976-2.30-65536", "param": [{"category": [3], "n": 976, "q": 65536, "secret_distribution": "normal", "claimed": 150, "sd": 2.3}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Kyber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1018, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 122}, "n": {"dim": 1018, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 122}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1018, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 103}, "n": {"dim": 1018, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 103}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1018, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 386, "inst": 0, "rop": 130}, "n": {"dim": 1018, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 386, "inst": 0, "rop": 130}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1018, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 143}, "n": {"dim": 1018, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 143}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1018, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 386, "inst": 0, "rop": 119}, "n": {"dim": 1018, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 386, "inst": 0, "rop": 119}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1018, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 386, "inst": 0, "rop": 125}, "n": {"dim": 1018, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 386, "inst": 0, "rop": 125}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1018, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 386, "inst": 0, "rop": 244}, "n": {"dim": 1018, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 386, "inst": 0, "rop": 244}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1018, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 115}, "n": {"dim": 1018, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 115}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1018, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 111}, "n": {"dim": 1018, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 111}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1018, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 273}, "n": {"dim": 1018, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 273}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1018, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 143}, "n": {"dim": 1018, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 143}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1018, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 386, "inst": 0, "rop": 122}, "n": {"dim": 1018, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 386, "inst": 0, "rop": 122}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1018, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 132}, "n": {"dim": 1018, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 386, "inst": 0, "rop": 132}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1018, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 113}, "n": {"dim": 1018, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 386, "inst": 0, "rop": 113}}}, "key": "CRYSTALS\u2011Kyber-0512-1.58-7681", "param": [{"category": [1], "k": 2, "n": 512, "q": 7681, "secret_distribution": "normal", "claimed": 102, "ring": "x^{n/k}+1", "sd": 1.5811388300841898}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Kyber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1137, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 472, "inst": 0, "rop": 147}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 471, "inst": 0, "rop": 148}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1150, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 487, "inst": 0, "rop": 130}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 480, "inst": 0, "rop": 137}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1129, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 463, "inst": 0, "rop": 152}, "n": {"dim": 1024, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 471, "inst": 0, "rop": 154}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1119, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 451, "inst": 0, "rop": 167}, "n": {"dim": 1024, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 454, "inst": 0, "rop": 169}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1133, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 468, "inst": 0, "rop": 143}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 480, "inst": 0, "rop": 144}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1117, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 449, "inst": 0, "rop": 169}, "n": {"dim": 1024, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 454, "inst": 0, "rop": 169}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1083, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 410, "inst": 0, "rop": 265}, "n": {"dim": 1024, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 402, "inst": 0, "rop": 289}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1137, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 472, "inst": 0, "rop": 141}, "n": {"dim": 1024, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 480, "inst": 0, "rop": 143}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1141, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 477, "inst": 0, "rop": 136}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 480, "inst": 0, "rop": 138}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1076, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 403, "inst": 0, "rop": 289}, "n": {"dim": 1024, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 402, "inst": 0, "rop": 290}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1121, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 454, "inst": 0, "rop": 163}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 462, "inst": 0, "rop": 165}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1117, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 449, "inst": 0, "rop": 169}, "n": {"dim": 1024, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 454, "inst": 0, "rop": 169}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1133, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 468, "inst": 0, "rop": 154}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 471, "inst": 0, "rop": 155}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1137, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 472, "inst": 0, "rop": 139}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 480, "inst": 0, "rop": 141}}}, "key": "CRYSTALS\u2011Kyber-0512-1.58-7681", "param": [{"category": [1], "k": 2, "n": 512, "q": 7681, "secret_distribution": "normal", "claimed": 102, "ring": "x^{n/k}+1", "sd": 1.5811388300841898}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Kyber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1501, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 189}, "n": {"dim": 1501, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 189}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1501, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 163}, "n": {"dim": 1501, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 163}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1501, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 614, "inst": 0, "rop": 196}, "n": {"dim": 1501, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 614, "inst": 0, "rop": 196}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1501, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 226}, "n": {"dim": 1501, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 226}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1501, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 614, "inst": 0, "rop": 180}, "n": {"dim": 1501, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 614, "inst": 0, "rop": 180}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1501, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 614, "inst": 0, "rop": 248}, "n": {"dim": 1501, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 614, "inst": 0, "rop": 248}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1501, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 614, "inst": 0, "rop": 456}, "n": {"dim": 1501, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 614, "inst": 0, "rop": 456}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1501, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 183}, "n": {"dim": 1501, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 183}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1501, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 172}, "n": {"dim": 1501, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 172}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1501, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 614, "inst": 0, "rop": 535}, "n": {"dim": 1501, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 614, "inst": 0, "rop": 535}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1501, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 614, "inst": 0, "rop": 210}, "n": {"dim": 1501, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 614, "inst": 0, "rop": 210}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1501, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 614, "inst": 0, "rop": 228}, "n": {"dim": 1501, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 614, "inst": 0, "rop": 228}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1501, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 614, "inst": 0, "rop": 193}, "n": {"dim": 1501, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 614, "inst": 0, "rop": 193}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1501, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 180}, "n": {"dim": 1501, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 614, "inst": 0, "rop": 180}}}, "key": "CRYSTALS\u2011Kyber-0768-1.41-7681", "param": [{"category": [3], "k": 3, "n": 768, "q": 7681, "secret_distribution": "normal", "claimed": 161, "ring": "x^{n/k}+1", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Kyber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1621, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 719, "inst": 0, "rop": 221}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 724, "inst": 0, "rop": 221}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 738, "inst": 0, "rop": 196}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 744, "inst": 0, "rop": 198}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1621, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 719, "inst": 0, "rop": 227}, "n": {"dim": 1536, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 724, "inst": 0, "rop": 228}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1606, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 701, "inst": 0, "rop": 258}, "n": {"dim": 1536, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 706, "inst": 0, "rop": 260}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1637, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 738, "inst": 0, "rop": 212}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 744, "inst": 0, "rop": 214}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1587, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 678, "inst": 0, "rop": 299}, "n": {"dim": 1536, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 679, "inst": 0, "rop": 299}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1545, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 630, "inst": 0, "rop": 472}, "n": {"dim": 1536, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 628, "inst": 0, "rop": 470}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 738, "inst": 0, "rop": 220}, "n": {"dim": 1536, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 724, "inst": 0, "rop": 217}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 738, "inst": 0, "rop": 206}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 744, "inst": 0, "rop": 207}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1532, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 615, "inst": 0, "rop": 537}, "n": {"dim": 1532, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 615, "inst": 0, "rop": 537}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1621, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 719, "inst": 0, "rop": 241}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 724, "inst": 0, "rop": 242}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1599, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 693, "inst": 0, "rop": 268}, "n": {"dim": 1536, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 694, "inst": 0, "rop": 269}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1621, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 719, "inst": 0, "rop": 222}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 724, "inst": 0, "rop": 222}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 738, "inst": 0, "rop": 216}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 724, "inst": 0, "rop": 217}}}, "key": "CRYSTALS\u2011Kyber-0768-1.41-7681", "param": [{"category": [3], "k": 3, "n": 768, "q": 7681, "secret_distribution": "normal", "claimed": 161, "ring": "x^{n/k}+1", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Kyber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1961, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 253}, "n": {"dim": 1961, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 253}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1961, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 221}, "n": {"dim": 1961, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 221}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1961, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 831, "inst": 0, "rop": 260}, "n": {"dim": 1961, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 831, "inst": 0, "rop": 260}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1961, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 306}, "n": {"dim": 1961, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 306}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1961, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 831, "inst": 0, "rop": 237}, "n": {"dim": 1961, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 831, "inst": 0, "rop": 237}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1961, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 831, "inst": 0, "rop": 381}, "n": {"dim": 1961, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 831, "inst": 0, "rop": 381}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1961, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 831, "inst": 0, "rop": 679}, "n": {"dim": 1961, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 831, "inst": 0, "rop": 679}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1961, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 248}, "n": {"dim": 1961, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 248}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1961, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 230}, "n": {"dim": 1961, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 230}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1961, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 831, "inst": 0, "rop": 861}, "n": {"dim": 1961, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 831, "inst": 0, "rop": 861}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1961, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 831, "inst": 0, "rop": 273}, "n": {"dim": 1961, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 831, "inst": 0, "rop": 273}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1961, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 831, "inst": 0, "rop": 340}, "n": {"dim": 1961, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 831, "inst": 0, "rop": 340}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1961, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 831, "inst": 0, "rop": 251}, "n": {"dim": 1961, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 831, "inst": 0, "rop": 251}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1961, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 243}, "n": {"dim": 1961, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 831, "inst": 0, "rop": 243}}}, "key": "CRYSTALS\u2011Kyber-1024-1.22-7681", "param": [{"category": [5], "k": 4, "n": 1024, "q": 7681, "secret_distribution": "normal", "claimed": 218, "ring": "x^{n/k}+1", "sd": 1.224744871391589}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Kyber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2088, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 963, "inst": 0, "rop": 292}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 293}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2114, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 994, "inst": 0, "rop": 264}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 998, "inst": 0, "rop": 265}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2088, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 963, "inst": 0, "rop": 298}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 300}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2066, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 937, "inst": 0, "rop": 345}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 945, "inst": 0, "rop": 348}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2114, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 994, "inst": 0, "rop": 280}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 967, "inst": 0, "rop": 280}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2034, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 898, "inst": 0, "rop": 430}, "n": {"dim": 2034, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 899, "inst": 0, "rop": 429}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1981, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 837, "inst": 0, "rop": 685}, "n": {"dim": 1981, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 837, "inst": 0, "rop": 685}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2088, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 963, "inst": 0, "rop": 288}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 288}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2114, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 994, "inst": 0, "rop": 274}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 998, "inst": 0, "rop": 275}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1963, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 816, "inst": 0, "rop": 836}, "n": {"dim": 1963, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 816, "inst": 0, "rop": 836}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2088, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 963, "inst": 0, "rop": 312}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 314}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2057, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 926, "inst": 0, "rop": 391}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 926, "inst": 0, "rop": 391}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2088, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 963, "inst": 0, "rop": 287}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 967, "inst": 0, "rop": 287}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2088, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 963, "inst": 0, "rop": 286}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 283}}}, "key": "CRYSTALS\u2011Kyber-1024-1.22-7681", "param": [{"category": [5], "k": 4, "n": 1024, "q": 7681, "secret_distribution": "normal", "claimed": 218, "ring": "x^{n/k}+1", "sd": 1.224744871391589}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "LOTUS"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1226, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 165}, "n": {"dim": 1147, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 537, "inst": 0, "rop": 166}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1226, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 141}, "n": {"dim": 1147, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 537, "inst": 0, "rop": 143}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1226, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 532, "inst": 0, "rop": 172}, "n": {"dim": 1147, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 537, "inst": 0, "rop": 174}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1226, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 196}, "n": {"dim": 1147, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 537, "inst": 0, "rop": 198}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1226, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 532, "inst": 0, "rop": 158}, "n": {"dim": 1147, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 537, "inst": 0, "rop": 159}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1226, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 532, "inst": 0, "rop": 202}, "n": {"dim": 1147, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 537, "inst": 0, "rop": 205}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1226, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 532, "inst": 0, "rop": 377}, "n": {"dim": 1147, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 537, "inst": 0, "rop": 381}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1226, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 159}, "n": {"dim": 1147, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 537, "inst": 0, "rop": 160}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1226, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 151}, "n": {"dim": 1147, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 537, "inst": 0, "rop": 152}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1226, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 532, "inst": 0, "rop": 431}, "n": {"dim": 1147, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 537, "inst": 0, "rop": 437}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1226, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 532, "inst": 0, "rop": 186}, "n": {"dim": 1147, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 537, "inst": 0, "rop": 187}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1226, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 532, "inst": 0, "rop": 189}, "n": {"dim": 1147, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 537, "inst": 0, "rop": 191}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1226, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 532, "inst": 0, "rop": 171}, "n": {"dim": 1147, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 537, "inst": 0, "rop": 172}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1226, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 156}, "n": {"dim": 1147, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 537, "inst": 0, "rop": 157}}}, "key": "LOTUS-0576-3.00-8192", "param": [{"category": [1, 2], "n": 576, "q": 8192, "secret_distribution": "normal", "claimed": "", "sd": 3.0}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "LOTUS"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1350, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 639, "inst": 0, "rop": 196}, "n": {"dim": 1152, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 203}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1367, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 662, "inst": 0, "rop": 176}, "n": {"dim": 1152, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 685, "inst": 0, "rop": 182}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1350, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 639, "inst": 0, "rop": 203}, "n": {"dim": 1152, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 652, "inst": 0, "rop": 207}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1338, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 624, "inst": 0, "rop": 230}, "n": {"dim": 1152, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 634, "inst": 0, "rop": 234}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1355, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 646, "inst": 0, "rop": 188}, "n": {"dim": 1152, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 669, "inst": 0, "rop": 194}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1310, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 589, "inst": 0, "rop": 274}, "n": {"dim": 1152, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 593, "inst": 0, "rop": 297}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1282, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 554, "inst": 0, "rop": 398}, "n": {"dim": 1152, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 550, "inst": 0, "rop": 417}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1350, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 639, "inst": 0, "rop": 191}, "n": {"dim": 1152, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 669, "inst": 0, "rop": 200}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1355, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 646, "inst": 0, "rop": 182}, "n": {"dim": 1152, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 669, "inst": 0, "rop": 188}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1270, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 540, "inst": 0, "rop": 441}, "n": {"dim": 1152, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 536, "inst": 0, "rop": 473}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1338, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 624, "inst": 0, "rop": 213}, "n": {"dim": 1152, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 652, "inst": 0, "rop": 220}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1326, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 609, "inst": 0, "rop": 234}, "n": {"dim": 1152, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 609, "inst": 0, "rop": 265}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1343, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 631, "inst": 0, "rop": 199}, "n": {"dim": 1152, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 652, "inst": 0, "rop": 204}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1350, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 639, "inst": 0, "rop": 189}, "n": {"dim": 1152, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 669, "inst": 0, "rop": 196}}}, "key": "LOTUS-0576-3.00-8192", "param": [{"category": [1, 2], "n": 576, "q": 8192, "secret_distribution": "normal", "claimed": "", "sd": 3.0}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "LOTUS"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1471, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 674, "inst": 0, "rop": 207}, "n": {"dim": 1401, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 208}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1471, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 674, "inst": 0, "rop": 179}, "n": {"dim": 1401, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 180}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1471, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 674, "inst": 0, "rop": 214}, "n": {"dim": 1401, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 679, "inst": 0, "rop": 215}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1471, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 674, "inst": 0, "rop": 249}, "n": {"dim": 1401, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 250}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1471, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 674, "inst": 0, "rop": 196}, "n": {"dim": 1401, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 679, "inst": 0, "rop": 197}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1471, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 674, "inst": 0, "rop": 284}, "n": {"dim": 1401, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 679, "inst": 0, "rop": 287}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1471, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 674, "inst": 0, "rop": 516}, "n": {"dim": 1401, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 679, "inst": 0, "rop": 521}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1471, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 674, "inst": 0, "rop": 201}, "n": {"dim": 1401, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 203}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1471, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 674, "inst": 0, "rop": 189}, "n": {"dim": 1401, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 190}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1471, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 674, "inst": 0, "rop": 618}, "n": {"dim": 1401, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 679, "inst": 0, "rop": 625}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1471, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 674, "inst": 0, "rop": 227}, "n": {"dim": 1401, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 679, "inst": 0, "rop": 229}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1471, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 674, "inst": 0, "rop": 258}, "n": {"dim": 1401, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 679, "inst": 0, "rop": 261}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1471, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 674, "inst": 0, "rop": 209}, "n": {"dim": 1401, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 679, "inst": 0, "rop": 210}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1471, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 674, "inst": 0, "rop": 197}, "n": {"dim": 1401, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 199}}}, "key": "LOTUS-0704-3.00-8192", "param": [{"category": [3, 4], "n": 704, "q": 8192, "secret_distribution": "normal", "claimed": "", "sd": 3.0}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "LOTUS"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1629, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 811, "inst": 0, "rop": 247}, "n": {"dim": 1408, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 825, "inst": 0, "rop": 251}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1629, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 811, "inst": 0, "rop": 221}, "n": {"dim": 1408, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 847, "inst": 0, "rop": 225}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1612, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 789, "inst": 0, "rop": 252}, "n": {"dim": 1408, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 825, "inst": 0, "rop": 258}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1605, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 778, "inst": 0, "rop": 287}, "n": {"dim": 1408, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 800, "inst": 0, "rop": 295}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1629, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 811, "inst": 0, "rop": 232}, "n": {"dim": 1408, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 823, "inst": 0, "rop": 238}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1592, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 762, "inst": 0, "rop": 337}, "n": {"dim": 1408, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 759, "inst": 0, "rop": 337}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1538, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 694, "inst": 0, "rop": 536}, "n": {"dim": 1408, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 685, "inst": 0, "rop": 554}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1629, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 811, "inst": 0, "rop": 242}, "n": {"dim": 1408, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 825, "inst": 0, "rop": 246}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1629, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 811, "inst": 0, "rop": 225}, "n": {"dim": 1408, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 847, "inst": 0, "rop": 235}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1525, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 679, "inst": 0, "rop": 625}, "n": {"dim": 1408, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 660, "inst": 0, "rop": 674}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1612, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 789, "inst": 0, "rop": 261}, "n": {"dim": 1408, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 803, "inst": 0, "rop": 265}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1592, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 762, "inst": 0, "rop": 303}, "n": {"dim": 1408, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 780, "inst": 0, "rop": 313}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1629, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 811, "inst": 0, "rop": 245}, "n": {"dim": 1408, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 823, "inst": 0, "rop": 248}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1629, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 811, "inst": 0, "rop": 237}, "n": {"dim": 1408, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 825, "inst": 0, "rop": 241}}}, "key": "LOTUS-0704-3.00-8192", "param": [{"category": [3, 4], "n": 704, "q": 8192, "secret_distribution": "normal", "claimed": "", "sd": 3.0}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "LOTUS"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1768, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 819, "inst": 0, "rop": 249}, "n": {"dim": 1658, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 824, "inst": 0, "rop": 251}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1768, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 819, "inst": 0, "rop": 218}, "n": {"dim": 1658, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 824, "inst": 0, "rop": 219}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1768, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 819, "inst": 0, "rop": 256}, "n": {"dim": 1658, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 824, "inst": 0, "rop": 258}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1768, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 819, "inst": 0, "rop": 302}, "n": {"dim": 1658, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 824, "inst": 0, "rop": 304}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1768, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 819, "inst": 0, "rop": 234}, "n": {"dim": 1658, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 824, "inst": 0, "rop": 235}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1768, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 819, "inst": 0, "rop": 373}, "n": {"dim": 1658, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 824, "inst": 0, "rop": 376}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1768, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 819, "inst": 0, "rop": 666}, "n": {"dim": 1658, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 824, "inst": 0, "rop": 672}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1768, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 819, "inst": 0, "rop": 244}, "n": {"dim": 1658, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 824, "inst": 0, "rop": 246}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1768, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 819, "inst": 0, "rop": 227}, "n": {"dim": 1658, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 824, "inst": 0, "rop": 229}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1768, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 819, "inst": 0, "rop": 841}, "n": {"dim": 1658, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 824, "inst": 0, "rop": 849}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1768, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 819, "inst": 0, "rop": 270}, "n": {"dim": 1658, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 824, "inst": 0, "rop": 271}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1768, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 819, "inst": 0, "rop": 333}, "n": {"dim": 1658, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 824, "inst": 0, "rop": 336}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1768, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 819, "inst": 0, "rop": 248}, "n": {"dim": 1658, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 824, "inst": 0, "rop": 249}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1768, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 819, "inst": 0, "rop": 240}, "n": {"dim": 1658, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 824, "inst": 0, "rop": 241}}}, "key": "LOTUS-0832-3.00-8192", "param": [{"category": [5], "n": 832, "q": 8192, "secret_distribution": "normal", "claimed": "", "sd": 3.0}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["LWE"], "name": "LOTUS"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1893, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 293}, "n": {"dim": 1664, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1000, "inst": 0, "rop": 302}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1918, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1002, "inst": 0, "rop": 266}, "n": {"dim": 1664, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 997, "inst": 0, "rop": 270}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1893, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 300}, "n": {"dim": 1664, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 307}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1863, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 928, "inst": 0, "rop": 343}, "n": {"dim": 1664, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 944, "inst": 0, "rop": 348}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1895, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 971, "inst": 0, "rop": 274}, "n": {"dim": 1664, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 997, "inst": 0, "rop": 281}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1842, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 900, "inst": 0, "rop": 425}, "n": {"dim": 1664, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 907, "inst": 0, "rop": 429}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1784, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 826, "inst": 0, "rop": 674}, "n": {"dim": 1664, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 834, "inst": 0, "rop": 682}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1893, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 288}, "n": {"dim": 1664, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1000, "inst": 0, "rop": 298}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1895, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 272}, "n": {"dim": 1664, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 997, "inst": 0, "rop": 275}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1760, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 797, "inst": 0, "rop": 811}, "n": {"dim": 1664, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 802, "inst": 0, "rop": 813}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1893, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 313}, "n": {"dim": 1664, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 313}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1859, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 923, "inst": 0, "rop": 390}, "n": {"dim": 1664, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 916, "inst": 0, "rop": 400}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1895, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 971, "inst": 0, "rop": 288}, "n": {"dim": 1664, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 997, "inst": 0, "rop": 295}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1893, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 283}, "n": {"dim": 1664, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1000, "inst": 0, "rop": 293}}}, "key": "LOTUS-0832-3.00-8192", "param": [{"category": [5], "n": 832, "q": 8192, "secret_distribution": "normal", "claimed": "", "sd": 3.0}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM", "KE"], "assumption": ["PLWE"], "name": "LAC"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 889, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 158}, "n": {"dim": 889, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 158}}, "0.265\u00a0\u03b2": {"2n": {"dim": 889, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 136}, "n": {"dim": 889, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 136}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 889, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 510, "inst": 0, "rop": 166}, "n": {"dim": 889, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 510, "inst": 0, "rop": 166}}, "0.368\u00a0\u03b2": {"2n": {"dim": 889, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 188}, "n": {"dim": 889, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 188}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 889, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 510, "inst": 0, "rop": 152}, "n": {"dim": 889, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 510, "inst": 0, "rop": 152}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 889, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 510, "inst": 0, "rop": 190}, "n": {"dim": 889, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 510, "inst": 0, "rop": 190}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 889, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 510, "inst": 0, "rop": 356}, "n": {"dim": 889, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 510, "inst": 0, "rop": 356}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 889, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 152}, "n": {"dim": 889, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 152}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 889, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 145}, "n": {"dim": 889, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 145}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 889, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 510, "inst": 0, "rop": 405}, "n": {"dim": 889, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 510, "inst": 0, "rop": 405}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 889, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 510, "inst": 0, "rop": 179}, "n": {"dim": 889, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 510, "inst": 0, "rop": 179}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 889, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 510, "inst": 0, "rop": 178}, "n": {"dim": 889, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 510, "inst": 0, "rop": 178}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 889, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 510, "inst": 0, "rop": 165}, "n": {"dim": 889, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 510, "inst": 0, "rop": 165}}, "0.292\u00a0\u03b2": {"2n": {"dim": 889, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 149}, "n": {"dim": 889, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 510, "inst": 0, "rop": 149}}}, "key": "LAC-0512-0.71-251", "param": [{"category": [1, 2], "n": 512, "q": 251, "secret_distribution": "normal", "claimed": 128, "ring": "x^n+1", "sd": 0.7071067811865476}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM", "KE"], "assumption": ["PLWE"], "name": "LAC"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 995, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 637, "inst": 0, "rop": 197}, "n": {"dim": 995, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 637, "inst": 0, "rop": 197}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1013, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 669, "inst": 0, "rop": 178}, "n": {"dim": 1013, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 669, "inst": 0, "rop": 178}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 995, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 637, "inst": 0, "rop": 203}, "n": {"dim": 995, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 637, "inst": 0, "rop": 203}}, "0.368\u00a0\u03b2": {"2n": {"dim": 978, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 607, "inst": 0, "rop": 231}, "n": {"dim": 978, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 607, "inst": 0, "rop": 231}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1004, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 653, "inst": 0, "rop": 190}, "n": {"dim": 1004, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 653, "inst": 0, "rop": 190}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 954, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 567, "inst": 0, "rop": 288}, "n": {"dim": 954, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 567, "inst": 0, "rop": 288}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 923, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 516, "inst": 0, "rop": 423}, "n": {"dim": 923, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 516, "inst": 0, "rop": 423}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1004, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 653, "inst": 0, "rop": 195}, "n": {"dim": 1004, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 653, "inst": 0, "rop": 195}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1004, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 653, "inst": 0, "rop": 183}, "n": {"dim": 1004, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 653, "inst": 0, "rop": 183}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 911, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 498, "inst": 0, "rop": 487}, "n": {"dim": 911, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 498, "inst": 0, "rop": 487}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 987, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 622, "inst": 0, "rop": 213}, "n": {"dim": 987, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 622, "inst": 0, "rop": 213}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 957, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 571, "inst": 0, "rop": 272}, "n": {"dim": 957, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 571, "inst": 0, "rop": 272}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 995, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 637, "inst": 0, "rop": 199}, "n": {"dim": 995, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 637, "inst": 0, "rop": 199}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1004, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 653, "inst": 0, "rop": 191}, "n": {"dim": 1004, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 653, "inst": 0, "rop": 191}}}, "key": "LAC-0512-0.71-251", "param": [{"category": [1, 2], "n": 512, "q": 251, "secret_distribution": "normal", "claimed": 128, "ring": "x^n+1", "sd": 0.7071067811865476}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM", "KE"], "assumption": ["PLWE"], "name": "LAC"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 298}, "n": {"dim": 1637, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 298}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 262}, "n": {"dim": 1637, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 262}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1637, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 985, "inst": 0, "rop": 305}, "n": {"dim": 1637, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 985, "inst": 0, "rop": 305}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 363}, "n": {"dim": 1637, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 363}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1637, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 985, "inst": 0, "rop": 278}, "n": {"dim": 1637, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 985, "inst": 0, "rop": 278}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1637, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 985, "inst": 0, "rop": 481}, "n": {"dim": 1637, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 985, "inst": 0, "rop": 481}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1637, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 985, "inst": 0, "rop": 847}, "n": {"dim": 1637, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 985, "inst": 0, "rop": 847}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 294}, "n": {"dim": 1637, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 294}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 271}, "n": {"dim": 1637, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 271}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1637, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 985, "inst": 0, "rop": 1137}, "n": {"dim": 1637, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 985, "inst": 0, "rop": 1137}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1637, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 985, "inst": 0, "rop": 318}, "n": {"dim": 1637, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 985, "inst": 0, "rop": 318}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1637, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 985, "inst": 0, "rop": 424}, "n": {"dim": 1637, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 985, "inst": 0, "rop": 424}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1637, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 985, "inst": 0, "rop": 292}, "n": {"dim": 1637, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 985, "inst": 0, "rop": 292}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1637, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 288}, "n": {"dim": 1637, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 985, "inst": 0, "rop": 288}}}, "key": "LAC-1024-0.50-251", "param": [{"category": [3, 4], "n": 1024, "q": 251, "secret_distribution": "normal", "claimed": 192, "ring": "x^n+1", "sd": 0.5}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM", "KE"], "assumption": ["PLWE"], "name": "LAC"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1778, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1188, "inst": 0, "rop": 358}, "n": {"dim": 1778, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1188, "inst": 0, "rop": 358}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1803, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1232, "inst": 0, "rop": 327}, "n": {"dim": 1803, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1232, "inst": 0, "rop": 327}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1778, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1188, "inst": 0, "rop": 364}, "n": {"dim": 1778, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1188, "inst": 0, "rop": 364}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1753, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1146, "inst": 0, "rop": 422}, "n": {"dim": 1753, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1146, "inst": 0, "rop": 422}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1803, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1232, "inst": 0, "rop": 343}, "n": {"dim": 1803, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1232, "inst": 0, "rop": 343}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1708, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1071, "inst": 0, "rop": 554}, "n": {"dim": 1708, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1071, "inst": 0, "rop": 554}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1658, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 989, "inst": 0, "rop": 852}, "n": {"dim": 1658, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 989, "inst": 0, "rop": 852}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1778, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1188, "inst": 0, "rop": 354}, "n": {"dim": 1778, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1188, "inst": 0, "rop": 354}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1803, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1232, "inst": 0, "rop": 337}, "n": {"dim": 1803, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1232, "inst": 0, "rop": 337}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1600, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 900, "inst": 0, "rop": 1297}, "n": {"dim": 1600, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 900, "inst": 0, "rop": 1297}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1778, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1188, "inst": 0, "rop": 378}, "n": {"dim": 1778, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1188, "inst": 0, "rop": 378}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1721, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1092, "inst": 0, "rop": 506}, "n": {"dim": 1721, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1092, "inst": 0, "rop": 506}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1778, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1188, "inst": 0, "rop": 348}, "n": {"dim": 1778, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1188, "inst": 0, "rop": 348}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1778, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1188, "inst": 0, "rop": 349}, "n": {"dim": 1778, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1188, "inst": 0, "rop": 349}}}, "key": "LAC-1024-0.50-251", "param": [{"category": [3, 4], "n": 1024, "q": 251, "secret_distribution": "normal", "claimed": 192, "ring": "x^n+1", "sd": 0.5}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM", "KE"], "assumption": ["PLWE"], "name": "LAC"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1683, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 333}, "n": {"dim": 1683, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 333}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1683, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 293}, "n": {"dim": 1683, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 293}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1683, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1105, "inst": 0, "rop": 340}, "n": {"dim": 1683, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1105, "inst": 0, "rop": 340}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1683, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 407}, "n": {"dim": 1683, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 407}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1683, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1105, "inst": 0, "rop": 310}, "n": {"dim": 1683, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1105, "inst": 0, "rop": 310}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1683, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1105, "inst": 0, "rop": 562}, "n": {"dim": 1683, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1105, "inst": 0, "rop": 562}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1683, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1105, "inst": 0, "rop": 983}, "n": {"dim": 1683, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1105, "inst": 0, "rop": 983}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1683, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 329}, "n": {"dim": 1683, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 329}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1683, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 303}, "n": {"dim": 1683, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 303}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1683, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1105, "inst": 0, "rop": 1377}, "n": {"dim": 1683, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1105, "inst": 0, "rop": 1377}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1683, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1105, "inst": 0, "rop": 353}, "n": {"dim": 1683, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1105, "inst": 0, "rop": 353}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1683, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1105, "inst": 0, "rop": 492}, "n": {"dim": 1683, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1105, "inst": 0, "rop": 492}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1683, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1105, "inst": 0, "rop": 323}, "n": {"dim": 1683, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1105, "inst": 0, "rop": 323}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1683, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 323}, "n": {"dim": 1683, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1105, "inst": 0, "rop": 323}}}, "key": "LAC-1024-0.71-251", "param": [{"category": [5], "n": 1024, "q": 251, "secret_distribution": "normal", "claimed": 256, "ring": "x^n+1", "sd": 0.7071067811865476}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM", "KE"], "assumption": ["PLWE"], "name": "LAC"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1878, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 411}, "n": {"dim": 1878, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 411}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1878, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 364}, "n": {"dim": 1878, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 364}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1850, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1317, "inst": 0, "rop": 414}, "n": {"dim": 1850, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1317, "inst": 0, "rop": 414}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1848, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 484}, "n": {"dim": 1848, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 484}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1878, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1370, "inst": 0, "rop": 380}, "n": {"dim": 1878, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1370, "inst": 0, "rop": 380}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1771, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1177, "inst": 0, "rop": 682}, "n": {"dim": 1771, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1177, "inst": 0, "rop": 682}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1721, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1092, "inst": 0, "rop": 970}, "n": {"dim": 1721, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1092, "inst": 0, "rop": 970}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1878, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 408}, "n": {"dim": 1878, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 408}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1878, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 374}, "n": {"dim": 1878, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 374}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1666, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1001, "inst": 0, "rop": 1482}, "n": {"dim": 1666, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1001, "inst": 0, "rop": 1482}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1850, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1317, "inst": 0, "rop": 416}, "n": {"dim": 1850, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1317, "inst": 0, "rop": 416}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1803, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1232, "inst": 0, "rop": 565}, "n": {"dim": 1803, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1232, "inst": 0, "rop": 565}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1878, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1370, "inst": 0, "rop": 394}, "n": {"dim": 1878, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1370, "inst": 0, "rop": 394}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1878, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 401}, "n": {"dim": 1878, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1370, "inst": 0, "rop": 401}}}, "key": "LAC-1024-0.71-251", "param": [{"category": [5], "n": 1024, "q": 251, "secret_distribution": "normal", "claimed": 256, "ring": "x^n+1", "sd": 0.7071067811865476}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA-2p"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 739, "inst": 0, "rop": 226}, "n": {"dim": 2036, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 744, "inst": 0, "rop": 227}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 739, "inst": 0, "rop": 196}, "n": {"dim": 2036, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 744, "inst": 0, "rop": 198}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2152, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 739, "inst": 0, "rop": 233}, "n": {"dim": 2036, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 744, "inst": 0, "rop": 234}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 739, "inst": 0, "rop": 272}, "n": {"dim": 2036, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 744, "inst": 0, "rop": 274}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2152, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 739, "inst": 0, "rop": 213}, "n": {"dim": 2036, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 744, "inst": 0, "rop": 214}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2152, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 739, "inst": 0, "rop": 323}, "n": {"dim": 2036, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 744, "inst": 0, "rop": 326}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2152, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 739, "inst": 0, "rop": 582}, "n": {"dim": 2036, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 744, "inst": 0, "rop": 587}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 739, "inst": 0, "rop": 220}, "n": {"dim": 2036, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 744, "inst": 0, "rop": 222}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 739, "inst": 0, "rop": 206}, "n": {"dim": 2036, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 744, "inst": 0, "rop": 207}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2152, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 739, "inst": 0, "rop": 714}, "n": {"dim": 2036, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 744, "inst": 0, "rop": 722}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2152, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 739, "inst": 0, "rop": 247}, "n": {"dim": 2036, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 744, "inst": 0, "rop": 248}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2152, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 739, "inst": 0, "rop": 291}, "n": {"dim": 2036, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 744, "inst": 0, "rop": 294}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2152, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 739, "inst": 0, "rop": 227}, "n": {"dim": 2036, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 744, "inst": 0, "rop": 228}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 739, "inst": 0, "rop": 216}, "n": {"dim": 2036, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 744, "inst": 0, "rop": 218}}}, "key": "LIMA-2p-1024-3.16-133121", "param": [{"category": [3], "n": 1024, "q": 133121, "secret_distribution": "normal", "claimed": 208, "ring": "x^n+1", "sd": 3.1622776601683795}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA-2p"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2282, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 844, "inst": 0, "rop": 257}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 865, "inst": 0, "rop": 263}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2296, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 858, "inst": 0, "rop": 228}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 891, "inst": 0, "rop": 237}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2282, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 844, "inst": 0, "rop": 263}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 865, "inst": 0, "rop": 269}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2258, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 820, "inst": 0, "rop": 302}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 841, "inst": 0, "rop": 310}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2296, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 858, "inst": 0, "rop": 244}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 865, "inst": 0, "rop": 246}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2234, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 797, "inst": 0, "rop": 365}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 808, "inst": 0, "rop": 366}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2193, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 758, "inst": 0, "rop": 602}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 765, "inst": 0, "rop": 609}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2282, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 844, "inst": 0, "rop": 252}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 865, "inst": 0, "rop": 258}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2296, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 858, "inst": 0, "rop": 238}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 865, "inst": 0, "rop": 240}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2165, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 733, "inst": 0, "rop": 705}, "n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 738, "inst": 0, "rop": 713}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2282, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 844, "inst": 0, "rop": 278}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 840, "inst": 0, "rop": 281}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2247, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 810, "inst": 0, "rop": 329}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 831, "inst": 0, "rop": 340}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2296, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 858, "inst": 0, "rop": 258}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 865, "inst": 0, "rop": 260}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2282, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 844, "inst": 0, "rop": 249}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 865, "inst": 0, "rop": 253}}}, "key": "LIMA-2p-1024-3.16-133121", "param": [{"category": [3], "n": 1024, "q": 133121, "secret_distribution": "normal", "claimed": 208, "ring": "x^n+1", "sd": 3.1622776601683795}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA-2p"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4116, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1618, "inst": 0, "rop": 484}, "n": {"dim": 4073, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1619, "inst": 0, "rop": 484}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4116, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1618, "inst": 0, "rop": 429}, "n": {"dim": 4073, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1619, "inst": 0, "rop": 430}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4116, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1618, "inst": 0, "rop": 489}, "n": {"dim": 4073, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1619, "inst": 0, "rop": 490}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4116, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1618, "inst": 0, "rop": 596}, "n": {"dim": 4073, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1619, "inst": 0, "rop": 596}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4116, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1618, "inst": 0, "rop": 446}, "n": {"dim": 4073, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1619, "inst": 0, "rop": 446}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4116, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1618, "inst": 0, "rop": 932}, "n": {"dim": 4073, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1619, "inst": 0, "rop": 933}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4116, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1618, "inst": 0, "rop": 1598}, "n": {"dim": 4073, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1619, "inst": 0, "rop": 1599}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4116, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1618, "inst": 0, "rop": 482}, "n": {"dim": 4073, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1619, "inst": 0, "rop": 482}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4116, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1618, "inst": 0, "rop": 440}, "n": {"dim": 4073, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1619, "inst": 0, "rop": 440}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4116, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1618, "inst": 0, "rop": 2662}, "n": {"dim": 4073, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1619, "inst": 0, "rop": 2665}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4116, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1618, "inst": 0, "rop": 504}, "n": {"dim": 4073, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1619, "inst": 0, "rop": 505}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4116, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1618, "inst": 0, "rop": 799}, "n": {"dim": 4073, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1619, "inst": 0, "rop": 800}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4116, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1618, "inst": 0, "rop": 461}, "n": {"dim": 4073, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1619, "inst": 0, "rop": 461}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4116, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1618, "inst": 0, "rop": 473}, "n": {"dim": 4073, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1619, "inst": 0, "rop": 473}}}, "key": "LIMA-2p-2048-3.16-184321", "param": [{"category": [4], "n": 2048, "q": 184321, "secret_distribution": "normal", "claimed": 444, "ring": "x^n+1", "sd": 3.1622776601683795}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA-2p"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1838, "inst": 0, "rop": 548}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1860, "inst": 0, "rop": 554}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4439, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1865, "inst": 0, "rop": 495}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1860, "inst": 0, "rop": 493}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4413, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1838, "inst": 0, "rop": 554}, "n": {"dim": 4096, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1860, "inst": 0, "rop": 560}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4329, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1750, "inst": 0, "rop": 666}, "n": {"dim": 4096, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1771, "inst": 0, "rop": 652}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4439, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1865, "inst": 0, "rop": 511}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1860, "inst": 0, "rop": 510}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4283, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1704, "inst": 0, "rop": 998}, "n": {"dim": 4096, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1674, "inst": 0, "rop": 987}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4187, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1608, "inst": 0, "rop": 1585}, "n": {"dim": 4096, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1608, "inst": 0, "rop": 1585}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1838, "inst": 0, "rop": 547}, "n": {"dim": 4096, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1860, "inst": 0, "rop": 554}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4439, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1865, "inst": 0, "rop": 506}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1860, "inst": 0, "rop": 504}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4139, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1560, "inst": 0, "rop": 2496}, "n": {"dim": 4096, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1559, "inst": 0, "rop": 2493}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4413, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1838, "inst": 0, "rop": 569}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1860, "inst": 0, "rop": 575}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4286, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1707, "inst": 0, "rop": 855}, "n": {"dim": 4096, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1716, "inst": 0, "rop": 861}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4439, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1865, "inst": 0, "rop": 526}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1860, "inst": 0, "rop": 525}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1838, "inst": 0, "rop": 537}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1860, "inst": 0, "rop": 544}}}, "key": "LIMA-2p-2048-3.16-184321", "param": [{"category": [4], "n": 2048, "q": 184321, "secret_distribution": "normal", "claimed": 444, "ring": "x^n+1", "sd": 3.1622776601683795}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWE"], "name": "R EMBLEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 954, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 121}, "n": {"dim": 954, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 121}}, "0.265\u00a0\u03b2": {"2n": {"dim": 954, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 102}, "n": {"dim": 954, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 102}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 954, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 383, "inst": 0, "rop": 129}, "n": {"dim": 954, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 383, "inst": 0, "rop": 129}}, "0.368\u00a0\u03b2": {"2n": {"dim": 954, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 141}, "n": {"dim": 954, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 141}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 954, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 383, "inst": 0, "rop": 118}, "n": {"dim": 954, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 383, "inst": 0, "rop": 118}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 954, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 383, "inst": 0, "rop": 123}, "n": {"dim": 954, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 383, "inst": 0, "rop": 123}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 954, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 383, "inst": 0, "rop": 242}, "n": {"dim": 954, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 383, "inst": 0, "rop": 242}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 954, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 114}, "n": {"dim": 954, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 114}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 954, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 111}, "n": {"dim": 954, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 111}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 954, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 270}, "n": {"dim": 954, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 270}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 954, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 142}, "n": {"dim": 954, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 142}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 954, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 383, "inst": 0, "rop": 121}, "n": {"dim": 954, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 383, "inst": 0, "rop": 121}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 954, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 131}, "n": {"dim": 954, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 131}}, "0.292\u00a0\u03b2": {"2n": {"dim": 954, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 112}, "n": {"dim": 954, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 112}}}, "key": "R EMBLEM-0512-25.00-65536", "param": [{"category": [1], "n": 512, "q": 65536, "secret_distribution": "(-1, 1)", "claimed": 128, "ring": "x^n+1 \\text{ \\textdagger}", "sd": 25.0}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWE"], "name": "R EMBLEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1026, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 459, "inst": 0, "rop": 143}, "n": {"dim": 1009, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 457, "inst": 0, "rop": 143}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1034, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 469, "inst": 0, "rop": 127}, "n": {"dim": 1008, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 474, "inst": 0, "rop": 126}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1019, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 451, "inst": 0, "rop": 149}, "n": {"dim": 1008, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 453, "inst": 0, "rop": 149}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1013, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 442, "inst": 0, "rop": 163}, "n": {"dim": 1008, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 444, "inst": 0, "rop": 164}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1026, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 459, "inst": 0, "rop": 139}, "n": {"dim": 1008, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 455, "inst": 0, "rop": 139}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1013, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 443, "inst": 0, "rop": 155}, "n": {"dim": 1008, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 444, "inst": 0, "rop": 155}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 948, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 384, "inst": 0, "rop": 247}, "n": {"dim": 976, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 398, "inst": 0, "rop": 255}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1026, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 459, "inst": 0, "rop": 137}, "n": {"dim": 1008, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 461, "inst": 0, "rop": 138}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1034, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 469, "inst": 0, "rop": 134}, "n": {"dim": 1008, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 464, "inst": 0, "rop": 133}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 946, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 378, "inst": 0, "rop": 265}, "n": {"dim": 970, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 388, "inst": 0, "rop": 275}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1013, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 442, "inst": 0, "rop": 159}, "n": {"dim": 1008, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 444, "inst": 0, "rop": 160}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1020, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 451, "inst": 0, "rop": 151}, "n": {"dim": 1008, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 452, "inst": 0, "rop": 152}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1019, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 451, "inst": 0, "rop": 149}, "n": {"dim": 1008, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 447, "inst": 0, "rop": 150}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1026, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 459, "inst": 0, "rop": 136}, "n": {"dim": 1008, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 461, "inst": 0, "rop": 135}}}, "key": "R EMBLEM-0512-25.00-65536", "param": [{"category": [1], "n": 512, "q": 65536, "secret_distribution": "(-1, 1)", "claimed": 128, "ring": "x^n+1 \\text{ \\textdagger}", "sd": 25.0}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWE"], "name": "R EMBLEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 947, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 110}, "n": {"dim": 947, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 110}}, "0.265\u00a0\u03b2": {"2n": {"dim": 947, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 92}, "n": {"dim": 947, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 92}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 947, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 345, "inst": 0, "rop": 118}, "n": {"dim": 947, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 345, "inst": 0, "rop": 118}}, "0.368\u00a0\u03b2": {"2n": {"dim": 947, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 127}, "n": {"dim": 947, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 127}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 947, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 345, "inst": 0, "rop": 108}, "n": {"dim": 947, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 345, "inst": 0, "rop": 108}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 947, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 345, "inst": 0, "rop": 105}, "n": {"dim": 947, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 345, "inst": 0, "rop": 105}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 947, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 345, "inst": 0, "rop": 210}, "n": {"dim": 947, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 345, "inst": 0, "rop": 210}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 947, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 103}, "n": {"dim": 947, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 103}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 947, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 100}, "n": {"dim": 947, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 100}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 947, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 345, "inst": 0, "rop": 234}, "n": {"dim": 947, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 345, "inst": 0, "rop": 234}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 947, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 345, "inst": 0, "rop": 131}, "n": {"dim": 947, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 345, "inst": 0, "rop": 131}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 947, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 345, "inst": 0, "rop": 105}, "n": {"dim": 947, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 345, "inst": 0, "rop": 105}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 947, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 345, "inst": 0, "rop": 121}, "n": {"dim": 947, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 345, "inst": 0, "rop": 121}}, "0.292\u00a0\u03b2": {"2n": {"dim": 947, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 101}, "n": {"dim": 947, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 101}}}, "key": "R EMBLEM-0512-3.00-16384", "param": [{"category": [1], "n": 512, "q": 16384, "secret_distribution": "(-1, 1)", "claimed": 128, "ring": "x^n+1 \\text{ \\textdagger}", "sd": 3.0}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWE"], "name": "R EMBLEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1031, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 409, "inst": 0, "rop": 129}, "n": {"dim": 1008, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 405, "inst": 0, "rop": 129}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1041, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 420, "inst": 0, "rop": 113}, "n": {"dim": 1008, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 424, "inst": 0, "rop": 113}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1025, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 401, "inst": 0, "rop": 134}, "n": {"dim": 1008, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 405, "inst": 0, "rop": 135}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1016, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 392, "inst": 0, "rop": 146}, "n": {"dim": 1008, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 395, "inst": 0, "rop": 146}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1034, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 412, "inst": 0, "rop": 126}, "n": {"dim": 1008, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 409, "inst": 0, "rop": 126}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1028, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 405, "inst": 0, "rop": 134}, "n": {"dim": 1008, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 402, "inst": 0, "rop": 133}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 986, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 359, "inst": 0, "rop": 221}, "n": {"dim": 986, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 357, "inst": 0, "rop": 220}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1031, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 409, "inst": 0, "rop": 124}, "n": {"dim": 1008, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 412, "inst": 0, "rop": 123}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1040, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 417, "inst": 0, "rop": 120}, "n": {"dim": 1008, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 416, "inst": 0, "rop": 120}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 979, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 352, "inst": 0, "rop": 240}, "n": {"dim": 978, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 350, "inst": 0, "rop": 239}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1018, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 394, "inst": 0, "rop": 145}, "n": {"dim": 1008, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 397, "inst": 0, "rop": 146}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1028, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 405, "inst": 0, "rop": 131}, "n": {"dim": 1008, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 402, "inst": 0, "rop": 132}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1028, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 404, "inst": 0, "rop": 137}, "n": {"dim": 1008, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 401, "inst": 0, "rop": 136}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1038, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 416, "inst": 0, "rop": 122}, "n": {"dim": 1008, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 412, "inst": 0, "rop": 122}}}, "key": "R EMBLEM-0512-3.00-16384", "param": [{"category": [1], "n": 512, "q": 16384, "secret_distribution": "(-1, 1)", "claimed": 128, "ring": "x^n+1 \\text{ \\textdagger}", "sd": 3.0}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA\u2011sp"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2080, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 465, "inst": 0, "rop": 145}, "n": {"dim": 2019, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 146}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2080, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 465, "inst": 0, "rop": 124}, "n": {"dim": 2019, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 125}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2080, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 465, "inst": 0, "rop": 153}, "n": {"dim": 2019, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 468, "inst": 0, "rop": 154}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2080, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 465, "inst": 0, "rop": 172}, "n": {"dim": 2019, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 173}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2080, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 465, "inst": 0, "rop": 140}, "n": {"dim": 2019, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 468, "inst": 0, "rop": 141}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2080, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 465, "inst": 0, "rop": 166}, "n": {"dim": 2019, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 468, "inst": 0, "rop": 167}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2080, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 465, "inst": 0, "rop": 314}, "n": {"dim": 2019, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 468, "inst": 0, "rop": 317}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2080, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 465, "inst": 0, "rop": 139}, "n": {"dim": 2019, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 140}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2080, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 465, "inst": 0, "rop": 133}, "n": {"dim": 2019, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 133}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2080, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 465, "inst": 0, "rop": 355}, "n": {"dim": 2019, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 468, "inst": 0, "rop": 358}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2080, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 465, "inst": 0, "rop": 167}, "n": {"dim": 2019, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 468, "inst": 0, "rop": 168}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2080, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 465, "inst": 0, "rop": 157}, "n": {"dim": 2019, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 468, "inst": 0, "rop": 159}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2080, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 465, "inst": 0, "rop": 154}, "n": {"dim": 2019, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 468, "inst": 0, "rop": 155}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2080, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 465, "inst": 0, "rop": 136}, "n": {"dim": 2019, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 468, "inst": 0, "rop": 137}}}, "key": "LIMA\u2011sp-1018-3.16-12521473", "param": [{"category": [1], "n": 1018, "q": 12521473, "secret_distribution": "normal", "claimed": 139, "ring": "\\sum_{i=0}^n x^i", "sd": 3.1622776601683795}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA\u2011sp"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2251, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 525, "inst": 0, "rop": 163}, "n": {"dim": 2036, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 525, "inst": 0, "rop": 164}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2261, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 141}, "n": {"dim": 2036, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 143}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2251, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 525, "inst": 0, "rop": 170}, "n": {"dim": 2036, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 525, "inst": 0, "rop": 170}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2234, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 514, "inst": 0, "rop": 190}, "n": {"dim": 2036, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 514, "inst": 0, "rop": 191}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2244, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 521, "inst": 0, "rop": 157}, "n": {"dim": 2036, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 536, "inst": 0, "rop": 159}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2237, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 516, "inst": 0, "rop": 193}, "n": {"dim": 2036, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 516, "inst": 0, "rop": 193}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2184, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 483, "inst": 0, "rop": 331}, "n": {"dim": 2036, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 483, "inst": 0, "rop": 331}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2251, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 525, "inst": 0, "rop": 157}, "n": {"dim": 2036, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 160}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2261, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 151}, "n": {"dim": 2036, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 152}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2171, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 475, "inst": 0, "rop": 366}, "n": {"dim": 2036, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 479, "inst": 0, "rop": 371}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2234, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 514, "inst": 0, "rop": 181}, "n": {"dim": 2036, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 525, "inst": 0, "rop": 184}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2237, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 516, "inst": 0, "rop": 181}, "n": {"dim": 2036, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 525, "inst": 0, "rop": 185}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2244, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 521, "inst": 0, "rop": 169}, "n": {"dim": 2036, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 525, "inst": 0, "rop": 170}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2251, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 525, "inst": 0, "rop": 154}, "n": {"dim": 2036, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 536, "inst": 0, "rop": 157}}}, "key": "LIMA\u2011sp-1018-3.16-12521473", "param": [{"category": [1], "n": 1018, "q": 12521473, "secret_distribution": "normal", "claimed": 139, "ring": "\\sum_{i=0}^n x^i", "sd": 3.1622776601683795}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA\u2011sp"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2713, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 573, "inst": 0, "rop": 177}, "n": {"dim": 2600, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 574, "inst": 0, "rop": 177}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2713, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 573, "inst": 0, "rop": 152}, "n": {"dim": 2600, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 574, "inst": 0, "rop": 153}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2713, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 573, "inst": 0, "rop": 184}, "n": {"dim": 2600, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 574, "inst": 0, "rop": 185}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2713, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 573, "inst": 0, "rop": 211}, "n": {"dim": 2600, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 574, "inst": 0, "rop": 212}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2713, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 573, "inst": 0, "rop": 169}, "n": {"dim": 2600, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 574, "inst": 0, "rop": 169}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2713, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 573, "inst": 0, "rop": 225}, "n": {"dim": 2600, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 574, "inst": 0, "rop": 225}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2713, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 573, "inst": 0, "rop": 416}, "n": {"dim": 2600, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 574, "inst": 0, "rop": 417}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2713, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 573, "inst": 0, "rop": 171}, "n": {"dim": 2600, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 574, "inst": 0, "rop": 171}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2713, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 573, "inst": 0, "rop": 162}, "n": {"dim": 2600, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 574, "inst": 0, "rop": 162}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2713, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 573, "inst": 0, "rop": 483}, "n": {"dim": 2600, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 574, "inst": 0, "rop": 484}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2713, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 573, "inst": 0, "rop": 199}, "n": {"dim": 2600, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 574, "inst": 0, "rop": 199}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2713, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 573, "inst": 0, "rop": 208}, "n": {"dim": 2600, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 574, "inst": 0, "rop": 209}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2713, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 573, "inst": 0, "rop": 183}, "n": {"dim": 2600, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 574, "inst": 0, "rop": 183}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2713, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 573, "inst": 0, "rop": 168}, "n": {"dim": 2600, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 574, "inst": 0, "rop": 168}}}, "key": "LIMA\u2011sp-1306-3.16-48181249", "param": [{"category": [2], "n": 1306, "q": 48181249, "secret_distribution": "normal", "claimed": 167, "ring": "\\sum_{i=0}^n x^i", "sd": 3.1622776601683795}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA\u2011sp"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2854, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 643, "inst": 0, "rop": 198}, "n": {"dim": 2612, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 638, "inst": 0, "rop": 196}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2854, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 643, "inst": 0, "rop": 171}, "n": {"dim": 2612, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 654, "inst": 0, "rop": 174}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2829, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 628, "inst": 0, "rop": 201}, "n": {"dim": 2612, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 638, "inst": 0, "rop": 203}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2829, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 628, "inst": 0, "rop": 232}, "n": {"dim": 2612, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 635, "inst": 0, "rop": 234}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2854, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 643, "inst": 0, "rop": 187}, "n": {"dim": 2612, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 638, "inst": 0, "rop": 187}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2824, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 625, "inst": 0, "rop": 255}, "n": {"dim": 2612, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 628, "inst": 0, "rop": 257}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2765, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 589, "inst": 0, "rop": 431}, "n": {"dim": 2612, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 594, "inst": 0, "rop": 436}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2854, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 643, "inst": 0, "rop": 192}, "n": {"dim": 2612, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 638, "inst": 0, "rop": 190}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2854, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 643, "inst": 0, "rop": 180}, "n": {"dim": 2612, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 654, "inst": 0, "rop": 183}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2749, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 580, "inst": 0, "rop": 492}, "n": {"dim": 2612, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 577, "inst": 0, "rop": 488}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2829, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 628, "inst": 0, "rop": 215}, "n": {"dim": 2612, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 638, "inst": 0, "rop": 218}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2819, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 622, "inst": 0, "rop": 232}, "n": {"dim": 2612, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 621, "inst": 0, "rop": 235}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2829, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 628, "inst": 0, "rop": 199}, "n": {"dim": 2612, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 638, "inst": 0, "rop": 200}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2854, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 643, "inst": 0, "rop": 188}, "n": {"dim": 2612, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 638, "inst": 0, "rop": 188}}}, "key": "LIMA\u2011sp-1306-3.16-48181249", "param": [{"category": [2], "n": 1306, "q": 48181249, "secret_distribution": "normal", "claimed": 167, "ring": "\\sum_{i=0}^n x^i", "sd": 3.1622776601683795}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA\u2011sp"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3734, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 875, "inst": 0, "rop": 266}, "n": {"dim": 3613, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 877, "inst": 0, "rop": 266}}, "0.265\u00a0\u03b2": {"2n": {"dim": 3734, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 875, "inst": 0, "rop": 232}, "n": {"dim": 3613, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 877, "inst": 0, "rop": 233}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3734, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 875, "inst": 0, "rop": 272}, "n": {"dim": 3613, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 877, "inst": 0, "rop": 273}}, "0.368\u00a0\u03b2": {"2n": {"dim": 3734, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 875, "inst": 0, "rop": 322}, "n": {"dim": 3613, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 877, "inst": 0, "rop": 323}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3734, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 875, "inst": 0, "rop": 249}, "n": {"dim": 3613, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 877, "inst": 0, "rop": 249}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 3734, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 875, "inst": 0, "rop": 409}, "n": {"dim": 3613, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 877, "inst": 0, "rop": 410}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 3734, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 875, "inst": 0, "rop": 726}, "n": {"dim": 3613, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 877, "inst": 0, "rop": 728}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 3734, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 875, "inst": 0, "rop": 261}, "n": {"dim": 3613, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 877, "inst": 0, "rop": 261}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3734, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 875, "inst": 0, "rop": 242}, "n": {"dim": 3613, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 877, "inst": 0, "rop": 243}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3734, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 875, "inst": 0, "rop": 937}, "n": {"dim": 3613, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 877, "inst": 0, "rop": 940}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3734, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 875, "inst": 0, "rop": 287}, "n": {"dim": 3613, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 877, "inst": 0, "rop": 288}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 3734, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 875, "inst": 0, "rop": 363}, "n": {"dim": 3613, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 877, "inst": 0, "rop": 364}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3734, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 875, "inst": 0, "rop": 264}, "n": {"dim": 3613, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 877, "inst": 0, "rop": 264}}, "0.292\u00a0\u03b2": {"2n": {"dim": 3734, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 875, "inst": 0, "rop": 256}, "n": {"dim": 3613, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 877, "inst": 0, "rop": 257}}}, "key": "LIMA\u2011sp-1822-3.16-44802049", "param": [{"category": [3], "n": 1822, "q": 44802049, "secret_distribution": "normal", "claimed": 247, "ring": "\\sum_{i=0}^n x^i", "sd": 3.1622776601683795}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA\u2011sp"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3908, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 291}, "n": {"dim": 3644, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 974, "inst": 0, "rop": 295}}, "0.265\u00a0\u03b2": {"2n": {"dim": 3908, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 260}, "n": {"dim": 3644, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 974, "inst": 0, "rop": 259}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3908, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 962, "inst": 0, "rop": 298}, "n": {"dim": 3644, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 974, "inst": 0, "rop": 301}}, "0.368\u00a0\u03b2": {"2n": {"dim": 3882, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 946, "inst": 0, "rop": 349}, "n": {"dim": 3644, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 950, "inst": 0, "rop": 350}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3908, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 962, "inst": 0, "rop": 272}, "n": {"dim": 3644, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 974, "inst": 0, "rop": 275}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 3834, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 915, "inst": 0, "rop": 448}, "n": {"dim": 3644, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 918, "inst": 0, "rop": 445}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 3797, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 892, "inst": 0, "rop": 745}, "n": {"dim": 3644, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 897, "inst": 0, "rop": 750}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 3908, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 287}, "n": {"dim": 3644, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 974, "inst": 0, "rop": 290}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3908, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 265}, "n": {"dim": 3644, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 974, "inst": 0, "rop": 269}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3772, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 876, "inst": 0, "rop": 939}, "n": {"dim": 3644, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 875, "inst": 0, "rop": 937}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3908, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 962, "inst": 0, "rop": 313}, "n": {"dim": 3644, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 974, "inst": 0, "rop": 316}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 3875, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 941, "inst": 0, "rop": 399}, "n": {"dim": 3644, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 947, "inst": 0, "rop": 403}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3908, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 962, "inst": 0, "rop": 287}, "n": {"dim": 3644, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 974, "inst": 0, "rop": 290}}, "0.292\u00a0\u03b2": {"2n": {"dim": 3908, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 281}, "n": {"dim": 3644, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 974, "inst": 0, "rop": 285}}}, "key": "LIMA\u2011sp-1822-3.16-44802049", "param": [{"category": [3], "n": 1822, "q": 44802049, "secret_distribution": "normal", "claimed": 247, "ring": "\\sum_{i=0}^n x^i", "sd": 3.1622776601683795}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA\u2011sp"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4190, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1097, "inst": 0, "rop": 331}, "n": {"dim": 4122, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 331}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4190, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1097, "inst": 0, "rop": 291}, "n": {"dim": 4122, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 291}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4190, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1097, "inst": 0, "rop": 337}, "n": {"dim": 4122, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1098, "inst": 0, "rop": 338}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4190, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1097, "inst": 0, "rop": 404}, "n": {"dim": 4122, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 405}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4190, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1097, "inst": 0, "rop": 308}, "n": {"dim": 4122, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1098, "inst": 0, "rop": 308}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4190, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1097, "inst": 0, "rop": 556}, "n": {"dim": 4122, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1098, "inst": 0, "rop": 557}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4190, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1097, "inst": 0, "rop": 973}, "n": {"dim": 4122, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1098, "inst": 0, "rop": 975}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4190, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1097, "inst": 0, "rop": 327}, "n": {"dim": 4122, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 327}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4190, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1097, "inst": 0, "rop": 301}, "n": {"dim": 4122, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 302}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4190, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1097, "inst": 0, "rop": 1362}, "n": {"dim": 4122, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1098, "inst": 0, "rop": 1364}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4190, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1097, "inst": 0, "rop": 352}, "n": {"dim": 4122, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1098, "inst": 0, "rop": 353}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4190, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1097, "inst": 0, "rop": 487}, "n": {"dim": 4122, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1098, "inst": 0, "rop": 488}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4190, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1097, "inst": 0, "rop": 323}, "n": {"dim": 4122, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1098, "inst": 0, "rop": 323}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4190, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1097, "inst": 0, "rop": 321}, "n": {"dim": 4122, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1098, "inst": 0, "rop": 321}}}, "key": "LIMA\u2011sp-2062-3.16-16900097", "param": [{"category": [4], "n": 2062, "q": 16900097, "secret_distribution": "normal", "claimed": 303, "ring": "\\sum_{i=0}^n x^i", "sd": 3.1622776601683795}]}, {"attack": "dual", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["RLWE"], "name": "LIMA\u2011sp"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4386, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1194, "inst": 0, "rop": 361}, "n": {"dim": 4124, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1207, "inst": 0, "rop": 363}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4405, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1207, "inst": 0, "rop": 322}, "n": {"dim": 4124, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1253, "inst": 0, "rop": 333}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4386, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1194, "inst": 0, "rop": 366}, "n": {"dim": 4124, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1207, "inst": 0, "rop": 369}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4386, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1194, "inst": 0, "rop": 440}, "n": {"dim": 4124, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1207, "inst": 0, "rop": 445}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4405, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1207, "inst": 0, "rop": 337}, "n": {"dim": 4124, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1207, "inst": 0, "rop": 341}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4353, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1170, "inst": 0, "rop": 607}, "n": {"dim": 4124, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1177, "inst": 0, "rop": 612}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4242, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1094, "inst": 0, "rop": 970}, "n": {"dim": 4124, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1122, "inst": 0, "rop": 1002}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4386, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1194, "inst": 0, "rop": 360}, "n": {"dim": 4124, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1207, "inst": 0, "rop": 360}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4405, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1207, "inst": 0, "rop": 331}, "n": {"dim": 4124, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1207, "inst": 0, "rop": 341}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4208, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1071, "inst": 0, "rop": 1308}, "n": {"dim": 4124, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1073, "inst": 0, "rop": 1312}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4386, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1194, "inst": 0, "rop": 381}, "n": {"dim": 4124, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1207, "inst": 0, "rop": 384}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4353, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1170, "inst": 0, "rop": 529}, "n": {"dim": 4124, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1177, "inst": 0, "rop": 533}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4405, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1207, "inst": 0, "rop": 352}, "n": {"dim": 4124, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1207, "inst": 0, "rop": 352}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4386, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1194, "inst": 0, "rop": 360}, "n": {"dim": 4124, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1207, "inst": 0, "rop": 353}}}, "key": "LIMA\u2011sp-2062-3.16-16900097", "param": [{"category": [4], "n": 2062, "q": 16900097, "secret_distribution": "normal", "claimed": 303, "ring": "\\sum_{i=0}^n x^i", "sd": 3.1622776601683795}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWR"], "name": "LightSaber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1087, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 426, "inst": 0, "rop": 134}, "n": {"dim": 1023, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 134}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1087, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 426, "inst": 0, "rop": 113}, "n": {"dim": 1023, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 114}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1087, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 426, "inst": 0, "rop": 141}, "n": {"dim": 1023, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 428, "inst": 0, "rop": 142}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1087, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 426, "inst": 0, "rop": 157}, "n": {"dim": 1023, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 158}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1087, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 426, "inst": 0, "rop": 130}, "n": {"dim": 1023, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 428, "inst": 0, "rop": 130}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1087, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 426, "inst": 0, "rop": 145}, "n": {"dim": 1023, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 428, "inst": 0, "rop": 146}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1087, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 426, "inst": 0, "rop": 279}, "n": {"dim": 1023, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 428, "inst": 0, "rop": 281}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1087, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 426, "inst": 0, "rop": 127}, "n": {"dim": 1023, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 128}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1087, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 426, "inst": 0, "rop": 122}, "n": {"dim": 1023, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 123}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1087, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 426, "inst": 0, "rop": 313}, "n": {"dim": 1023, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 428, "inst": 0, "rop": 315}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1087, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 426, "inst": 0, "rop": 154}, "n": {"dim": 1023, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 428, "inst": 0, "rop": 155}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1087, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 426, "inst": 0, "rop": 140}, "n": {"dim": 1023, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 428, "inst": 0, "rop": 141}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1087, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 426, "inst": 0, "rop": 143}, "n": {"dim": 1023, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 428, "inst": 0, "rop": 143}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1087, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 426, "inst": 0, "rop": 125}, "n": {"dim": 1023, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 428, "inst": 0, "rop": 125}}}, "key": "LightSaber-0512-2.29-8192", "param": [{"category": [1], "k": 2, "n": 512, "q": 8192, "secret_distribution": "normal", "claimed": 115, "ring": "x^{n/k} + 1", "sd": 2.29128784747792}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWR"], "name": "LightSaber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1182, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 521, "inst": 0, "rop": 162}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 520, "inst": 0, "rop": 169}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1191, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 532, "inst": 0, "rop": 142}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 534, "inst": 0, "rop": 153}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1173, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 510, "inst": 0, "rop": 166}, "n": {"dim": 1024, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 520, "inst": 0, "rop": 170}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1160, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 495, "inst": 0, "rop": 186}, "n": {"dim": 1024, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 509, "inst": 0, "rop": 188}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1182, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 521, "inst": 0, "rop": 155}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 534, "inst": 0, "rop": 158}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1160, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 495, "inst": 0, "rop": 186}, "n": {"dim": 1024, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 479, "inst": 0, "rop": 224}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1120, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 447, "inst": 0, "rop": 299}, "n": {"dim": 1024, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 453, "inst": 0, "rop": 303}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1179, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 517, "inst": 0, "rop": 155}, "n": {"dim": 1024, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 520, "inst": 0, "rop": 169}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1182, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 521, "inst": 0, "rop": 150}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 534, "inst": 0, "rop": 153}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1112, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 439, "inst": 0, "rop": 328}, "n": {"dim": 1024, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 444, "inst": 0, "rop": 332}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1164, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 499, "inst": 0, "rop": 178}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 520, "inst": 0, "rop": 182}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1169, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 505, "inst": 0, "rop": 176}, "n": {"dim": 1024, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 520, "inst": 0, "rop": 183}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1173, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 510, "inst": 0, "rop": 166}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 523, "inst": 0, "rop": 169}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1182, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 521, "inst": 0, "rop": 153}, "n": {"dim": 1024, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 520, "inst": 0, "rop": 169}}}, "key": "LightSaber-0512-2.29-8192", "param": [{"category": [1], "k": 2, "n": 512, "q": 8192, "secret_distribution": "normal", "claimed": 115, "ring": "x^{n/k} + 1", "sd": 2.29128784747792}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWE"], "name": "EMBLEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1462, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 107}, "n": {"dim": 1462, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 107}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1462, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 90}, "n": {"dim": 1462, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 90}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1462, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 337, "inst": 0, "rop": 115}, "n": {"dim": 1462, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 337, "inst": 0, "rop": 115}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1462, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 125}, "n": {"dim": 1462, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 125}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1462, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 337, "inst": 0, "rop": 106}, "n": {"dim": 1462, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 337, "inst": 0, "rop": 106}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1462, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 337, "inst": 0, "rop": 101}, "n": {"dim": 1462, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 337, "inst": 0, "rop": 101}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1495, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 335, "inst": 0, "rop": 203}, "n": {"dim": 1495, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 335, "inst": 0, "rop": 203}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1462, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 101}, "n": {"dim": 1462, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 101}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1462, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 98}, "n": {"dim": 1462, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 98}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1495, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 335, "inst": 0, "rop": 227}, "n": {"dim": 1495, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 335, "inst": 0, "rop": 227}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1462, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 337, "inst": 0, "rop": 129}, "n": {"dim": 1462, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 337, "inst": 0, "rop": 129}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1462, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 337, "inst": 0, "rop": 102}, "n": {"dim": 1462, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 337, "inst": 0, "rop": 102}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1462, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 337, "inst": 0, "rop": 120}, "n": {"dim": 1462, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 337, "inst": 0, "rop": 120}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1462, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 99}, "n": {"dim": 1462, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 337, "inst": 0, "rop": 99}}}, "key": "EMBLEM-0770-25.00-16777216", "param": [{"category": [1], "n": 770, "q": 16777216, "secret_distribution": "(-1, 1)", "claimed": 128, "sd": 25.0}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWE"], "name": "EMBLEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1543, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 119}, "n": {"dim": 1516, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 375, "inst": 0, "rop": 119}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1558, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 386, "inst": 0, "rop": 103}, "n": {"dim": 1518, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 387, "inst": 0, "rop": 103}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1534, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 371, "inst": 0, "rop": 125}, "n": {"dim": 1516, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 375, "inst": 0, "rop": 126}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1527, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 365, "inst": 0, "rop": 135}, "n": {"dim": 1516, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 365, "inst": 0, "rop": 135}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1543, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 378, "inst": 0, "rop": 117}, "n": {"dim": 1516, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 379, "inst": 0, "rop": 117}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1546, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 375, "inst": 0, "rop": 121}, "n": {"dim": 1516, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 375, "inst": 0, "rop": 120}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1494, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 343, "inst": 0, "rop": 208}, "n": {"dim": 1493, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 342, "inst": 0, "rop": 207}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1549, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 379, "inst": 0, "rop": 114}, "n": {"dim": 1516, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 381, "inst": 0, "rop": 114}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1553, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 384, "inst": 0, "rop": 111}, "n": {"dim": 1519, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 381, "inst": 0, "rop": 110}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1484, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 337, "inst": 0, "rop": 227}, "n": {"dim": 1489, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 338, "inst": 0, "rop": 229}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1525, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 365, "inst": 0, "rop": 137}, "n": {"dim": 1516, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 368, "inst": 0, "rop": 138}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1542, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 377, "inst": 0, "rop": 119}, "n": {"dim": 1516, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 375, "inst": 0, "rop": 118}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1534, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 371, "inst": 0, "rop": 129}, "n": {"dim": 1516, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 373, "inst": 0, "rop": 129}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1549, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 379, "inst": 0, "rop": 112}, "n": {"dim": 1516, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 381, "inst": 0, "rop": 112}}}, "key": "EMBLEM-0770-25.00-16777216", "param": [{"category": [1], "n": 770, "q": 16777216, "secret_distribution": "(-1, 1)", "claimed": 128, "sd": 25.0}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWE"], "name": "EMBLEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1229, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 259, "inst": 0, "rop": 84}, "n": {"dim": 1190, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 260, "inst": 0, "rop": 84}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1229, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 259, "inst": 0, "rop": 69}, "n": {"dim": 1190, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 260, "inst": 0, "rop": 69}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1229, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 259, "inst": 0, "rop": 93}, "n": {"dim": 1190, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 260, "inst": 0, "rop": 93}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1229, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 259, "inst": 0, "rop": 96}, "n": {"dim": 1190, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 260, "inst": 0, "rop": 96}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1229, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 259, "inst": 0, "rop": 86}, "n": {"dim": 1190, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 260, "inst": 0, "rop": 86}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1229, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 259, "inst": 0, "rop": 66}, "n": {"dim": 1190, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 260, "inst": 0, "rop": 67}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1229, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 259, "inst": 0, "rop": 141}, "n": {"dim": 1190, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 260, "inst": 0, "rop": 142}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1229, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 259, "inst": 0, "rop": 78}, "n": {"dim": 1190, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 260, "inst": 0, "rop": 78}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1229, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 259, "inst": 0, "rop": 77}, "n": {"dim": 1190, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 260, "inst": 0, "rop": 77}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1229, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 259, "inst": 0, "rop": 162}, "n": {"dim": 1190, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 260, "inst": 0, "rop": 163}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1229, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 259, "inst": 0, "rop": 106}, "n": {"dim": 1190, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 260, "inst": 0, "rop": 106}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1229, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 259, "inst": 0, "rop": 71}, "n": {"dim": 1190, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 260, "inst": 0, "rop": 71}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1229, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 259, "inst": 0, "rop": 99}, "n": {"dim": 1190, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 260, "inst": 0, "rop": 99}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1229, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 259, "inst": 0, "rop": 76}, "n": {"dim": 1190, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 260, "inst": 0, "rop": 76}}}, "key": "EMBLEM-0611-25.00-16777216", "param": [{"category": [1], "n": 611, "q": 16777216, "secret_distribution": "(-2, 2)", "claimed": 128, "sd": 25.0}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWE"], "name": "EMBLEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1309, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 300, "inst": 0, "rop": 97}, "n": {"dim": 1213, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 306, "inst": 0, "rop": 98}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1330, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 315, "inst": 0, "rop": 84}, "n": {"dim": 1213, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 315, "inst": 0, "rop": 85}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1303, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 296, "inst": 0, "rop": 104}, "n": {"dim": 1213, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 301, "inst": 0, "rop": 105}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1290, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 292, "inst": 0, "rop": 108}, "n": {"dim": 1214, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 110}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1309, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 300, "inst": 0, "rop": 97}, "n": {"dim": 1213, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 306, "inst": 0, "rop": 98}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1317, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 306, "inst": 0, "rop": 89}, "n": {"dim": 1214, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 310, "inst": 0, "rop": 90}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1255, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 271, "inst": 0, "rop": 151}, "n": {"dim": 1203, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 272, "inst": 0, "rop": 152}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1316, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 305, "inst": 0, "rop": 92}, "n": {"dim": 1213, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 310, "inst": 0, "rop": 93}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1309, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 305, "inst": 0, "rop": 90}, "n": {"dim": 1213, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 310, "inst": 0, "rop": 91}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1250, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 266, "inst": 0, "rop": 168}, "n": {"dim": 1205, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 268, "inst": 0, "rop": 169}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1296, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 291, "inst": 0, "rop": 115}, "n": {"dim": 1208, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 288, "inst": 0, "rop": 115}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1317, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 306, "inst": 0, "rop": 90}, "n": {"dim": 1213, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 309, "inst": 0, "rop": 91}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1289, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 291, "inst": 0, "rop": 107}, "n": {"dim": 1213, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 296, "inst": 0, "rop": 109}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1309, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 305, "inst": 0, "rop": 90}, "n": {"dim": 1213, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 310, "inst": 0, "rop": 91}}}, "key": "EMBLEM-0611-25.00-16777216", "param": [{"category": [1], "n": 611, "q": 16777216, "secret_distribution": "(-2, 2)", "claimed": 128, "sd": 25.0}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWR"], "name": "Saber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1583, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 693, "inst": 0, "rop": 212}, "n": {"dim": 1527, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 213}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1583, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 693, "inst": 0, "rop": 184}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 185}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1583, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 693, "inst": 0, "rop": 219}, "n": {"dim": 1527, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 695, "inst": 0, "rop": 220}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1583, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 693, "inst": 0, "rop": 256}, "n": {"dim": 1527, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 256}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1583, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 693, "inst": 0, "rop": 201}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 695, "inst": 0, "rop": 201}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1583, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 693, "inst": 0, "rop": 295}, "n": {"dim": 1527, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 695, "inst": 0, "rop": 296}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1583, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 693, "inst": 0, "rop": 535}, "n": {"dim": 1527, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 695, "inst": 0, "rop": 537}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1583, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 693, "inst": 0, "rop": 207}, "n": {"dim": 1527, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 207}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1583, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 693, "inst": 0, "rop": 194}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 194}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1583, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 693, "inst": 0, "rop": 645}, "n": {"dim": 1527, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 695, "inst": 0, "rop": 648}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1583, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 693, "inst": 0, "rop": 233}, "n": {"dim": 1527, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 695, "inst": 0, "rop": 233}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1583, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 693, "inst": 0, "rop": 268}, "n": {"dim": 1527, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 695, "inst": 0, "rop": 269}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1583, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 693, "inst": 0, "rop": 214}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 695, "inst": 0, "rop": 215}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1583, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 693, "inst": 0, "rop": 203}, "n": {"dim": 1527, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 695, "inst": 0, "rop": 203}}}, "key": "Saber-0768-2.29-8192", "param": [{"category": [3], "k": 3, "n": 768, "q": 8192, "secret_distribution": "normal", "claimed": 180, "ring": "x^{n/k} + 1", "sd": 2.29128784747792}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWR"], "name": "Saber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1716, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 829, "inst": 0, "rop": 252}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 835, "inst": 0, "rop": 254}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1716, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 829, "inst": 0, "rop": 224}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 851, "inst": 0, "rop": 226}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1698, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 806, "inst": 0, "rop": 258}, "n": {"dim": 1536, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 835, "inst": 0, "rop": 261}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1692, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 798, "inst": 0, "rop": 294}, "n": {"dim": 1536, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 812, "inst": 0, "rop": 299}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1716, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 829, "inst": 0, "rop": 237}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 851, "inst": 0, "rop": 242}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1663, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 762, "inst": 0, "rop": 345}, "n": {"dim": 1536, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 771, "inst": 0, "rop": 343}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1625, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 716, "inst": 0, "rop": 559}, "n": {"dim": 1536, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 703, "inst": 0, "rop": 555}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1716, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 829, "inst": 0, "rop": 247}, "n": {"dim": 1536, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 835, "inst": 0, "rop": 249}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1716, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 829, "inst": 0, "rop": 230}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 851, "inst": 0, "rop": 236}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1598, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 685, "inst": 0, "rop": 635}, "n": {"dim": 1536, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 689, "inst": 0, "rop": 640}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1698, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 806, "inst": 0, "rop": 266}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 812, "inst": 0, "rop": 268}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1680, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 783, "inst": 0, "rop": 314}, "n": {"dim": 1536, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 793, "inst": 0, "rop": 320}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1716, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 829, "inst": 0, "rop": 250}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 827, "inst": 0, "rop": 250}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1716, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 829, "inst": 0, "rop": 243}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 835, "inst": 0, "rop": 244}}}, "key": "Saber-0768-2.29-8192", "param": [{"category": [3], "k": 3, "n": 768, "q": 8192, "secret_distribution": "normal", "claimed": 180, "ring": "x^{n/k} + 1", "sd": 2.29128784747792}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWR"], "name": "FireSaber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 293}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 293}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 257}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 257}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 300}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 300}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 357}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 357}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 273}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 273}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 968, "inst": 0, "rop": 469}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 968, "inst": 0, "rop": 469}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 968, "inst": 0, "rop": 828}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 968, "inst": 0, "rop": 828}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 288}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 288}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 267}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 267}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 1105}, "n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 1105}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 314}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 314}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 968, "inst": 0, "rop": 414}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 968, "inst": 0, "rop": 414}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 287}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 287}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 283}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 283}}}, "key": "FireSaber-1024-2.29-8192", "param": [{"category": [5], "k": 4, "n": 1024, "q": 8192, "secret_distribution": "normal", "claimed": 245, "ring": "x^{n/k} + 1", "sd": 2.29128784747792}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWR"], "name": "FireSaber"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2218, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1118, "inst": 0, "rop": 345}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1132, "inst": 0, "rop": 341}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2248, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1158, "inst": 0, "rop": 307}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1161, "inst": 0, "rop": 308}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2218, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1118, "inst": 0, "rop": 346}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1132, "inst": 0, "rop": 347}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2214, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1113, "inst": 0, "rop": 410}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1120, "inst": 0, "rop": 413}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2248, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1158, "inst": 0, "rop": 324}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1161, "inst": 0, "rop": 325}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2158, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1040, "inst": 0, "rop": 521}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1055, "inst": 0, "rop": 528}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2096, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 964, "inst": 0, "rop": 834}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 965, "inst": 0, "rop": 829}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2227, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1130, "inst": 0, "rop": 337}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1132, "inst": 0, "rop": 339}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2248, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1158, "inst": 0, "rop": 318}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1161, "inst": 0, "rop": 318}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2070, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 932, "inst": 0, "rop": 1038}, "n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 930, "inst": 0, "rop": 1044}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2218, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1118, "inst": 0, "rop": 357}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1132, "inst": 0, "rop": 361}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2191, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1083, "inst": 0, "rop": 479}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1082, "inst": 0, "rop": 478}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2248, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1158, "inst": 0, "rop": 338}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1161, "inst": 0, "rop": 339}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2248, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1158, "inst": 0, "rop": 339}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1132, "inst": 0, "rop": 338}}}, "key": "FireSaber-1024-2.29-8192", "param": [{"category": [5], "k": 4, "n": 1024, "q": 8192, "secret_distribution": "normal", "claimed": 245, "ring": "x^{n/k} + 1", "sd": 2.29128784747792}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "NTRU LPrime"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1352, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 165}, "n": {"dim": 1352, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 165}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1352, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 141}, "n": {"dim": 1352, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 141}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1352, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 532, "inst": 0, "rop": 172}, "n": {"dim": 1352, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 532, "inst": 0, "rop": 172}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1352, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 196}, "n": {"dim": 1352, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 196}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1352, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 532, "inst": 0, "rop": 158}, "n": {"dim": 1352, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 532, "inst": 0, "rop": 158}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1352, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 532, "inst": 0, "rop": 202}, "n": {"dim": 1352, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 532, "inst": 0, "rop": 202}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1220, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 458, "inst": 0, "rop": 365}, "n": {"dim": 1220, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 458, "inst": 0, "rop": 365}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1352, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 159}, "n": {"dim": 1352, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 159}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1352, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 151}, "n": {"dim": 1352, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 151}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1127, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 422, "inst": 0, "rop": 398}, "n": {"dim": 1127, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 422, "inst": 0, "rop": 398}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1352, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 532, "inst": 0, "rop": 186}, "n": {"dim": 1352, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 532, "inst": 0, "rop": 186}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1352, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 532, "inst": 0, "rop": 189}, "n": {"dim": 1352, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 532, "inst": 0, "rop": 189}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1352, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 532, "inst": 0, "rop": 171}, "n": {"dim": 1352, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 532, "inst": 0, "rop": 171}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1352, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 156}, "n": {"dim": 1352, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 532, "inst": 0, "rop": 156}}}, "key": "NTRU LPrime-0761-0.82-4591", "param": [{"category": [5], "n": 761, "q": 4591, "secret_distribution": "((-1, 1), 250)", "claimed": 225, "ring": "x^n - x - 1", "sd": 0.816496580927726}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "NTRU LPrime"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1395, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 600, "inst": 0, "rop": 187}, "n": {"dim": 1395, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 600, "inst": 0, "rop": 187}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1415, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 618, "inst": 0, "rop": 166}, "n": {"dim": 1415, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 618, "inst": 0, "rop": 166}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1401, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 597, "inst": 0, "rop": 193}, "n": {"dim": 1401, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 597, "inst": 0, "rop": 193}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1339, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 560, "inst": 0, "rop": 216}, "n": {"dim": 1339, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 560, "inst": 0, "rop": 216}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1416, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 612, "inst": 0, "rop": 180}, "n": {"dim": 1416, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 612, "inst": 0, "rop": 180}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1403, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 586, "inst": 0, "rop": 232}, "n": {"dim": 1403, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 586, "inst": 0, "rop": 232}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1321, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 517, "inst": 0, "rop": 365}, "n": {"dim": 1321, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 517, "inst": 0, "rop": 365}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1408, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 604, "inst": 0, "rop": 182}, "n": {"dim": 1408, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 604, "inst": 0, "rop": 182}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1434, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 623, "inst": 0, "rop": 175}, "n": {"dim": 1434, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 623, "inst": 0, "rop": 175}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1313, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 507, "inst": 0, "rop": 404}, "n": {"dim": 1313, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 507, "inst": 0, "rop": 404}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1383, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 586, "inst": 0, "rop": 203}, "n": {"dim": 1383, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 586, "inst": 0, "rop": 203}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1406, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 590, "inst": 0, "rop": 219}, "n": {"dim": 1406, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 590, "inst": 0, "rop": 219}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1422, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 608, "inst": 0, "rop": 192}, "n": {"dim": 1422, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 608, "inst": 0, "rop": 192}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1404, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 605, "inst": 0, "rop": 179}, "n": {"dim": 1404, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 605, "inst": 0, "rop": 179}}}, "key": "NTRU LPrime-0761-0.82-4591", "param": [{"category": [5], "n": 761, "q": 4591, "secret_distribution": "((-1, 1), 250)", "claimed": 225, "ring": "x^n - x - 1", "sd": 0.816496580927726}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Dilithium"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1641, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 343, "inst": 0, "rop": 109}, "n": {"dim": 1522, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 347, "inst": 0, "rop": 110}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1641, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 343, "inst": 0, "rop": 91}, "n": {"dim": 1522, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 347, "inst": 0, "rop": 92}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1641, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 343, "inst": 0, "rop": 117}, "n": {"dim": 1522, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 347, "inst": 0, "rop": 118}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1641, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 343, "inst": 0, "rop": 127}, "n": {"dim": 1522, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 347, "inst": 0, "rop": 128}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1641, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 343, "inst": 0, "rop": 108}, "n": {"dim": 1522, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 347, "inst": 0, "rop": 109}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1641, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 343, "inst": 0, "rop": 104}, "n": {"dim": 1522, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 347, "inst": 0, "rop": 106}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1641, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 343, "inst": 0, "rop": 208}, "n": {"dim": 1522, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 347, "inst": 0, "rop": 211}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1641, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 343, "inst": 0, "rop": 103}, "n": {"dim": 1522, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 347, "inst": 0, "rop": 104}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1641, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 343, "inst": 0, "rop": 100}, "n": {"dim": 1522, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 347, "inst": 0, "rop": 101}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1641, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 343, "inst": 0, "rop": 233}, "n": {"dim": 1522, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 347, "inst": 0, "rop": 236}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1641, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 343, "inst": 0, "rop": 131}, "n": {"dim": 1522, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 347, "inst": 0, "rop": 132}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1641, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 343, "inst": 0, "rop": 104}, "n": {"dim": 1522, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 347, "inst": 0, "rop": 106}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1641, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 343, "inst": 0, "rop": 121}, "n": {"dim": 1522, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 347, "inst": 0, "rop": 122}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1641, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 343, "inst": 0, "rop": 101}, "n": {"dim": 1522, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 347, "inst": 0, "rop": 102}}}, "key": "CRYSTALS\u2011Dilithium-0768-3.74-8380417", "param": [{"category": [1], "k": 3, "n": 768, "q": 8380417, "secret_distribution": "(-6, 6)", "claimed": 91, "ring": "x^{n/k}+1", "sd": 3.7416573867739413}]}, {"attack": "dual", "scheme": {"primitive": ["SIG"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Dilithium"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1727, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 388, "inst": 0, "rop": 123}, "n": {"dim": 1530, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 396, "inst": 0, "rop": 126}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1761, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 404, "inst": 0, "rop": 108}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 408, "inst": 0, "rop": 110}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1736, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 388, "inst": 0, "rop": 130}, "n": {"dim": 1524, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 391, "inst": 0, "rop": 132}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1710, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 380, "inst": 0, "rop": 141}, "n": {"dim": 1524, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 384, "inst": 0, "rop": 143}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1723, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 388, "inst": 0, "rop": 121}, "n": {"dim": 1524, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 398, "inst": 0, "rop": 123}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1726, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 386, "inst": 0, "rop": 127}, "n": {"dim": 1527, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 394, "inst": 0, "rop": 130}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1679, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 356, "inst": 0, "rop": 220}, "n": {"dim": 1524, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 358, "inst": 0, "rop": 221}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1747, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 395, "inst": 0, "rop": 118}, "n": {"dim": 1524, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 398, "inst": 0, "rop": 120}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1750, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 397, "inst": 0, "rop": 114}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 408, "inst": 0, "rop": 117}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1667, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 351, "inst": 0, "rop": 241}, "n": {"dim": 1524, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 352, "inst": 0, "rop": 246}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1709, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 380, "inst": 0, "rop": 142}, "n": {"dim": 1524, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 384, "inst": 0, "rop": 144}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1740, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 390, "inst": 0, "rop": 124}, "n": {"dim": 1530, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 396, "inst": 0, "rop": 128}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1713, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 382, "inst": 0, "rop": 133}, "n": {"dim": 1524, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 391, "inst": 0, "rop": 135}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1747, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 395, "inst": 0, "rop": 116}, "n": {"dim": 1536, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 402, "inst": 0, "rop": 119}}}, "key": "CRYSTALS\u2011Dilithium-0768-3.74-8380417", "param": [{"category": [1], "k": 3, "n": 768, "q": 8380417, "secret_distribution": "(-6, 6)", "claimed": 91, "ring": "x^{n/k}+1", "sd": 3.7416573867739413}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Dilithium"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2144, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 486, "inst": 0, "rop": 151}, "n": {"dim": 2027, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 488, "inst": 0, "rop": 152}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2144, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 486, "inst": 0, "rop": 129}, "n": {"dim": 2027, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 488, "inst": 0, "rop": 130}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2144, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 486, "inst": 0, "rop": 159}, "n": {"dim": 2027, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 488, "inst": 0, "rop": 159}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2144, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 486, "inst": 0, "rop": 179}, "n": {"dim": 2027, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 488, "inst": 0, "rop": 180}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2144, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 486, "inst": 0, "rop": 146}, "n": {"dim": 2027, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 488, "inst": 0, "rop": 146}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2144, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 486, "inst": 0, "rop": 177}, "n": {"dim": 2027, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 488, "inst": 0, "rop": 178}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2144, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 486, "inst": 0, "rop": 334}, "n": {"dim": 2027, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 488, "inst": 0, "rop": 335}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2144, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 486, "inst": 0, "rop": 145}, "n": {"dim": 2027, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 488, "inst": 0, "rop": 146}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2144, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 486, "inst": 0, "rop": 138}, "n": {"dim": 2027, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 488, "inst": 0, "rop": 139}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2144, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 486, "inst": 0, "rop": 379}, "n": {"dim": 2027, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 488, "inst": 0, "rop": 381}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2144, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 486, "inst": 0, "rop": 173}, "n": {"dim": 2027, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 488, "inst": 0, "rop": 173}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2144, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 486, "inst": 0, "rop": 167}, "n": {"dim": 2027, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 488, "inst": 0, "rop": 168}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2144, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 486, "inst": 0, "rop": 160}, "n": {"dim": 2027, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 488, "inst": 0, "rop": 160}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2144, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 486, "inst": 0, "rop": 142}, "n": {"dim": 2027, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 488, "inst": 0, "rop": 143}}}, "key": "CRYSTALS\u2011Dilithium-1024-3.16-8380417", "param": [{"category": [2], "k": 4, "n": 1024, "q": 8380417, "secret_distribution": "(-5, 5)", "claimed": 125, "ring": "x^{n/k}+1", "sd": 3.1622776601683795}]}, {"attack": "dual", "scheme": {"primitive": ["SIG"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Dilithium"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2237, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 541, "inst": 0, "rop": 168}, "n": {"dim": 2040, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 545, "inst": 0, "rop": 170}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2270, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 552, "inst": 0, "rop": 148}, "n": {"dim": 2040, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 557, "inst": 0, "rop": 149}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2252, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 540, "inst": 0, "rop": 175}, "n": {"dim": 2040, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 545, "inst": 0, "rop": 177}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2218, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 529, "inst": 0, "rop": 196}, "n": {"dim": 2040, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 534, "inst": 0, "rop": 198}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2245, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 541, "inst": 0, "rop": 162}, "n": {"dim": 2034, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 552, "inst": 0, "rop": 164}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2215, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 527, "inst": 0, "rop": 200}, "n": {"dim": 2034, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 532, "inst": 0, "rop": 202}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2174, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 494, "inst": 0, "rop": 342}, "n": {"dim": 2032, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 495, "inst": 0, "rop": 342}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2252, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 546, "inst": 0, "rop": 164}, "n": {"dim": 2033, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 551, "inst": 0, "rop": 165}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2245, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 547, "inst": 0, "rop": 156}, "n": {"dim": 2040, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 557, "inst": 0, "rop": 158}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2166, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 489, "inst": 0, "rop": 383}, "n": {"dim": 2034, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 488, "inst": 0, "rop": 381}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2235, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 535, "inst": 0, "rop": 188}, "n": {"dim": 2032, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 539, "inst": 0, "rop": 189}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2228, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 530, "inst": 0, "rop": 189}, "n": {"dim": 2040, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 536, "inst": 0, "rop": 191}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2252, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 540, "inst": 0, "rop": 175}, "n": {"dim": 2040, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 545, "inst": 0, "rop": 176}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2252, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 546, "inst": 0, "rop": 161}, "n": {"dim": 2036, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 554, "inst": 0, "rop": 163}}}, "key": "CRYSTALS\u2011Dilithium-1024-3.16-8380417", "param": [{"category": [2], "k": 4, "n": 1024, "q": 8380417, "secret_distribution": "(-5, 5)", "claimed": 125, "ring": "x^{n/k}+1", "sd": 3.1622776601683795}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Dilithium"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2578, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 598, "inst": 0, "rop": 184}, "n": {"dim": 2516, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 185}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2578, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 598, "inst": 0, "rop": 159}, "n": {"dim": 2516, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 159}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2578, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 598, "inst": 0, "rop": 192}, "n": {"dim": 2516, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 599, "inst": 0, "rop": 192}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2578, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 598, "inst": 0, "rop": 221}, "n": {"dim": 2516, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 221}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2578, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 598, "inst": 0, "rop": 175}, "n": {"dim": 2516, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 599, "inst": 0, "rop": 176}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2578, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 598, "inst": 0, "rop": 239}, "n": {"dim": 2516, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 599, "inst": 0, "rop": 240}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2578, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 598, "inst": 0, "rop": 440}, "n": {"dim": 2516, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 599, "inst": 0, "rop": 441}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2578, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 598, "inst": 0, "rop": 178}, "n": {"dim": 2516, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 179}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2578, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 598, "inst": 0, "rop": 168}, "n": {"dim": 2516, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 168}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2578, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 598, "inst": 0, "rop": 515}, "n": {"dim": 2516, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 599, "inst": 0, "rop": 516}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2578, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 598, "inst": 0, "rop": 206}, "n": {"dim": 2516, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 599, "inst": 0, "rop": 206}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2578, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 598, "inst": 0, "rop": 220}, "n": {"dim": 2516, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 599, "inst": 0, "rop": 221}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2578, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 598, "inst": 0, "rop": 190}, "n": {"dim": 2516, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 599, "inst": 0, "rop": 190}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2578, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 598, "inst": 0, "rop": 175}, "n": {"dim": 2516, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 175}}}, "key": "CRYSTALS\u2011Dilithium-1280-2.00-8380417", "param": [{"category": [3], "k": 5, "n": 1280, "q": 8380417, "secret_distribution": "(-3, 3)", "claimed": 158, "ring": "x^{n/k}+1", "sd": 2.0}]}, {"attack": "dual", "scheme": {"primitive": ["SIG"], "assumption": ["MLWE"], "name": "CRYSTALS\u2011Dilithium"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2695, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 659, "inst": 0, "rop": 203}, "n": {"dim": 2550, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 665, "inst": 0, "rop": 204}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2701, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 669, "inst": 0, "rop": 178}, "n": {"dim": 2540, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 674, "inst": 0, "rop": 179}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2695, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 659, "inst": 0, "rop": 210}, "n": {"dim": 2540, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 658, "inst": 0, "rop": 209}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2671, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 649, "inst": 0, "rop": 239}, "n": {"dim": 2540, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 648, "inst": 0, "rop": 239}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2699, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 668, "inst": 0, "rop": 194}, "n": {"dim": 2550, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 665, "inst": 0, "rop": 193}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2662, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 643, "inst": 0, "rop": 265}, "n": {"dim": 2550, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 638, "inst": 0, "rop": 264}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2604, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 606, "inst": 0, "rop": 448}, "n": {"dim": 2545, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 602, "inst": 0, "rop": 444}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2695, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 659, "inst": 0, "rop": 197}, "n": {"dim": 2550, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 665, "inst": 0, "rop": 199}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2699, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 668, "inst": 0, "rop": 187}, "n": {"dim": 2550, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 665, "inst": 0, "rop": 187}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2581, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 591, "inst": 0, "rop": 506}, "n": {"dim": 2540, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 592, "inst": 0, "rop": 507}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2675, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 652, "inst": 0, "rop": 222}, "n": {"dim": 2540, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 658, "inst": 0, "rop": 223}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2662, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 643, "inst": 0, "rop": 243}, "n": {"dim": 2540, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 646, "inst": 0, "rop": 244}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2695, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 659, "inst": 0, "rop": 206}, "n": {"dim": 2541, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 659, "inst": 0, "rop": 206}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2697, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 659, "inst": 0, "rop": 195}, "n": {"dim": 2550, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 665, "inst": 0, "rop": 195}}}, "key": "CRYSTALS\u2011Dilithium-1280-2.00-8380417", "param": [{"category": [3], "k": 5, "n": 1280, "q": 8380417, "secret_distribution": "(-3, 3)", "claimed": 158, "ring": "x^{n/k}+1", "sd": 2.0}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["RLWE"], "name": "qTESLA"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2270, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 179}, "n": {"dim": 2045, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 591, "inst": 0, "rop": 182}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2270, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 154}, "n": {"dim": 2045, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 591, "inst": 0, "rop": 157}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2270, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 579, "inst": 0, "rop": 186}, "n": {"dim": 2045, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 591, "inst": 0, "rop": 189}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2270, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 214}, "n": {"dim": 2045, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 591, "inst": 0, "rop": 218}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2270, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 579, "inst": 0, "rop": 170}, "n": {"dim": 2045, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 591, "inst": 0, "rop": 174}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2270, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 579, "inst": 0, "rop": 228}, "n": {"dim": 2045, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 591, "inst": 0, "rop": 235}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2270, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 579, "inst": 0, "rop": 422}, "n": {"dim": 2045, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 591, "inst": 0, "rop": 433}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2270, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 173}, "n": {"dim": 2045, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 591, "inst": 0, "rop": 176}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2270, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 163}, "n": {"dim": 2045, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 591, "inst": 0, "rop": 166}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2270, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 579, "inst": 0, "rop": 490}, "n": {"dim": 2045, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 591, "inst": 0, "rop": 506}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2270, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 579, "inst": 0, "rop": 200}, "n": {"dim": 2045, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 591, "inst": 0, "rop": 203}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2270, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 579, "inst": 0, "rop": 211}, "n": {"dim": 2045, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 591, "inst": 0, "rop": 217}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2270, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 579, "inst": 0, "rop": 184}, "n": {"dim": 2045, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 591, "inst": 0, "rop": 188}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2270, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 579, "inst": 0, "rop": 170}, "n": {"dim": 2045, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 591, "inst": 0, "rop": 173}}}, "key": "qTESLA-1024-8.49-8058881", "param": [{"category": [1], "n": 1024, "q": 8058881, "secret_distribution": "normal", "claimed": 128, "ring": "x^n + 1", "sd": 8.493218002880191}]}, {"attack": "dual", "scheme": {"primitive": ["SIG"], "assumption": ["RLWE"], "name": "qTESLA"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2413, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 656, "inst": 0, "rop": 201}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 208}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2435, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 672, "inst": 0, "rop": 179}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 696, "inst": 0, "rop": 185}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2413, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 656, "inst": 0, "rop": 208}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 679, "inst": 0, "rop": 215}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2400, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 646, "inst": 0, "rop": 238}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 661, "inst": 0, "rop": 244}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2413, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 656, "inst": 0, "rop": 191}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 679, "inst": 0, "rop": 197}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2375, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 628, "inst": 0, "rop": 257}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 643, "inst": 0, "rop": 272}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2328, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 594, "inst": 0, "rop": 436}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 607, "inst": 0, "rop": 449}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2413, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 656, "inst": 0, "rop": 196}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 203}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2413, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 656, "inst": 0, "rop": 184}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 191}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2317, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 587, "inst": 0, "rop": 501}, "n": {"dim": 2048, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 591, "inst": 0, "rop": 518}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2392, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 640, "inst": 0, "rop": 218}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 662, "inst": 0, "rop": 225}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2396, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 643, "inst": 0, "rop": 243}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 656, "inst": 0, "rop": 249}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2413, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 656, "inst": 0, "rop": 205}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 679, "inst": 0, "rop": 211}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2413, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 656, "inst": 0, "rop": 192}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 679, "inst": 0, "rop": 199}}}, "key": "qTESLA-1024-8.49-8058881", "param": [{"category": [1], "n": 1024, "q": 8058881, "secret_distribution": "normal", "claimed": 128, "ring": "x^n + 1", "sd": 8.493218002880191}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["RLWE"], "name": "qTESLA"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1298, "inst": 0, "rop": 390}, "n": {"dim": 4097, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1312, "inst": 0, "rop": 394}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1298, "inst": 0, "rop": 344}, "n": {"dim": 4097, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1312, "inst": 0, "rop": 348}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4413, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1298, "inst": 0, "rop": 396}, "n": {"dim": 4097, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1312, "inst": 0, "rop": 400}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1298, "inst": 0, "rop": 478}, "n": {"dim": 4097, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1312, "inst": 0, "rop": 483}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4413, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1298, "inst": 0, "rop": 361}, "n": {"dim": 4097, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1312, "inst": 0, "rop": 365}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4413, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1298, "inst": 0, "rop": 697}, "n": {"dim": 4097, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1312, "inst": 0, "rop": 707}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4413, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1298, "inst": 0, "rop": 1208}, "n": {"dim": 4097, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1312, "inst": 0, "rop": 1224}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1298, "inst": 0, "rop": 387}, "n": {"dim": 4097, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1312, "inst": 0, "rop": 391}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1298, "inst": 0, "rop": 355}, "n": {"dim": 4097, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1312, "inst": 0, "rop": 359}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4413, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1298, "inst": 0, "rop": 1813}, "n": {"dim": 4097, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1312, "inst": 0, "rop": 1847}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4413, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1298, "inst": 0, "rop": 411}, "n": {"dim": 4097, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1312, "inst": 0, "rop": 415}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4413, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1298, "inst": 0, "rop": 604}, "n": {"dim": 4097, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1312, "inst": 0, "rop": 612}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4413, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1298, "inst": 0, "rop": 376}, "n": {"dim": 4097, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1312, "inst": 0, "rop": 380}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4413, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1298, "inst": 0, "rop": 380}, "n": {"dim": 4097, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1312, "inst": 0, "rop": 384}}}, "key": "qTESLA-2048-8.49-12681217", "param": [{"category": [3], "n": 2048, "q": 12681217, "secret_distribution": "normal", "claimed": 192, "ring": "x^n + 1", "sd": 8.493218002880191}]}, {"attack": "dual", "scheme": {"primitive": ["SIG"], "assumption": ["RLWE"], "name": "qTESLA"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4652, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1435, "inst": 0, "rop": 430}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1489, "inst": 0, "rop": 446}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4652, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1435, "inst": 0, "rop": 381}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1489, "inst": 0, "rop": 395}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4652, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1435, "inst": 0, "rop": 436}, "n": {"dim": 4096, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1489, "inst": 0, "rop": 452}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4663, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1444, "inst": 0, "rop": 532}, "n": {"dim": 4096, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1446, "inst": 0, "rop": 533}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4652, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1435, "inst": 0, "rop": 397}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1489, "inst": 0, "rop": 411}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4562, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1364, "inst": 0, "rop": 744}, "n": {"dim": 4096, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1388, "inst": 0, "rop": 762}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4512, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1326, "inst": 0, "rop": 1241}, "n": {"dim": 4096, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1321, "inst": 0, "rop": 1235}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4652, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1435, "inst": 0, "rop": 427}, "n": {"dim": 4096, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1489, "inst": 0, "rop": 443}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4652, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1435, "inst": 0, "rop": 391}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1489, "inst": 0, "rop": 406}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4410, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1250, "inst": 0, "rop": 1700}, "n": {"dim": 4096, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1250, "inst": 0, "rop": 1783}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4652, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1435, "inst": 0, "rop": 451}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1489, "inst": 0, "rop": 467}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4618, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1408, "inst": 0, "rop": 670}, "n": {"dim": 4096, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1388, "inst": 0, "rop": 658}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4652, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1435, "inst": 0, "rop": 412}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1489, "inst": 0, "rop": 426}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4652, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1435, "inst": 0, "rop": 420}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1489, "inst": 0, "rop": 435}}}, "key": "qTESLA-2048-8.49-12681217", "param": [{"category": [3], "n": 2048, "q": 12681217, "secret_distribution": "normal", "claimed": 192, "ring": "x^n + 1", "sd": 8.493218002880191}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["RLWE"], "name": "qTESLA"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4423, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1215, "inst": 0, "rop": 366}, "n": {"dim": 4095, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1228, "inst": 0, "rop": 369}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4423, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1215, "inst": 0, "rop": 322}, "n": {"dim": 4095, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1228, "inst": 0, "rop": 326}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4423, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1215, "inst": 0, "rop": 372}, "n": {"dim": 4095, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1228, "inst": 0, "rop": 375}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4423, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1215, "inst": 0, "rop": 448}, "n": {"dim": 4095, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1228, "inst": 0, "rop": 452}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4423, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1215, "inst": 0, "rop": 339}, "n": {"dim": 4095, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1228, "inst": 0, "rop": 342}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4423, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1215, "inst": 0, "rop": 638}, "n": {"dim": 4095, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1228, "inst": 0, "rop": 647}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4423, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1215, "inst": 0, "rop": 1110}, "n": {"dim": 4095, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1228, "inst": 0, "rop": 1125}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4423, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1215, "inst": 0, "rop": 362}, "n": {"dim": 4095, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1228, "inst": 0, "rop": 366}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4423, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1215, "inst": 0, "rop": 333}, "n": {"dim": 4095, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1228, "inst": 0, "rop": 336}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4423, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1215, "inst": 0, "rop": 1619}, "n": {"dim": 4095, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1228, "inst": 0, "rop": 1649}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4423, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1215, "inst": 0, "rop": 387}, "n": {"dim": 4095, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1228, "inst": 0, "rop": 390}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4423, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1215, "inst": 0, "rop": 555}, "n": {"dim": 4095, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1228, "inst": 0, "rop": 563}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4423, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1215, "inst": 0, "rop": 354}, "n": {"dim": 4095, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1228, "inst": 0, "rop": 357}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4423, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1215, "inst": 0, "rop": 355}, "n": {"dim": 4095, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1228, "inst": 0, "rop": 359}}}, "key": "qTESLA-2048-8.49-27627521", "param": [{"category": [5], "n": 2048, "q": 27627521, "secret_distribution": "normal", "claimed": 256, "ring": "x^n + 1", "sd": 8.493218002880191}]}, {"attack": "dual", "scheme": {"primitive": ["SIG"], "assumption": ["RLWE"], "name": "qTESLA"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4625, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1331, "inst": 0, "rop": 400}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1376, "inst": 0, "rop": 413}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4697, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1385, "inst": 0, "rop": 368}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1376, "inst": 0, "rop": 365}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4625, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1331, "inst": 0, "rop": 406}, "n": {"dim": 4096, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1376, "inst": 0, "rop": 419}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4625, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1331, "inst": 0, "rop": 490}, "n": {"dim": 4096, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1323, "inst": 0, "rop": 487}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4625, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1331, "inst": 0, "rop": 376}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1376, "inst": 0, "rop": 382}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4524, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1257, "inst": 0, "rop": 690}, "n": {"dim": 4096, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1298, "inst": 0, "rop": 697}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4496, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1237, "inst": 0, "rop": 1136}, "n": {"dim": 4096, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1253, "inst": 0, "rop": 1154}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4625, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1331, "inst": 0, "rop": 396}, "n": {"dim": 4096, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1376, "inst": 0, "rop": 410}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4625, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1331, "inst": 0, "rop": 376}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1376, "inst": 0, "rop": 376}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4414, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1179, "inst": 0, "rop": 1538}, "n": {"dim": 4096, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1177, "inst": 0, "rop": 1590}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4625, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1331, "inst": 0, "rop": 421}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1376, "inst": 0, "rop": 434}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4596, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1310, "inst": 0, "rop": 611}, "n": {"dim": 4096, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1338, "inst": 0, "rop": 628}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4625, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1331, "inst": 0, "rop": 385}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1376, "inst": 0, "rop": 397}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4625, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1331, "inst": 0, "rop": 389}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1376, "inst": 0, "rop": 402}}}, "key": "qTESLA-2048-8.49-27627521", "param": [{"category": [5], "n": 2048, "q": 27627521, "secret_distribution": "normal", "claimed": 256, "ring": "x^n + 1", "sd": 8.493218002880191}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["PLWE"], "name": "Titanium.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2008, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 200}, "n": {"dim": 2008, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 200}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2008, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 173}, "n": {"dim": 2008, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 173}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2008, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 652, "inst": 0, "rop": 207}, "n": {"dim": 2008, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 652, "inst": 0, "rop": 207}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2008, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 240}, "n": {"dim": 2008, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 240}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2008, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 652, "inst": 0, "rop": 190}, "n": {"dim": 2008, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 652, "inst": 0, "rop": 190}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2008, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 652, "inst": 0, "rop": 271}, "n": {"dim": 2008, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 652, "inst": 0, "rop": 271}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2008, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 652, "inst": 0, "rop": 494}, "n": {"dim": 2008, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 652, "inst": 0, "rop": 494}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2008, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 194}, "n": {"dim": 2008, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 194}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2008, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 183}, "n": {"dim": 2008, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 183}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2008, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 652, "inst": 0, "rop": 587}, "n": {"dim": 2008, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 652, "inst": 0, "rop": 587}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2008, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 652, "inst": 0, "rop": 221}, "n": {"dim": 2008, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 652, "inst": 0, "rop": 221}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2008, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 652, "inst": 0, "rop": 247}, "n": {"dim": 2008, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 652, "inst": 0, "rop": 247}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2008, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 652, "inst": 0, "rop": 204}, "n": {"dim": 2008, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 652, "inst": 0, "rop": 204}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2008, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 191}, "n": {"dim": 2008, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 652, "inst": 0, "rop": 191}}}, "key": "Titanium.PKE-1024-1.41-86017", "param": [{"category": [1], "n": 1024, "q": 86017, "secret_distribution": "normal", "claimed": 128, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["PLWE"], "name": "Titanium.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2140, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 747, "inst": 0, "rop": 228}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 758, "inst": 0, "rop": 231}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2154, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 761, "inst": 0, "rop": 202}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 771, "inst": 0, "rop": 205}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2140, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 747, "inst": 0, "rop": 235}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 738, "inst": 0, "rop": 237}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2127, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 735, "inst": 0, "rop": 271}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 738, "inst": 0, "rop": 272}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2154, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 761, "inst": 0, "rop": 219}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 751, "inst": 0, "rop": 216}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2113, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 721, "inst": 0, "rop": 312}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 719, "inst": 0, "rop": 311}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2063, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 676, "inst": 0, "rop": 518}, "n": {"dim": 2045, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 660, "inst": 0, "rop": 517}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2140, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 747, "inst": 0, "rop": 223}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 758, "inst": 0, "rop": 226}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2154, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 761, "inst": 0, "rop": 212}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 764, "inst": 0, "rop": 213}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2031, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 648, "inst": 0, "rop": 594}, "n": {"dim": 2031, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 648, "inst": 0, "rop": 594}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2140, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 747, "inst": 0, "rop": 249}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 738, "inst": 0, "rop": 246}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2113, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 721, "inst": 0, "rop": 282}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 719, "inst": 0, "rop": 282}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2133, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 741, "inst": 0, "rop": 229}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 751, "inst": 0, "rop": 230}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2140, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 747, "inst": 0, "rop": 219}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 758, "inst": 0, "rop": 222}}}, "key": "Titanium.PKE-1024-1.41-86017", "param": [{"category": [1], "n": 1024, "q": 86017, "secret_distribution": "normal", "claimed": 128, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["PLWE"], "name": "Titanium.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2464, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 231}, "n": {"dim": 2464, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 231}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2464, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 201}, "n": {"dim": 2464, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 201}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2464, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 757, "inst": 0, "rop": 238}, "n": {"dim": 2464, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 757, "inst": 0, "rop": 238}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2464, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 279}, "n": {"dim": 2464, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 279}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2464, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 757, "inst": 0, "rop": 218}, "n": {"dim": 2464, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 757, "inst": 0, "rop": 218}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2464, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 757, "inst": 0, "rop": 334}, "n": {"dim": 2464, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 757, "inst": 0, "rop": 334}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2464, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 757, "inst": 0, "rop": 601}, "n": {"dim": 2464, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 757, "inst": 0, "rop": 601}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2464, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 226}, "n": {"dim": 2464, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 226}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2464, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 211}, "n": {"dim": 2464, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 211}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2464, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 757, "inst": 0, "rop": 742}, "n": {"dim": 2464, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 757, "inst": 0, "rop": 742}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2464, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 757, "inst": 0, "rop": 252}, "n": {"dim": 2464, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 757, "inst": 0, "rop": 252}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2464, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 757, "inst": 0, "rop": 301}, "n": {"dim": 2464, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 757, "inst": 0, "rop": 301}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2464, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 757, "inst": 0, "rop": 232}, "n": {"dim": 2464, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 757, "inst": 0, "rop": 232}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2464, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 222}, "n": {"dim": 2464, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 757, "inst": 0, "rop": 222}}}, "key": "Titanium.PKE-1280-1.41-301057", "param": [{"category": [1], "n": 1280, "q": 301057, "secret_distribution": "normal", "claimed": 160, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["PLWE"], "name": "Titanium.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2651, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 855, "inst": 0, "rop": 260}, "n": {"dim": 2560, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 846, "inst": 0, "rop": 259}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2668, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 869, "inst": 0, "rop": 231}, "n": {"dim": 2560, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 859, "inst": 0, "rop": 232}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2651, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 855, "inst": 0, "rop": 267}, "n": {"dim": 2560, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 846, "inst": 0, "rop": 264}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2637, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 843, "inst": 0, "rop": 311}, "n": {"dim": 2560, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 846, "inst": 0, "rop": 312}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2668, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 869, "inst": 0, "rop": 247}, "n": {"dim": 2560, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 859, "inst": 0, "rop": 245}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2606, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 817, "inst": 0, "rop": 372}, "n": {"dim": 2560, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 818, "inst": 0, "rop": 372}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2540, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 762, "inst": 0, "rop": 606}, "n": {"dim": 2541, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 763, "inst": 0, "rop": 607}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2651, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 855, "inst": 0, "rop": 255}, "n": {"dim": 2560, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 846, "inst": 0, "rop": 259}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2668, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 869, "inst": 0, "rop": 241}, "n": {"dim": 2560, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 859, "inst": 0, "rop": 238}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2529, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 754, "inst": 0, "rop": 738}, "n": {"dim": 2529, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 754, "inst": 0, "rop": 738}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2651, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 855, "inst": 0, "rop": 281}, "n": {"dim": 2560, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 846, "inst": 0, "rop": 278}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2622, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 831, "inst": 0, "rop": 340}, "n": {"dim": 2560, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 832, "inst": 0, "rop": 340}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2639, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 845, "inst": 0, "rop": 260}, "n": {"dim": 2560, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 859, "inst": 0, "rop": 259}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2651, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 855, "inst": 0, "rop": 250}, "n": {"dim": 2560, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 255}}}, "key": "Titanium.PKE-1280-1.41-301057", "param": [{"category": [1], "n": 1280, "q": 301057, "secret_distribution": "normal", "claimed": 160, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["PLWE"], "name": "Titanium.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2973, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 265}, "n": {"dim": 2973, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 265}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2973, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 231}, "n": {"dim": 2973, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 231}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2973, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 871, "inst": 0, "rop": 271}, "n": {"dim": 2973, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 871, "inst": 0, "rop": 271}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2973, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 321}, "n": {"dim": 2973, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 321}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2973, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 871, "inst": 0, "rop": 248}, "n": {"dim": 2973, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 871, "inst": 0, "rop": 248}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2973, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 871, "inst": 0, "rop": 406}, "n": {"dim": 2973, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 871, "inst": 0, "rop": 406}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2973, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 871, "inst": 0, "rop": 722}, "n": {"dim": 2973, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 871, "inst": 0, "rop": 722}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2973, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 260}, "n": {"dim": 2973, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 260}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2973, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 241}, "n": {"dim": 2973, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 241}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2973, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 871, "inst": 0, "rop": 930}, "n": {"dim": 2973, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 871, "inst": 0, "rop": 930}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2973, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 871, "inst": 0, "rop": 286}, "n": {"dim": 2973, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 871, "inst": 0, "rop": 286}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2973, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 871, "inst": 0, "rop": 361}, "n": {"dim": 2973, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 871, "inst": 0, "rop": 361}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2973, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 871, "inst": 0, "rop": 262}, "n": {"dim": 2973, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 871, "inst": 0, "rop": 262}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2973, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 255}, "n": {"dim": 2973, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 871, "inst": 0, "rop": 255}}}, "key": "Titanium.PKE-1536-1.41-737281", "param": [{"category": [3], "n": 1536, "q": 737281, "secret_distribution": "normal", "claimed": 192, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["PLWE"], "name": "Titanium.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3153, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 294}, "n": {"dim": 3072, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 293}}, "0.265\u00a0\u03b2": {"2n": {"dim": 3180, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 993, "inst": 0, "rop": 264}, "n": {"dim": 3072, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 982, "inst": 0, "rop": 261}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3153, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 971, "inst": 0, "rop": 300}, "n": {"dim": 3072, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 968, "inst": 0, "rop": 300}}, "0.368\u00a0\u03b2": {"2n": {"dim": 3146, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 965, "inst": 0, "rop": 356}, "n": {"dim": 3072, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 357}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3180, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 993, "inst": 0, "rop": 280}, "n": {"dim": 3072, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 982, "inst": 0, "rop": 277}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 3114, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 940, "inst": 0, "rop": 451}, "n": {"dim": 3072, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 931, "inst": 0, "rop": 445}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 3057, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 894, "inst": 0, "rop": 747}, "n": {"dim": 3057, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 894, "inst": 0, "rop": 747}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 3153, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 289}, "n": {"dim": 3072, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 289}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3180, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 993, "inst": 0, "rop": 274}, "n": {"dim": 3072, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 982, "inst": 0, "rop": 271}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3027, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 871, "inst": 0, "rop": 930}, "n": {"dim": 3027, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 871, "inst": 0, "rop": 930}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3153, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 971, "inst": 0, "rop": 315}, "n": {"dim": 3072, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 968, "inst": 0, "rop": 314}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 3099, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 928, "inst": 0, "rop": 406}, "n": {"dim": 3072, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 951, "inst": 0, "rop": 405}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3180, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 993, "inst": 0, "rop": 295}, "n": {"dim": 3072, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 982, "inst": 0, "rop": 292}}, "0.292\u00a0\u03b2": {"2n": {"dim": 3153, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 971, "inst": 0, "rop": 284}, "n": {"dim": 3072, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 968, "inst": 0, "rop": 284}}}, "key": "Titanium.PKE-1536-1.41-737281", "param": [{"category": [3], "n": 1536, "q": 737281, "secret_distribution": "normal", "claimed": 192, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["PLWE"], "name": "Titanium.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 356}, "n": {"dim": 3914, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 356}}, "0.265\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 314}, "n": {"dim": 3914, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 314}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3914, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1183, "inst": 0, "rop": 362}, "n": {"dim": 3914, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1183, "inst": 0, "rop": 362}}, "0.368\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 436}, "n": {"dim": 3914, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 436}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1183, "inst": 0, "rop": 330}, "n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1183, "inst": 0, "rop": 330}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 3914, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1183, "inst": 0, "rop": 616}, "n": {"dim": 3914, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1183, "inst": 0, "rop": 616}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 3914, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1183, "inst": 0, "rop": 1073}, "n": {"dim": 3914, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1183, "inst": 0, "rop": 1073}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 352}, "n": {"dim": 3914, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 352}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 324}, "n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 324}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3914, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 1547}, "n": {"dim": 3914, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 1547}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3914, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 377}, "n": {"dim": 3914, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 377}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 3914, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1183, "inst": 0, "rop": 537}, "n": {"dim": 3914, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1183, "inst": 0, "rop": 537}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 345}, "n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 345}}, "0.292\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 346}, "n": {"dim": 3914, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 346}}}, "key": "Titanium.PKE-2048-1.41-1198081", "param": [{"category": [5], "n": 2048, "q": 1198081, "secret_distribution": "normal", "claimed": 256, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["PLWE"], "name": "Titanium.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 395}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 395}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 349}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 350}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4159, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1314, "inst": 0, "rop": 401}, "n": {"dim": 4096, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1317, "inst": 0, "rop": 401}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4162, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1316, "inst": 0, "rop": 485}, "n": {"dim": 4096, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1268, "inst": 0, "rop": 483}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4159, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1314, "inst": 0, "rop": 365}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1317, "inst": 0, "rop": 366}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4060, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1234, "inst": 0, "rop": 652}, "n": {"dim": 4061, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1235, "inst": 0, "rop": 652}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4021, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1203, "inst": 0, "rop": 1096}, "n": {"dim": 4021, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1203, "inst": 0, "rop": 1096}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 391}, "n": {"dim": 4096, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 392}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 359}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 360}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3936, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1138, "inst": 0, "rop": 1474}, "n": {"dim": 3936, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1138, "inst": 0, "rop": 1474}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4159, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1314, "inst": 0, "rop": 416}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1317, "inst": 0, "rop": 416}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4120, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1282, "inst": 0, "rop": 595}, "n": {"dim": 4096, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1282, "inst": 0, "rop": 595}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4159, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1314, "inst": 0, "rop": 380}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1317, "inst": 0, "rop": 381}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 384}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 385}}}, "key": "Titanium.PKE-2048-1.41-1198081", "param": [{"category": [5], "n": 2048, "q": 1198081, "secret_distribution": "normal", "claimed": 256, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["NTRU"], "name": "Falcon"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1023, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 482, "inst": 0, "rop": 150}}, "0.265\u00a0\u03b2": {"n": {"dim": 1023, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 482, "inst": 0, "rop": 128}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1023, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 482, "inst": 0, "rop": 158}}, "0.368\u00a0\u03b2": {"n": {"dim": 1023, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 482, "inst": 0, "rop": 178}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1023, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 482, "inst": 0, "rop": 145}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 1023, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 482, "inst": 0, "rop": 175}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 1023, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 482, "inst": 0, "rop": 330}}, "0.2975\u00a0\u03b2": {"n": {"dim": 1023, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 482, "inst": 0, "rop": 144}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1023, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 482, "inst": 0, "rop": 137}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1023, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 482, "inst": 0, "rop": 373}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1023, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 482, "inst": 0, "rop": 171}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 1023, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 482, "inst": 0, "rop": 165}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1023, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 482, "inst": 0, "rop": 158}}, "0.292\u00a0\u03b2": {"n": {"dim": 1023, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 482, "inst": 0, "rop": 141}}}, "key": "Falcon-0512-4.05-12289", "param": [{"category": [1], "n": 512, "q": 12289, "norm_g": 91.7126275384148, "norm_f": 91.7126275384148, "secret_distribution": "normal", "claimed": 103, "ring": "x^n + 1", "sd": 4.053163803303075}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["NTRU"], "name": "Falcon"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1532, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 728, "inst": 0, "rop": 223}}, "0.265\u00a0\u03b2": {"n": {"dim": 1532, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 728, "inst": 0, "rop": 193}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1532, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 728, "inst": 0, "rop": 229}}, "0.368\u00a0\u03b2": {"n": {"dim": 1532, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 728, "inst": 0, "rop": 268}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1532, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 728, "inst": 0, "rop": 210}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 1532, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 728, "inst": 0, "rop": 316}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 1532, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 728, "inst": 0, "rop": 571}}, "0.2975\u00a0\u03b2": {"n": {"dim": 1532, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 728, "inst": 0, "rop": 217}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1532, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 728, "inst": 0, "rop": 203}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1532, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 728, "inst": 0, "rop": 697}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1532, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 728, "inst": 0, "rop": 243}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 1532, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 728, "inst": 0, "rop": 286}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1532, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 728, "inst": 0, "rop": 223}}, "0.292\u00a0\u03b2": {"n": {"dim": 1532, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 728, "inst": 0, "rop": 213}}}, "key": "Falcon-0768-4.05-18433", "param": [{"category": [2, 3], "n": 768, "q": 18433, "norm_g": 112.32304683367524, "norm_f": 112.32304683367524, "secret_distribution": "normal", "claimed": 172, "ring": "x^n - x^{n/2} + 1", "sd": 4.053108832851334}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["NTRU"], "name": "Falcon"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 2041, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 975, "inst": 0, "rop": 295}}, "0.265\u00a0\u03b2": {"n": {"dim": 2041, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 975, "inst": 0, "rop": 259}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 2041, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 975, "inst": 0, "rop": 302}}, "0.368\u00a0\u03b2": {"n": {"dim": 2041, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 975, "inst": 0, "rop": 359}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 2041, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 975, "inst": 0, "rop": 275}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 2041, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 975, "inst": 0, "rop": 474}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 2041, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 975, "inst": 0, "rop": 836}}, "0.2975\u00a0\u03b2": {"n": {"dim": 2041, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 975, "inst": 0, "rop": 291}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 2041, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 975, "inst": 0, "rop": 269}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 2041, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 975, "inst": 0, "rop": 1118}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 2041, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 975, "inst": 0, "rop": 316}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 2041, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 975, "inst": 0, "rop": 418}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 2041, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 975, "inst": 0, "rop": 289}}, "0.292\u00a0\u03b2": {"n": {"dim": 2041, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 975, "inst": 0, "rop": 285}}}, "key": "Falcon-1024-2.87-12289", "param": [{"category": [4, 5], "n": 1024, "q": 12289, "norm_g": 91.7126275384148, "norm_f": 91.7126275384148, "secret_distribution": "normal", "claimed": 230, "ring": "x^n + 1", "sd": 2.8660196105754623}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["NTRU"], "name": "NTRU HRSS"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1286, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 463, "inst": 0, "rop": 145}}, "0.265\u00a0\u03b2": {"n": {"dim": 1286, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 463, "inst": 0, "rop": 123}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1286, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 463, "inst": 0, "rop": 152}}, "0.368\u00a0\u03b2": {"n": {"dim": 1286, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 463, "inst": 0, "rop": 171}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1286, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 463, "inst": 0, "rop": 140}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 1286, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 463, "inst": 0, "rop": 165}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 1286, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 463, "inst": 0, "rop": 313}}, "0.2975\u00a0\u03b2": {"n": {"dim": 1286, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 463, "inst": 0, "rop": 138}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1286, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 463, "inst": 0, "rop": 132}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1308, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 461, "inst": 0, "rop": 350}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1286, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 463, "inst": 0, "rop": 165}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 1286, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 463, "inst": 0, "rop": 157}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1286, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 463, "inst": 0, "rop": 153}}, "0.292\u00a0\u03b2": {"n": {"dim": 1286, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 463, "inst": 0, "rop": 136}}}, "key": "NTRU HRSS-0700-0.79-8192", "param": [{"category": [1], "n": 700, "q": 8192, "norm_g": 20.91650066335189, "norm_f": 20.91650066335189, "secret_distribution": "((-1, 1), 437)", "claimed": 123, "ring": "\\sum_{i=0}^{n-1} x^i", "sd": 0.7905694150420949}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 674, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 290, "inst": 0, "rop": 98}, "n": {"dim": 674, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 290, "inst": 0, "rop": 98}}, "0.265\u00a0\u03b2": {"2n": {"dim": 698, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 304, "inst": 0, "rop": 81}, "n": {"dim": 698, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 304, "inst": 0, "rop": 81}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 674, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 290, "inst": 0, "rop": 106}, "n": {"dim": 674, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 290, "inst": 0, "rop": 106}}, "0.368\u00a0\u03b2": {"2n": {"dim": 593, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 243, "inst": 0, "rop": 109}, "n": {"dim": 593, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 243, "inst": 0, "rop": 109}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 698, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 304, "inst": 0, "rop": 98}, "n": {"dim": 698, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 304, "inst": 0, "rop": 98}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 545, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 214, "inst": 0, "rop": 78}, "n": {"dim": 545, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 214, "inst": 0, "rop": 78}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 393, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 134, "inst": 0, "rop": 126}, "n": {"dim": 393, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 134, "inst": 0, "rop": 126}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 674, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 290, "inst": 0, "rop": 91}, "n": {"dim": 674, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 290, "inst": 0, "rop": 91}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 698, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 304, "inst": 0, "rop": 90}, "n": {"dim": 698, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 304, "inst": 0, "rop": 90}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 393, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 134, "inst": 0, "rop": 145}, "n": {"dim": 393, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 134, "inst": 0, "rop": 145}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 674, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 290, "inst": 0, "rop": 118}, "n": {"dim": 674, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 290, "inst": 0, "rop": 118}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 593, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 243, "inst": 0, "rop": 84}, "n": {"dim": 593, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 243, "inst": 0, "rop": 84}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 698, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 304, "inst": 0, "rop": 110}, "n": {"dim": 698, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 304, "inst": 0, "rop": 110}}, "0.292\u00a0\u03b2": {"2n": {"dim": 674, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 290, "inst": 0, "rop": 89}, "n": {"dim": 674, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 290, "inst": 0, "rop": 89}}}, "key": "uRound2.PKE-0420-1.12-1024", "param": [{"category": [1], "n": 420, "q": 1024, "secret_distribution": "((-1, 1), 62)", "claimed": 74, "ring": "\\sum_{i=0}^n x^i", "sd": 1.118033988749895}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 589, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 276, "inst": 0, "rop": 107}, "n": {"dim": 589, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 276, "inst": 0, "rop": 107}}, "0.265\u00a0\u03b2": {"2n": {"dim": 632, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 312, "inst": 0, "rop": 96}, "n": {"dim": 632, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 312, "inst": 0, "rop": 96}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 578, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 264, "inst": 0, "rop": 113}, "n": {"dim": 578, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 264, "inst": 0, "rop": 113}}, "0.368\u00a0\u03b2": {"2n": {"dim": 595, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 272, "inst": 0, "rop": 116}, "n": {"dim": 595, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 272, "inst": 0, "rop": 116}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 604, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 285, "inst": 0, "rop": 107}, "n": {"dim": 604, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 285, "inst": 0, "rop": 107}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 649, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 315, "inst": 0, "rop": 101}, "n": {"dim": 649, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 315, "inst": 0, "rop": 101}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 499, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 205, "inst": 0, "rop": 136}, "n": {"dim": 499, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 205, "inst": 0, "rop": 136}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 589, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 280, "inst": 0, "rop": 102}, "n": {"dim": 589, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 280, "inst": 0, "rop": 102}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 671, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 331, "inst": 0, "rop": 102}, "n": {"dim": 671, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 331, "inst": 0, "rop": 102}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 412, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 155, "inst": 0, "rop": 143}, "n": {"dim": 412, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 155, "inst": 0, "rop": 143}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 633, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 292, "inst": 0, "rop": 122}, "n": {"dim": 633, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 292, "inst": 0, "rop": 122}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 614, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 296, "inst": 0, "rop": 100}, "n": {"dim": 614, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 296, "inst": 0, "rop": 100}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 657, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 310, "inst": 0, "rop": 117}, "n": {"dim": 657, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 310, "inst": 0, "rop": 117}}, "0.292\u00a0\u03b2": {"2n": {"dim": 610, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 294, "inst": 0, "rop": 101}, "n": {"dim": 610, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 294, "inst": 0, "rop": 101}}}, "key": "uRound2.PKE-0420-1.12-1024", "param": [{"category": [1], "n": 420, "q": 1024, "secret_distribution": "((-1, 1), 62)", "claimed": 74, "ring": "\\sum_{i=0}^n x^i", "sd": 1.118033988749895}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 909, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 382, "inst": 0, "rop": 122}, "n": {"dim": 909, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 382, "inst": 0, "rop": 122}}, "0.265\u00a0\u03b2": {"2n": {"dim": 928, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 386, "inst": 0, "rop": 103}, "n": {"dim": 928, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 386, "inst": 0, "rop": 103}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 909, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 382, "inst": 0, "rop": 130}, "n": {"dim": 909, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 382, "inst": 0, "rop": 130}}, "0.368\u00a0\u03b2": {"2n": {"dim": 871, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 361, "inst": 0, "rop": 142}, "n": {"dim": 871, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 361, "inst": 0, "rop": 142}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 928, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 386, "inst": 0, "rop": 119}, "n": {"dim": 928, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 386, "inst": 0, "rop": 119}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 744, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 295, "inst": 0, "rop": 118}, "n": {"dim": 744, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 295, "inst": 0, "rop": 118}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 565, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 200, "inst": 0, "rop": 187}, "n": {"dim": 565, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 200, "inst": 0, "rop": 187}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 909, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 382, "inst": 0, "rop": 115}, "n": {"dim": 909, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 382, "inst": 0, "rop": 115}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 928, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 386, "inst": 0, "rop": 111}, "n": {"dim": 928, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 386, "inst": 0, "rop": 111}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 565, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 200, "inst": 0, "rop": 206}, "n": {"dim": 565, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 200, "inst": 0, "rop": 206}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 904, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 142}, "n": {"dim": 904, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 142}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 864, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 347, "inst": 0, "rop": 120}, "n": {"dim": 864, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 347, "inst": 0, "rop": 120}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 901, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 384, "inst": 0, "rop": 132}, "n": {"dim": 901, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 384, "inst": 0, "rop": 132}}, "0.292\u00a0\u03b2": {"2n": {"dim": 909, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 382, "inst": 0, "rop": 113}, "n": {"dim": 909, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 382, "inst": 0, "rop": 113}}}, "key": "uRound2.PKE-0540-4.61-8192", "param": [{"category": [2], "n": 540, "q": 8192, "secret_distribution": "((-1, 1), 96)", "claimed": 97, "ring": "\\sum_{i=0}^n x^i", "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 887, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 409, "inst": 0, "rop": 135}, "n": {"dim": 868, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 398, "inst": 0, "rop": 135}}, "0.265\u00a0\u03b2": {"2n": {"dim": 904, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 428, "inst": 0, "rop": 120}, "n": {"dim": 928, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 442, "inst": 0, "rop": 121}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 884, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 403, "inst": 0, "rop": 141}, "n": {"dim": 871, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 396, "inst": 0, "rop": 141}}, "0.368\u00a0\u03b2": {"2n": {"dim": 825, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 364, "inst": 0, "rop": 150}, "n": {"dim": 852, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 380, "inst": 0, "rop": 150}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 901, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 418, "inst": 0, "rop": 133}, "n": {"dim": 912, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 423, "inst": 0, "rop": 133}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 811, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 365, "inst": 0, "rop": 135}, "n": {"dim": 767, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 342, "inst": 0, "rop": 136}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 747, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 302, "inst": 0, "rop": 200}, "n": {"dim": 673, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 265, "inst": 0, "rop": 192}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 887, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 409, "inst": 0, "rop": 131}, "n": {"dim": 900, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 130}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 892, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 416, "inst": 0, "rop": 127}, "n": {"dim": 925, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 436, "inst": 0, "rop": 127}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 618, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 233, "inst": 0, "rop": 201}, "n": {"dim": 618, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 233, "inst": 0, "rop": 201}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 863, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 386, "inst": 0, "rop": 151}, "n": {"dim": 887, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 399, "inst": 0, "rop": 151}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 814, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 368, "inst": 0, "rop": 135}, "n": {"dim": 790, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 353, "inst": 0, "rop": 135}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 883, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 399, "inst": 0, "rop": 144}, "n": {"dim": 859, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 388, "inst": 0, "rop": 142}}, "0.292\u00a0\u03b2": {"2n": {"dim": 916, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 427, "inst": 0, "rop": 130}, "n": {"dim": 875, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 406, "inst": 0, "rop": 128}}}, "key": "uRound2.PKE-0540-4.61-8192", "param": [{"category": [2], "n": 540, "q": 8192, "secret_distribution": "((-1, 1), 96)", "claimed": 97, "ring": "\\sum_{i=0}^n x^i", "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 999, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 134}, "n": {"dim": 999, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 134}}, "0.265\u00a0\u03b2": {"2n": {"dim": 987, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 423, "inst": 0, "rop": 113}, "n": {"dim": 987, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 423, "inst": 0, "rop": 113}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 999, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 422, "inst": 0, "rop": 141}, "n": {"dim": 999, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 422, "inst": 0, "rop": 141}}, "0.368\u00a0\u03b2": {"2n": {"dim": 947, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 396, "inst": 0, "rop": 157}, "n": {"dim": 947, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 396, "inst": 0, "rop": 157}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 987, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 423, "inst": 0, "rop": 130}, "n": {"dim": 987, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 423, "inst": 0, "rop": 130}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 803, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 323, "inst": 0, "rop": 135}, "n": {"dim": 803, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 323, "inst": 0, "rop": 135}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 607, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 215, "inst": 0, "rop": 210}, "n": {"dim": 607, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 215, "inst": 0, "rop": 210}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 999, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 127}, "n": {"dim": 999, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 127}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 987, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 423, "inst": 0, "rop": 122}, "n": {"dim": 987, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 423, "inst": 0, "rop": 122}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 607, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 215, "inst": 0, "rop": 229}, "n": {"dim": 607, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 215, "inst": 0, "rop": 229}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 987, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 154}, "n": {"dim": 987, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 154}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 880, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 367, "inst": 0, "rop": 136}, "n": {"dim": 880, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 367, "inst": 0, "rop": 136}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 987, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 143}, "n": {"dim": 987, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 143}}, "0.292\u00a0\u03b2": {"2n": {"dim": 999, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 125}, "n": {"dim": 999, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 125}}}, "key": "uRound2.PKE-0586-4.61-8192", "param": [{"category": [3], "n": 586, "q": 8192, "secret_distribution": "((-1, 1), 104)", "claimed": 107, "ring": "\\sum_{i=0}^n x^i", "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 949, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 445, "inst": 0, "rop": 148}, "n": {"dim": 984, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 465, "inst": 0, "rop": 149}}, "0.265\u00a0\u03b2": {"2n": {"dim": 962, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 463, "inst": 0, "rop": 132}, "n": {"dim": 989, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 478, "inst": 0, "rop": 132}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 971, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 454, "inst": 0, "rop": 154}, "n": {"dim": 944, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 439, "inst": 0, "rop": 154}}, "0.368\u00a0\u03b2": {"2n": {"dim": 882, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 396, "inst": 0, "rop": 165}, "n": {"dim": 923, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 421, "inst": 0, "rop": 166}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 978, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 463, "inst": 0, "rop": 145}, "n": {"dim": 951, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 447, "inst": 0, "rop": 144}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 886, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 404, "inst": 0, "rop": 154}, "n": {"dim": 913, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 419, "inst": 0, "rop": 156}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 684, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 270, "inst": 0, "rop": 211}, "n": {"dim": 684, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 270, "inst": 0, "rop": 211}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 950, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 446, "inst": 0, "rop": 144}, "n": {"dim": 966, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 458, "inst": 0, "rop": 143}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 957, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 455, "inst": 0, "rop": 138}, "n": {"dim": 984, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 470, "inst": 0, "rop": 139}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 615, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 232, "inst": 0, "rop": 222}, "n": {"dim": 615, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 232, "inst": 0, "rop": 222}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 939, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 430, "inst": 0, "rop": 164}, "n": {"dim": 947, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 436, "inst": 0, "rop": 164}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 859, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 390, "inst": 0, "rop": 152}, "n": {"dim": 945, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 438, "inst": 0, "rop": 154}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 957, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 445, "inst": 0, "rop": 155}, "n": {"dim": 944, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 439, "inst": 0, "rop": 154}}, "0.292\u00a0\u03b2": {"2n": {"dim": 978, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 463, "inst": 0, "rop": 142}, "n": {"dim": 970, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 460, "inst": 0, "rop": 141}}}, "key": "uRound2.PKE-0586-4.61-8192", "param": [{"category": [3], "n": 586, "q": 8192, "secret_distribution": "((-1, 1), 104)", "claimed": 107, "ring": "\\sum_{i=0}^n x^i", "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1185, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 167}, "n": {"dim": 1185, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 167}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1170, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 541, "inst": 0, "rop": 144}, "n": {"dim": 1170, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 541, "inst": 0, "rop": 144}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1185, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 536, "inst": 0, "rop": 175}, "n": {"dim": 1185, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 536, "inst": 0, "rop": 175}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1156, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 521, "inst": 0, "rop": 199}, "n": {"dim": 1156, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 521, "inst": 0, "rop": 199}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1170, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 541, "inst": 0, "rop": 160}, "n": {"dim": 1170, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 541, "inst": 0, "rop": 160}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 951, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 411, "inst": 0, "rop": 194}, "n": {"dim": 951, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 411, "inst": 0, "rop": 194}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 738, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 283, "inst": 0, "rop": 294}, "n": {"dim": 738, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 283, "inst": 0, "rop": 294}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1185, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 161}, "n": {"dim": 1185, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 161}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1185, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 153}, "n": {"dim": 1185, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 153}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 707, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 274, "inst": 0, "rop": 313}, "n": {"dim": 707, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 274, "inst": 0, "rop": 313}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1185, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 536, "inst": 0, "rop": 188}, "n": {"dim": 1185, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 536, "inst": 0, "rop": 188}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1053, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 466, "inst": 0, "rop": 188}, "n": {"dim": 1053, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 466, "inst": 0, "rop": 188}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1170, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 541, "inst": 0, "rop": 173}, "n": {"dim": 1170, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 541, "inst": 0, "rop": 173}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1185, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 158}, "n": {"dim": 1185, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 158}}}, "key": "uRound2.PKE-0708-18.47-32768", "param": [{"category": [4, 5], "n": 708, "q": 32768, "secret_distribution": "((-1, 1), 140)", "claimed": 138, "ring": "\\sum_{i=0}^n x^i", "sd": 18.472953201911167}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1167, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 577, "inst": 0, "rop": 186}, "n": {"dim": 1168, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 578, "inst": 0, "rop": 186}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1179, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 594, "inst": 0, "rop": 166}, "n": {"dim": 1216, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 618, "inst": 0, "rop": 167}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1159, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 565, "inst": 0, "rop": 194}, "n": {"dim": 1195, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 590, "inst": 0, "rop": 193}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1151, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 556, "inst": 0, "rop": 212}, "n": {"dim": 1141, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 547, "inst": 0, "rop": 213}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1182, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 590, "inst": 0, "rop": 179}, "n": {"dim": 1188, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 591, "inst": 0, "rop": 180}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1015, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 477, "inst": 0, "rop": 209}, "n": {"dim": 1148, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 552, "inst": 0, "rop": 219}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 840, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 352, "inst": 0, "rop": 293}, "n": {"dim": 839, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 351, "inst": 0, "rop": 296}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1150, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 567, "inst": 0, "rop": 182}, "n": {"dim": 1188, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 591, "inst": 0, "rop": 181}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1215, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 613, "inst": 0, "rop": 174}, "n": {"dim": 1209, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 606, "inst": 0, "rop": 174}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 801, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 327, "inst": 0, "rop": 306}, "n": {"dim": 801, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 327, "inst": 0, "rop": 306}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1157, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 564, "inst": 0, "rop": 202}, "n": {"dim": 1157, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 564, "inst": 0, "rop": 202}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1050, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 497, "inst": 0, "rop": 204}, "n": {"dim": 1086, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 519, "inst": 0, "rop": 204}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1171, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 576, "inst": 0, "rop": 190}, "n": {"dim": 1195, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 590, "inst": 0, "rop": 191}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1176, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 582, "inst": 0, "rop": 180}, "n": {"dim": 1139, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 564, "inst": 0, "rop": 179}}}, "key": "uRound2.PKE-0708-18.47-32768", "param": [{"category": [4, 5], "n": 708, "q": 32768, "secret_distribution": "((-1, 1), 140)", "claimed": 138, "ring": "\\sum_{i=0}^n x^i", "sd": 18.472953201911167}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["NTRU"], "name": "NTRUEncrypt"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 816, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 316, "inst": 0, "rop": 101}}, "0.265\u00a0\u03b2": {"n": {"dim": 812, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 319, "inst": 0, "rop": 85}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 816, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 316, "inst": 0, "rop": 109}}, "0.368\u00a0\u03b2": {"n": {"dim": 816, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 316, "inst": 0, "rop": 117}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 812, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 319, "inst": 0, "rop": 101}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 816, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 316, "inst": 0, "rop": 92}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 816, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 316, "inst": 0, "rop": 186}}, "0.2975\u00a0\u03b2": {"n": {"dim": 816, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 316, "inst": 0, "rop": 95}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 812, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 319, "inst": 0, "rop": 93}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 816, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 316, "inst": 0, "rop": 208}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 812, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 319, "inst": 0, "rop": 123}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 816, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 316, "inst": 0, "rop": 93}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 812, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 319, "inst": 0, "rop": 114}}, "0.292\u00a0\u03b2": {"n": {"dim": 816, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 316, "inst": 0, "rop": 93}}}, "key": "NTRUEncrypt-0443-0.80-2048", "param": [{"category": [1], "n": 443, "q": 2048, "norm_g": 16.941074346097416, "norm_f": 16.941074346097416, "secret_distribution": "((-1, 1), 287)", "claimed": 84, "ring": "x^n - 1", "sd": 0.8048947325421136}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["NTRU"], "name": "NTRUEncrypt"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1345, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 185}}, "0.265\u00a0\u03b2": {"n": {"dim": 1345, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 159}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1345, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 599, "inst": 0, "rop": 192}}, "0.368\u00a0\u03b2": {"n": {"dim": 1345, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 221}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1345, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 599, "inst": 0, "rop": 176}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 1345, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 599, "inst": 0, "rop": 240}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 1345, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 599, "inst": 0, "rop": 441}}, "0.2975\u00a0\u03b2": {"n": {"dim": 1345, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 179}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1345, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 169}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1345, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 599, "inst": 0, "rop": 516}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1345, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 599, "inst": 0, "rop": 205}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 1345, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 599, "inst": 0, "rop": 221}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1345, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 599, "inst": 0, "rop": 189}}, "0.292\u00a0\u03b2": {"n": {"dim": 1345, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 175}}}, "key": "NTRUEncrypt-0743-0.82-2048", "param": [{"category": [1, 2, 3, 4, 5], "n": 743, "q": 2048, "norm_g": 22.24859546128699, "norm_f": 22.24859546128699, "secret_distribution": "((-1, 1), 495)", "claimed": 159, "ring": "x^n - 1", "sd": 0.8162218050219381}]}, {"attack": "primal", "scheme": {"primitive": ["KEM", "PKE"], "assumption": ["NTRU"], "name": "NTRUEncrypt"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 2049, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 935, "inst": 0, "rop": 283}}, "0.265\u00a0\u03b2": {"n": {"dim": 2049, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 935, "inst": 0, "rop": 248}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 2049, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 935, "inst": 0, "rop": 290}}, "0.368\u00a0\u03b2": {"n": {"dim": 2049, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 935, "inst": 0, "rop": 345}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 935, "inst": 0, "rop": 265}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 2049, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 935, "inst": 0, "rop": 448}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 2049, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 935, "inst": 0, "rop": 792}}, "0.2975\u00a0\u03b2": {"n": {"dim": 2049, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 935, "inst": 0, "rop": 279}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 935, "inst": 0, "rop": 258}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 2049, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 935, "inst": 0, "rop": 1043}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 2049, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 935, "inst": 0, "rop": 304}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 2049, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 935, "inst": 0, "rop": 396}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 2049, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 935, "inst": 0, "rop": 279}}, "0.292\u00a0\u03b2": {"n": {"dim": 2049, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 935, "inst": 0, "rop": 274}}}, "key": "NTRUEncrypt-1024-724.00-1073750017", "param": [{"category": [4, 5], "n": 1024, "q": 1073750017, "norm_g": 23168.0, "norm_f": 23168.0, "secret_distribution": "normal", "claimed": 198, "ring": "x^n - 1", "sd": 724.0}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["NTRU"], "name": "SNTRU Prime"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1327, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 528, "inst": 0, "rop": 164}}, "0.265\u00a0\u03b2": {"n": {"dim": 1327, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 528, "inst": 0, "rop": 140}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1327, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 528, "inst": 0, "rop": 171}}, "0.368\u00a0\u03b2": {"n": {"dim": 1327, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 528, "inst": 0, "rop": 195}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1327, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 528, "inst": 0, "rop": 157}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 1327, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 528, "inst": 0, "rop": 200}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 1323, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 518, "inst": 0, "rop": 370}}, "0.2975\u00a0\u03b2": {"n": {"dim": 1327, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 528, "inst": 0, "rop": 158}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1327, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 528, "inst": 0, "rop": 149}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1177, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 447, "inst": 0, "rop": 410}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1327, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 528, "inst": 0, "rop": 184}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 1327, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 528, "inst": 0, "rop": 187}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1327, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 528, "inst": 0, "rop": 170}}, "0.292\u00a0\u03b2": {"n": {"dim": 1327, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 528, "inst": 0, "rop": 155}}}, "key": "SNTRU Prime-0761-0.82-4591", "param": [{"category": [5], "n": 761, "q": 4591, "norm_g": 22.524061208701536, "norm_f": 16.911534525287763, "secret_distribution": "((-1, 1), 286)", "claimed": 248, "ring": "x^n - x - 1", "sd": 0.816496580927726}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 877, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 92}, "n": {"dim": 877, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 92}}, "0.265\u00a0\u03b2": {"2n": {"dim": 877, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 76}, "n": {"dim": 877, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 76}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 877, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 286, "inst": 0, "rop": 100}, "n": {"dim": 877, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 286, "inst": 0, "rop": 100}}, "0.368\u00a0\u03b2": {"2n": {"dim": 837, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 265, "inst": 0, "rop": 105}, "n": {"dim": 837, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 265, "inst": 0, "rop": 105}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 877, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 286, "inst": 0, "rop": 93}, "n": {"dim": 877, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 286, "inst": 0, "rop": 93}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 752, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 234, "inst": 0, "rop": 75}, "n": {"dim": 752, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 234, "inst": 0, "rop": 75}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 567, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 152, "inst": 0, "rop": 126}, "n": {"dim": 567, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 152, "inst": 0, "rop": 126}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 877, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 86}, "n": {"dim": 877, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 86}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 877, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 84}, "n": {"dim": 877, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 84}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 567, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 152, "inst": 0, "rop": 145}, "n": {"dim": 567, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 152, "inst": 0, "rop": 145}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 877, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 286, "inst": 0, "rop": 113}, "n": {"dim": 877, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 286, "inst": 0, "rop": 113}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 837, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 265, "inst": 0, "rop": 80}, "n": {"dim": 837, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 265, "inst": 0, "rop": 80}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 877, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 286, "inst": 0, "rop": 105}, "n": {"dim": 877, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 286, "inst": 0, "rop": 105}}, "0.292\u00a0\u03b2": {"2n": {"dim": 877, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 84}, "n": {"dim": 877, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 84}}}, "key": "uRound2.KEM-0500-2.29-16384", "param": [{"category": [1], "n": 500, "q": 16384, "secret_distribution": "((-1, 1), 74)", "claimed": 74, "sd": 2.29128784747792}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 814, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 288, "inst": 0, "rop": 100}, "n": {"dim": 839, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 300, "inst": 0, "rop": 100}}, "0.265\u00a0\u03b2": {"2n": {"dim": 834, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 306, "inst": 0, "rop": 88}, "n": {"dim": 828, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 304, "inst": 0, "rop": 88}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 783, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 271, "inst": 0, "rop": 106}, "n": {"dim": 807, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 281, "inst": 0, "rop": 106}}, "0.368\u00a0\u03b2": {"2n": {"dim": 787, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 270, "inst": 0, "rop": 109}, "n": {"dim": 780, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 267, "inst": 0, "rop": 109}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 814, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 288, "inst": 0, "rop": 100}, "n": {"dim": 839, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 300, "inst": 0, "rop": 100}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 801, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 290, "inst": 0, "rop": 90}, "n": {"dim": 801, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 290, "inst": 0, "rop": 90}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 618, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 187, "inst": 0, "rop": 127}, "n": {"dim": 618, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 187, "inst": 0, "rop": 127}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 795, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 283, "inst": 0, "rop": 95}, "n": {"dim": 819, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 294, "inst": 0, "rop": 95}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 845, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 307, "inst": 0, "rop": 94}, "n": {"dim": 821, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 94}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 656, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 198, "inst": 0, "rop": 144}, "n": {"dim": 656, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 198, "inst": 0, "rop": 144}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 805, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 275, "inst": 0, "rop": 116}, "n": {"dim": 806, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 277, "inst": 0, "rop": 116}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 821, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 296, "inst": 0, "rop": 93}, "n": {"dim": 822, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 297, "inst": 0, "rop": 93}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 780, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 267, "inst": 0, "rop": 110}, "n": {"dim": 803, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 277, "inst": 0, "rop": 110}}, "0.292\u00a0\u03b2": {"2n": {"dim": 832, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 300, "inst": 0, "rop": 94}, "n": {"dim": 821, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 94}}}, "key": "uRound2.KEM-0500-2.29-16384", "param": [{"category": [1], "n": 500, "q": 16384, "secret_distribution": "((-1, 1), 74)", "claimed": 74, "sd": 2.29128784747792}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1021, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 113}, "n": {"dim": 1021, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 113}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1021, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 95}, "n": {"dim": 1021, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 95}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1021, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 355, "inst": 0, "rop": 121}, "n": {"dim": 1021, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 355, "inst": 0, "rop": 121}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1021, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 131}, "n": {"dim": 1021, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 131}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1021, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 355, "inst": 0, "rop": 111}, "n": {"dim": 1021, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 355, "inst": 0, "rop": 111}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1021, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 355, "inst": 0, "rop": 110}, "n": {"dim": 1021, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 355, "inst": 0, "rop": 110}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 742, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 225, "inst": 0, "rop": 188}, "n": {"dim": 742, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 225, "inst": 0, "rop": 188}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1021, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 106}, "n": {"dim": 1021, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 106}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1021, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 103}, "n": {"dim": 1021, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 103}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 742, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 225, "inst": 0, "rop": 207}, "n": {"dim": 742, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 225, "inst": 0, "rop": 207}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1021, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 355, "inst": 0, "rop": 134}, "n": {"dim": 1021, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 355, "inst": 0, "rop": 134}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1021, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 355, "inst": 0, "rop": 109}, "n": {"dim": 1021, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 355, "inst": 0, "rop": 109}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1021, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 355, "inst": 0, "rop": 124}, "n": {"dim": 1021, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 355, "inst": 0, "rop": 124}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1021, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 104}, "n": {"dim": 1021, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 104}}}, "key": "uRound2.KEM-0580-4.61-32768", "param": [{"category": [2], "n": 580, "q": 32768, "secret_distribution": "((-1, 1), 116)", "claimed": 96, "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1026, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 390, "inst": 0, "rop": 126}, "n": {"dim": 1030, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 393, "inst": 0, "rop": 126}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1048, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 408, "inst": 0, "rop": 111}, "n": {"dim": 1023, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 398, "inst": 0, "rop": 111}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1020, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 383, "inst": 0, "rop": 132}, "n": {"dim": 1027, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 388, "inst": 0, "rop": 132}}, "0.368\u00a0\u03b2": {"2n": {"dim": 961, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 352, "inst": 0, "rop": 141}, "n": {"dim": 1016, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 142}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1034, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 396, "inst": 0, "rop": 124}, "n": {"dim": 1030, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 393, "inst": 0, "rop": 123}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 942, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 351, "inst": 0, "rop": 126}, "n": {"dim": 943, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 351, "inst": 0, "rop": 126}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 870, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 293, "inst": 0, "rop": 192}, "n": {"dim": 870, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 293, "inst": 0, "rop": 192}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1021, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 390, "inst": 0, "rop": 120}, "n": {"dim": 1012, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 387, "inst": 0, "rop": 120}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1041, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 401, "inst": 0, "rop": 118}, "n": {"dim": 1009, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 386, "inst": 0, "rop": 118}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 826, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 271, "inst": 0, "rop": 203}, "n": {"dim": 826, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 271, "inst": 0, "rop": 203}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 992, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 365, "inst": 0, "rop": 142}, "n": {"dim": 1001, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 371, "inst": 0, "rop": 142}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1025, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 388, "inst": 0, "rop": 127}, "n": {"dim": 984, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 370, "inst": 0, "rop": 125}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1020, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 383, "inst": 0, "rop": 134}, "n": {"dim": 1034, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 389, "inst": 0, "rop": 135}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1036, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 398, "inst": 0, "rop": 119}, "n": {"dim": 1019, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 391, "inst": 0, "rop": 119}}}, "key": "uRound2.KEM-0580-4.61-32768", "param": [{"category": [2], "n": 580, "q": 32768, "secret_distribution": "((-1, 1), 116)", "claimed": 96, "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 124}, "n": {"dim": 1102, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 124}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 105}, "n": {"dim": 1102, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 105}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1102, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 394, "inst": 0, "rop": 132}, "n": {"dim": 1102, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 394, "inst": 0, "rop": 132}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 145}, "n": {"dim": 1102, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 145}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1102, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 394, "inst": 0, "rop": 121}, "n": {"dim": 1102, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 394, "inst": 0, "rop": 121}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1075, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 380, "inst": 0, "rop": 128}, "n": {"dim": 1075, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 380, "inst": 0, "rop": 128}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 736, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 229, "inst": 0, "rop": 213}, "n": {"dim": 736, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 229, "inst": 0, "rop": 213}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 118}, "n": {"dim": 1102, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 118}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 114}, "n": {"dim": 1102, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 114}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 736, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 229, "inst": 0, "rop": 232}, "n": {"dim": 736, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 229, "inst": 0, "rop": 232}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1102, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 394, "inst": 0, "rop": 145}, "n": {"dim": 1102, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 394, "inst": 0, "rop": 145}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1102, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 394, "inst": 0, "rop": 126}, "n": {"dim": 1102, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 394, "inst": 0, "rop": 126}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1102, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 394, "inst": 0, "rop": 134}, "n": {"dim": 1102, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 394, "inst": 0, "rop": 134}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 116}, "n": {"dim": 1102, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 116}}}, "key": "uRound2.KEM-0630-4.61-32768", "param": [{"category": [3], "n": 630, "q": 32768, "secret_distribution": "((-1, 1), 126)", "claimed": 106, "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1110, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 431, "inst": 0, "rop": 138}, "n": {"dim": 1111, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 433, "inst": 0, "rop": 138}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1125, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 447, "inst": 0, "rop": 122}, "n": {"dim": 1110, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 441, "inst": 0, "rop": 122}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1103, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 423, "inst": 0, "rop": 145}, "n": {"dim": 1108, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 427, "inst": 0, "rop": 144}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1095, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 414, "inst": 0, "rop": 158}, "n": {"dim": 1097, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 417, "inst": 0, "rop": 157}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1110, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 431, "inst": 0, "rop": 136}, "n": {"dim": 1112, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 434, "inst": 0, "rop": 135}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1052, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 400, "inst": 0, "rop": 143}, "n": {"dim": 1026, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 390, "inst": 0, "rop": 143}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 887, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 301, "inst": 0, "rop": 213}, "n": {"dim": 1001, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 351, "inst": 0, "rop": 227}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1085, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 133}, "n": {"dim": 1085, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 133}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1117, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 439, "inst": 0, "rop": 129}, "n": {"dim": 1087, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 426, "inst": 0, "rop": 129}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 833, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 274, "inst": 0, "rop": 224}, "n": {"dim": 833, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 274, "inst": 0, "rop": 224}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1063, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 399, "inst": 0, "rop": 157}, "n": {"dim": 1100, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 419, "inst": 0, "rop": 155}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1079, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 414, "inst": 0, "rop": 142}, "n": {"dim": 1077, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 414, "inst": 0, "rop": 141}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1103, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 146}, "n": {"dim": 1105, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 426, "inst": 0, "rop": 146}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1109, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 434, "inst": 0, "rop": 131}, "n": {"dim": 1102, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 432, "inst": 0, "rop": 131}}}, "key": "uRound2.KEM-0630-4.61-32768", "param": [{"category": [3], "n": 630, "q": 32768, "secret_distribution": "((-1, 1), 126)", "claimed": 106, "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 161}, "n": {"dim": 1337, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 161}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 138}, "n": {"dim": 1337, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 138}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1337, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 518, "inst": 0, "rop": 168}, "n": {"dim": 1337, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 518, "inst": 0, "rop": 168}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1368, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 191}, "n": {"dim": 1368, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 191}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 518, "inst": 0, "rop": 154}, "n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 518, "inst": 0, "rop": 154}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1177, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 432, "inst": 0, "rop": 188}, "n": {"dim": 1177, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 432, "inst": 0, "rop": 188}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 856, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 290, "inst": 0, "rop": 294}, "n": {"dim": 856, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 290, "inst": 0, "rop": 294}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 155}, "n": {"dim": 1337, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 155}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 147}, "n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 147}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 850, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 276, "inst": 0, "rop": 314}, "n": {"dim": 850, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 276, "inst": 0, "rop": 314}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1337, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 518, "inst": 0, "rop": 182}, "n": {"dim": 1337, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 518, "inst": 0, "rop": 182}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1306, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 488, "inst": 0, "rop": 181}, "n": {"dim": 1306, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 488, "inst": 0, "rop": 181}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 518, "inst": 0, "rop": 168}, "n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 518, "inst": 0, "rop": 168}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 152}, "n": {"dim": 1337, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 152}}}, "key": "uRound2.KEM-0786-4.61-32768", "param": [{"category": [4], "n": 786, "q": 32768, "secret_distribution": "((-1, 1), 156)", "claimed": 139, "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1374, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 562, "inst": 0, "rop": 180}, "n": {"dim": 1330, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 546, "inst": 0, "rop": 176}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1375, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 576, "inst": 0, "rop": 157}, "n": {"dim": 1377, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 579, "inst": 0, "rop": 157}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1355, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 552, "inst": 0, "rop": 183}, "n": {"dim": 1359, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 556, "inst": 0, "rop": 183}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1320, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 528, "inst": 0, "rop": 203}, "n": {"dim": 1308, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 523, "inst": 0, "rop": 202}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1361, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 562, "inst": 0, "rop": 171}, "n": {"dim": 1362, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 564, "inst": 0, "rop": 171}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1302, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 520, "inst": 0, "rop": 205}, "n": {"dim": 1265, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 502, "inst": 0, "rop": 202}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1092, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 394, "inst": 0, "rop": 296}, "n": {"dim": 1092, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 394, "inst": 0, "rop": 296}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1361, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 562, "inst": 0, "rop": 172}, "n": {"dim": 1362, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 564, "inst": 0, "rop": 172}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1370, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 567, "inst": 0, "rop": 165}, "n": {"dim": 1384, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 576, "inst": 0, "rop": 165}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 953, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 326, "inst": 0, "rop": 306}, "n": {"dim": 953, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 326, "inst": 0, "rop": 306}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1350, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 550, "inst": 0, "rop": 194}, "n": {"dim": 1320, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 534, "inst": 0, "rop": 193}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1306, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 524, "inst": 0, "rop": 195}, "n": {"dim": 1273, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 509, "inst": 0, "rop": 194}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1355, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 552, "inst": 0, "rop": 183}, "n": {"dim": 1352, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 552, "inst": 0, "rop": 182}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1361, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 562, "inst": 0, "rop": 170}, "n": {"dim": 1362, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 564, "inst": 0, "rop": 170}}}, "key": "uRound2.KEM-0786-4.61-32768", "param": [{"category": [4], "n": 786, "q": 32768, "secret_distribution": "((-1, 1), 156)", "claimed": 139, "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 161}, "n": {"dim": 1337, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 161}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 138}, "n": {"dim": 1337, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 138}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1337, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 518, "inst": 0, "rop": 168}, "n": {"dim": 1337, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 518, "inst": 0, "rop": 168}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1368, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 191}, "n": {"dim": 1368, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 191}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 518, "inst": 0, "rop": 154}, "n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 518, "inst": 0, "rop": 154}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1177, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 432, "inst": 0, "rop": 188}, "n": {"dim": 1177, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 432, "inst": 0, "rop": 188}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 856, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 290, "inst": 0, "rop": 294}, "n": {"dim": 856, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 290, "inst": 0, "rop": 294}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 155}, "n": {"dim": 1337, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 155}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 147}, "n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 147}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 850, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 276, "inst": 0, "rop": 314}, "n": {"dim": 850, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 276, "inst": 0, "rop": 314}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1337, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 518, "inst": 0, "rop": 182}, "n": {"dim": 1337, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 518, "inst": 0, "rop": 182}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1306, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 488, "inst": 0, "rop": 181}, "n": {"dim": 1306, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 488, "inst": 0, "rop": 181}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 518, "inst": 0, "rop": 168}, "n": {"dim": 1337, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 518, "inst": 0, "rop": 168}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1337, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 152}, "n": {"dim": 1337, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 518, "inst": 0, "rop": 152}}}, "key": "uRound2.KEM-0786-4.61-32768", "param": [{"category": [5], "n": 786, "q": 32768, "secret_distribution": "((-1, 1), 156)", "claimed": 138, "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["LWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1374, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 562, "inst": 0, "rop": 180}, "n": {"dim": 1330, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 546, "inst": 0, "rop": 176}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1375, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 576, "inst": 0, "rop": 157}, "n": {"dim": 1377, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 579, "inst": 0, "rop": 157}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1355, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 552, "inst": 0, "rop": 183}, "n": {"dim": 1359, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 556, "inst": 0, "rop": 183}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1320, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 528, "inst": 0, "rop": 203}, "n": {"dim": 1308, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 523, "inst": 0, "rop": 202}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1361, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 562, "inst": 0, "rop": 171}, "n": {"dim": 1362, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 564, "inst": 0, "rop": 171}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1302, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 520, "inst": 0, "rop": 205}, "n": {"dim": 1265, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 502, "inst": 0, "rop": 202}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1092, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 394, "inst": 0, "rop": 296}, "n": {"dim": 1092, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 394, "inst": 0, "rop": 296}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1361, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 562, "inst": 0, "rop": 172}, "n": {"dim": 1362, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 564, "inst": 0, "rop": 172}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1370, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 567, "inst": 0, "rop": 165}, "n": {"dim": 1384, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 576, "inst": 0, "rop": 165}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 953, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 326, "inst": 0, "rop": 306}, "n": {"dim": 953, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 326, "inst": 0, "rop": 306}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1350, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 550, "inst": 0, "rop": 194}, "n": {"dim": 1320, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 534, "inst": 0, "rop": 193}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1306, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 524, "inst": 0, "rop": 195}, "n": {"dim": 1273, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 509, "inst": 0, "rop": 194}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1355, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 552, "inst": 0, "rop": 183}, "n": {"dim": 1352, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 552, "inst": 0, "rop": 182}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1361, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 562, "inst": 0, "rop": 170}, "n": {"dim": 1362, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 564, "inst": 0, "rop": 170}}}, "key": "uRound2.KEM-0786-4.61-32768", "param": [{"category": [5], "n": 786, "q": 32768, "secret_distribution": "((-1, 1), 156)", "claimed": 138, "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["PLWE"], "name": "Titanium.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1980, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 194}, "n": {"dim": 1980, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 194}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1980, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 168}, "n": {"dim": 1980, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 168}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1980, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 631, "inst": 0, "rop": 201}, "n": {"dim": 1980, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 631, "inst": 0, "rop": 201}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1980, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 233}, "n": {"dim": 1980, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 233}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1980, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 631, "inst": 0, "rop": 184}, "n": {"dim": 1980, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 631, "inst": 0, "rop": 184}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1980, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 631, "inst": 0, "rop": 258}, "n": {"dim": 1980, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 631, "inst": 0, "rop": 258}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1980, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 631, "inst": 0, "rop": 473}, "n": {"dim": 1980, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 631, "inst": 0, "rop": 473}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1980, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 188}, "n": {"dim": 1980, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 188}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1980, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 177}, "n": {"dim": 1980, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 177}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1980, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 631, "inst": 0, "rop": 559}, "n": {"dim": 1980, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 631, "inst": 0, "rop": 559}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1980, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 631, "inst": 0, "rop": 215}, "n": {"dim": 1980, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 631, "inst": 0, "rop": 215}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1980, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 631, "inst": 0, "rop": 237}, "n": {"dim": 1980, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 631, "inst": 0, "rop": 237}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1980, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 631, "inst": 0, "rop": 198}, "n": {"dim": 1980, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 631, "inst": 0, "rop": 198}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1980, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 185}, "n": {"dim": 1980, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 631, "inst": 0, "rop": 185}}}, "key": "Titanium.KEM-1024-1.41-118273", "param": [{"category": [1], "n": 1024, "q": 118273, "secret_distribution": "normal", "claimed": 128, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["PLWE"], "name": "Titanium.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 730, "inst": 0, "rop": 223}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 721, "inst": 0, "rop": 221}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 730, "inst": 0, "rop": 194}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 735, "inst": 0, "rop": 195}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2131, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 711, "inst": 0, "rop": 228}, "n": {"dim": 2048, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 721, "inst": 0, "rop": 227}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2125, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 706, "inst": 0, "rop": 260}, "n": {"dim": 2048, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 709, "inst": 0, "rop": 261}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2152, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 730, "inst": 0, "rop": 210}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 735, "inst": 0, "rop": 212}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2107, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 690, "inst": 0, "rop": 293}, "n": {"dim": 2048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 691, "inst": 0, "rop": 294}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2062, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 651, "inst": 0, "rop": 493}, "n": {"dim": 2048, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 651, "inst": 0, "rop": 493}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2137, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 717, "inst": 0, "rop": 217}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 721, "inst": 0, "rop": 215}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 730, "inst": 0, "rop": 203}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 735, "inst": 0, "rop": 205}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2045, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 636, "inst": 0, "rop": 565}, "n": {"dim": 2045, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 636, "inst": 0, "rop": 565}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2131, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 711, "inst": 0, "rop": 239}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 721, "inst": 0, "rop": 241}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2125, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 706, "inst": 0, "rop": 274}, "n": {"dim": 2048, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 709, "inst": 0, "rop": 276}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2152, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 730, "inst": 0, "rop": 224}, "n": {"dim": 2048, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 716, "inst": 0, "rop": 222}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2152, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 730, "inst": 0, "rop": 214}, "n": {"dim": 2048, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 721, "inst": 0, "rop": 213}}}, "key": "Titanium.KEM-1024-1.41-118273", "param": [{"category": [1], "n": 1024, "q": 118273, "secret_distribution": "normal", "claimed": 128, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["PLWE"], "name": "Titanium.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2473, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 223}, "n": {"dim": 2473, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 223}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2473, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 194}, "n": {"dim": 2473, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 194}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2473, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 731, "inst": 0, "rop": 230}, "n": {"dim": 2473, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 731, "inst": 0, "rop": 230}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2473, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 270}, "n": {"dim": 2473, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 270}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2473, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 731, "inst": 0, "rop": 211}, "n": {"dim": 2473, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 731, "inst": 0, "rop": 211}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2473, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 731, "inst": 0, "rop": 318}, "n": {"dim": 2473, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 731, "inst": 0, "rop": 318}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2473, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 731, "inst": 0, "rop": 574}, "n": {"dim": 2473, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 731, "inst": 0, "rop": 574}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2473, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 218}, "n": {"dim": 2473, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 218}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2473, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 204}, "n": {"dim": 2473, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 204}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2473, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 731, "inst": 0, "rop": 702}, "n": {"dim": 2473, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 731, "inst": 0, "rop": 702}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2473, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 731, "inst": 0, "rop": 245}, "n": {"dim": 2473, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 731, "inst": 0, "rop": 245}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2473, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 731, "inst": 0, "rop": 287}, "n": {"dim": 2473, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 731, "inst": 0, "rop": 287}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2473, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 731, "inst": 0, "rop": 225}, "n": {"dim": 2473, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 731, "inst": 0, "rop": 225}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2473, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 214}, "n": {"dim": 2473, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 731, "inst": 0, "rop": 214}}}, "key": "Titanium.KEM-1280-1.41-430081", "param": [{"category": [1], "n": 1280, "q": 430081, "secret_distribution": "normal", "claimed": 160, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["PLWE"], "name": "Titanium.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2665, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 835, "inst": 0, "rop": 254}, "n": {"dim": 2560, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 825, "inst": 0, "rop": 251}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2665, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 835, "inst": 0, "rop": 222}, "n": {"dim": 2560, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 840, "inst": 0, "rop": 223}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2637, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 812, "inst": 0, "rop": 260}, "n": {"dim": 2560, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 825, "inst": 0, "rop": 258}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2635, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 810, "inst": 0, "rop": 299}, "n": {"dim": 2560, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 813, "inst": 0, "rop": 300}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2665, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 835, "inst": 0, "rop": 238}, "n": {"dim": 2560, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 840, "inst": 0, "rop": 240}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2621, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 799, "inst": 0, "rop": 360}, "n": {"dim": 2560, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 793, "inst": 0, "rop": 357}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2566, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 754, "inst": 0, "rop": 598}, "n": {"dim": 2541, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 735, "inst": 0, "rop": 596}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2649, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 822, "inst": 0, "rop": 245}, "n": {"dim": 2560, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 825, "inst": 0, "rop": 246}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2665, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 835, "inst": 0, "rop": 231}, "n": {"dim": 2560, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 840, "inst": 0, "rop": 233}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2537, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 732, "inst": 0, "rop": 704}, "n": {"dim": 2537, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 732, "inst": 0, "rop": 704}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2637, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 812, "inst": 0, "rop": 268}, "n": {"dim": 2560, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 825, "inst": 0, "rop": 272}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2621, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 799, "inst": 0, "rop": 323}, "n": {"dim": 2560, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 800, "inst": 0, "rop": 323}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2665, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 835, "inst": 0, "rop": 253}, "n": {"dim": 2560, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 816, "inst": 0, "rop": 252}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2665, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 835, "inst": 0, "rop": 244}, "n": {"dim": 2560, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 825, "inst": 0, "rop": 241}}}, "key": "Titanium.KEM-1280-1.41-430081", "param": [{"category": [1], "n": 1280, "q": 430081, "secret_distribution": "normal", "claimed": 160, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["PLWE"], "name": "Titanium.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2940, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 263}, "n": {"dim": 2940, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 263}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2940, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 230}, "n": {"dim": 2940, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 230}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2940, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 867, "inst": 0, "rop": 270}, "n": {"dim": 2940, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 867, "inst": 0, "rop": 270}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2940, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 320}, "n": {"dim": 2940, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 320}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2940, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 867, "inst": 0, "rop": 247}, "n": {"dim": 2940, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 867, "inst": 0, "rop": 247}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2940, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 867, "inst": 0, "rop": 404}, "n": {"dim": 2940, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 867, "inst": 0, "rop": 404}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2940, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 867, "inst": 0, "rop": 718}, "n": {"dim": 2940, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 867, "inst": 0, "rop": 718}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2940, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 258}, "n": {"dim": 2940, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 258}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2940, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 240}, "n": {"dim": 2940, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 240}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2940, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 867, "inst": 0, "rop": 923}, "n": {"dim": 2940, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 867, "inst": 0, "rop": 923}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2940, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 867, "inst": 0, "rop": 285}, "n": {"dim": 2940, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 867, "inst": 0, "rop": 285}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2940, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 867, "inst": 0, "rop": 359}, "n": {"dim": 2940, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 867, "inst": 0, "rop": 359}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2940, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 867, "inst": 0, "rop": 261}, "n": {"dim": 2940, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 867, "inst": 0, "rop": 261}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2940, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 254}, "n": {"dim": 2940, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 867, "inst": 0, "rop": 254}}}, "key": "Titanium.KEM-1536-1.41-783361", "param": [{"category": [3], "n": 1536, "q": 783361, "secret_distribution": "normal", "claimed": 192, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["PLWE"], "name": "Titanium.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3146, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 959, "inst": 0, "rop": 291}, "n": {"dim": 3072, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 291}}, "0.265\u00a0\u03b2": {"2n": {"dim": 3179, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 987, "inst": 0, "rop": 262}, "n": {"dim": 3072, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 976, "inst": 0, "rop": 259}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3146, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 959, "inst": 0, "rop": 297}, "n": {"dim": 3072, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 962, "inst": 0, "rop": 298}}, "0.368\u00a0\u03b2": {"2n": {"dim": 3146, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 959, "inst": 0, "rop": 353}, "n": {"dim": 3072, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 355}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3179, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 987, "inst": 0, "rop": 278}, "n": {"dim": 3072, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 976, "inst": 0, "rop": 276}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 3114, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 934, "inst": 0, "rop": 447}, "n": {"dim": 3072, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 925, "inst": 0, "rop": 441}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 3057, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 889, "inst": 0, "rop": 741}, "n": {"dim": 3057, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 889, "inst": 0, "rop": 741}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 3146, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 959, "inst": 0, "rop": 289}, "n": {"dim": 3072, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 287}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3179, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 987, "inst": 0, "rop": 272}, "n": {"dim": 3072, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 976, "inst": 0, "rop": 269}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3027, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 866, "inst": 0, "rop": 921}, "n": {"dim": 3027, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 866, "inst": 0, "rop": 921}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3146, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 959, "inst": 0, "rop": 312}, "n": {"dim": 3072, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 962, "inst": 0, "rop": 312}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 3135, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 951, "inst": 0, "rop": 405}, "n": {"dim": 3072, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 945, "inst": 0, "rop": 402}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3179, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 987, "inst": 0, "rop": 293}, "n": {"dim": 3072, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 976, "inst": 0, "rop": 290}}, "0.292\u00a0\u03b2": {"2n": {"dim": 3146, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 959, "inst": 0, "rop": 289}, "n": {"dim": 3072, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 962, "inst": 0, "rop": 284}}}, "key": "Titanium.KEM-1536-1.41-783361", "param": [{"category": [3], "n": 1536, "q": 783361, "secret_distribution": "normal", "claimed": 192, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["PLWE"], "name": "Titanium.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 356}, "n": {"dim": 3914, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 356}}, "0.265\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 314}, "n": {"dim": 3914, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 314}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3914, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1183, "inst": 0, "rop": 362}, "n": {"dim": 3914, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1183, "inst": 0, "rop": 362}}, "0.368\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 436}, "n": {"dim": 3914, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 436}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1183, "inst": 0, "rop": 330}, "n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1183, "inst": 0, "rop": 330}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 3914, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1183, "inst": 0, "rop": 616}, "n": {"dim": 3914, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1183, "inst": 0, "rop": 616}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 3914, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1183, "inst": 0, "rop": 1073}, "n": {"dim": 3914, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1183, "inst": 0, "rop": 1073}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 352}, "n": {"dim": 3914, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 352}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 324}, "n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 324}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3914, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 1547}, "n": {"dim": 3914, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 1547}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3914, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 377}, "n": {"dim": 3914, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 377}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 3914, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1183, "inst": 0, "rop": 537}, "n": {"dim": 3914, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1183, "inst": 0, "rop": 537}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 345}, "n": {"dim": 3914, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1183, "inst": 0, "rop": 345}}, "0.292\u00a0\u03b2": {"2n": {"dim": 3914, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 346}, "n": {"dim": 3914, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1183, "inst": 0, "rop": 346}}}, "key": "Titanium.KEM-2048-1.41-1198081", "param": [{"category": [5], "n": 2048, "q": 1198081, "secret_distribution": "normal", "claimed": 256, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["PLWE"], "name": "Titanium.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 395}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 395}}, "0.265\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 349}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 350}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4159, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1314, "inst": 0, "rop": 401}, "n": {"dim": 4096, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1317, "inst": 0, "rop": 401}}, "0.368\u00a0\u03b2": {"2n": {"dim": 4162, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1316, "inst": 0, "rop": 485}, "n": {"dim": 4096, "name": "0.368\u00a0\u03b2", "drop": false, "beta": 1268, "inst": 0, "rop": 483}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 4159, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1314, "inst": 0, "rop": 365}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1317, "inst": 0, "rop": 366}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 4060, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1234, "inst": 0, "rop": 652}, "n": {"dim": 4061, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 1235, "inst": 0, "rop": 652}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 4021, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1203, "inst": 0, "rop": 1096}, "n": {"dim": 4021, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": false, "beta": 1203, "inst": 0, "rop": 1096}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 391}, "n": {"dim": 4096, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 392}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 359}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 360}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3936, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1138, "inst": 0, "rop": 1474}, "n": {"dim": 3936, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1138, "inst": 0, "rop": 1474}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4159, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1314, "inst": 0, "rop": 416}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1317, "inst": 0, "rop": 416}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 4120, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1282, "inst": 0, "rop": 595}, "n": {"dim": 4096, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": false, "beta": 1282, "inst": 0, "rop": 595}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 4159, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1314, "inst": 0, "rop": 380}, "n": {"dim": 4096, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1317, "inst": 0, "rop": 381}}, "0.292\u00a0\u03b2": {"2n": {"dim": 4159, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1314, "inst": 0, "rop": 384}, "n": {"dim": 4096, "name": "0.292\u00a0\u03b2", "drop": false, "beta": 1317, "inst": 0, "rop": 385}}}, "key": "Titanium.KEM-2048-1.41-1198081", "param": [{"category": [5], "n": 2048, "q": 1198081, "secret_distribution": "normal", "claimed": 256, "ring": "x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}", "sd": 1.4142135623730951}]}, {"attack": "primal", "scheme": {"primitive": ["SIG"], "assumption": ["NTRU"], "name": "pqNTRUsign"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1861, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 177}}, "0.265\u00a0\u03b2": {"n": {"dim": 1861, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 152}}, "292\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1861, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 573, "inst": 0, "rop": 184}}, "0.368\u00a0\u03b2": {"n": {"dim": 1861, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 211}}, "0.265\u00a0\u03b2 +\u00a016.4": {"n": {"dim": 1861, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 573, "inst": 0, "rop": 169}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"n": {"dim": 1861, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 573, "inst": 0, "rop": 225}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"n": {"dim": 1861, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 573, "inst": 0, "rop": 416}}, "0.2975\u00a0\u03b2": {"n": {"dim": 1861, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 171}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"n": {"dim": 1861, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 162}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1851, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 569, "inst": 0, "rop": 480}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1861, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 573, "inst": 0, "rop": 198}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"n": {"dim": 1861, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 573, "inst": 0, "rop": 208}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"n": {"dim": 1861, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 573, "inst": 0, "rop": 183}}, "0.292\u00a0\u03b2": {"n": {"dim": 1861, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 168}}}, "key": "pqNTRUsign-1024-0.70-65537", "param": [{"category": [1, 2, 3, 4, 5], "n": 1024, "q": 65537, "norm_g": 22.38302928559939, "norm_f": 22.38302928559939, "secret_distribution": "((-1, 1), 501)", "claimed": 149, "ring": "x^n - 1", "sd": 0.699469665174981}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 845, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 276, "inst": 0, "rop": 93}, "n": {"dim": 845, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 276, "inst": 0, "rop": 93}}, "0.265\u00a0\u03b2": {"2n": {"dim": 859, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 77}, "n": {"dim": 859, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 77}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 859, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 286, "inst": 0, "rop": 101}, "n": {"dim": 859, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 286, "inst": 0, "rop": 101}}, "0.368\u00a0\u03b2": {"2n": {"dim": 803, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 255, "inst": 0, "rop": 105}, "n": {"dim": 803, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 255, "inst": 0, "rop": 105}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 859, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 286, "inst": 0, "rop": 93}, "n": {"dim": 859, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 286, "inst": 0, "rop": 93}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 766, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 234, "inst": 0, "rop": 75}, "n": {"dim": 766, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 234, "inst": 0, "rop": 75}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 578, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 157, "inst": 0, "rop": 126}, "n": {"dim": 578, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 157, "inst": 0, "rop": 126}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 845, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 276, "inst": 0, "rop": 86}, "n": {"dim": 845, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 276, "inst": 0, "rop": 86}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 859, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 85}, "n": {"dim": 859, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 85}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 578, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 157, "inst": 0, "rop": 146}, "n": {"dim": 578, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 157, "inst": 0, "rop": 146}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 859, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 286, "inst": 0, "rop": 113}, "n": {"dim": 859, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 286, "inst": 0, "rop": 113}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 803, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 255, "inst": 0, "rop": 80}, "n": {"dim": 803, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 255, "inst": 0, "rop": 80}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 859, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 286, "inst": 0, "rop": 106}, "n": {"dim": 859, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 286, "inst": 0, "rop": 106}}, "0.292\u00a0\u03b2": {"2n": {"dim": 859, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 84}, "n": {"dim": 859, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 286, "inst": 0, "rop": 84}}}, "key": "uRound2.PKE-0500-4.61-32768", "param": [{"category": [1], "n": 500, "q": 32768, "secret_distribution": "((-1, 1), 74)", "claimed": 74, "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 816, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 289, "inst": 0, "rop": 100}, "n": {"dim": 837, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 298, "inst": 0, "rop": 101}}, "0.265\u00a0\u03b2": {"2n": {"dim": 859, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 318, "inst": 0, "rop": 89}, "n": {"dim": 828, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 304, "inst": 0, "rop": 88}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 790, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 274, "inst": 0, "rop": 106}, "n": {"dim": 783, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 271, "inst": 0, "rop": 106}}, "0.368\u00a0\u03b2": {"2n": {"dim": 827, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 288, "inst": 0, "rop": 112}, "n": {"dim": 770, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 263, "inst": 0, "rop": 109}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 816, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 289, "inst": 0, "rop": 100}, "n": {"dim": 839, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 300, "inst": 0, "rop": 101}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 823, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 299, "inst": 0, "rop": 91}, "n": {"dim": 754, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 270, "inst": 0, "rop": 90}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 641, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 197, "inst": 0, "rop": 129}, "n": {"dim": 641, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 197, "inst": 0, "rop": 129}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 796, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 284, "inst": 0, "rop": 95}, "n": {"dim": 819, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 294, "inst": 0, "rop": 95}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 843, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 305, "inst": 0, "rop": 95}, "n": {"dim": 823, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 296, "inst": 0, "rop": 94}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 655, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 197, "inst": 0, "rop": 144}, "n": {"dim": 655, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 197, "inst": 0, "rop": 144}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 797, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 271, "inst": 0, "rop": 117}, "n": {"dim": 813, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 280, "inst": 0, "rop": 116}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 798, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 287, "inst": 0, "rop": 92}, "n": {"dim": 821, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 296, "inst": 0, "rop": 93}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 793, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 273, "inst": 0, "rop": 110}, "n": {"dim": 780, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 267, "inst": 0, "rop": 110}}, "0.292\u00a0\u03b2": {"2n": {"dim": 843, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 305, "inst": 0, "rop": 95}, "n": {"dim": 823, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 296, "inst": 0, "rop": 94}}}, "key": "uRound2.PKE-0500-4.61-32768", "param": [{"category": [1], "n": 500, "q": 32768, "secret_distribution": "((-1, 1), 74)", "claimed": 74, "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1035, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 114}, "n": {"dim": 1035, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 114}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1035, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 95}, "n": {"dim": 1035, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 95}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1035, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 358, "inst": 0, "rop": 121}, "n": {"dim": 1035, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 358, "inst": 0, "rop": 121}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1035, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 132}, "n": {"dim": 1035, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 132}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1035, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 358, "inst": 0, "rop": 112}, "n": {"dim": 1035, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 358, "inst": 0, "rop": 112}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 919, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 305, "inst": 0, "rop": 110}, "n": {"dim": 919, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 305, "inst": 0, "rop": 110}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 708, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 215, "inst": 0, "rop": 184}, "n": {"dim": 708, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 215, "inst": 0, "rop": 184}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1035, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 107}, "n": {"dim": 1035, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 107}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1035, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 104}, "n": {"dim": 1035, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 104}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 708, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 215, "inst": 0, "rop": 203}, "n": {"dim": 708, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 215, "inst": 0, "rop": 203}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1035, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 134}, "n": {"dim": 1035, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 134}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1019, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 355, "inst": 0, "rop": 110}, "n": {"dim": 1019, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 355, "inst": 0, "rop": 110}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1035, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 125}, "n": {"dim": 1035, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 125}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1035, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 105}, "n": {"dim": 1035, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 105}}}, "key": "uRound2.PKE-0585-4.61-32768", "param": [{"category": [2], "n": 585, "q": 32768, "secret_distribution": "((-1, 1), 110)", "claimed": 96, "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1003, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 125}, "n": {"dim": 1013, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 384, "inst": 0, "rop": 125}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1031, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 400, "inst": 0, "rop": 111}, "n": {"dim": 1043, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 405, "inst": 0, "rop": 111}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1012, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 379, "inst": 0, "rop": 132}, "n": {"dim": 1014, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 381, "inst": 0, "rop": 132}}, "0.368\u00a0\u03b2": {"2n": {"dim": 994, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 368, "inst": 0, "rop": 141}, "n": {"dim": 934, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 340, "inst": 0, "rop": 140}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1005, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 380, "inst": 0, "rop": 124}, "n": {"dim": 1011, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 385, "inst": 0, "rop": 123}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1002, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 377, "inst": 0, "rop": 127}, "n": {"dim": 975, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 366, "inst": 0, "rop": 125}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 820, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 272, "inst": 0, "rop": 185}, "n": {"dim": 820, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 272, "inst": 0, "rop": 185}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1033, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 394, "inst": 0, "rop": 121}, "n": {"dim": 1035, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 396, "inst": 0, "rop": 121}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1040, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 401, "inst": 0, "rop": 118}, "n": {"dim": 1039, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 399, "inst": 0, "rop": 118}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 799, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 259, "inst": 0, "rop": 198}, "n": {"dim": 799, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 259, "inst": 0, "rop": 198}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 994, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 367, "inst": 0, "rop": 142}, "n": {"dim": 995, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 368, "inst": 0, "rop": 142}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 979, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 368, "inst": 0, "rop": 124}, "n": {"dim": 947, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 354, "inst": 0, "rop": 125}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 998, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 373, "inst": 0, "rop": 134}, "n": {"dim": 1024, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 384, "inst": 0, "rop": 135}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1009, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 385, "inst": 0, "rop": 119}, "n": {"dim": 1009, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 386, "inst": 0, "rop": 119}}}, "key": "uRound2.PKE-0585-4.61-32768", "param": [{"category": [2], "n": 585, "q": 32768, "secret_distribution": "((-1, 1), 110)", "claimed": 96, "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 400, "inst": 0, "rop": 126}, "n": {"dim": 1102, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 400, "inst": 0, "rop": 126}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1095, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 401, "inst": 0, "rop": 107}, "n": {"dim": 1095, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 401, "inst": 0, "rop": 107}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1102, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 400, "inst": 0, "rop": 134}, "n": {"dim": 1102, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 400, "inst": 0, "rop": 134}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1107, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 393, "inst": 0, "rop": 148}, "n": {"dim": 1107, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 393, "inst": 0, "rop": 148}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1095, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 401, "inst": 0, "rop": 123}, "n": {"dim": 1095, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 401, "inst": 0, "rop": 123}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1004, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 345, "inst": 0, "rop": 128}, "n": {"dim": 1004, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 345, "inst": 0, "rop": 128}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 705, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 215, "inst": 0, "rop": 205}, "n": {"dim": 705, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 215, "inst": 0, "rop": 205}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 400, "inst": 0, "rop": 120}, "n": {"dim": 1102, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 400, "inst": 0, "rop": 120}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1095, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 401, "inst": 0, "rop": 115}, "n": {"dim": 1095, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 401, "inst": 0, "rop": 115}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 705, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 215, "inst": 0, "rop": 224}, "n": {"dim": 705, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 215, "inst": 0, "rop": 224}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1102, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 400, "inst": 0, "rop": 147}, "n": {"dim": 1102, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 400, "inst": 0, "rop": 147}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1090, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 388, "inst": 0, "rop": 128}, "n": {"dim": 1090, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 388, "inst": 0, "rop": 128}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1095, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 401, "inst": 0, "rop": 136}, "n": {"dim": 1095, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 401, "inst": 0, "rop": 136}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1102, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 400, "inst": 0, "rop": 118}, "n": {"dim": 1102, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 400, "inst": 0, "rop": 118}}}, "key": "uRound2.PKE-0643-4.61-32768", "param": [{"category": [3], "n": 643, "q": 32768, "secret_distribution": "((-1, 1), 114)", "claimed": 106, "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1098, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 426, "inst": 0, "rop": 138}, "n": {"dim": 1097, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 426, "inst": 0, "rop": 138}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1108, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 440, "inst": 0, "rop": 122}, "n": {"dim": 1141, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 455, "inst": 0, "rop": 123}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1081, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 413, "inst": 0, "rop": 145}, "n": {"dim": 1052, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 401, "inst": 0, "rop": 144}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1045, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 393, "inst": 0, "rop": 155}, "n": {"dim": 1074, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 406, "inst": 0, "rop": 156}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1105, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 430, "inst": 0, "rop": 136}, "n": {"dim": 1107, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 432, "inst": 0, "rop": 135}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1019, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 385, "inst": 0, "rop": 142}, "n": {"dim": 974, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 366, "inst": 0, "rop": 141}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 757, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 245, "inst": 0, "rop": 202}, "n": {"dim": 757, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 245, "inst": 0, "rop": 202}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1121, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 437, "inst": 0, "rop": 134}, "n": {"dim": 1124, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 441, "inst": 0, "rop": 134}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1112, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 438, "inst": 0, "rop": 129}, "n": {"dim": 1128, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 446, "inst": 0, "rop": 130}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 863, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 287, "inst": 0, "rop": 223}, "n": {"dim": 863, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 287, "inst": 0, "rop": 223}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1081, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 409, "inst": 0, "rop": 155}, "n": {"dim": 1078, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 408, "inst": 0, "rop": 155}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1053, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 403, "inst": 0, "rop": 141}, "n": {"dim": 1022, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 389, "inst": 0, "rop": 141}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1081, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 413, "inst": 0, "rop": 146}, "n": {"dim": 1100, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 424, "inst": 0, "rop": 146}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1123, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 438, "inst": 0, "rop": 133}, "n": {"dim": 1126, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 442, "inst": 0, "rop": 132}}}, "key": "uRound2.PKE-0643-4.61-32768", "param": [{"category": [3], "n": 643, "q": 32768, "secret_distribution": "((-1, 1), 114)", "claimed": 106, "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 160}, "n": {"dim": 1438, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 160}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 137}, "n": {"dim": 1438, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 137}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1438, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 515, "inst": 0, "rop": 168}, "n": {"dim": 1438, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 515, "inst": 0, "rop": 168}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1468, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 513, "inst": 0, "rop": 190}, "n": {"dim": 1468, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 513, "inst": 0, "rop": 190}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 515, "inst": 0, "rop": 154}, "n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 515, "inst": 0, "rop": 154}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1330, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 448, "inst": 0, "rop": 189}, "n": {"dim": 1330, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 448, "inst": 0, "rop": 189}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 949, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 297, "inst": 0, "rop": 298}, "n": {"dim": 949, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 297, "inst": 0, "rop": 298}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 154}, "n": {"dim": 1438, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 154}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 146}, "n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 146}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 941, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 0, "rop": 320}, "n": {"dim": 941, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 0, "rop": 320}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1438, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 0, "rop": 181}, "n": {"dim": 1438, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 0, "rop": 181}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1404, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 491, "inst": 0, "rop": 180}, "n": {"dim": 1404, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 491, "inst": 0, "rop": 180}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 0, "rop": 167}, "n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 0, "rop": 167}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 151}, "n": {"dim": 1438, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 151}}}, "key": "uRound2.PKE-0835-2.29-32768", "param": [{"category": [4], "n": 835, "q": 32768, "secret_distribution": "((-1, 1), 166)", "claimed": 138, "sd": 2.29128784747792}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1459, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 554, "inst": 0, "rop": 175}, "n": {"dim": 1450, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 551, "inst": 0, "rop": 175}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1500, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 579, "inst": 0, "rop": 156}, "n": {"dim": 1483, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 574, "inst": 0, "rop": 156}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1445, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 546, "inst": 0, "rop": 181}, "n": {"dim": 1462, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 551, "inst": 0, "rop": 182}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1395, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 516, "inst": 0, "rop": 200}, "n": {"dim": 1440, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 534, "inst": 0, "rop": 203}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1506, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 576, "inst": 0, "rop": 170}, "n": {"dim": 1477, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 564, "inst": 0, "rop": 169}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1352, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 495, "inst": 0, "rop": 200}, "n": {"dim": 1467, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 545, "inst": 0, "rop": 211}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1222, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 413, "inst": 0, "rop": 300}, "n": {"dim": 1222, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 413, "inst": 0, "rop": 300}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1469, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 562, "inst": 0, "rop": 171}, "n": {"dim": 1473, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 563, "inst": 0, "rop": 170}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1479, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 569, "inst": 0, "rop": 163}, "n": {"dim": 1502, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 578, "inst": 0, "rop": 164}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1210, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 403, "inst": 0, "rop": 330}, "n": {"dim": 1210, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 403, "inst": 0, "rop": 330}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1448, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 542, "inst": 0, "rop": 193}, "n": {"dim": 1439, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 539, "inst": 0, "rop": 192}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1404, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 521, "inst": 0, "rop": 194}, "n": {"dim": 1393, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 516, "inst": 0, "rop": 193}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1466, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 555, "inst": 0, "rop": 180}, "n": {"dim": 1484, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 563, "inst": 0, "rop": 181}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1497, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 169}, "n": {"dim": 1473, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 563, "inst": 0, "rop": 168}}}, "key": "uRound2.PKE-0835-2.29-32768", "param": [{"category": [4], "n": 835, "q": 32768, "secret_distribution": "((-1, 1), 166)", "claimed": 138, "sd": 2.29128784747792}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 160}, "n": {"dim": 1438, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 160}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 137}, "n": {"dim": 1438, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 137}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1438, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 515, "inst": 0, "rop": 168}, "n": {"dim": 1438, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 515, "inst": 0, "rop": 168}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1468, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 513, "inst": 0, "rop": 190}, "n": {"dim": 1468, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 513, "inst": 0, "rop": 190}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 515, "inst": 0, "rop": 154}, "n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 515, "inst": 0, "rop": 154}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1330, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 448, "inst": 0, "rop": 189}, "n": {"dim": 1330, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 448, "inst": 0, "rop": 189}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 949, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 297, "inst": 0, "rop": 298}, "n": {"dim": 949, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 297, "inst": 0, "rop": 298}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 154}, "n": {"dim": 1438, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 154}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 146}, "n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 146}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 941, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 0, "rop": 320}, "n": {"dim": 941, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 0, "rop": 320}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1438, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 0, "rop": 181}, "n": {"dim": 1438, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 0, "rop": 181}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1404, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 491, "inst": 0, "rop": 180}, "n": {"dim": 1404, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 491, "inst": 0, "rop": 180}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 0, "rop": 167}, "n": {"dim": 1438, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 0, "rop": 167}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1438, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 151}, "n": {"dim": 1438, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 515, "inst": 0, "rop": 151}}}, "key": "uRound2.PKE-0835-2.29-32768", "param": [{"category": [5], "n": 835, "q": 32768, "secret_distribution": "((-1, 1), 166)", "claimed": 138, "sd": 2.29128784747792}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["LWR"], "name": "uRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1459, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 554, "inst": 0, "rop": 175}, "n": {"dim": 1450, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 551, "inst": 0, "rop": 175}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1500, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 579, "inst": 0, "rop": 156}, "n": {"dim": 1483, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 574, "inst": 0, "rop": 156}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1445, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 546, "inst": 0, "rop": 181}, "n": {"dim": 1462, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 551, "inst": 0, "rop": 182}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1395, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 516, "inst": 0, "rop": 200}, "n": {"dim": 1440, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 534, "inst": 0, "rop": 203}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1506, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 576, "inst": 0, "rop": 170}, "n": {"dim": 1477, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 564, "inst": 0, "rop": 169}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1352, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 495, "inst": 0, "rop": 200}, "n": {"dim": 1467, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 545, "inst": 0, "rop": 211}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1222, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 413, "inst": 0, "rop": 300}, "n": {"dim": 1222, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 413, "inst": 0, "rop": 300}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1469, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 562, "inst": 0, "rop": 171}, "n": {"dim": 1473, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 563, "inst": 0, "rop": 170}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1479, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 569, "inst": 0, "rop": 163}, "n": {"dim": 1502, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 578, "inst": 0, "rop": 164}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1210, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 403, "inst": 0, "rop": 330}, "n": {"dim": 1210, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 403, "inst": 0, "rop": 330}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1448, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 542, "inst": 0, "rop": 193}, "n": {"dim": 1439, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 539, "inst": 0, "rop": 192}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1404, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 521, "inst": 0, "rop": 194}, "n": {"dim": 1393, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 516, "inst": 0, "rop": 193}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1466, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 555, "inst": 0, "rop": 180}, "n": {"dim": 1484, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 563, "inst": 0, "rop": 181}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1497, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 169}, "n": {"dim": 1473, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 563, "inst": 0, "rop": 168}}}, "key": "uRound2.PKE-0835-2.29-32768", "param": [{"category": [5], "n": 835, "q": 32768, "secret_distribution": "((-1, 1), 166)", "claimed": 138, "sd": 2.29128784747792}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 686, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 98}, "n": {"dim": 686, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 98}}, "0.265\u00a0\u03b2": {"2n": {"dim": 686, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 82}, "n": {"dim": 686, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 82}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 686, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 302, "inst": 0, "rop": 107}, "n": {"dim": 686, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 302, "inst": 0, "rop": 107}}, "0.368\u00a0\u03b2": {"2n": {"dim": 622, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 255, "inst": 0, "rop": 111}, "n": {"dim": 622, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 255, "inst": 0, "rop": 111}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 686, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 302, "inst": 0, "rop": 98}, "n": {"dim": 686, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 302, "inst": 0, "rop": 98}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 548, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 223, "inst": 0, "rop": 80}, "n": {"dim": 548, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 223, "inst": 0, "rop": 80}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 427, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 150, "inst": 0, "rop": 131}, "n": {"dim": 427, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 150, "inst": 0, "rop": 131}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 686, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 92}, "n": {"dim": 686, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 92}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 686, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 90}, "n": {"dim": 686, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 90}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 427, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 150, "inst": 0, "rop": 150}, "n": {"dim": 427, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 150, "inst": 0, "rop": 150}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 686, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 302, "inst": 0, "rop": 119}, "n": {"dim": 686, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 302, "inst": 0, "rop": 119}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 622, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 255, "inst": 0, "rop": 86}, "n": {"dim": 622, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 255, "inst": 0, "rop": 86}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 686, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 302, "inst": 0, "rop": 111}, "n": {"dim": 686, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 302, "inst": 0, "rop": 111}}, "0.292\u00a0\u03b2": {"2n": {"dim": 686, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 90}, "n": {"dim": 686, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 302, "inst": 0, "rop": 90}}}, "key": "uRound2.KEM-0418-4.61-4096", "param": [{"category": [1], "n": 418, "q": 4096, "secret_distribution": "((-1, 1), 66)", "claimed": 75, "ring": "\\sum_{i=0}^n x^i", "sd": 4.6097722286464435}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 664, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 323, "inst": 0, "rop": 109}, "n": {"dim": 644, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 311, "inst": 0, "rop": 109}}, "0.265\u00a0\u03b2": {"2n": {"dim": 696, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 353, "inst": 0, "rop": 98}, "n": {"dim": 696, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 352, "inst": 0, "rop": 98}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 682, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 330, "inst": 0, "rop": 117}, "n": {"dim": 609, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 285, "inst": 0, "rop": 115}}, "0.368\u00a0\u03b2": {"2n": {"dim": 595, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 275, "inst": 0, "rop": 118}, "n": {"dim": 567, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 258, "inst": 0, "rop": 118}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 648, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 314, "inst": 0, "rop": 108}, "n": {"dim": 670, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 327, "inst": 0, "rop": 109}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 593, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 289, "inst": 0, "rop": 100}, "n": {"dim": 593, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 290, "inst": 0, "rop": 101}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 536, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 226, "inst": 0, "rop": 142}, "n": {"dim": 536, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 226, "inst": 0, "rop": 142}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 652, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 320, "inst": 0, "rop": 104}, "n": {"dim": 668, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 328, "inst": 0, "rop": 105}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 670, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 332, "inst": 0, "rop": 103}, "n": {"dim": 693, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 345, "inst": 0, "rop": 104}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 415, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 157, "inst": 0, "rop": 148}, "n": {"dim": 415, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 157, "inst": 0, "rop": 148}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 633, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 294, "inst": 0, "rop": 124}, "n": {"dim": 673, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 319, "inst": 0, "rop": 126}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 585, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 283, "inst": 0, "rop": 102}, "n": {"dim": 596, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 289, "inst": 0, "rop": 102}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 656, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 311, "inst": 0, "rop": 118}, "n": {"dim": 637, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 300, "inst": 0, "rop": 118}}, "0.292\u00a0\u03b2": {"2n": {"dim": 689, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 343, "inst": 0, "rop": 105}, "n": {"dim": 629, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 307, "inst": 0, "rop": 104}}}, "key": "uRound2.KEM-0418-4.61-4096", "param": [{"category": [1], "n": 418, "q": 4096, "secret_distribution": "((-1, 1), 66)", "claimed": 75, "ring": "\\sum_{i=0}^n x^i", "sd": 4.6097722286464435}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 850, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 126}, "n": {"dim": 850, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 126}}, "0.265\u00a0\u03b2": {"2n": {"dim": 850, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 107}, "n": {"dim": 850, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 107}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 850, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 397, "inst": 0, "rop": 134}, "n": {"dim": 850, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 397, "inst": 0, "rop": 134}}, "0.368\u00a0\u03b2": {"2n": {"dim": 690, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 299, "inst": 0, "rop": 143}, "n": {"dim": 690, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 299, "inst": 0, "rop": 143}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 850, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 397, "inst": 0, "rop": 123}, "n": {"dim": 850, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 397, "inst": 0, "rop": 123}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 642, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 265, "inst": 0, "rop": 114}, "n": {"dim": 642, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 265, "inst": 0, "rop": 114}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 464, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 172, "inst": 0, "rop": 173}, "n": {"dim": 464, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 172, "inst": 0, "rop": 173}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 850, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 120}, "n": {"dim": 850, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 120}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 850, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 115}, "n": {"dim": 850, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 115}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 464, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 172, "inst": 0, "rop": 192}, "n": {"dim": 464, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 172, "inst": 0, "rop": 192}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 850, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 397, "inst": 0, "rop": 146}, "n": {"dim": 850, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 397, "inst": 0, "rop": 146}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 690, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 299, "inst": 0, "rop": 119}, "n": {"dim": 690, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 299, "inst": 0, "rop": 119}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 850, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 397, "inst": 0, "rop": 136}, "n": {"dim": 850, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 397, "inst": 0, "rop": 136}}, "0.292\u00a0\u03b2": {"2n": {"dim": 850, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 117}, "n": {"dim": 850, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 117}}}, "key": "uRound2.KEM-0522-36.95-32768", "param": [{"category": [2], "n": 522, "q": 32768, "secret_distribution": "((-1, 1), 78)", "claimed": 97, "ring": "\\sum_{i=0}^n x^i", "sd": 36.94928957368463}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 831, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 429, "inst": 0, "rop": 139}, "n": {"dim": 812, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 417, "inst": 0, "rop": 138}}, "0.265\u00a0\u03b2": {"2n": {"dim": 800, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 122}, "n": {"dim": 819, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 430, "inst": 0, "rop": 123}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 802, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 407, "inst": 0, "rop": 144}, "n": {"dim": 778, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 392, "inst": 0, "rop": 143}}, "0.368\u00a0\u03b2": {"2n": {"dim": 734, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 358, "inst": 0, "rop": 151}, "n": {"dim": 674, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 321, "inst": 0, "rop": 149}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 790, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 404, "inst": 0, "rop": 135}, "n": {"dim": 807, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 413, "inst": 0, "rop": 135}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 710, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 354, "inst": 0, "rop": 135}, "n": {"dim": 663, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 328, "inst": 0, "rop": 133}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 505, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 210, "inst": 0, "rop": 177}, "n": {"dim": 505, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 210, "inst": 0, "rop": 177}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 712, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 357, "inst": 0, "rop": 132}, "n": {"dim": 713, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 357, "inst": 0, "rop": 132}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 789, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 408, "inst": 0, "rop": 129}, "n": {"dim": 814, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 422, "inst": 0, "rop": 129}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 572, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 241, "inst": 0, "rop": 194}, "n": {"dim": 468, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 185, "inst": 0, "rop": 189}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 820, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 413, "inst": 0, "rop": 155}, "n": {"dim": 822, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 414, "inst": 0, "rop": 155}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 712, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 355, "inst": 0, "rop": 134}, "n": {"dim": 668, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 330, "inst": 0, "rop": 133}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 828, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 422, "inst": 0, "rop": 146}, "n": {"dim": 752, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 374, "inst": 0, "rop": 144}}, "0.292\u00a0\u03b2": {"2n": {"dim": 837, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 437, "inst": 0, "rop": 133}, "n": {"dim": 812, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 421, "inst": 0, "rop": 132}}}, "key": "uRound2.KEM-0522-36.95-32768", "param": [{"category": [2], "n": 522, "q": 32768, "secret_distribution": "((-1, 1), 78)", "claimed": 97, "ring": "\\sum_{i=0}^n x^i", "sd": 36.94928957368463}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 884, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 421, "inst": 0, "rop": 133}, "n": {"dim": 884, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 421, "inst": 0, "rop": 133}}, "0.265\u00a0\u03b2": {"2n": {"dim": 908, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 425, "inst": 0, "rop": 113}, "n": {"dim": 908, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 425, "inst": 0, "rop": 113}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 884, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 421, "inst": 0, "rop": 141}, "n": {"dim": 884, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 421, "inst": 0, "rop": 141}}, "0.368\u00a0\u03b2": {"2n": {"dim": 827, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 156}, "n": {"dim": 827, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 383, "inst": 0, "rop": 156}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 908, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 425, "inst": 0, "rop": 130}, "n": {"dim": 908, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 425, "inst": 0, "rop": 130}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 702, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 300, "inst": 0, "rop": 132}, "n": {"dim": 702, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 300, "inst": 0, "rop": 132}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 525, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 207, "inst": 0, "rop": 204}, "n": {"dim": 525, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 207, "inst": 0, "rop": 204}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 884, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 421, "inst": 0, "rop": 127}, "n": {"dim": 884, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 421, "inst": 0, "rop": 127}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 908, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 425, "inst": 0, "rop": 122}, "n": {"dim": 908, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 425, "inst": 0, "rop": 122}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 525, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 207, "inst": 0, "rop": 223}, "n": {"dim": 525, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 207, "inst": 0, "rop": 223}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 884, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 421, "inst": 0, "rop": 154}, "n": {"dim": 884, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 421, "inst": 0, "rop": 154}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 740, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 335, "inst": 0, "rop": 134}, "n": {"dim": 740, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 335, "inst": 0, "rop": 134}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 880, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 142}, "n": {"dim": 880, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 142}}, "0.292\u00a0\u03b2": {"2n": {"dim": 884, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 421, "inst": 0, "rop": 125}, "n": {"dim": 884, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 421, "inst": 0, "rop": 125}}}, "key": "uRound2.KEM-0540-18.47-16384", "param": [{"category": [3], "n": 540, "q": 16384, "secret_distribution": "((-1, 1), 96)", "claimed": 106, "ring": "\\sum_{i=0}^n x^i", "sd": 18.472953201911167}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 833, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 428, "inst": 0, "rop": 149}, "n": {"dim": 872, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 456, "inst": 0, "rop": 149}}, "0.265\u00a0\u03b2": {"2n": {"dim": 887, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 472, "inst": 0, "rop": 134}, "n": {"dim": 890, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 477, "inst": 0, "rop": 133}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 870, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 451, "inst": 0, "rop": 154}, "n": {"dim": 867, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 447, "inst": 0, "rop": 155}}, "0.368\u00a0\u03b2": {"2n": {"dim": 786, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 392, "inst": 0, "rop": 165}, "n": {"dim": 817, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 411, "inst": 0, "rop": 165}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 874, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 459, "inst": 0, "rop": 145}, "n": {"dim": 887, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 467, "inst": 0, "rop": 146}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 780, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 392, "inst": 0, "rop": 154}, "n": {"dim": 746, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 373, "inst": 0, "rop": 152}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 589, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 256, "inst": 0, "rop": 206}, "n": {"dim": 590, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 256, "inst": 0, "rop": 206}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 876, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 460, "inst": 0, "rop": 144}, "n": {"dim": 850, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 443, "inst": 0, "rop": 144}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 876, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 460, "inst": 0, "rop": 141}, "n": {"dim": 901, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 478, "inst": 0, "rop": 140}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 632, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 274, "inst": 0, "rop": 225}, "n": {"dim": 704, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 315, "inst": 0, "rop": 237}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 810, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 406, "inst": 0, "rop": 164}, "n": {"dim": 862, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 440, "inst": 0, "rop": 165}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 830, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 425, "inst": 0, "rop": 153}, "n": {"dim": 866, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 447, "inst": 0, "rop": 156}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 868, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 450, "inst": 0, "rop": 155}, "n": {"dim": 854, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 440, "inst": 0, "rop": 155}}, "0.292\u00a0\u03b2": {"2n": {"dim": 834, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 434, "inst": 0, "rop": 142}, "n": {"dim": 901, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 478, "inst": 0, "rop": 143}}}, "key": "uRound2.KEM-0540-18.47-16384", "param": [{"category": [3], "n": 540, "q": 16384, "secret_distribution": "((-1, 1), 96)", "claimed": 106, "ring": "\\sum_{i=0}^n x^i", "sd": 18.472953201911167}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1098, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 176}, "n": {"dim": 1098, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 176}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1142, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 569, "inst": 0, "rop": 152}, "n": {"dim": 1142, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 569, "inst": 0, "rop": 152}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1098, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 552, "inst": 0, "rop": 183}, "n": {"dim": 1098, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 552, "inst": 0, "rop": 183}}, "0.368\u00a0\u03b2": {"2n": {"dim": 960, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 465, "inst": 0, "rop": 205}, "n": {"dim": 960, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 465, "inst": 0, "rop": 205}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1142, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 569, "inst": 0, "rop": 168}, "n": {"dim": 1142, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 569, "inst": 0, "rop": 168}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 748, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 333, "inst": 0, "rop": 188}, "n": {"dim": 748, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 333, "inst": 0, "rop": 188}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 597, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 240, "inst": 0, "rop": 271}, "n": {"dim": 597, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 240, "inst": 0, "rop": 271}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1098, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 170}, "n": {"dim": 1098, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 170}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1142, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 569, "inst": 0, "rop": 161}, "n": {"dim": 1142, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 569, "inst": 0, "rop": 161}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 597, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 240, "inst": 0, "rop": 290}, "n": {"dim": 597, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 240, "inst": 0, "rop": 290}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1098, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 552, "inst": 0, "rop": 197}, "n": {"dim": 1098, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 552, "inst": 0, "rop": 197}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 844, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 388, "inst": 0, "rop": 187}, "n": {"dim": 844, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 388, "inst": 0, "rop": 187}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1142, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 569, "inst": 0, "rop": 181}, "n": {"dim": 1142, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 569, "inst": 0, "rop": 181}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1098, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 167}, "n": {"dim": 1098, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 167}}}, "key": "uRound2.KEM-0700-36.95-32768", "param": [{"category": [4], "n": 700, "q": 32768, "secret_distribution": "((-1, 1), 112)", "claimed": 140, "ring": "\\sum_{i=0}^n x^i", "sd": 36.94928957368463}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1026, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 558, "inst": 0, "rop": 191}, "n": {"dim": 1034, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 563, "inst": 0, "rop": 191}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1134, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 641, "inst": 0, "rop": 175}, "n": {"dim": 1086, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 606, "inst": 0, "rop": 174}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1119, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 617, "inst": 0, "rop": 201}, "n": {"dim": 1054, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 573, "inst": 0, "rop": 198}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1012, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 216}, "n": {"dim": 1101, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 591, "inst": 0, "rop": 224}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1095, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 608, "inst": 0, "rop": 186}, "n": {"dim": 1061, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 584, "inst": 0, "rop": 185}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 921, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 478, "inst": 0, "rop": 210}, "n": {"dim": 916, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 474, "inst": 0, "rop": 212}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 938, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 455, "inst": 0, "rop": 326}, "n": {"dim": 728, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 332, "inst": 0, "rop": 279}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 965, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 519, "inst": 0, "rop": 187}, "n": {"dim": 1122, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 622, "inst": 0, "rop": 191}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1095, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 608, "inst": 0, "rop": 181}, "n": {"dim": 1100, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 615, "inst": 0, "rop": 180}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 598, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 255, "inst": 0, "rop": 286}, "n": {"dim": 598, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 255, "inst": 0, "rop": 286}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1051, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 567, "inst": 0, "rop": 207}, "n": {"dim": 1045, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 560, "inst": 0, "rop": 209}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1106, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 599, "inst": 0, "rop": 224}, "n": {"dim": 959, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 505, "inst": 0, "rop": 207}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1074, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 588, "inst": 0, "rop": 195}, "n": {"dim": 1133, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 626, "inst": 0, "rop": 199}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1157, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 649, "inst": 0, "rop": 191}, "n": {"dim": 1122, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 622, "inst": 0, "rop": 188}}}, "key": "uRound2.KEM-0700-36.95-32768", "param": [{"category": [4], "n": 700, "q": 32768, "secret_distribution": "((-1, 1), 112)", "claimed": 140, "ring": "\\sum_{i=0}^n x^i", "sd": 36.94928957368463}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1110, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 171}, "n": {"dim": 1110, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 171}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1105, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 553, "inst": 0, "rop": 147}, "n": {"dim": 1105, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 553, "inst": 0, "rop": 147}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1110, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 552, "inst": 0, "rop": 178}, "n": {"dim": 1110, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 552, "inst": 0, "rop": 178}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1013, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 498, "inst": 0, "rop": 202}, "n": {"dim": 1013, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 498, "inst": 0, "rop": 202}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1105, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 553, "inst": 0, "rop": 163}, "n": {"dim": 1105, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 553, "inst": 0, "rop": 163}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 826, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 383, "inst": 0, "rop": 189}, "n": {"dim": 826, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 383, "inst": 0, "rop": 189}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 611, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 258, "inst": 0, "rop": 278}, "n": {"dim": 611, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 258, "inst": 0, "rop": 278}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1110, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 165}, "n": {"dim": 1110, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 165}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1105, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 553, "inst": 0, "rop": 156}, "n": {"dim": 1105, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 553, "inst": 0, "rop": 156}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 592, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 240, "inst": 0, "rop": 297}, "n": {"dim": 592, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 240, "inst": 0, "rop": 297}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1110, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 552, "inst": 0, "rop": 191}, "n": {"dim": 1110, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 552, "inst": 0, "rop": 191}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 893, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 429, "inst": 0, "rop": 187}, "n": {"dim": 893, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 429, "inst": 0, "rop": 187}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1105, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 553, "inst": 0, "rop": 177}, "n": {"dim": 1105, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 553, "inst": 0, "rop": 177}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1110, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 162}, "n": {"dim": 1110, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 162}}}, "key": "uRound2.KEM-0676-36.95-32768", "param": [{"category": [5], "n": 676, "q": 32768, "secret_distribution": "((-1, 1), 120)", "claimed": 139, "ring": "\\sum_{i=0}^n x^i", "sd": 36.94928957368463}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "uRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1032, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 559, "inst": 0, "rop": 190}, "n": {"dim": 1091, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 601, "inst": 0, "rop": 190}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1089, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 610, "inst": 0, "rop": 170}, "n": {"dim": 1104, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 621, "inst": 0, "rop": 171}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1073, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 586, "inst": 0, "rop": 196}, "n": {"dim": 1064, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 580, "inst": 0, "rop": 195}}, "0.368\u00a0\u03b2": {"2n": {"dim": 982, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 516, "inst": 0, "rop": 213}, "n": {"dim": 1075, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 578, "inst": 0, "rop": 218}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1081, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 597, "inst": 0, "rop": 183}, "n": {"dim": 1040, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 570, "inst": 0, "rop": 183}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 887, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 459, "inst": 0, "rop": 208}, "n": {"dim": 918, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 477, "inst": 0, "rop": 210}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 692, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 313, "inst": 0, "rop": 279}, "n": {"dim": 847, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 402, "inst": 0, "rop": 301}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1060, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 581, "inst": 0, "rop": 185}, "n": {"dim": 1091, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 601, "inst": 0, "rop": 186}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1057, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 581, "inst": 0, "rop": 178}, "n": {"dim": 1117, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 626, "inst": 0, "rop": 179}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 932, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 447, "inst": 0, "rop": 352}, "n": {"dim": 657, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 287, "inst": 0, "rop": 295}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1017, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 543, "inst": 0, "rop": 205}, "n": {"dim": 1036, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 555, "inst": 0, "rop": 205}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 895, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 463, "inst": 0, "rop": 204}, "n": {"dim": 1044, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 557, "inst": 0, "rop": 212}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1040, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 563, "inst": 0, "rop": 193}, "n": {"dim": 1085, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 592, "inst": 0, "rop": 194}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1068, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 589, "inst": 0, "rop": 182}, "n": {"dim": 1065, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 588, "inst": 0, "rop": 182}}}, "key": "uRound2.KEM-0676-36.95-32768", "param": [{"category": [5], "n": 676, "q": 32768, "secret_distribution": "((-1, 1), 120)", "claimed": 139, "ring": "\\sum_{i=0}^n x^i", "sd": 36.94928957368463}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "nRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 750, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 96}, "n": {"dim": 750, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 96}}, "0.265\u00a0\u03b2": {"2n": {"dim": 755, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 297, "inst": 0, "rop": 79}, "n": {"dim": 755, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 297, "inst": 0, "rop": 79}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 750, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 293, "inst": 0, "rop": 104}, "n": {"dim": 750, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 293, "inst": 0, "rop": 104}}, "0.368\u00a0\u03b2": {"2n": {"dim": 743, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 281, "inst": 0, "rop": 110}, "n": {"dim": 743, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 281, "inst": 0, "rop": 110}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 755, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 297, "inst": 0, "rop": 96}, "n": {"dim": 755, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 297, "inst": 0, "rop": 96}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 679, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 248, "inst": 0, "rop": 80}, "n": {"dim": 679, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 248, "inst": 0, "rop": 80}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 475, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 151, "inst": 0, "rop": 134}, "n": {"dim": 475, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 151, "inst": 0, "rop": 134}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 750, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 89}, "n": {"dim": 750, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 89}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 750, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 88}, "n": {"dim": 750, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 88}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 475, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 151, "inst": 0, "rop": 153}, "n": {"dim": 475, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 151, "inst": 0, "rop": 153}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 750, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 293, "inst": 0, "rop": 117}, "n": {"dim": 750, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 293, "inst": 0, "rop": 117}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 700, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 259, "inst": 0, "rop": 85}, "n": {"dim": 700, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 259, "inst": 0, "rop": 85}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 755, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 297, "inst": 0, "rop": 108}, "n": {"dim": 755, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 297, "inst": 0, "rop": 108}}, "0.292\u00a0\u03b2": {"2n": {"dim": 750, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 88}, "n": {"dim": 750, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 88}}}, "key": "nRound2.PKE-0442-1.47-2659", "param": [{"category": [1], "n": 442, "q": 2659, "secret_distribution": "((-1, 1), 74)", "claimed": 74, "ring": "\\sum_{i=0}^n x^i", "sd": 1.4711384933077167}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "nRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 743, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 324, "inst": 0, "rop": 107}, "n": {"dim": 728, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 315, "inst": 0, "rop": 107}}, "0.265\u00a0\u03b2": {"2n": {"dim": 732, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 328, "inst": 0, "rop": 94}, "n": {"dim": 733, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 329, "inst": 0, "rop": 95}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 718, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 306, "inst": 0, "rop": 113}, "n": {"dim": 713, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 304, "inst": 0, "rop": 113}}, "0.368\u00a0\u03b2": {"2n": {"dim": 690, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 289, "inst": 0, "rop": 117}, "n": {"dim": 690, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 289, "inst": 0, "rop": 117}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 743, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 324, "inst": 0, "rop": 107}, "n": {"dim": 742, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 325, "inst": 0, "rop": 107}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 686, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 300, "inst": 0, "rop": 99}, "n": {"dim": 686, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 300, "inst": 0, "rop": 99}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 589, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 223, "inst": 0, "rop": 141}, "n": {"dim": 589, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 223, "inst": 0, "rop": 141}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 724, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 318, "inst": 0, "rop": 102}, "n": {"dim": 745, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 329, "inst": 0, "rop": 102}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 730, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 321, "inst": 0, "rop": 100}, "n": {"dim": 708, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 310, "inst": 0, "rop": 100}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 582, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 214, "inst": 0, "rop": 154}, "n": {"dim": 582, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 214, "inst": 0, "rop": 154}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 706, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 294, "inst": 0, "rop": 122}, "n": {"dim": 718, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 302, "inst": 0, "rop": 122}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 742, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 326, "inst": 0, "rop": 102}, "n": {"dim": 742, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 326, "inst": 0, "rop": 102}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 732, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 312, "inst": 0, "rop": 116}, "n": {"dim": 733, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 313, "inst": 0, "rop": 116}}, "0.292\u00a0\u03b2": {"2n": {"dim": 708, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 310, "inst": 0, "rop": 100}, "n": {"dim": 705, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 308, "inst": 0, "rop": 101}}}, "key": "nRound2.PKE-0442-1.47-2659", "param": [{"category": [1], "n": 442, "q": 2659, "secret_distribution": "((-1, 1), 74)", "claimed": 74, "ring": "\\sum_{i=0}^n x^i", "sd": 1.4711384933077167}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "nRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 918, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 388, "inst": 0, "rop": 124}, "n": {"dim": 918, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 388, "inst": 0, "rop": 124}}, "0.265\u00a0\u03b2": {"2n": {"dim": 921, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 393, "inst": 0, "rop": 105}, "n": {"dim": 921, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 393, "inst": 0, "rop": 105}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 918, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 388, "inst": 0, "rop": 132}, "n": {"dim": 918, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 388, "inst": 0, "rop": 132}}, "0.368\u00a0\u03b2": {"2n": {"dim": 825, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 326, "inst": 0, "rop": 144}, "n": {"dim": 825, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 326, "inst": 0, "rop": 144}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 921, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 393, "inst": 0, "rop": 122}, "n": {"dim": 921, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 393, "inst": 0, "rop": 122}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 704, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 272, "inst": 0, "rop": 117}, "n": {"dim": 704, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 272, "inst": 0, "rop": 117}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 582, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 204, "inst": 0, "rop": 181}, "n": {"dim": 582, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 204, "inst": 0, "rop": 181}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 918, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 388, "inst": 0, "rop": 118}, "n": {"dim": 918, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 388, "inst": 0, "rop": 118}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 921, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 393, "inst": 0, "rop": 114}, "n": {"dim": 921, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 393, "inst": 0, "rop": 114}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 550, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 184, "inst": 0, "rop": 199}, "n": {"dim": 550, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 184, "inst": 0, "rop": 199}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 918, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 388, "inst": 0, "rop": 145}, "n": {"dim": 918, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 388, "inst": 0, "rop": 145}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 825, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 326, "inst": 0, "rop": 120}, "n": {"dim": 825, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 326, "inst": 0, "rop": 120}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 921, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 393, "inst": 0, "rop": 134}, "n": {"dim": 921, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 393, "inst": 0, "rop": 134}}, "0.292\u00a0\u03b2": {"2n": {"dim": 918, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 388, "inst": 0, "rop": 116}, "n": {"dim": 918, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 388, "inst": 0, "rop": 116}}}, "key": "nRound2.PKE-0556-1.86-3343", "param": [{"category": [2], "n": 556, "q": 3343, "secret_distribution": "((-1, 1), 88)", "claimed": 97, "ring": "\\sum_{i=0}^n x^i", "sd": 1.8626083342516564}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "nRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 878, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 401, "inst": 0, "rop": 136}, "n": {"dim": 872, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 397, "inst": 0, "rop": 136}}, "0.265\u00a0\u03b2": {"2n": {"dim": 883, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 414, "inst": 0, "rop": 121}, "n": {"dim": 887, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 417, "inst": 0, "rop": 121}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 908, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 416, "inst": 0, "rop": 143}, "n": {"dim": 892, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 406, "inst": 0, "rop": 143}}, "0.368\u00a0\u03b2": {"2n": {"dim": 808, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 355, "inst": 0, "rop": 150}, "n": {"dim": 886, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 398, "inst": 0, "rop": 153}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 901, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 418, "inst": 0, "rop": 134}, "n": {"dim": 890, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 411, "inst": 0, "rop": 133}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 844, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 382, "inst": 0, "rop": 137}, "n": {"dim": 844, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 382, "inst": 0, "rop": 137}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 549, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 204, "inst": 0, "rop": 183}, "n": {"dim": 549, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 204, "inst": 0, "rop": 183}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 852, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 390, "inst": 0, "rop": 130}, "n": {"dim": 927, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 433, "inst": 0, "rop": 133}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 932, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 438, "inst": 0, "rop": 129}, "n": {"dim": 878, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 407, "inst": 0, "rop": 127}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 567, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 207, "inst": 0, "rop": 196}, "n": {"dim": 567, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 207, "inst": 0, "rop": 196}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 835, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 369, "inst": 0, "rop": 151}, "n": {"dim": 835, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 369, "inst": 0, "rop": 151}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 847, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 384, "inst": 0, "rop": 136}, "n": {"dim": 847, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 384, "inst": 0, "rop": 136}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 895, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 406, "inst": 0, "rop": 144}, "n": {"dim": 897, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 410, "inst": 0, "rop": 144}}, "0.292\u00a0\u03b2": {"2n": {"dim": 882, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 408, "inst": 0, "rop": 129}, "n": {"dim": 882, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 408, "inst": 0, "rop": 129}}}, "key": "nRound2.PKE-0556-1.86-3343", "param": [{"category": [2], "n": 556, "q": 3343, "secret_distribution": "((-1, 1), 88)", "claimed": 97, "ring": "\\sum_{i=0}^n x^i", "sd": 1.8626083342516564}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "nRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 958, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 131}, "n": {"dim": 958, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 131}}, "0.265\u00a0\u03b2": {"2n": {"dim": 958, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 111}, "n": {"dim": 958, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 111}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 958, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 418, "inst": 0, "rop": 139}, "n": {"dim": 958, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 418, "inst": 0, "rop": 139}}, "0.368\u00a0\u03b2": {"2n": {"dim": 974, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 414, "inst": 0, "rop": 154}, "n": {"dim": 974, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 414, "inst": 0, "rop": 154}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 958, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 418, "inst": 0, "rop": 128}, "n": {"dim": 958, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 418, "inst": 0, "rop": 128}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 821, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 337, "inst": 0, "rop": 134}, "n": {"dim": 821, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 337, "inst": 0, "rop": 134}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 604, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 214, "inst": 0, "rop": 211}, "n": {"dim": 604, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 214, "inst": 0, "rop": 211}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 958, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 125}, "n": {"dim": 958, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 125}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 958, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 120}, "n": {"dim": 958, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 120}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 604, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 214, "inst": 0, "rop": 230}, "n": {"dim": 604, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 214, "inst": 0, "rop": 230}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 958, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 418, "inst": 0, "rop": 152}, "n": {"dim": 958, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 418, "inst": 0, "rop": 152}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 924, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 388, "inst": 0, "rop": 134}, "n": {"dim": 924, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 388, "inst": 0, "rop": 134}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 958, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 418, "inst": 0, "rop": 141}, "n": {"dim": 958, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 418, "inst": 0, "rop": 141}}, "0.292\u00a0\u03b2": {"2n": {"dim": 958, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 123}, "n": {"dim": 958, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 418, "inst": 0, "rop": 123}}}, "key": "nRound2.PKE-0576-1.27-2309", "param": [{"category": [3], "n": 576, "q": 2309, "secret_distribution": "((-1, 1), 108)", "claimed": 106, "ring": "\\sum_{i=0}^n x^i", "sd": 1.2694482394736055}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "nRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 965, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 453, "inst": 0, "rop": 147}, "n": {"dim": 965, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 453, "inst": 0, "rop": 147}}, "0.265\u00a0\u03b2": {"2n": {"dim": 963, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 460, "inst": 0, "rop": 130}, "n": {"dim": 1009, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 485, "inst": 0, "rop": 132}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 937, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 432, "inst": 0, "rop": 152}, "n": {"dim": 937, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 432, "inst": 0, "rop": 152}}, "0.368\u00a0\u03b2": {"2n": {"dim": 926, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 420, "inst": 0, "rop": 164}, "n": {"dim": 926, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 420, "inst": 0, "rop": 164}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 973, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 457, "inst": 0, "rop": 143}, "n": {"dim": 966, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 453, "inst": 0, "rop": 143}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 929, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 426, "inst": 0, "rop": 155}, "n": {"dim": 929, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 426, "inst": 0, "rop": 155}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 808, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 333, "inst": 0, "rop": 227}, "n": {"dim": 808, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 333, "inst": 0, "rop": 227}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 968, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 457, "inst": 0, "rop": 141}, "n": {"dim": 968, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 457, "inst": 0, "rop": 141}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 971, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 459, "inst": 0, "rop": 137}, "n": {"dim": 979, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 464, "inst": 0, "rop": 137}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 641, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 244, "inst": 0, "rop": 224}, "n": {"dim": 641, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 244, "inst": 0, "rop": 224}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 924, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 420, "inst": 0, "rop": 162}, "n": {"dim": 979, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 450, "inst": 0, "rop": 164}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 879, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 401, "inst": 0, "rop": 150}, "n": {"dim": 879, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 401, "inst": 0, "rop": 150}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 963, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 446, "inst": 0, "rop": 153}, "n": {"dim": 958, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 443, "inst": 0, "rop": 153}}, "0.292\u00a0\u03b2": {"2n": {"dim": 968, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 457, "inst": 0, "rop": 140}, "n": {"dim": 968, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 457, "inst": 0, "rop": 140}}}, "key": "nRound2.PKE-0576-1.27-2309", "param": [{"category": [3], "n": 576, "q": 2309, "secret_distribution": "((-1, 1), 108)", "claimed": 106, "ring": "\\sum_{i=0}^n x^i", "sd": 1.2694482394736055}]}, {"attack": "primal", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "nRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1192, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 167}, "n": {"dim": 1192, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 167}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1192, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 143}, "n": {"dim": 1192, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 143}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1192, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 537, "inst": 0, "rop": 174}, "n": {"dim": 1192, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 537, "inst": 0, "rop": 174}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1164, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 529, "inst": 0, "rop": 199}, "n": {"dim": 1164, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 529, "inst": 0, "rop": 199}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1192, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 537, "inst": 0, "rop": 160}, "n": {"dim": 1192, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 537, "inst": 0, "rop": 160}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 978, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 410, "inst": 0, "rop": 193}, "n": {"dim": 978, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 410, "inst": 0, "rop": 193}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 734, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 281, "inst": 0, "rop": 292}, "n": {"dim": 734, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 281, "inst": 0, "rop": 292}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1192, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 161}, "n": {"dim": 1192, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 161}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1192, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 152}, "n": {"dim": 1192, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 152}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 734, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 281, "inst": 0, "rop": 313}, "n": {"dim": 734, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 281, "inst": 0, "rop": 313}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1192, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 537, "inst": 0, "rop": 187}, "n": {"dim": 1192, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 537, "inst": 0, "rop": 187}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1032, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 446, "inst": 0, "rop": 187}, "n": {"dim": 1032, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 446, "inst": 0, "rop": 187}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1192, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 537, "inst": 0, "rop": 173}, "n": {"dim": 1192, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 537, "inst": 0, "rop": 173}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1192, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 158}, "n": {"dim": 1192, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 537, "inst": 0, "rop": 158}}}, "key": "nRound2.PKE-0708-1.57-2837", "param": [{"category": [4, 5], "n": 708, "q": 2837, "secret_distribution": "((-1, 1), 140)", "claimed": 138, "ring": "\\sum_{i=0}^n x^i", "sd": 1.5732888629792405}]}, {"attack": "dual", "scheme": {"primitive": ["PKE"], "assumption": ["RLWR"], "name": "nRound2.PKE"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1165, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 573, "inst": 0, "rop": 186}, "n": {"dim": 1230, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 610, "inst": 0, "rop": 189}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1212, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 611, "inst": 0, "rop": 167}, "n": {"dim": 1203, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 605, "inst": 0, "rop": 166}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1192, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 583, "inst": 0, "rop": 193}, "n": {"dim": 1198, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 588, "inst": 0, "rop": 193}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1168, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 564, "inst": 0, "rop": 213}, "n": {"dim": 1149, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 552, "inst": 0, "rop": 212}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1207, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 600, "inst": 0, "rop": 180}, "n": {"dim": 1210, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 603, "inst": 0, "rop": 180}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 494, "inst": 0, "rop": 210}, "n": {"dim": 1048, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 494, "inst": 0, "rop": 210}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1071, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 475, "inst": 0, "rop": 334}, "n": {"dim": 1071, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 475, "inst": 0, "rop": 334}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1175, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 579, "inst": 0, "rop": 181}, "n": {"dim": 1186, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 587, "inst": 0, "rop": 181}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1175, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 586, "inst": 0, "rop": 173}, "n": {"dim": 1175, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 587, "inst": 0, "rop": 174}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 902, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 379, "inst": 0, "rop": 319}, "n": {"dim": 902, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 379, "inst": 0, "rop": 319}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1167, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 568, "inst": 0, "rop": 202}, "n": {"dim": 1220, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 596, "inst": 0, "rop": 206}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1070, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 509, "inst": 0, "rop": 203}, "n": {"dim": 1070, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 509, "inst": 0, "rop": 203}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1210, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 595, "inst": 0, "rop": 191}, "n": {"dim": 1212, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 597, "inst": 0, "rop": 191}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1205, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 179}, "n": {"dim": 1203, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 599, "inst": 0, "rop": 180}}}, "key": "nRound2.PKE-0708-1.57-2837", "param": [{"category": [4, 5], "n": 708, "q": 2837, "secret_distribution": "((-1, 1), 140)", "claimed": 138, "ring": "\\sum_{i=0}^n x^i", "sd": 1.5732888629792405}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "nRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 666, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 95}, "n": {"dim": 666, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 95}}, "0.265\u00a0\u03b2": {"2n": {"dim": 666, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 79}, "n": {"dim": 666, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 79}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 666, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 295, "inst": 0, "rop": 103}, "n": {"dim": 666, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 295, "inst": 0, "rop": 103}}, "0.368\u00a0\u03b2": {"2n": {"dim": 657, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 290, "inst": 0, "rop": 109}, "n": {"dim": 657, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 290, "inst": 0, "rop": 109}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 666, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 295, "inst": 0, "rop": 95}, "n": {"dim": 666, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 295, "inst": 0, "rop": 95}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 615, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 254, "inst": 0, "rop": 79}, "n": {"dim": 615, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 254, "inst": 0, "rop": 79}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 451, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 158, "inst": 0, "rop": 133}, "n": {"dim": 451, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 158, "inst": 0, "rop": 133}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 666, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 88}, "n": {"dim": 666, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 88}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 666, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 87}, "n": {"dim": 666, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 87}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 451, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 158, "inst": 0, "rop": 152}, "n": {"dim": 451, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 158, "inst": 0, "rop": 152}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 666, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 0, "rop": 115}, "n": {"dim": 666, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 0, "rop": 115}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 626, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 259, "inst": 0, "rop": 84}, "n": {"dim": 626, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 259, "inst": 0, "rop": 84}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 666, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 0, "rop": 107}, "n": {"dim": 666, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 0, "rop": 107}}, "0.292\u00a0\u03b2": {"2n": {"dim": 666, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 87}, "n": {"dim": 666, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 295, "inst": 0, "rop": 87}}}, "key": "nRound2.KEM-0400-3.61-3209", "param": [{"category": [1], "n": 400, "q": 3209, "secret_distribution": "((-1, 1), 72)", "claimed": 74, "ring": "\\sum_{i=0}^n x^i", "sd": 3.6070549183961935}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "nRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 636, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 306, "inst": 0, "rop": 107}, "n": {"dim": 634, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 305, "inst": 0, "rop": 107}}, "0.265\u00a0\u03b2": {"2n": {"dim": 662, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 332, "inst": 0, "rop": 96}, "n": {"dim": 672, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 338, "inst": 0, "rop": 96}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 645, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 307, "inst": 0, "rop": 113}, "n": {"dim": 654, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 313, "inst": 0, "rop": 113}}, "0.368\u00a0\u03b2": {"2n": {"dim": 622, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 291, "inst": 0, "rop": 117}, "n": {"dim": 627, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 293, "inst": 0, "rop": 117}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 636, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 306, "inst": 0, "rop": 107}, "n": {"dim": 631, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 303, "inst": 0, "rop": 107}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 612, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 299, "inst": 0, "rop": 100}, "n": {"dim": 638, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 313, "inst": 0, "rop": 100}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 465, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 189, "inst": 0, "rop": 140}, "n": {"dim": 465, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 189, "inst": 0, "rop": 140}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 676, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 334, "inst": 0, "rop": 103}, "n": {"dim": 654, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 320, "inst": 0, "rop": 103}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 637, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 312, "inst": 0, "rop": 101}, "n": {"dim": 678, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 335, "inst": 0, "rop": 102}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 558, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 232, "inst": 0, "rop": 160}, "n": {"dim": 451, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 175, "inst": 0, "rop": 152}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 628, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 291, "inst": 0, "rop": 122}, "n": {"dim": 623, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 288, "inst": 0, "rop": 122}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 653, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 319, "inst": 0, "rop": 102}, "n": {"dim": 654, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 320, "inst": 0, "rop": 102}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 646, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 305, "inst": 0, "rop": 116}, "n": {"dim": 643, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 304, "inst": 0, "rop": 116}}, "0.292\u00a0\u03b2": {"2n": {"dim": 655, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 322, "inst": 0, "rop": 102}, "n": {"dim": 659, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 324, "inst": 0, "rop": 102}}}, "key": "nRound2.KEM-0400-3.61-3209", "param": [{"category": [1], "n": 400, "q": 3209, "secret_distribution": "((-1, 1), 72)", "claimed": 74, "ring": "\\sum_{i=0}^n x^i", "sd": 3.6070549183961935}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "nRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 819, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 119}, "n": {"dim": 819, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 119}}, "0.265\u00a0\u03b2": {"2n": {"dim": 819, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 101}, "n": {"dim": 819, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 101}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 819, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 378, "inst": 0, "rop": 127}, "n": {"dim": 819, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 378, "inst": 0, "rop": 127}}, "0.368\u00a0\u03b2": {"2n": {"dim": 801, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 364, "inst": 0, "rop": 139}, "n": {"dim": 801, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 364, "inst": 0, "rop": 139}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 819, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 378, "inst": 0, "rop": 117}, "n": {"dim": 819, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 378, "inst": 0, "rop": 117}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 745, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 326, "inst": 0, "rop": 116}, "n": {"dim": 745, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 326, "inst": 0, "rop": 116}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 528, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 209, "inst": 0, "rop": 187}, "n": {"dim": 528, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 209, "inst": 0, "rop": 187}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 819, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 113}, "n": {"dim": 819, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 113}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 819, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 109}, "n": {"dim": 819, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 109}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 528, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 209, "inst": 0, "rop": 206}, "n": {"dim": 528, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 209, "inst": 0, "rop": 206}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 819, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 378, "inst": 0, "rop": 140}, "n": {"dim": 819, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 378, "inst": 0, "rop": 140}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 762, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 339, "inst": 0, "rop": 117}, "n": {"dim": 762, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 339, "inst": 0, "rop": 117}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 819, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 378, "inst": 0, "rop": 130}, "n": {"dim": 819, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 378, "inst": 0, "rop": 130}}, "0.292\u00a0\u03b2": {"2n": {"dim": 819, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 111}, "n": {"dim": 819, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 378, "inst": 0, "rop": 111}}}, "key": "nRound2.KEM-0486-2.18-1949", "param": [{"category": [2], "n": 486, "q": 1949, "secret_distribution": "((-1, 1), 96)", "claimed": 97, "ring": "\\sum_{i=0}^n x^i", "sd": 2.1787238503231188}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "nRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 795, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 404, "inst": 0, "rop": 135}, "n": {"dim": 818, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 136}}, "0.265\u00a0\u03b2": {"2n": {"dim": 818, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 430, "inst": 0, "rop": 121}, "n": {"dim": 814, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 427, "inst": 0, "rop": 121}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 835, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 424, "inst": 0, "rop": 143}, "n": {"dim": 791, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 399, "inst": 0, "rop": 141}}, "0.368\u00a0\u03b2": {"2n": {"dim": 810, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 403, "inst": 0, "rop": 153}, "n": {"dim": 760, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 374, "inst": 0, "rop": 151}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 804, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 412, "inst": 0, "rop": 133}, "n": {"dim": 807, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 414, "inst": 0, "rop": 133}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 814, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 413, "inst": 0, "rop": 142}, "n": {"dim": 747, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 374, "inst": 0, "rop": 137}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 642, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 283, "inst": 0, "rop": 196}, "n": {"dim": 642, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 283, "inst": 0, "rop": 196}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 827, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 427, "inst": 0, "rop": 131}, "n": {"dim": 845, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 438, "inst": 0, "rop": 132}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 824, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 428, "inst": 0, "rop": 128}, "n": {"dim": 809, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 127}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 569, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 239, "inst": 0, "rop": 203}, "n": {"dim": 569, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 239, "inst": 0, "rop": 203}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 785, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 390, "inst": 0, "rop": 151}, "n": {"dim": 807, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 403, "inst": 0, "rop": 151}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 814, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 413, "inst": 0, "rop": 139}, "n": {"dim": 773, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 389, "inst": 0, "rop": 136}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 818, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 414, "inst": 0, "rop": 143}, "n": {"dim": 813, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 411, "inst": 0, "rop": 143}}, "0.292\u00a0\u03b2": {"2n": {"dim": 805, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 415, "inst": 0, "rop": 129}, "n": {"dim": 823, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 426, "inst": 0, "rop": 129}}}, "key": "nRound2.KEM-0486-2.18-1949", "param": [{"category": [2], "n": 486, "q": 1949, "secret_distribution": "((-1, 1), 96)", "claimed": 97, "ring": "\\sum_{i=0}^n x^i", "sd": 2.1787238503231188}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "nRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 901, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 136}, "n": {"dim": 901, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 136}}, "0.265\u00a0\u03b2": {"2n": {"dim": 898, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 427, "inst": 0, "rop": 116}, "n": {"dim": 898, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 427, "inst": 0, "rop": 116}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 901, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 419, "inst": 0, "rop": 144}, "n": {"dim": 901, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 419, "inst": 0, "rop": 144}}, "0.368\u00a0\u03b2": {"2n": {"dim": 782, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 350, "inst": 0, "rop": 156}, "n": {"dim": 782, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 350, "inst": 0, "rop": 156}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 898, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 427, "inst": 0, "rop": 132}, "n": {"dim": 898, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 427, "inst": 0, "rop": 132}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 649, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 274, "inst": 0, "rop": 130}, "n": {"dim": 649, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 274, "inst": 0, "rop": 130}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 502, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 190, "inst": 0, "rop": 196}, "n": {"dim": 502, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 190, "inst": 0, "rop": 196}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 901, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 129}, "n": {"dim": 901, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 129}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 898, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 427, "inst": 0, "rop": 124}, "n": {"dim": 898, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 427, "inst": 0, "rop": 124}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 502, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 190, "inst": 0, "rop": 215}, "n": {"dim": 502, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 190, "inst": 0, "rop": 215}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 901, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 419, "inst": 0, "rop": 156}, "n": {"dim": 901, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 419, "inst": 0, "rop": 156}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 694, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 305, "inst": 0, "rop": 133}, "n": {"dim": 694, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 305, "inst": 0, "rop": 133}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 898, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 427, "inst": 0, "rop": 145}, "n": {"dim": 898, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 427, "inst": 0, "rop": 145}}, "0.292\u00a0\u03b2": {"2n": {"dim": 901, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 127}, "n": {"dim": 901, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 419, "inst": 0, "rop": 127}}}, "key": "nRound2.KEM-0556-3.76-3343", "param": [{"category": [3], "n": 556, "q": 3343, "secret_distribution": "((-1, 1), 88)", "claimed": 106, "ring": "\\sum_{i=0}^n x^i", "sd": 3.758621985155586}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "nRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 881, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 459, "inst": 0, "rop": 150}, "n": {"dim": 889, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 465, "inst": 0, "rop": 150}}, "0.265\u00a0\u03b2": {"2n": {"dim": 895, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 479, "inst": 0, "rop": 135}, "n": {"dim": 901, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 484, "inst": 0, "rop": 134}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 878, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 452, "inst": 0, "rop": 157}, "n": {"dim": 858, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 443, "inst": 0, "rop": 155}}, "0.368\u00a0\u03b2": {"2n": {"dim": 746, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 365, "inst": 0, "rop": 164}, "n": {"dim": 768, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 380, "inst": 0, "rop": 163}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 839, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 435, "inst": 0, "rop": 145}, "n": {"dim": 859, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 448, "inst": 0, "rop": 146}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 776, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 392, "inst": 0, "rop": 153}, "n": {"dim": 782, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 394, "inst": 0, "rop": 153}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 535, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 226, "inst": 0, "rop": 200}, "n": {"dim": 535, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 226, "inst": 0, "rop": 200}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 860, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 450, "inst": 0, "rop": 145}, "n": {"dim": 911, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 483, "inst": 0, "rop": 147}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 890, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 470, "inst": 0, "rop": 141}, "n": {"dim": 888, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 470, "inst": 0, "rop": 141}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 503, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 204, "inst": 0, "rop": 212}, "n": {"dim": 503, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 204, "inst": 0, "rop": 212}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 796, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 398, "inst": 0, "rop": 164}, "n": {"dim": 870, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 443, "inst": 0, "rop": 166}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 804, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 409, "inst": 0, "rop": 151}, "n": {"dim": 800, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 406, "inst": 0, "rop": 152}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 875, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 450, "inst": 0, "rop": 157}, "n": {"dim": 855, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 441, "inst": 0, "rop": 155}}, "0.292\u00a0\u03b2": {"2n": {"dim": 863, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 452, "inst": 0, "rop": 143}, "n": {"dim": 888, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 470, "inst": 0, "rop": 144}}}, "key": "nRound2.KEM-0556-3.76-3343", "param": [{"category": [3], "n": 556, "q": 3343, "secret_distribution": "((-1, 1), 88)", "claimed": 106, "ring": "\\sum_{i=0}^n x^i", "sd": 3.758621985155586}]}, {"attack": "primal", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "nRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1085, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 167}, "n": {"dim": 1085, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 167}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1074, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 541, "inst": 0, "rop": 144}, "n": {"dim": 1074, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 541, "inst": 0, "rop": 144}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1085, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 536, "inst": 0, "rop": 175}, "n": {"dim": 1085, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 536, "inst": 0, "rop": 175}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1058, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 523, "inst": 0, "rop": 199}, "n": {"dim": 1058, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 523, "inst": 0, "rop": 199}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1074, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 541, "inst": 0, "rop": 160}, "n": {"dim": 1074, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 541, "inst": 0, "rop": 160}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 852, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 394, "inst": 0, "rop": 190}, "n": {"dim": 852, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 394, "inst": 0, "rop": 190}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 641, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 270, "inst": 0, "rop": 286}, "n": {"dim": 641, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 270, "inst": 0, "rop": 286}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1085, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 161}, "n": {"dim": 1085, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 161}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1085, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 153}, "n": {"dim": 1085, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 153}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 610, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 257, "inst": 0, "rop": 306}, "n": {"dim": 610, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 257, "inst": 0, "rop": 306}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1085, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 536, "inst": 0, "rop": 188}, "n": {"dim": 1085, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 536, "inst": 0, "rop": 188}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 929, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 452, "inst": 0, "rop": 186}, "n": {"dim": 929, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 452, "inst": 0, "rop": 186}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1074, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 541, "inst": 0, "rop": 173}, "n": {"dim": 1074, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 541, "inst": 0, "rop": 173}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1085, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 158}, "n": {"dim": 1085, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 536, "inst": 0, "rop": 158}}}, "key": "nRound2.KEM-0658-1.46-1319", "param": [{"category": [4, 5], "n": 658, "q": 1319, "secret_distribution": "((-1, 1), 130)", "claimed": 139, "ring": "\\sum_{i=0}^n x^i", "sd": 1.4590706550793462}]}, {"attack": "dual", "scheme": {"primitive": ["KEM"], "assumption": ["RLWR"], "name": "nRound2.KEM"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1103, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 603, "inst": 0, "rop": 189}, "n": {"dim": 1087, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 593, "inst": 0, "rop": 189}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1088, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 607, "inst": 0, "rop": 169}, "n": {"dim": 1091, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 609, "inst": 0, "rop": 169}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1074, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 582, "inst": 0, "rop": 194}, "n": {"dim": 1076, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 584, "inst": 0, "rop": 194}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1048, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 558, "inst": 0, "rop": 214}, "n": {"dim": 1048, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 558, "inst": 0, "rop": 214}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1135, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 626, "inst": 0, "rop": 185}, "n": {"dim": 1081, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 595, "inst": 0, "rop": 181}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 918, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 475, "inst": 0, "rop": 211}, "n": {"dim": 918, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 475, "inst": 0, "rop": 211}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 903, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 432, "inst": 0, "rop": 315}, "n": {"dim": 903, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 432, "inst": 0, "rop": 315}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1046, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 569, "inst": 0, "rop": 183}, "n": {"dim": 1106, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 606, "inst": 0, "rop": 185}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1112, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 618, "inst": 0, "rop": 177}, "n": {"dim": 1113, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 619, "inst": 0, "rop": 177}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 897, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 424, "inst": 0, "rop": 338}, "n": {"dim": 897, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 424, "inst": 0, "rop": 338}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1078, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 578, "inst": 0, "rop": 205}, "n": {"dim": 1087, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 585, "inst": 0, "rop": 205}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1010, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 534, "inst": 0, "rop": 207}, "n": {"dim": 1010, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 534, "inst": 0, "rop": 207}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1092, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 595, "inst": 0, "rop": 192}, "n": {"dim": 1087, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 593, "inst": 0, "rop": 192}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1135, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 626, "inst": 0, "rop": 185}, "n": {"dim": 1081, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 595, "inst": 0, "rop": 181}}}, "key": "nRound2.KEM-0658-1.46-1319", "param": [{"category": [4, 5], "n": 658, "q": 1319, "secret_distribution": "((-1, 1), 130)", "claimed": 139, "ring": "\\sum_{i=0}^n x^i", "sd": 1.4590706550793462}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1595, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 639, "inst": 0, "rop": 196}, "n": {"dim": 1527, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 642, "inst": 0, "rop": 197}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1595, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 639, "inst": 0, "rop": 170}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 642, "inst": 0, "rop": 171}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1595, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 639, "inst": 0, "rop": 203}, "n": {"dim": 1527, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 642, "inst": 0, "rop": 204}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1595, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 639, "inst": 0, "rop": 236}, "n": {"dim": 1527, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 642, "inst": 0, "rop": 237}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1595, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 639, "inst": 0, "rop": 186}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 642, "inst": 0, "rop": 187}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1595, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 639, "inst": 0, "rop": 263}, "n": {"dim": 1527, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 642, "inst": 0, "rop": 265}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1595, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 639, "inst": 0, "rop": 481}, "n": {"dim": 1527, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 642, "inst": 0, "rop": 484}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1595, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 639, "inst": 0, "rop": 191}, "n": {"dim": 1527, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 642, "inst": 0, "rop": 191}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1595, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 639, "inst": 0, "rop": 179}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 642, "inst": 0, "rop": 180}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1595, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 639, "inst": 0, "rop": 569}, "n": {"dim": 1527, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 642, "inst": 0, "rop": 573}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1595, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 639, "inst": 0, "rop": 217}, "n": {"dim": 1527, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 642, "inst": 0, "rop": 218}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1595, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 639, "inst": 0, "rop": 241}, "n": {"dim": 1527, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 642, "inst": 0, "rop": 242}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1595, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 639, "inst": 0, "rop": 200}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 642, "inst": 0, "rop": 201}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1595, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 639, "inst": 0, "rop": 187}, "n": {"dim": 1527, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 642, "inst": 0, "rop": 188}}}, "key": "KINDI-0768-2.29-16384", "param": [{"category": [2], "k": 3, "n": 768, "q": 16384, "secret_distribution": "(-4, 4)", "claimed": 164, "ring": "x^{n/k}+1", "sd": 2.29128784747792}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1702, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 738, "inst": 0, "rop": 226}, "n": {"dim": 1524, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 753, "inst": 0, "rop": 230}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1719, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 758, "inst": 0, "rop": 202}, "n": {"dim": 1524, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 774, "inst": 0, "rop": 206}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1702, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 738, "inst": 0, "rop": 233}, "n": {"dim": 1524, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 753, "inst": 0, "rop": 237}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1686, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 719, "inst": 0, "rop": 265}, "n": {"dim": 1524, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 726, "inst": 0, "rop": 268}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1716, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 746, "inst": 0, "rop": 217}, "n": {"dim": 1524, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 753, "inst": 0, "rop": 218}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1682, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": false, "beta": 699, "inst": 0, "rop": 320}, "n": {"dim": 1527, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 694, "inst": 0, "rop": 325}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1604, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 638, "inst": 0, "rop": 480}, "n": {"dim": 1524, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 645, "inst": 0, "rop": 487}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1702, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 738, "inst": 0, "rop": 221}, "n": {"dim": 1524, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 753, "inst": 0, "rop": 225}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1719, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 758, "inst": 0, "rop": 211}, "n": {"dim": 1536, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 771, "inst": 0, "rop": 215}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1594, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 621, "inst": 0, "rop": 565}, "n": {"dim": 1524, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 619, "inst": 0, "rop": 598}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1712, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 734, "inst": 0, "rop": 246}, "n": {"dim": 1524, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 733, "inst": 0, "rop": 245}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1680, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 712, "inst": 0, "rop": 278}, "n": {"dim": 1527, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 706, "inst": 0, "rop": 298}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1702, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 738, "inst": 0, "rop": 227}, "n": {"dim": 1524, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 753, "inst": 0, "rop": 230}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1705, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 740, "inst": 0, "rop": 218}, "n": {"dim": 1524, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 753, "inst": 0, "rop": 221}}}, "key": "KINDI-0768-2.29-16384", "param": [{"category": [2], "k": 3, "n": 768, "q": 16384, "secret_distribution": "(-4, 4)", "claimed": 164, "ring": "x^{n/k}+1", "sd": 2.29128784747792}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1969, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 253}, "n": {"dim": 1969, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 253}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1969, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 221}, "n": {"dim": 1969, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 221}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1969, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 831, "inst": 0, "rop": 260}, "n": {"dim": 1969, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 831, "inst": 0, "rop": 260}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1969, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 306}, "n": {"dim": 1969, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 306}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1969, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 831, "inst": 0, "rop": 237}, "n": {"dim": 1969, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 831, "inst": 0, "rop": 237}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1969, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 831, "inst": 0, "rop": 381}, "n": {"dim": 1969, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 831, "inst": 0, "rop": 381}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1969, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 831, "inst": 0, "rop": 679}, "n": {"dim": 1969, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 831, "inst": 0, "rop": 679}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1969, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 248}, "n": {"dim": 1969, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 248}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1969, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 230}, "n": {"dim": 1969, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 230}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1970, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 828, "inst": 0, "rop": 861}, "n": {"dim": 1970, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 828, "inst": 0, "rop": 861}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1969, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 831, "inst": 0, "rop": 273}, "n": {"dim": 1969, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 831, "inst": 0, "rop": 273}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1969, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 831, "inst": 0, "rop": 340}, "n": {"dim": 1969, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 831, "inst": 0, "rop": 340}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1969, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 831, "inst": 0, "rop": 251}, "n": {"dim": 1969, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 831, "inst": 0, "rop": 251}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1969, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 243}, "n": {"dim": 1969, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 831, "inst": 0, "rop": 243}}}, "key": "KINDI-1024-1.12-8192", "param": [{"category": [4], "k": 2, "n": 1024, "q": 8192, "secret_distribution": "(-2, 2)", "claimed": 207, "ring": "x^{n/k}+1", "sd": 1.118033988749895}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2078, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 949, "inst": 0, "rop": 288}, "n": {"dim": 2016, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 950, "inst": 0, "rop": 288}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2111, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 969, "inst": 0, "rop": 257}, "n": {"dim": 2032, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 971, "inst": 0, "rop": 258}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2091, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 942, "inst": 0, "rop": 293}, "n": {"dim": 2032, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 941, "inst": 0, "rop": 292}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2055, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 921, "inst": 0, "rop": 339}, "n": {"dim": 2016, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 921, "inst": 0, "rop": 339}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2111, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 969, "inst": 0, "rop": 274}, "n": {"dim": 2032, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 971, "inst": 0, "rop": 274}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2022, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 882, "inst": 0, "rop": 413}, "n": {"dim": 2016, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 882, "inst": 0, "rop": 413}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2012, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 837, "inst": 0, "rop": 687}, "n": {"dim": 2012, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 837, "inst": 0, "rop": 687}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2086, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 954, "inst": 0, "rop": 284}, "n": {"dim": 2018, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 953, "inst": 0, "rop": 284}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2111, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 969, "inst": 0, "rop": 267}, "n": {"dim": 2032, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 971, "inst": 0, "rop": 268}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1947, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 784, "inst": 0, "rop": 875}, "n": {"dim": 1947, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 784, "inst": 0, "rop": 875}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2087, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 939, "inst": 0, "rop": 305}, "n": {"dim": 2032, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 941, "inst": 0, "rop": 306}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2054, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 901, "inst": 0, "rop": 378}, "n": {"dim": 2032, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 901, "inst": 0, "rop": 378}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2086, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 954, "inst": 0, "rop": 284}, "n": {"dim": 2020, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 956, "inst": 0, "rop": 284}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2111, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 969, "inst": 0, "rop": 283}, "n": {"dim": 2032, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 971, "inst": 0, "rop": 284}}}, "key": "KINDI-1024-1.12-8192", "param": [{"category": [4], "k": 2, "n": 1024, "q": 8192, "secret_distribution": "(-2, 2)", "claimed": 207, "ring": "x^{n/k}+1", "sd": 1.118033988749895}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2073, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 897, "inst": 0, "rop": 272}, "n": {"dim": 2046, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 898, "inst": 0, "rop": 273}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2073, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 897, "inst": 0, "rop": 238}, "n": {"dim": 2046, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 898, "inst": 0, "rop": 238}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2073, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 897, "inst": 0, "rop": 279}, "n": {"dim": 2046, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 898, "inst": 0, "rop": 279}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2073, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 897, "inst": 0, "rop": 331}, "n": {"dim": 2046, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 898, "inst": 0, "rop": 331}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2073, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 897, "inst": 0, "rop": 255}, "n": {"dim": 2046, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 898, "inst": 0, "rop": 255}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2073, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 897, "inst": 0, "rop": 423}, "n": {"dim": 2046, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 898, "inst": 0, "rop": 424}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2073, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 897, "inst": 0, "rop": 750}, "n": {"dim": 2046, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 898, "inst": 0, "rop": 751}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2073, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 897, "inst": 0, "rop": 267}, "n": {"dim": 2046, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 898, "inst": 0, "rop": 268}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2073, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 897, "inst": 0, "rop": 248}, "n": {"dim": 2046, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 898, "inst": 0, "rop": 248}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2073, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 897, "inst": 0, "rop": 975}, "n": {"dim": 2046, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 898, "inst": 0, "rop": 977}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2073, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 897, "inst": 0, "rop": 293}, "n": {"dim": 2046, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 898, "inst": 0, "rop": 293}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2073, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 897, "inst": 0, "rop": 375}, "n": {"dim": 2046, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 898, "inst": 0, "rop": 376}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2073, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 897, "inst": 0, "rop": 269}, "n": {"dim": 2046, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 898, "inst": 0, "rop": 269}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2073, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 897, "inst": 0, "rop": 262}, "n": {"dim": 2046, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 898, "inst": 0, "rop": 263}}}, "key": "KINDI-1024-2.29-16384", "param": [{"category": [4], "k": 2, "n": 1024, "q": 16384, "secret_distribution": "(-4, 4)", "claimed": 232, "ring": "x^{n/k}+1", "sd": 2.29128784747792}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2246, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1032, "inst": 0, "rop": 313}, "n": {"dim": 2040, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1035, "inst": 0, "rop": 314}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2251, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1049, "inst": 0, "rop": 279}, "n": {"dim": 2040, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1070, "inst": 0, "rop": 285}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2229, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1022, "inst": 0, "rop": 317}, "n": {"dim": 2040, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1035, "inst": 0, "rop": 320}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2210, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 999, "inst": 0, "rop": 369}, "n": {"dim": 2032, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1009, "inst": 0, "rop": 372}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2234, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1038, "inst": 0, "rop": 292}, "n": {"dim": 2041, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1051, "inst": 0, "rop": 296}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2160, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 960, "inst": 0, "rop": 464}, "n": {"dim": 2040, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 967, "inst": 0, "rop": 469}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2087, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 886, "inst": 0, "rop": 738}, "n": {"dim": 2016, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 887, "inst": 0, "rop": 739}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2231, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1030, "inst": 0, "rop": 307}, "n": {"dim": 2048, "name": "0.2975\u00a0\u03b2", "drop": false, "beta": 1047, "inst": 0, "rop": 312}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2236, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1040, "inst": 0, "rop": 286}, "n": {"dim": 2041, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1051, "inst": 0, "rop": 291}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2080, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 858, "inst": 0, "rop": 907}, "n": {"dim": 2036, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 863, "inst": 0, "rop": 916}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2216, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1014, "inst": 0, "rop": 327}, "n": {"dim": 2032, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1023, "inst": 0, "rop": 330}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2181, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 972, "inst": 0, "rop": 417}, "n": {"dim": 2032, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 978, "inst": 0, "rop": 420}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2234, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1038, "inst": 0, "rop": 306}, "n": {"dim": 2032, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1038, "inst": 0, "rop": 307}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2231, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1030, "inst": 0, "rop": 302}, "n": {"dim": 2032, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1058, "inst": 0, "rop": 310}}}, "key": "KINDI-1024-2.29-16384", "param": [{"category": [4], "k": 2, "n": 1024, "q": 16384, "secret_distribution": "(-4, 4)", "claimed": 232, "ring": "x^{n/k}+1", "sd": 2.29128784747792}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2428, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 301}, "n": {"dim": 2428, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 301}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2428, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 264}, "n": {"dim": 2428, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 264}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2428, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 995, "inst": 0, "rop": 307}, "n": {"dim": 2428, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 995, "inst": 0, "rop": 307}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2428, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 367}, "n": {"dim": 2428, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 367}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2428, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 995, "inst": 0, "rop": 281}, "n": {"dim": 2428, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 995, "inst": 0, "rop": 281}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2428, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 995, "inst": 0, "rop": 487}, "n": {"dim": 2428, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 995, "inst": 0, "rop": 487}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2428, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 995, "inst": 0, "rop": 858}, "n": {"dim": 2428, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 995, "inst": 0, "rop": 858}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2428, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 297}, "n": {"dim": 2428, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 297}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2428, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 274}, "n": {"dim": 2428, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 274}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2428, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 995, "inst": 0, "rop": 1156}, "n": {"dim": 2428, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 995, "inst": 0, "rop": 1156}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2428, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 995, "inst": 0, "rop": 322}, "n": {"dim": 2428, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 995, "inst": 0, "rop": 322}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2428, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 995, "inst": 0, "rop": 429}, "n": {"dim": 2428, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 995, "inst": 0, "rop": 429}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2428, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 995, "inst": 0, "rop": 295}, "n": {"dim": 2428, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 995, "inst": 0, "rop": 295}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2428, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 291}, "n": {"dim": 2428, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 995, "inst": 0, "rop": 291}}}, "key": "KINDI-1280-1.12-16384", "param": [{"category": [5], "k": 5, "n": 1280, "q": 16384, "secret_distribution": "(-2, 2)", "claimed": 251, "ring": "x^{n/k}+1", "sd": 1.118033988749895}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2603, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1140, "inst": 0, "rop": 344}, "n": {"dim": 2540, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1140, "inst": 0, "rop": 344}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2623, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1163, "inst": 0, "rop": 309}, "n": {"dim": 2540, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1165, "inst": 0, "rop": 309}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2615, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": false, "beta": 1130, "inst": 0, "rop": 347}, "n": {"dim": 2540, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1140, "inst": 0, "rop": 350}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2573, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1095, "inst": 0, "rop": 404}, "n": {"dim": 2550, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1095, "inst": 0, "rop": 404}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2608, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1134, "inst": 0, "rop": 320}, "n": {"dim": 2550, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1136, "inst": 0, "rop": 319}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2494, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1039, "inst": 0, "rop": 519}, "n": {"dim": 2494, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1039, "inst": 0, "rop": 519}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2436, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 978, "inst": 0, "rop": 839}, "n": {"dim": 2436, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 978, "inst": 0, "rop": 839}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2603, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1140, "inst": 0, "rop": 340}, "n": {"dim": 2540, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1140, "inst": 0, "rop": 340}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2592, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1145, "inst": 0, "rop": 314}, "n": {"dim": 2521, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1142, "inst": 0, "rop": 314}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2428, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 948, "inst": 0, "rop": 1068}, "n": {"dim": 2428, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 948, "inst": 0, "rop": 1068}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2605, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1124, "inst": 0, "rop": 360}, "n": {"dim": 2560, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": false, "beta": 1124, "inst": 0, "rop": 360}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2551, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1070, "inst": 0, "rop": 472}, "n": {"dim": 2550, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1070, "inst": 0, "rop": 472}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2590, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1124, "inst": 0, "rop": 329}, "n": {"dim": 2540, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1124, "inst": 0, "rop": 329}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2603, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1140, "inst": 0, "rop": 333}, "n": {"dim": 2540, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1140, "inst": 0, "rop": 333}}}, "key": "KINDI-1280-1.12-16384", "param": [{"category": [5], "k": 5, "n": 1280, "q": 16384, "secret_distribution": "(-2, 2)", "claimed": 251, "ring": "x^{n/k}+1", "sd": 1.118033988749895}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2917, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 399}, "n": {"dim": 2917, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 399}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2917, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 352}, "n": {"dim": 2917, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 352}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2917, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1328, "inst": 0, "rop": 405}, "n": {"dim": 2917, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1328, "inst": 0, "rop": 405}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2917, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 489}, "n": {"dim": 2917, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 489}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2917, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1328, "inst": 0, "rop": 369}, "n": {"dim": 2917, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1328, "inst": 0, "rop": 369}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2917, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1328, "inst": 0, "rop": 718}, "n": {"dim": 2917, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1328, "inst": 0, "rop": 718}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2917, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 1328, "inst": 0, "rop": 1243}, "n": {"dim": 2917, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 1328, "inst": 0, "rop": 1243}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2917, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 396}, "n": {"dim": 2917, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 396}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2917, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 363}, "n": {"dim": 2917, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 363}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2918, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1321, "inst": 0, "rop": 1882}, "n": {"dim": 2918, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1321, "inst": 0, "rop": 1882}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2917, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1328, "inst": 0, "rop": 419}, "n": {"dim": 2917, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1328, "inst": 0, "rop": 419}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2917, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1328, "inst": 0, "rop": 622}, "n": {"dim": 2917, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1328, "inst": 0, "rop": 622}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2917, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1328, "inst": 0, "rop": 383}, "n": {"dim": 2917, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1328, "inst": 0, "rop": 383}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2917, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 388}, "n": {"dim": 2917, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1328, "inst": 0, "rop": 388}}}, "key": "KINDI-1536-1.12-8192", "param": [{"category": [5], "k": 3, "n": 1536, "q": 8192, "secret_distribution": "(-2, 2)", "claimed": 330, "ring": "x^{n/k}+1", "sd": 1.118033988749895}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["MLWE"], "name": "KINDI"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3032, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1499, "inst": 0, "rop": 449}, "n": {"dim": 3024, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1499, "inst": 0, "rop": 449}}, "0.265\u00a0\u03b2": {"2n": {"dim": 3068, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1536, "inst": 0, "rop": 408}, "n": {"dim": 3030, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1536, "inst": 0, "rop": 408}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3032, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1499, "inst": 0, "rop": 455}, "n": {"dim": 3024, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1499, "inst": 0, "rop": 455}}, "0.368\u00a0\u03b2": {"2n": {"dim": 3030, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1466, "inst": 0, "rop": 540}, "n": {"dim": 3030, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1466, "inst": 0, "rop": 540}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 3055, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1528, "inst": 0, "rop": 422}, "n": {"dim": 3024, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1528, "inst": 0, "rop": 422}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2967, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1387, "inst": 0, "rop": 761}, "n": {"dim": 2967, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1387, "inst": 0, "rop": 761}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2857, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 1285, "inst": 0, "rop": 1192}, "n": {"dim": 2857, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 1285, "inst": 0, "rop": 1192}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 3045, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1506, "inst": 0, "rop": 449}, "n": {"dim": 3030, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1506, "inst": 0, "rop": 449}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 3055, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1528, "inst": 0, "rop": 416}, "n": {"dim": 3024, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1528, "inst": 0, "rop": 416}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2837, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1226, "inst": 0, "rop": 1780}, "n": {"dim": 2837, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1226, "inst": 0, "rop": 1780}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3032, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1499, "inst": 0, "rop": 469}, "n": {"dim": 3024, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1499, "inst": 0, "rop": 469}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2988, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1413, "inst": 0, "rop": 673}, "n": {"dim": 2988, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1413, "inst": 0, "rop": 673}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 3076, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1508, "inst": 0, "rop": 433}, "n": {"dim": 3060, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1508, "inst": 0, "rop": 433}}, "0.292\u00a0\u03b2": {"2n": {"dim": 3081, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1530, "inst": 0, "rop": 447}, "n": {"dim": 3048, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1530, "inst": 0, "rop": 447}}}, "key": "KINDI-1536-1.12-8192", "param": [{"category": [5], "k": 3, "n": 1536, "q": 8192, "secret_distribution": "(-2, 2)", "claimed": 330, "ring": "x^{n/k}+1", "sd": 1.118033988749895}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 941, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 148}, "n": {"dim": 941, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 148}}, "0.265\u00a0\u03b2": {"2n": {"dim": 941, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 126}, "n": {"dim": 941, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 126}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 941, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 474, "inst": 1, "rop": 155}, "n": {"dim": 941, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 474, "inst": 1, "rop": 155}}, "0.368\u00a0\u03b2": {"2n": {"dim": 941, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 175}, "n": {"dim": 941, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 175}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 941, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 474, "inst": 1, "rop": 143}, "n": {"dim": 941, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 474, "inst": 1, "rop": 143}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 940, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 472, "inst": 1, "rop": 170}, "n": {"dim": 940, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 472, "inst": 1, "rop": 170}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 937, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 466, "inst": 1, "rop": 322}, "n": {"dim": 937, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 466, "inst": 1, "rop": 322}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 941, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 142}, "n": {"dim": 941, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 142}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 941, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 135}, "n": {"dim": 941, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 135}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 934, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 457, "inst": 1, "rop": 362}, "n": {"dim": 934, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 457, "inst": 1, "rop": 362}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 941, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 474, "inst": 1, "rop": 168}, "n": {"dim": 941, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 474, "inst": 1, "rop": 168}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 941, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 474, "inst": 1, "rop": 162}, "n": {"dim": 941, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 474, "inst": 1, "rop": 162}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 941, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 474, "inst": 1, "rop": 155}, "n": {"dim": 941, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 474, "inst": 1, "rop": 155}}, "0.292\u00a0\u03b2": {"2n": {"dim": 941, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 139}, "n": {"dim": 941, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 474, "inst": 1, "rop": 139}}}, "key": "Lizard-1024-1.12-2048", "param": [{"category": [1], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 140)", "claimed": 130, "sd": 1.118033988749895}, {"category": [1], "n": 536, "q": 2048, "secret_distribution": "((-1, 1), 268)", "claimed": 133, "sd": 2.58555}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1022, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 566, "inst": 1, "rop": 175}, "n": {"dim": 1034, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 573, "inst": 1, "rop": 177}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1045, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 590, "inst": 1, "rop": 157}, "n": {"dim": 1042, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 584, "inst": 1, "rop": 158}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1028, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 564, "inst": 1, "rop": 182}, "n": {"dim": 1014, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 554, "inst": 1, "rop": 181}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1017, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 548, "inst": 1, "rop": 202}, "n": {"dim": 998, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 538, "inst": 1, "rop": 200}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1036, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 577, "inst": 1, "rop": 170}, "n": {"dim": 1026, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 572, "inst": 1, "rop": 169}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1014, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 543, "inst": 1, "rop": 208}, "n": {"dim": 998, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 534, "inst": 1, "rop": 204}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 939, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 465, "inst": 1, "rop": 318}, "n": {"dim": 950, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 470, "inst": 1, "rop": 321}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1036, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 577, "inst": 1, "rop": 172}, "n": {"dim": 1022, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 566, "inst": 1, "rop": 170}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1031, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 579, "inst": 1, "rop": 163}, "n": {"dim": 1042, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 584, "inst": 1, "rop": 164}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 932, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 456, "inst": 1, "rop": 347}, "n": {"dim": 918, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 447, "inst": 1, "rop": 344}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1004, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 546, "inst": 1, "rop": 190}, "n": {"dim": 1026, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 561, "inst": 1, "rop": 194}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1005, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 545, "inst": 1, "rop": 195}, "n": {"dim": 1020, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 552, "inst": 1, "rop": 198}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1028, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 564, "inst": 1, "rop": 180}, "n": {"dim": 1033, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 571, "inst": 1, "rop": 181}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1036, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 577, "inst": 1, "rop": 169}, "n": {"dim": 1034, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 573, "inst": 1, "rop": 169}}}, "key": "Lizard-1024-1.12-2048", "param": [{"category": [1], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 140)", "claimed": 130, "sd": 1.118033988749895}, {"category": [1], "n": 536, "q": 2048, "secret_distribution": "((-1, 1), 268)", "claimed": 133, "sd": 2.58555}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1216, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 183}, "n": {"dim": 1216, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 183}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1216, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 158}, "n": {"dim": 1216, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 158}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1216, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 595, "inst": 1, "rop": 191}, "n": {"dim": 1216, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 595, "inst": 1, "rop": 191}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1216, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 219}, "n": {"dim": 1216, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 219}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1216, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 595, "inst": 1, "rop": 175}, "n": {"dim": 1216, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 595, "inst": 1, "rop": 175}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1216, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 595, "inst": 1, "rop": 237}, "n": {"dim": 1216, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 595, "inst": 1, "rop": 237}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 634, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 272, "inst": 0, "rop": 372}, "n": {"dim": 634, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 272, "inst": 0, "rop": 372}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1216, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 178}, "n": {"dim": 1216, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 178}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1216, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 167}, "n": {"dim": 1216, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 167}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 611, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 254, "inst": 0, "rop": 391}, "n": {"dim": 611, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 254, "inst": 0, "rop": 391}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1216, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 595, "inst": 1, "rop": 204}, "n": {"dim": 1216, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 595, "inst": 1, "rop": 204}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1216, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 595, "inst": 1, "rop": 219}, "n": {"dim": 1216, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 595, "inst": 1, "rop": 219}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1216, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 595, "inst": 1, "rop": 188}, "n": {"dim": 1216, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 595, "inst": 1, "rop": 188}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1216, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 174}, "n": {"dim": 1216, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 595, "inst": 1, "rop": 174}}}, "key": "Lizard-1024-1.12-1024", "param": [{"category": [1], "n": 1024, "q": 1024, "secret_distribution": "((-1, 1), 128)", "claimed": 147, "sd": 1.118033988749895}, {"category": [1], "n": 663, "q": 1024, "secret_distribution": "((-1, 1), 497)", "claimed": 131, "sd": 0.891}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1293, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 701, "inst": 1, "rop": 215}, "n": {"dim": 1293, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 701, "inst": 1, "rop": 215}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1305, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 719, "inst": 1, "rop": 191}, "n": {"dim": 1305, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 720, "inst": 1, "rop": 191}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1293, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 701, "inst": 1, "rop": 222}, "n": {"dim": 1293, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 701, "inst": 1, "rop": 222}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1271, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 670, "inst": 1, "rop": 251}, "n": {"dim": 1271, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 670, "inst": 1, "rop": 251}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1305, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 719, "inst": 1, "rop": 207}, "n": {"dim": 1312, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 716, "inst": 1, "rop": 208}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1256, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 648, "inst": 1, "rop": 289}, "n": {"dim": 1256, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 648, "inst": 1, "rop": 289}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 681, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 304, "inst": 0, "rop": 371}, "n": {"dim": 681, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 304, "inst": 0, "rop": 371}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1293, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 701, "inst": 1, "rop": 210}, "n": {"dim": 1293, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 701, "inst": 1, "rop": 210}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1305, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 719, "inst": 1, "rop": 201}, "n": {"dim": 1305, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 720, "inst": 1, "rop": 201}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 675, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 296, "inst": 0, "rop": 386}, "n": {"dim": 675, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 296, "inst": 0, "rop": 386}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1283, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 685, "inst": 1, "rop": 231}, "n": {"dim": 1283, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 685, "inst": 1, "rop": 231}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1256, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 648, "inst": 1, "rop": 289}, "n": {"dim": 1256, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 648, "inst": 1, "rop": 289}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1293, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 701, "inst": 1, "rop": 216}, "n": {"dim": 1293, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 701, "inst": 1, "rop": 216}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1302, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 708, "inst": 1, "rop": 209}, "n": {"dim": 1302, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 709, "inst": 1, "rop": 208}}}, "key": "Lizard-1024-1.12-1024", "param": [{"category": [1], "n": 1024, "q": 1024, "secret_distribution": "((-1, 1), 128)", "claimed": 147, "sd": 1.118033988749895}, {"category": [1], "n": 663, "q": 1024, "secret_distribution": "((-1, 1), 497)", "claimed": 131, "sd": 0.891}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1436, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 216}, "n": {"dim": 1436, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 216}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1436, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 187}, "n": {"dim": 1436, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 187}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1436, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 704, "inst": 1, "rop": 222}, "n": {"dim": 1436, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 704, "inst": 1, "rop": 222}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1436, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 260}, "n": {"dim": 1436, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 260}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1436, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 704, "inst": 1, "rop": 203}, "n": {"dim": 1436, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 704, "inst": 1, "rop": 203}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1436, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 704, "inst": 1, "rop": 302}, "n": {"dim": 1436, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 704, "inst": 1, "rop": 302}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 904, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 386, "inst": 0, "rop": 480}, "n": {"dim": 904, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 386, "inst": 0, "rop": 480}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1436, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 210}, "n": {"dim": 1436, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 210}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1436, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 197}, "n": {"dim": 1436, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 197}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 871, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 505}, "n": {"dim": 871, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 505}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1436, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 704, "inst": 1, "rop": 236}, "n": {"dim": 1436, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 704, "inst": 1, "rop": 236}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1436, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 704, "inst": 1, "rop": 273}, "n": {"dim": 1436, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 704, "inst": 1, "rop": 273}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1436, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 704, "inst": 1, "rop": 217}, "n": {"dim": 1436, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 704, "inst": 1, "rop": 217}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1436, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 206}, "n": {"dim": 1436, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 704, "inst": 1, "rop": 206}}}, "key": "Lizard-1024-1.12-2048", "param": [{"category": [3], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 200)", "claimed": 195, "sd": 1.118033988749895}, {"category": [3], "n": 816, "q": 2048, "secret_distribution": "((-1, 1), 408)", "claimed": 193, "sd": 1.3394}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1527, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 817, "inst": 1, "rop": 249}, "n": {"dim": 1527, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 818, "inst": 1, "rop": 249}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1558, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 846, "inst": 1, "rop": 226}, "n": {"dim": 1544, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 842, "inst": 1, "rop": 224}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1527, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 817, "inst": 1, "rop": 255}, "n": {"dim": 1527, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 818, "inst": 1, "rop": 256}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1514, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 793, "inst": 1, "rop": 292}, "n": {"dim": 1513, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 791, "inst": 1, "rop": 292}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1533, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 827, "inst": 1, "rop": 236}, "n": {"dim": 1538, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 833, "inst": 1, "rop": 238}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1466, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 755, "inst": 1, "rop": 334}, "n": {"dim": 1466, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 755, "inst": 1, "rop": 334}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1234, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 565, "inst": 0, "rop": 491}, "n": {"dim": 1234, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 565, "inst": 0, "rop": 491}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1527, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 817, "inst": 1, "rop": 245}, "n": {"dim": 1527, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 818, "inst": 1, "rop": 245}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1544, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 834, "inst": 1, "rop": 231}, "n": {"dim": 1543, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 833, "inst": 1, "rop": 232}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1152, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 512, "inst": 0, "rop": 520}, "n": {"dim": 1152, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 512, "inst": 0, "rop": 520}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1527, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 817, "inst": 1, "rop": 269}, "n": {"dim": 1535, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 812, "inst": 1, "rop": 269}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1499, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 779, "inst": 1, "rop": 312}, "n": {"dim": 1499, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 779, "inst": 1, "rop": 312}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1533, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 827, "inst": 1, "rop": 250}, "n": {"dim": 1527, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 818, "inst": 1, "rop": 247}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1537, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 825, "inst": 1, "rop": 242}, "n": {"dim": 1533, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 822, "inst": 1, "rop": 241}}}, "key": "Lizard-1024-1.12-2048", "param": [{"category": [3], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 200)", "claimed": 195, "sd": 1.118033988749895}, {"category": [3], "n": 816, "q": 2048, "secret_distribution": "((-1, 1), 408)", "claimed": 193, "sd": 1.3394}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1672, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 251}, "n": {"dim": 1672, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 251}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1672, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 220}, "n": {"dim": 1672, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 220}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1672, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 822, "inst": 0, "rop": 258}, "n": {"dim": 1672, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 822, "inst": 0, "rop": 258}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1668, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 815, "inst": 0, "rop": 304}, "n": {"dim": 1668, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 815, "inst": 0, "rop": 304}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1672, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 822, "inst": 0, "rop": 236}, "n": {"dim": 1672, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 822, "inst": 0, "rop": 236}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1256, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 578, "inst": 0, "rop": 336}, "n": {"dim": 1256, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 578, "inst": 0, "rop": 336}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 904, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 386, "inst": 0, "rop": 480}, "n": {"dim": 904, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 386, "inst": 0, "rop": 480}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1672, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 246}, "n": {"dim": 1672, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 246}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1672, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 229}, "n": {"dim": 1672, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 229}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 871, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 505}, "n": {"dim": 871, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 505}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1672, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 822, "inst": 0, "rop": 272}, "n": {"dim": 1672, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 822, "inst": 0, "rop": 272}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1341, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 619, "inst": 0, "rop": 318}, "n": {"dim": 1341, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 619, "inst": 0, "rop": 318}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1672, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 822, "inst": 0, "rop": 250}, "n": {"dim": 1672, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 822, "inst": 0, "rop": 250}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1672, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 242}, "n": {"dim": 1672, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 822, "inst": 0, "rop": 242}}}, "key": "Lizard-1024-1.12-2048", "param": [{"category": [3], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 200)", "claimed": 195, "sd": 1.118033988749895}, {"category": [3], "n": 952, "q": 2048, "secret_distribution": "((-1, 1), 714)", "claimed": 203, "sd": 1.675967}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1720, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 915, "inst": 0, "rop": 281}, "n": {"dim": 1720, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 915, "inst": 0, "rop": 281}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1727, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 934, "inst": 0, "rop": 252}, "n": {"dim": 1727, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 934, "inst": 0, "rop": 252}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1694, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 897, "inst": 0, "rop": 285}, "n": {"dim": 1694, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 897, "inst": 0, "rop": 285}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1613, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 837, "inst": 0, "rop": 320}, "n": {"dim": 1613, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 837, "inst": 0, "rop": 320}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1691, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 909, "inst": 0, "rop": 263}, "n": {"dim": 1691, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 909, "inst": 0, "rop": 263}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1449, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 724, "inst": 0, "rop": 355}, "n": {"dim": 1449, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 724, "inst": 0, "rop": 355}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1234, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 565, "inst": 0, "rop": 491}, "n": {"dim": 1234, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 565, "inst": 0, "rop": 491}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1724, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 921, "inst": 0, "rop": 277}, "n": {"dim": 1724, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 921, "inst": 0, "rop": 277}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1702, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 917, "inst": 0, "rop": 259}, "n": {"dim": 1702, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 917, "inst": 0, "rop": 259}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1152, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 512, "inst": 0, "rop": 520}, "n": {"dim": 1152, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 512, "inst": 0, "rop": 520}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1675, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 884, "inst": 0, "rop": 295}, "n": {"dim": 1675, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 884, "inst": 0, "rop": 295}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1517, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 770, "inst": 0, "rop": 338}, "n": {"dim": 1517, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 770, "inst": 0, "rop": 338}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1723, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 917, "inst": 0, "rop": 278}, "n": {"dim": 1723, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 917, "inst": 0, "rop": 278}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1687, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 907, "inst": 0, "rop": 270}, "n": {"dim": 1687, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 907, "inst": 0, "rop": 270}}}, "key": "Lizard-1024-1.12-2048", "param": [{"category": [3], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 200)", "claimed": 195, "sd": 1.118033988749895}, {"category": [3], "n": 952, "q": 2048, "secret_distribution": "((-1, 1), 714)", "claimed": 203, "sd": 1.675967}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1898, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 301}, "n": {"dim": 1898, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 301}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1898, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 264}, "n": {"dim": 1898, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 264}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1898, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 996, "inst": 1, "rop": 308}, "n": {"dim": 1898, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 996, "inst": 1, "rop": 308}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1898, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 367}, "n": {"dim": 1898, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 367}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1898, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 996, "inst": 1, "rop": 281}, "n": {"dim": 1898, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 996, "inst": 1, "rop": 281}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1898, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 996, "inst": 1, "rop": 488}, "n": {"dim": 1898, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 996, "inst": 1, "rop": 488}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 991, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 378, "inst": 0, "rop": 664}, "n": {"dim": 991, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 378, "inst": 0, "rop": 664}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1898, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 297}, "n": {"dim": 1898, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 297}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1898, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 274}, "n": {"dim": 1898, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 274}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 957, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 362, "inst": 0, "rop": 689}, "n": {"dim": 957, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 362, "inst": 0, "rop": 689}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1898, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 996, "inst": 1, "rop": 322}, "n": {"dim": 1898, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 996, "inst": 1, "rop": 322}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1898, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 996, "inst": 1, "rop": 430}, "n": {"dim": 1898, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 996, "inst": 1, "rop": 430}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1898, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 996, "inst": 1, "rop": 295}, "n": {"dim": 1898, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 996, "inst": 1, "rop": 295}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1898, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 291}, "n": {"dim": 1898, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 996, "inst": 1, "rop": 291}}}, "key": "Lizard-2048-1.12-4096", "param": [{"category": [5], "n": 2048, "q": 4096, "secret_distribution": "((-1, 1), 200)", "claimed": 257, "sd": 1.118033988749895}, {"category": [5], "n": 1088, "q": 4096, "secret_distribution": "((-1, 1), 544)", "claimed": 266, "sd": 3.11251}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1985, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1147, "inst": 1, "rop": 347}, "n": {"dim": 1993, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1164, "inst": 1, "rop": 351}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2006, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1184, "inst": 1, "rop": 314}, "n": {"dim": 2022, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1187, "inst": 1, "rop": 315}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1979, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1143, "inst": 1, "rop": 352}, "n": {"dim": 1993, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1164, "inst": 1, "rop": 357}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1959, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1108, "inst": 1, "rop": 409}, "n": {"dim": 1942, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1109, "inst": 1, "rop": 409}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2006, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1184, "inst": 1, "rop": 331}, "n": {"dim": 1996, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1166, "inst": 1, "rop": 326}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1880, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1035, "inst": 1, "rop": 517}, "n": {"dim": 1943, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1064, "inst": 1, "rop": 539}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1209, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 495, "inst": 0, "rop": 653}, "n": {"dim": 1209, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 495, "inst": 0, "rop": 653}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1993, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1153, "inst": 1, "rop": 344}, "n": {"dim": 1993, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1164, "inst": 1, "rop": 347}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2006, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1184, "inst": 1, "rop": 324}, "n": {"dim": 2000, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1169, "inst": 1, "rop": 321}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1006, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 389, "inst": 0, "rop": 670}, "n": {"dim": 1006, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 389, "inst": 0, "rop": 670}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1979, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1143, "inst": 1, "rop": 365}, "n": {"dim": 1949, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1130, "inst": 1, "rop": 362}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1931, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1071, "inst": 1, "rop": 474}, "n": {"dim": 1936, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1078, "inst": 1, "rop": 476}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2006, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1162, "inst": 1, "rop": 339}, "n": {"dim": 1993, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1164, "inst": 1, "rop": 339}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2006, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1162, "inst": 1, "rop": 340}, "n": {"dim": 1993, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1164, "inst": 1, "rop": 340}}}, "key": "Lizard-2048-1.12-4096", "param": [{"category": [5], "n": 2048, "q": 4096, "secret_distribution": "((-1, 1), 200)", "claimed": 257, "sd": 1.118033988749895}, {"category": [5], "n": 1088, "q": 4096, "secret_distribution": "((-1, 1), 544)", "claimed": 266, "sd": 3.11251}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2280, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 362}, "n": {"dim": 2280, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 362}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2280, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 319}, "n": {"dim": 2280, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 319}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2280, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1203, "inst": 1, "rop": 368}, "n": {"dim": 2280, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1203, "inst": 1, "rop": 368}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2280, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 443}, "n": {"dim": 2280, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 443}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2280, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1203, "inst": 1, "rop": 336}, "n": {"dim": 2280, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1203, "inst": 1, "rop": 336}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1256, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 578, "inst": 0, "rop": 552}, "n": {"dim": 1256, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 578, "inst": 0, "rop": 552}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 904, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 386, "inst": 0, "rop": 695}, "n": {"dim": 904, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 386, "inst": 0, "rop": 695}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2280, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 358}, "n": {"dim": 2280, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 358}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2280, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1203, "inst": 1, "rop": 330}, "n": {"dim": 2280, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1203, "inst": 1, "rop": 330}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 871, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 720}, "n": {"dim": 871, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 358, "inst": 0, "rop": 720}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2280, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1203, "inst": 1, "rop": 382}, "n": {"dim": 2280, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1203, "inst": 1, "rop": 382}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1341, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 619, "inst": 0, "rop": 533}, "n": {"dim": 1341, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 619, "inst": 0, "rop": 533}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2280, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1203, "inst": 1, "rop": 350}, "n": {"dim": 2280, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1203, "inst": 1, "rop": 350}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2280, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 352}, "n": {"dim": 2280, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1203, "inst": 1, "rop": 352}}}, "key": "Lizard-2048-1.12-2048", "param": [{"category": [5], "n": 2048, "q": 2048, "secret_distribution": "((-1, 1), 200)", "claimed": 291, "sd": 1.118033988749895}, {"category": [5], "n": 1300, "q": 2048, "secret_distribution": "((-1, 1), 975)", "claimed": 264, "sd": 1.072223}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["LWR", "LWE"], "name": "Lizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2448, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1392, "inst": 1, "rop": 417}, "n": {"dim": 2448, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1392, "inst": 1, "rop": 417}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2451, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1422, "inst": 1, "rop": 377}, "n": {"dim": 2451, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1422, "inst": 1, "rop": 377}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2430, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1379, "inst": 1, "rop": 420}, "n": {"dim": 2430, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1379, "inst": 1, "rop": 420}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2410, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1337, "inst": 1, "rop": 493}, "n": {"dim": 2410, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1337, "inst": 1, "rop": 493}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2457, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1398, "inst": 1, "rop": 389}, "n": {"dim": 2457, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1398, "inst": 1, "rop": 389}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1776, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 921, "inst": 0, "rop": 602}, "n": {"dim": 1776, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 921, "inst": 0, "rop": 602}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1264, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 582, "inst": 0, "rop": 706}, "n": {"dim": 1264, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 582, "inst": 0, "rop": 706}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2448, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1392, "inst": 1, "rop": 415}, "n": {"dim": 2448, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1392, "inst": 1, "rop": 415}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2484, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1418, "inst": 1, "rop": 388}, "n": {"dim": 2484, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": false, "beta": 1418, "inst": 1, "rop": 388}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 959, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 408, "inst": 0, "rop": 703}, "n": {"dim": 959, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 408, "inst": 0, "rop": 703}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2412, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1366, "inst": 1, "rop": 430}, "n": {"dim": 2412, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1366, "inst": 1, "rop": 430}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1980, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1062, "inst": 0, "rop": 581}, "n": {"dim": 1980, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1062, "inst": 0, "rop": 581}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2448, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1392, "inst": 1, "rop": 400}, "n": {"dim": 2448, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1392, "inst": 1, "rop": 400}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2448, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1392, "inst": 1, "rop": 407}, "n": {"dim": 2448, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1392, "inst": 1, "rop": 407}}}, "key": "Lizard-2048-1.12-2048", "param": [{"category": [5], "n": 2048, "q": 2048, "secret_distribution": "((-1, 1), 200)", "claimed": 291, "sd": 1.118033988749895}, {"category": [5], "n": 1300, "q": 2048, "secret_distribution": "((-1, 1), 975)", "claimed": 264, "sd": 1.072223}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWR", "RLWE"], "name": "RLizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1248, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 645, "inst": 1, "rop": 251}, "n": {"dim": 1248, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 645, "inst": 1, "rop": 251}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1381, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 714, "inst": 1, "rop": 223}, "n": {"dim": 1381, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 714, "inst": 1, "rop": 223}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1280, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 655, "inst": 1, "rop": 258}, "n": {"dim": 1280, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 655, "inst": 1, "rop": 258}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1058, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 519, "inst": 1, "rop": 286}, "n": {"dim": 1058, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 519, "inst": 1, "rop": 286}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1381, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 714, "inst": 1, "rop": 240}, "n": {"dim": 1381, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 714, "inst": 1, "rop": 240}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 870, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 396, "inst": 1, "rop": 276}, "n": {"dim": 870, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 396, "inst": 1, "rop": 276}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 641, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 266, "inst": 1, "rop": 370}, "n": {"dim": 641, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 266, "inst": 1, "rop": 370}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1253, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 634, "inst": 1, "rop": 245}, "n": {"dim": 1253, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 634, "inst": 1, "rop": 245}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1381, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 714, "inst": 1, "rop": 233}, "n": {"dim": 1381, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 714, "inst": 1, "rop": 233}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 641, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 266, "inst": 1, "rop": 390}, "n": {"dim": 641, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 266, "inst": 1, "rop": 390}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1248, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 645, "inst": 1, "rop": 272}, "n": {"dim": 1248, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 645, "inst": 1, "rop": 272}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 906, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 428, "inst": 1, "rop": 272}, "n": {"dim": 906, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 428, "inst": 1, "rop": 272}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1381, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 714, "inst": 1, "rop": 253}, "n": {"dim": 1381, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 714, "inst": 1, "rop": 253}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1280, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 655, "inst": 1, "rop": 242}, "n": {"dim": 1280, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 655, "inst": 1, "rop": 242}}}, "key": "RLizard-1024-1.12-1024", "param": [{"category": [1], "n": 1024, "q": 1024, "secret_distribution": "((-1, 1), 128)", "claimed": 147, "ring": "x^n+1", "sd": 1.118033988749895}, {"category": [1], "n": 1024, "q": 1024, "secret_distribution": "((-1, 1), 128)", "claimed": 153, "ring": "x^n+1", "sd": 1.069416}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWR", "RLWE"], "name": "RLizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1453, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 836, "inst": 1, "rop": 273}, "n": {"dim": 1453, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 836, "inst": 1, "rop": 273}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1421, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 823, "inst": 1, "rop": 247}, "n": {"dim": 1421, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 823, "inst": 1, "rop": 247}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1530, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 900, "inst": 0, "rop": 285}, "n": {"dim": 1530, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 900, "inst": 0, "rop": 285}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1428, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 806, "inst": 0, "rop": 318}, "n": {"dim": 1428, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 806, "inst": 0, "rop": 318}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1479, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 865, "inst": 0, "rop": 263}, "n": {"dim": 1479, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 865, "inst": 0, "rop": 263}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1103, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 584, "inst": 1, "rop": 305}, "n": {"dim": 1103, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 584, "inst": 1, "rop": 305}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 681, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 304, "inst": 0, "rop": 371}, "n": {"dim": 681, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 304, "inst": 0, "rop": 371}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1409, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 816, "inst": 0, "rop": 267}, "n": {"dim": 1409, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 816, "inst": 0, "rop": 267}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1506, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 885, "inst": 0, "rop": 260}, "n": {"dim": 1506, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 885, "inst": 0, "rop": 260}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 677, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 1, "rop": 384}, "n": {"dim": 677, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 295, "inst": 1, "rop": 384}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1440, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 825, "inst": 0, "rop": 292}, "n": {"dim": 1440, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 825, "inst": 0, "rop": 292}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1336, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 740, "inst": 0, "rop": 325}, "n": {"dim": 1336, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 740, "inst": 0, "rop": 325}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1429, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 828, "inst": 0, "rop": 271}, "n": {"dim": 1429, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 828, "inst": 0, "rop": 271}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1367, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 782, "inst": 1, "rop": 260}, "n": {"dim": 1367, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 782, "inst": 1, "rop": 260}}}, "key": "RLizard-1024-1.12-1024", "param": [{"category": [1], "n": 1024, "q": 1024, "secret_distribution": "((-1, 1), 128)", "claimed": 147, "ring": "x^n+1", "sd": 1.118033988749895}, {"category": [1], "n": 1024, "q": 1024, "secret_distribution": "((-1, 1), 128)", "claimed": 153, "ring": "x^n+1", "sd": 1.069416}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWR", "RLWE"], "name": "RLizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1732, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 257}, "n": {"dim": 1732, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 257}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1732, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 225}, "n": {"dim": 1732, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 225}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1732, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 844, "inst": 0, "rop": 264}, "n": {"dim": 1732, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 844, "inst": 0, "rop": 264}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1732, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 312}, "n": {"dim": 1732, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 312}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1732, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 844, "inst": 0, "rop": 241}, "n": {"dim": 1732, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 844, "inst": 0, "rop": 241}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1477, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 708, "inst": 0, "rop": 378}, "n": {"dim": 1477, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 708, "inst": 0, "rop": 378}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1155, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 507, "inst": 0, "rop": 570}, "n": {"dim": 1155, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 507, "inst": 0, "rop": 570}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1732, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 252}, "n": {"dim": 1732, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 252}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1732, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 234}, "n": {"dim": 1732, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 234}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 983, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 609}, "n": {"dim": 983, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 423, "inst": 0, "rop": 609}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1732, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 844, "inst": 0, "rop": 278}, "n": {"dim": 1732, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 844, "inst": 0, "rop": 278}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1664, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 817, "inst": 0, "rop": 346}, "n": {"dim": 1664, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 817, "inst": 0, "rop": 346}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1732, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 844, "inst": 0, "rop": 255}, "n": {"dim": 1732, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 844, "inst": 0, "rop": 255}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1732, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 247}, "n": {"dim": 1732, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 844, "inst": 0, "rop": 247}}}, "key": "RLizard-1024-1.12-2048", "param": [{"category": [3], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 264)", "claimed": 195, "ring": "x^n+1", "sd": 1.118033988749895}, {"category": [3], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 256)", "claimed": 195, "ring": "x^n+1", "sd": 1.458989}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWR", "RLWE"], "name": "RLizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1764, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 951, "inst": 0, "rop": 290}, "n": {"dim": 1764, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 951, "inst": 0, "rop": 290}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1779, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 973, "inst": 0, "rop": 260}, "n": {"dim": 1779, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 973, "inst": 0, "rop": 260}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1758, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 943, "inst": 0, "rop": 295}, "n": {"dim": 1758, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 943, "inst": 0, "rop": 295}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1754, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 920, "inst": 0, "rop": 342}, "n": {"dim": 1754, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 920, "inst": 0, "rop": 342}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1811, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 980, "inst": 0, "rop": 277}, "n": {"dim": 1811, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 980, "inst": 0, "rop": 277}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1709, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 875, "inst": 0, "rop": 412}, "n": {"dim": 1709, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 875, "inst": 0, "rop": 412}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1420, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 697, "inst": 1, "rop": 596}, "n": {"dim": 1420, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 697, "inst": 1, "rop": 596}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1762, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 950, "inst": 0, "rop": 286}, "n": {"dim": 1762, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 950, "inst": 0, "rop": 286}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1812, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 981, "inst": 0, "rop": 272}, "n": {"dim": 1812, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 981, "inst": 0, "rop": 272}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1127, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 499, "inst": 0, "rop": 579}, "n": {"dim": 1127, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 499, "inst": 0, "rop": 579}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1731, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 925, "inst": 0, "rop": 305}, "n": {"dim": 1731, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 925, "inst": 0, "rop": 305}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1676, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 866, "inst": 0, "rop": 369}, "n": {"dim": 1676, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 866, "inst": 0, "rop": 369}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1758, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 943, "inst": 0, "rop": 286}, "n": {"dim": 1758, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 943, "inst": 0, "rop": 286}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1776, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 959, "inst": 0, "rop": 282}, "n": {"dim": 1776, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 959, "inst": 0, "rop": 282}}}, "key": "RLizard-1024-1.12-2048", "param": [{"category": [3], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 264)", "claimed": 195, "ring": "x^n+1", "sd": 1.118033988749895}, {"category": [3], "n": 1024, "q": 2048, "secret_distribution": "((-1, 1), 256)", "claimed": 195, "ring": "x^n+1", "sd": 1.458989}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWR", "RLWE"], "name": "RLizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1700, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 828, "inst": 0, "rop": 421}, "n": {"dim": 1700, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 828, "inst": 0, "rop": 421}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1901, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 947, "inst": 0, "rop": 389}, "n": {"dim": 1901, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 947, "inst": 0, "rop": 389}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1700, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 828, "inst": 0, "rop": 428}, "n": {"dim": 1700, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 828, "inst": 0, "rop": 428}}, "0.368\u00a0\u03b2": {"2n": {"dim": 1391, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 656, "inst": 0, "rop": 468}, "n": {"dim": 1391, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 656, "inst": 0, "rop": 468}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 1901, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 947, "inst": 0, "rop": 405}, "n": {"dim": 1901, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 947, "inst": 0, "rop": 405}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1097, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 487, "inst": 0, "rop": 476}, "n": {"dim": 1097, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 487, "inst": 0, "rop": 476}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 815, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 330, "inst": 0, "rop": 593}, "n": {"dim": 815, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 330, "inst": 0, "rop": 593}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 1700, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 828, "inst": 0, "rop": 416}, "n": {"dim": 1700, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 828, "inst": 0, "rop": 416}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1901, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 947, "inst": 0, "rop": 398}, "n": {"dim": 1901, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 947, "inst": 0, "rop": 398}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 801, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 326, "inst": 0, "rop": 615}, "n": {"dim": 801, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 326, "inst": 0, "rop": 615}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1700, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 828, "inst": 0, "rop": 442}, "n": {"dim": 1700, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 828, "inst": 0, "rop": 442}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1191, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 542, "inst": 0, "rop": 466}, "n": {"dim": 1191, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 542, "inst": 0, "rop": 466}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1901, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 947, "inst": 0, "rop": 419}, "n": {"dim": 1901, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 947, "inst": 0, "rop": 419}}, "0.292\u00a0\u03b2": {"2n": {"dim": 1700, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 828, "inst": 0, "rop": 412}, "n": {"dim": 1700, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 828, "inst": 0, "rop": 412}}}, "key": "RLizard-2048-1.12-2048", "param": [{"category": [3], "n": 2048, "q": 2048, "secret_distribution": "((-1, 1), 164)", "claimed": 291, "ring": "x^n+1", "sd": 1.118033988749895}, {"category": [3], "n": 2048, "q": 2048, "secret_distribution": "((-1, 1), 184)", "claimed": 304, "ring": "x^n+1", "sd": 2.002534}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWR", "RLWE"], "name": "RLizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2080, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1148, "inst": 0, "rop": 453}, "n": {"dim": 2080, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1148, "inst": 0, "rop": 453}}, "0.265\u00a0\u03b2": {"2n": {"dim": 1966, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1101, "inst": 0, "rop": 401}, "n": {"dim": 1966, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1101, "inst": 0, "rop": 401}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2119, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1175, "inst": 0, "rop": 457}, "n": {"dim": 2119, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1175, "inst": 0, "rop": 457}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2247, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1252, "inst": 0, "rop": 517}, "n": {"dim": 2247, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1252, "inst": 0, "rop": 517}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2008, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1125, "inst": 0, "rop": 413}, "n": {"dim": 2008, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1125, "inst": 0, "rop": 413}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1526, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 771, "inst": 0, "rop": 512}, "n": {"dim": 1526, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 771, "inst": 0, "rop": 512}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 954, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 411, "inst": 0, "rop": 587}, "n": {"dim": 954, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 411, "inst": 0, "rop": 587}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2214, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1240, "inst": 0, "rop": 454}, "n": {"dim": 2214, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1240, "inst": 0, "rop": 454}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 1916, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1065, "inst": 0, "rop": 408}, "n": {"dim": 1916, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1065, "inst": 0, "rop": 408}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 861, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 357, "inst": 0, "rop": 605}, "n": {"dim": 861, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 357, "inst": 0, "rop": 605}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1792, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 962, "inst": 0, "rop": 450}, "n": {"dim": 1792, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 962, "inst": 0, "rop": 450}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1629, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 842, "inst": 0, "rop": 498}, "n": {"dim": 1629, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 842, "inst": 0, "rop": 498}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2222, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1245, "inst": 0, "rop": 450}, "n": {"dim": 2222, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1245, "inst": 0, "rop": 450}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2170, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1210, "inst": 0, "rop": 450}, "n": {"dim": 2170, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1210, "inst": 0, "rop": 450}}}, "key": "RLizard-2048-1.12-2048", "param": [{"category": [3], "n": 2048, "q": 2048, "secret_distribution": "((-1, 1), 164)", "claimed": 291, "ring": "x^n+1", "sd": 1.118033988749895}, {"category": [3], "n": 2048, "q": 2048, "secret_distribution": "((-1, 1), 184)", "claimed": 304, "ring": "x^n+1", "sd": 2.002534}]}, {"attack": "primal", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWR", "RLWE"], "name": "RLizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2666, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1310, "inst": 0, "rop": 476}, "n": {"dim": 2666, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1310, "inst": 0, "rop": 476}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2869, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1433, "inst": 0, "rop": 429}, "n": {"dim": 2869, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1433, "inst": 0, "rop": 429}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2666, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1310, "inst": 0, "rop": 482}, "n": {"dim": 2666, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1310, "inst": 0, "rop": 482}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2217, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1044, "inst": 0, "rop": 554}, "n": {"dim": 2217, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1044, "inst": 0, "rop": 554}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2869, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1433, "inst": 0, "rop": 445}, "n": {"dim": 2869, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1433, "inst": 0, "rop": 445}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 1556, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 679, "inst": 0, "rop": 623}, "n": {"dim": 1556, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 679, "inst": 0, "rop": 623}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 1153, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 461, "inst": 0, "rop": 802}, "n": {"dim": 1153, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 461, "inst": 0, "rop": 802}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2608, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1270, "inst": 0, "rop": 473}, "n": {"dim": 2608, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1270, "inst": 0, "rop": 473}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2869, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1433, "inst": 0, "rop": 439}, "n": {"dim": 2869, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1433, "inst": 0, "rop": 439}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1099, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 428, "inst": 0, "rop": 837}, "n": {"dim": 1099, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 428, "inst": 0, "rop": 837}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2666, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1310, "inst": 0, "rop": 496}, "n": {"dim": 2666, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1310, "inst": 0, "rop": 496}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 1724, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 765, "inst": 0, "rop": 594}, "n": {"dim": 1724, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 765, "inst": 0, "rop": 594}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2869, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1433, "inst": 0, "rop": 460}, "n": {"dim": 2869, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1433, "inst": 0, "rop": 460}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2666, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1310, "inst": 0, "rop": 466}, "n": {"dim": 2666, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1310, "inst": 0, "rop": 466}}}, "key": "RLizard-2048-1.12-4096", "param": [{"category": [5], "n": 2048, "q": 4096, "secret_distribution": "((-1, 1), 256)", "claimed": 348, "ring": "x^n+1", "sd": 1.118033988749895}, {"category": [5], "n": 2048, "q": 4096, "secret_distribution": "((-1, 1), 256)", "claimed": 318, "ring": "x^n+1", "sd": 2.635593}]}, {"attack": "dual", "scheme": {"primitive": ["PKE", "KEM"], "assumption": ["RLWR", "RLWE"], "name": "RLizard"}, "cost": {"0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2856, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1515, "inst": 0, "rop": 506}, "n": {"dim": 2856, "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1515, "inst": 0, "rop": 506}}, "0.265\u00a0\u03b2": {"2n": {"dim": 2598, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1571, "inst": 1, "rop": 485}, "n": {"dim": 2598, "name": "0.265\u00a0\u03b2", "drop": true, "beta": 1571, "inst": 1, "rop": 485}}, "292\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2807, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1484, "inst": 0, "rop": 509}, "n": {"dim": 2807, "name": "292\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1484, "inst": 0, "rop": 509}}, "0.368\u00a0\u03b2": {"2n": {"dim": 2490, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1281, "inst": 0, "rop": 552}, "n": {"dim": 2490, "name": "0.368\u00a0\u03b2", "drop": true, "beta": 1281, "inst": 0, "rop": 552}}, "0.265\u00a0\u03b2 +\u00a016.4": {"2n": {"dim": 2453, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1468, "inst": 1, "rop": 493}, "n": {"dim": 2453, "name": "0.265\u00a0\u03b2 +\u00a016.4", "drop": true, "beta": 1468, "inst": 1, "rop": 493}}, "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25": {"2n": {"dim": 2134, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1040, "inst": 0, "rop": 652}, "n": {"dim": 2134, "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "drop": true, "beta": 1040, "inst": 0, "rop": 652}}, "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1": {"2n": {"dim": 2169, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 1017, "inst": 0, "rop": 963}, "n": {"dim": 2169, "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "drop": true, "beta": 1017, "inst": 0, "rop": 963}}, "0.2975\u00a0\u03b2": {"2n": {"dim": 2810, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1486, "inst": 0, "rop": 505}, "n": {"dim": 2810, "name": "0.2975\u00a0\u03b2", "drop": true, "beta": 1486, "inst": 0, "rop": 505}}, "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2": {"2n": {"dim": 2830, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1533, "inst": 0, "rop": 453}, "n": {"dim": 2830, "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "drop": true, "beta": 1533, "inst": 0, "rop": 453}}, "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 1130, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 1, "rop": 864}, "n": {"dim": 1130, "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 515, "inst": 1, "rop": 864}}, "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2856, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1515, "inst": 0, "rop": 518}, "n": {"dim": 2856, "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1515, "inst": 0, "rop": 518}}, "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)": {"2n": {"dim": 2179, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1071, "inst": 0, "rop": 615}, "n": {"dim": 2179, "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "drop": true, "beta": 1071, "inst": 0, "rop": 615}}, "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)": {"2n": {"dim": 2970, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1589, "inst": 0, "rop": 497}, "n": {"dim": 2970, "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "drop": true, "beta": 1589, "inst": 0, "rop": 497}}, "0.292\u00a0\u03b2": {"2n": {"dim": 2906, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1547, "inst": 0, "rop": 501}, "n": {"dim": 2906, "name": "0.292\u00a0\u03b2", "drop": true, "beta": 1547, "inst": 0, "rop": 501}}}, "key": "RLizard-2048-1.12-4096", "param": [{"category": [5], "n": 2048, "q": 4096, "secret_distribution": "((-1, 1), 256)", "claimed": 348, "ring": "x^n+1", "sd": 1.118033988749895}, {"category": [5], "n": 2048, "q": 4096, "secret_distribution": "((-1, 1), 256)", "claimed": 318, "ring": "x^n+1", "sd": 2.635593}]}];
\ No newline at end of file
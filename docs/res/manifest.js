@@ -0,0 +1,2 @@
+var models = [{"group": "Quantum sieving", "name": "0.265\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.265*beta)"}, {"group": "Quantum sieving", "name": "0.265\u00a0\u03b2 +\u00a016.4", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.265*beta + 16.4)"}, {"group": "Quantum sieving", "name": "0.2975\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.2975*beta)"}, {"group": "Quantum sieving", "name": "0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.265*beta + log(beta,2))"}, {"group": "Quantum sieving", "name": "0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.265*beta + 16.4 + log(8*d,2))"}, {"group": "Classical sieving", "name": "0.292\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.292*beta)"}, {"group": "Classical sieving", "name": "292\u00a0\u03b2 +\u00a016.4", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.292*beta + 16.4)"}, {"group": "Classical sieving", "name": "0.368\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.368*beta)"}, {"group": "Classical sieving", "name": "0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.292*beta + log(beta,2))"}, {"group": "Classical sieving", "name": "0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.292*beta + 16.4 + log(8*d,2))"}, {"group": "Quantum enumeration", "name": "\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)", "lambda": " lambda beta, d, B: ZZ(2)**RR((0.18728*beta*log(beta, 2) - 1.0192*beta + 16.1)/2)"}, {"group": "Quantum enumeration", "name": "0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25", "lambda": " lambda beta, d, B: ZZ(2)**RR(-0.7550818937366788*beta + 0.12472525302110621*beta*log(beta,2) + 2.254440896969337)"}, {"group": "Classical enumeration", "name": "0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1", "lambda": " lambda beta, d, B: ZZ(2)**RR(0.18728*beta*log(beta, 2) - 1.0192*beta + 16.1)"}, {"group": "Classical enumeration", "name": "0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)", "lambda": " lambda beta, d, B: BKZ.svp_repeat(beta, d) * ZZ(2)**RR(0.000784314*beta**2 + 0.366078*beta - 6.125 + 7)"}];
+var manifest = {"schemes":[{"primitive":["KEM"],"assumption":["RLWE"],"name":"KCL\u2011RLWE"},{"primitive":["KEM"],"assumption":["ILWE"],"name":"BabyBear"},{"primitive":["KEM","PKE"],"assumption":["RLWE"],"name":"NewHope"},{"primitive":["KEM"],"assumption":["ILWE"],"name":"MamaBear"},{"primitive":["KEM"],"assumption":["ILWE"],"name":"PapaBear"},{"primitive":["KEM"],"assumption":["MLWE"],"name":"KCL\u2011MLWE"},{"primitive":["KE"],"assumption":["RLWE"],"name":"HILA5"},{"primitive":["KEM"],"assumption":["RLWE"],"name":"Ding Key Exchange"},{"primitive":["KEM","PKE"],"assumption":["LWE"],"name":"Frodo"},{"primitive":["KEM","PKE"],"assumption":["MLWE"],"name":"CRYSTALS\u2011Kyber"},{"primitive":["KEM","PKE"],"assumption":["LWE"],"name":"LOTUS"},{"primitive":["PKE","KEM","KE"],"assumption":["PLWE"],"name":"LAC"},{"primitive":["KEM","PKE"],"assumption":["RLWE"],"name":"LIMA-2p"},{"primitive":["PKE","KEM"],"assumption":["RLWE"],"name":"R EMBLEM"},{"primitive":["KEM","PKE"],"assumption":["RLWE"],"name":"LIMA\u2011sp"},{"primitive":["PKE","KEM"],"assumption":["MLWR"],"name":"LightSaber"},{"primitive":["PKE","KEM"],"assumption":["LWE"],"name":"EMBLEM"},{"primitive":["PKE","KEM"],"assumption":["MLWR"],"name":"Saber"},{"primitive":["PKE","KEM"],"assumption":["MLWR"],"name":"FireSaber"},{"primitive":["KEM"],"assumption":["RLWR"],"name":"NTRU LPrime"},{"primitive":["SIG"],"assumption":["MLWE"],"name":"CRYSTALS\u2011Dilithium"},{"primitive":["SIG"],"assumption":["RLWE"],"name":"qTESLA"},{"primitive":["PKE"],"assumption":["PLWE"],"name":"Titanium.PKE"},{"primitive":["SIG"],"assumption":["NTRU"],"name":"Falcon"},{"primitive":["KEM"],"assumption":["NTRU"],"name":"NTRU HRSS"},{"primitive":["PKE"],"assumption":["RLWR"],"name":"uRound2.PKE"},{"primitive":["KEM","PKE"],"assumption":["NTRU"],"name":"NTRUEncrypt"},{"primitive":["KEM"],"assumption":["NTRU"],"name":"SNTRU Prime"},{"primitive":["KEM"],"assumption":["LWR"],"name":"uRound2.KEM"},{"primitive":["KEM"],"assumption":["PLWE"],"name":"Titanium.KEM"},{"primitive":["SIG"],"assumption":["NTRU"],"name":"pqNTRUsign"},{"primitive":["PKE"],"assumption":["RLWR"],"name":"nRound2.PKE"},{"primitive":["KEM"],"assumption":["RLWR"],"name":"nRound2.KEM"},{"primitive":["PKE","KEM"],"assumption":["MLWE"],"name":"KINDI"},{"primitive":["PKE","KEM"],"assumption":["LWR","LWE"],"name":"Lizard"},{"primitive":["PKE","KEM"],"assumption":["RLWR","RLWE"],"name":"RLizard"}],"shards":{"lwe-n":{"rows":190,"hash":"1bb317c7481d","file":"table-lwe-n.js"},"ntru":{"rows":9,"hash":"5376916e915d","file":"table-ntru.js"},"lwe-2n":{"rows":190,"hash":"5f9cc0181125","file":"table-lwe-2n.js"}},"snippets":{"dual-drop":"duald = partial(drop_and_solve, dual_scale, postprocess=True)\nduald(n, alpha, q, secret_distribution=secret_distribution, m=m, success_probability=success_probability, reduction_cost_model=reduction_cost_model)","primal-drop":"primald = partial(drop_and_solve, primal_usvp, postprocess=False, decision=False)\nprimald(n, alpha, q, secret_distribution=secret_distribution, m=m,  success_probability=success_probability, reduction_cost_model=reduction_cost_model{rotations})","primal":"primal_usvp(n, alpha, q, secret_distribution=secret_distribution, m=m, success_probability=success_probability, reduction_cost_model=reduction_cost_model)","setup":"load('https://bitbucket.org/malb/lwe-estimator/raw/HEAD/estimator.py')\nn = {n}\nsd = {sd}\nq = {q}\nalpha = sqrt(2*pi)*sd/RR(q)\nm = {m}\nsecret_distribution = {secret_distribution}\nsuccess_probability = 0.99\nreduction_cost_model = {lambda}\n","header":"# To reproduce the estimate run this snippet on http://aleph.sagemath.org/\n# Ring ops: {rop}\n# Block size: {beta}\n# Dimension: {dim}\n","dual":"dual_scale(n, alpha, q, secret_distribution=secret_distribution, m=m, success_probability=success_probability, reduction_cost_model=reduction_cost_model)","multiple":"# NOTE: This scheme relies on different hard problem instances for key recovery and message recovery.\n# The code below gives the cost of the cheaper of the two attacks under the chosen cost model.\n"}};
\ No newline at end of file
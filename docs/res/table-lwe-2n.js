@@ -0,0 +1 @@
+loadShard("lwe-2n", {"rows":{"primitive":[[1],[1],[1],[1],[1],[1],[1,11],[1,11],[1,11],[1,11],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[25],[25],[1],[1],[1],[1],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[11,1,25],[11,1,25],[11,1,25],[11,1,25],[11,1,25],[11,1,25],[1,11],[1,11],[1,11],[1,11],[11,1],[11,1],[11,1],[11,1],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[1],[1],[72],[72],[72],[72],[72],[72],[72],[72],[72],[72],[72],[72],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[11],[11],[11],[11],[11],[11],[11],[11],[1],[1],[1],[1],[1],[1],[1],[1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1]],"param":[[0],[0],[1],[1],[2],[2],[3],[3],[4],[4],[5],[5],[6],[6],[7],[7],[8],[8],[9],[9],[10],[10],[0],[0],[11],[11],[12],[12],[13],[13],[14],[14],[15],[15],[16],[16],[17],[17],[18],[18],[19],[19],[20],[20],[21],[21],[22],[22],[23],[23],[24],[24],[25],[25],[26],[26],[27],[27],[28],[28],[29],[29],[30],[30],[31],[31],[32],[32],[33],[33],[34],[34],[35],[35],[36],[36],[37],[37],[38],[38],[39],[39],[40],[40],[41],[41],[42],[42],[43],[43],[44],[44],[45],[45],[46],[46],[47],[47],[48],[48],[49],[49],[50],[50],[51],[51],[52],[52],[53],[53],[54],[54],[55],[55],[56],[56],[57],[57],[58],[58],[59],[59],[47],[47],[60],[60],[61],[61],[62],[62],[63],[63],[64],[64],[65],[65],[66],[66],[67],[67],[68],[68],[69],[69],[70],[70],[71],[71],[72],[72],[73],[73],[74],[74],[75],[75],[76],[76],[77],[77],[78],[78],[79],[79],[80],[80],[81],[81],[82],[82],[83,84],[83,84],[85,86],[85,86],[87,88],[87,88],[87,89],[87,89],[90,91],[90,91],[92,93],[92,93],[94,95],[94,95],[96,97],[96,97],[98,99],[98,99],[100,101],[100,101]],"attack":[3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5],"assumption":[[2],[2],[7],[7],[7],[7],[2],[2],[2],[2],[7],[7],[7],[7],[7],[7],[7],[7],[21],[21],[21],[21],[2],[2],[2],[2],[2],[2],[31],[31],[31],[31],[21],[21],[21],[21],[21],[21],[31],[31],[31],[31],[31],[31],[43],[43],[43],[43],[43],[43],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[59],[59],[31],[31],[31],[31],[59],[59],[59],[59],[69],[69],[21],[21],[21],[21],[21],[21],[2],[2],[2],[2],[2],[2],[43],[43],[43],[43],[43],[43],[43],[43],[69],[69],[69],[69],[69],[69],[69],[69],[91],[91],[91],[91],[91],[91],[91],[91],[91],[91],[43],[43],[43],[43],[43],[43],[43],[43],[91],[91],[91],[91],[91],[91],[91],[91],[91],[91],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[21],[21],[21],[21],[21],[21],[21],[21],[21],[21],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[69,2],[69,2],[69,2],[69,2],[69,2],[69,2],[69,2],[69,2]],"key":[4,4,8,8,9,9,12,12,13,13,15,15,16,16,18,18,19,19,22,22,23,23,26,26,28,28,29,29,32,32,33,33,35,35,36,36,37,37,39,39,40,40,41,41,44,44,45,45,46,46,48,48,49,49,51,51,52,52,54,54,55,55,56,56,57,57,60,60,62,62,63,63,65,65,67,67,70,70,73,73,74,74,75,75,77,77,78,78,79,79,81,81,82,82,83,83,84,84,86,86,87,87,88,88,89,89,92,92,93,93,94,94,95,95,95,95,97,97,98,98,99,99,100,100,101,101,102,102,103,103,104,104,104,104,105,105,106,106,107,107,108,108,109,109,111,111,112,112,113,113,114,114,116,116,117,117,118,118,119,119,121,121,122,122,123,123,124,124,125,125,127,127,128,128,127,127,127,127,129,129,130,130,132,132,133,133,134,134,135,135],"scheme":[0,0,6,6,6,6,10,10,10,10,14,14,14,14,17,17,17,17,20,20,20,20,24,24,27,27,27,27,30,30,30,30,34,34,34,34,34,34,38,38,38,38,38,38,42,42,42,42,42,42,47,47,47,47,50,50,50,50,53,53,53,53,53,53,53,53,58,58,61,61,61,61,64,64,66,66,68,68,71,71,71,71,71,71,76,76,76,76,76,76,80,80,80,80,80,80,80,80,85,85,85,85,85,85,85,85,90,90,90,90,90,90,90,90,90,90,96,96,96,96,96,96,96,96,85,85,85,85,85,85,85,85,85,85,90,90,90,90,90,90,90,90,90,90,110,110,110,110,110,110,110,110,115,115,115,115,115,115,115,115,120,120,120,120,120,120,120,120,120,120,126,126,126,126,126,126,126,126,126,126,126,126,131,131,131,131,131,131,131,131]},"errors":{},"models":[136,137,138,139,140,141,142,143,144,145,146,147,148,149],"cost":{"rop":[257,273,288,267,287,283,300,357,293,314,414,469,828,1105,306,322,344,316,337,337,348,409,347,356,482,523,838,1040,153,170,172,163,183,169,185,213,178,199,210,227,420,487,192,207,210,202,217,208,223,253,216,231,297,297,442,553,143,159,160,152,172,157,173,198,166,187,190,204,380,436,180,192,197,186,205,193,206,232,203,218,257,289,409,473,103,119,115,111,132,113,130,143,122,143,122,125,244,273,128,142,140,135,153,138,151,168,146,163,161,169,263,289,235,252,264,245,266,259,276,327,269,290,369,416,738,955,283,295,309,293,304,304,320,374,314,334,429,477,753,936,239,256,269,249,269,264,280,332,273,294,378,425,755,982,294,310,327,304,321,321,331,387,331,341,436,483,774,994,220,237,247,230,251,243,259,306,253,273,339,380,678,859,273,282,298,275,295,292,309,352,302,317,404,432,691,823,324,340,363,334,354,356,373,449,367,387,558,641,1115,1627,390,406,437,400,420,429,446,525,440,456,639,710,1134,1579,293,309,329,303,323,323,339,407,333,353,491,561,981,1375,350,366,388,360,380,381,398,462,392,412,567,632,994,1291,149,166,167,158,179,164,181,207,173,194,202,218,404,467,180,196,197,187,205,194,210,238,203,220,244,259,425,482,185,201,207,194,215,203,220,256,213,233,269,296,537,648,224,237,248,231,251,243,258,295,253,267,316,345,561,637,257,273,288,267,287,283,300,357,293,314,414,469,828,1105,306,322,344,316,337,337,348,409,347,356,482,523,838,1040,90,106,101,98,119,99,115,125,107,128,102,101,203,227,111,125,122,118,136,120,134,145,127,145,138,138,224,241,190,207,214,200,221,210,226,264,219,240,280,309,559,680,222,236,246,230,250,245,255,296,248,269,322,348,575,670,128,144,144,137,158,141,157,178,150,171,165,174,329,372,155,170,172,163,180,170,182,204,175,193,199,214,347,383,188,204,211,197,218,207,223,261,216,237,275,304,549,666,223,233,242,229,247,241,253,290,246,267,318,351,565,671,103,119,115,111,132,113,130,143,122,143,122,125,244,273,130,143,141,136,154,139,152,167,147,163,169,169,265,289,163,180,183,172,193,180,196,226,189,210,228,248,456,535,196,212,220,206,222,216,227,258,221,241,268,299,472,537,221,237,248,230,251,243,260,306,253,273,340,381,679,861,264,280,288,274,287,286,298,345,292,312,391,430,685,836,141,158,159,151,171,156,172,196,165,186,189,202,377,431,176,188,191,182,199,189,203,230,196,213,234,274,398,441,179,196,201,189,209,197,214,249,207,227,258,284,516,618,221,232,242,225,245,237,252,287,247,261,303,337,536,625,218,234,244,227,248,240,256,302,249,270,333,373,666,841,266,274,288,272,288,283,300,343,293,313,390,425,674,811,136,152,152,145,165,149,166,188,158,179,178,190,356,405,178,190,195,183,199,191,203,231,197,213,272,288,423,487,262,278,294,271,292,288,305,363,298,318,424,481,847,1137,327,343,354,337,348,349,364,422,358,378,506,554,852,1297,293,310,329,303,323,323,340,407,333,353,492,562,983,1377,364,380,408,374,394,401,414,484,411,416,565,682,970,1482,196,213,220,206,227,216,233,272,226,247,291,323,582,714,228,244,252,238,258,249,263,302,257,278,329,365,602,705,429,446,482,440,461,473,489,596,484,504,799,932,1598,2662,495,511,547,506,526,537,554,666,548,569,855,998,1585,2496,102,118,114,111,131,112,129,141,121,142,121,123,242,270,127,139,137,134,149,136,149,163,143,159,151,155,247,265,92,108,103,100,121,101,118,127,110,131,105,105,210,234,113,126,124,120,137,122,134,146,129,145,131,134,221,240,124,140,139,133,154,136,153,172,145,167,157,166,314,355,141,157,157,151,169,154,170,190,163,181,181,193,331,366,152,169,171,162,183,168,184,211,177,199,208,225,416,483,171,187,192,180,199,188,201,232,198,215,232,255,431,492,232,249,261,242,264,256,272,322,266,287,363,409,726,937,260,272,287,265,287,281,298,349,291,313,399,448,745,939,291,308,327,301,323,321,337,404,331,352,487,556,973,1362,322,337,360,331,352,360,366,440,361,381,529,607,970,1308,113,130,127,122,143,125,141,157,134,154,140,145,279,313,142,155,155,150,166,153,166,186,162,178,176,186,299,328,90,106,101,98,120,99,115,125,107,129,102,101,203,227,103,117,114,111,129,112,125,135,119,137,119,121,208,227,69,86,78,77,99,76,93,96,84,106,71,66,141,162,84,97,92,90,107,90,104,108,97,115,90,89,151,168,184,201,207,194,214,203,219,256,212,233,268,295,535,645,224,237,247,230,250,243,258,294,252,266,314,345,559,635,257,273,288,267,287,283,300,357,293,314,414,469,828,1105,307,324,337,318,338,339,346,410,345,357,479,521,834,1038,141,158,159,151,171,156,172,196,165,186,189,202,365,398,166,180,182,175,192,179,193,216,187,203,219,232,365,404,91,108,103,100,121,101,117,127,109,131,104,104,208,233,108,121,118,114,133,116,130,141,123,142,124,127,220,241,129,146,145,138,160,142,159,179,151,173,167,177,334,379,148,162,164,156,175,161,175,196,168,188,189,200,342,383,159,175,178,168,190,175,192,221,184,206,220,239,440,515,178,194,197,187,206,195,210,239,203,222,243,265,448,506,154,170,173,163,184,170,186,214,179,200,211,228,422,490,179,191,196,184,205,192,208,238,201,218,243,257,436,501,344,361,387,355,376,380,396,478,390,411,604,697,1208,1813,381,397,427,391,412,420,436,532,430,451,670,744,1241,1700,322,339,362,333,354,355,372,448,366,387,555,638,1110,1619,368,376,396,376,385,389,406,490,400,421,611,690,1136,1538,173,190,194,183,204,191,207,240,200,221,247,271,494,587,202,219,223,212,229,219,235,271,228,249,282,312,518,594,201,218,226,211,232,222,238,279,231,252,301,334,601,742,231,247,255,241,260,250,267,311,260,281,340,372,606,738,231,248,260,241,262,255,271,321,265,286,361,406,722,930,264,280,289,274,295,284,300,356,294,315,406,451,747,930,314,330,352,324,345,346,362,436,356,377,537,616,1073,1547,349,365,391,359,380,384,401,485,395,416,595,652,1096,1474,81,98,91,90,110,89,106,109,98,118,84,78,126,145,96,107,102,102,117,101,113,116,107,122,100,101,136,143,103,119,115,111,132,113,130,142,122,142,120,118,187,206,120,133,131,127,144,130,141,150,135,151,135,135,200,201,113,130,127,122,143,125,141,157,134,154,136,135,210,229,132,145,144,138,155,142,154,165,148,164,152,154,211,222,144,160,161,153,173,158,175,199,167,188,188,194,294,313,166,179,182,174,190,180,194,212,186,202,204,209,293,306,76,93,86,84,105,84,100,105,92,113,80,75,126,145,88,100,95,94,110,94,106,109,100,116,93,90,127,144,95,111,106,103,124,104,121,131,113,134,109,110,188,207,111,124,120,118,134,119,132,141,126,142,127,126,192,203,105,121,118,114,134,116,132,145,124,145,126,128,213,232,122,136,133,129,146,131,145,158,138,157,142,143,213,224,138,154,155,147,168,152,168,191,161,182,181,188,294,314,157,171,172,165,183,170,183,203,180,194,195,205,296,306,138,154,155,147,168,152,168,191,161,182,181,188,294,314,157,171,172,165,183,170,183,203,180,194,195,205,296,306,168,184,188,177,198,185,201,233,194,215,237,258,473,559,194,210,217,203,224,214,228,260,223,239,274,293,493,565,194,211,218,204,225,214,230,270,223,245,287,318,574,702,222,238,245,231,253,244,260,299,254,268,323,360,598,704,230,247,258,240,261,254,270,320,263,285,359,404,718,923,262,278,289,272,293,289,297,353,291,312,405,447,741,921,314,330,352,324,345,346,362,436,356,377,537,616,1073,1547,349,365,391,359,380,384,401,485,395,416,595,652,1096,1474,77,93,86,85,106,84,101,105,93,113,80,75,126,146,89,100,95,95,110,95,106,112,100,117,92,91,129,144,95,112,107,104,125,105,121,132,114,134,110,110,184,203,111,124,121,118,134,119,132,141,125,142,124,127,185,198,107,123,120,115,136,118,134,148,126,147,128,128,205,224,122,136,134,129,146,133,145,155,138,155,141,142,202,223,137,154,154,146,167,151,168,190,160,181,180,189,298,320,156,170,171,163,180,169,181,200,175,193,194,200,300,330,137,154,154,146,167,151,168,190,160,181,180,189,298,320,156,170,171,163,180,169,181,200,175,193,194,200,300,330,82,98,92,90,111,90,107,111,98,119,86,80,131,150,98,108,104,103,118,105,117,118,109,124,102,100,142,148,107,123,120,115,136,117,134,143,126,146,119,114,173,192,122,135,132,129,146,133,144,151,139,155,134,135,177,194,113,130,127,122,142,125,141,156,133,154,134,132,204,223,134,145,144,141,155,142,154,165,149,164,153,154,206,225,152,168,170,161,181,167,183,205,176,197,187,188,271,290,175,186,187,181,195,191,201,216,191,207,224,210,326,286,147,163,165,156,177,162,178,202,171,191,187,189,278,297,170,183,185,178,193,182,196,213,190,205,204,208,279,352,79,96,89,88,108,88,104,110,96,117,85,80,134,153,94,107,102,100,116,100,113,117,107,122,102,99,141,154,105,122,118,114,134,116,132,144,124,145,120,117,181,199,121,134,130,129,144,129,143,150,136,151,136,137,183,196,111,128,125,120,141,123,139,154,131,152,134,134,211,230,130,143,141,137,153,140,152,164,147,162,150,155,227,224,143,160,161,152,173,158,174,199,167,187,187,193,292,313,167,180,181,173,191,179,193,213,186,202,203,210,334,319,79,95,88,87,107,87,103,109,95,115,84,79,133,152,96,107,103,101,116,102,113,117,107,122,102,100,140,160,101,117,113,109,130,111,127,139,119,140,117,116,187,206,121,133,131,128,143,129,143,153,135,151,139,142,196,203,116,132,129,124,145,127,144,156,136,156,133,130,196,215,135,145,145,141,157,143,157,164,150,164,151,153,200,212,144,160,161,153,173,158,175,199,167,188,186,190,286,306,169,185,183,177,192,185,194,214,189,205,207,211,315,338,170,186,191,179,200,187,203,236,196,217,241,263,481,569,202,217,221,211,227,218,233,265,226,246,278,320,480,565,221,237,248,230,251,243,260,306,253,273,340,381,679,861,257,274,284,267,284,283,293,339,288,305,378,413,687,875,238,255,267,248,269,262,279,331,272,293,375,423,750,975,279,292,307,286,306,302,317,369,313,327,417,464,738,907,264,281,297,274,295,291,307,367,301,322,429,487,858,1156,309,320,340,314,329,333,347,404,344,360,472,519,839,1068,352,369,396,363,383,388,405,489,399,419,622,718,1243,1882,408,422,449,416,433,447,455,540,449,469,673,761,1192,1780,126,143,142,135,155,139,155,175,148,168,162,170,322,362,157,170,172,163,180,169,182,202,175,190,195,208,318,347,158,175,178,167,188,174,191,219,183,204,219,237,372,391,191,207,210,201,216,209,222,251,215,231,289,289,371,386,187,203,210,197,217,206,222,260,216,236,273,302,480,505,226,236,245,231,250,242,255,292,249,269,312,334,491,520,220,236,246,229,250,242,258,304,251,272,318,336,480,505,252,263,277,259,278,270,285,320,281,295,338,355,491,520,264,281,297,274,295,291,308,367,301,322,430,488,664,689,314,331,344,324,339,340,352,409,347,365,474,517,653,670,319,336,358,330,350,352,368,443,362,382,533,552,695,720,377,389,415,388,400,407,420,493,417,430,581,602,706,703,223,240,245,233,253,242,258,286,251,272,272,276,370,390,247,263,267,260,271,260,285,318,273,292,325,305,371,384,225,241,252,234,255,247,264,312,257,278,346,378,570,609,260,277,286,272,286,282,295,342,290,305,369,412,596,579,389,405,416,398,419,412,428,468,421,442,466,476,593,615,401,413,454,408,450,450,457,517,453,450,498,512,587,605,429,445,473,439,460,466,482,554,476,496,594,623,802,837,485,493,505,453,497,501,509,552,506,518,615,652,963,864],"dim":[2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2294,2294,2294,2294,2294,2294,2263,2260,2294,2263,2244,2204,2143,2117,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1290,1277,1277,1290,1277,1277,1277,1264,1277,1266,1238,1238,1204,1179,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1258,1246,1246,1246,1235,1246,1235,1225,1246,1235,1212,1200,1168,1155,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1040,1175,1167,1163,1167,1159,1163,1155,1144,1163,1147,1148,1143,1109,1104,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2227,2199,2204,2227,2199,2204,2204,2185,2204,2204,2169,2157,2089,2067,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1852,1852,1847,1852,1828,1847,1823,1815,1823,1823,1787,1775,1727,1682,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1782,1782,1782,1782,1782,1782,1782,1751,1782,1761,1748,1721,1671,1645,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2385,2385,2385,2385,2385,2385,2385,2358,2385,2347,2313,2287,2232,2155,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2288,2288,2278,2288,2288,2278,2278,2245,2278,2278,2232,2210,2126,2091,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1585,1585,1573,1579,1571,1573,1573,1559,1573,1559,1558,1541,1501,1492,1566,1566,1566,1566,1566,1566,1566,1566,1566,1566,1566,1566,1566,1566,1712,1712,1712,1712,1712,1712,1694,1688,1712,1694,1676,1659,1621,1594,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2101,2294,2294,2294,2294,2294,2294,2263,2260,2294,2263,2244,2204,2143,2117,1143,1143,1143,1143,1143,1143,1143,1143,1143,1143,1143,1143,1143,1143,1244,1228,1236,1236,1220,1236,1228,1220,1228,1220,1218,1218,1186,1175,2133,2133,2133,2133,2133,2133,2133,2133,2133,2133,2133,2133,2133,2133,2257,2257,2243,2257,2257,2267,2243,2220,2243,2243,2225,2206,2156,2130,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1375,1474,1474,1462,1474,1462,1474,1462,1445,1462,1451,1451,1440,1399,1389,1968,1968,1968,1968,1968,1968,1968,1968,1968,1968,1968,1968,1968,1968,2155,2132,2126,2132,2132,2126,2126,2104,2126,2126,2106,2081,2038,2011,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1150,1133,1137,1141,1133,1137,1129,1119,1137,1121,1117,1117,1083,1076,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1637,1637,1637,1637,1621,1637,1621,1606,1621,1621,1599,1587,1545,1532,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,2114,2114,2088,2114,2088,2088,2088,2066,2088,2088,2057,2034,1981,1963,1226,1226,1226,1226,1226,1226,1226,1226,1226,1226,1226,1226,1226,1226,1367,1355,1350,1355,1343,1350,1350,1338,1350,1338,1326,1310,1282,1270,1471,1471,1471,1471,1471,1471,1471,1471,1471,1471,1471,1471,1471,1471,1629,1629,1629,1629,1629,1629,1612,1605,1629,1612,1592,1592,1538,1525,1768,1768,1768,1768,1768,1768,1768,1768,1768,1768,1768,1768,1768,1768,1918,1895,1893,1895,1895,1893,1893,1863,1893,1893,1859,1842,1784,1760,889,889,889,889,889,889,889,889,889,889,889,889,889,889,1013,1004,1004,1004,995,1004,995,978,995,987,957,954,923,911,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1803,1803,1778,1803,1778,1778,1778,1753,1778,1778,1721,1708,1658,1600,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1878,1878,1878,1878,1878,1878,1850,1848,1878,1850,1803,1771,1721,1666,2152,2152,2152,2152,2152,2152,2152,2152,2152,2152,2152,2152,2152,2152,2296,2296,2282,2296,2296,2282,2282,2258,2282,2282,2247,2234,2193,2165,4116,4116,4116,4116,4116,4116,4116,4116,4116,4116,4116,4116,4116,4116,4439,4439,4413,4439,4439,4413,4413,4329,4413,4413,4286,4283,4187,4139,954,954,954,954,954,954,954,954,954,954,954,954,954,954,1034,1026,1026,1034,1019,1026,1019,1013,1026,1013,1020,1013,948,946,947,947,947,947,947,947,947,947,947,947,947,947,947,947,1041,1034,1031,1040,1028,1038,1025,1016,1031,1018,1028,1028,986,979,2080,2080,2080,2080,2080,2080,2080,2080,2080,2080,2080,2080,2080,2080,2261,2244,2251,2261,2244,2251,2251,2234,2251,2234,2237,2237,2184,2171,2713,2713,2713,2713,2713,2713,2713,2713,2713,2713,2713,2713,2713,2713,2854,2854,2854,2854,2829,2854,2829,2829,2854,2829,2819,2824,2765,2749,3734,3734,3734,3734,3734,3734,3734,3734,3734,3734,3734,3734,3734,3734,3908,3908,3908,3908,3908,3908,3908,3882,3908,3908,3875,3834,3797,3772,4190,4190,4190,4190,4190,4190,4190,4190,4190,4190,4190,4190,4190,4190,4405,4405,4386,4405,4405,4386,4386,4386,4386,4386,4353,4353,4242,4208,1087,1087,1087,1087,1087,1087,1087,1087,1087,1087,1087,1087,1087,1087,1191,1182,1179,1182,1173,1182,1173,1160,1182,1164,1169,1160,1120,1112,1462,1462,1462,1462,1462,1462,1462,1462,1462,1462,1462,1462,1495,1495,1558,1543,1549,1553,1534,1549,1534,1527,1543,1525,1542,1546,1494,1484,1229,1229,1229,1229,1229,1229,1229,1229,1229,1229,1229,1229,1229,1229,1330,1309,1316,1309,1289,1309,1303,1290,1309,1296,1317,1317,1255,1250,1583,1583,1583,1583,1583,1583,1583,1583,1583,1583,1583,1583,1583,1583,1716,1716,1716,1716,1716,1716,1698,1692,1716,1698,1680,1663,1625,1598,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2248,2248,2227,2248,2248,2248,2218,2214,2218,2218,2191,2158,2096,2070,1352,1352,1352,1352,1352,1352,1352,1352,1352,1352,1352,1352,1220,1127,1415,1416,1408,1434,1422,1404,1401,1339,1395,1383,1406,1403,1321,1313,1641,1641,1641,1641,1641,1641,1641,1641,1641,1641,1641,1641,1641,1641,1761,1723,1747,1750,1713,1747,1736,1710,1727,1709,1740,1726,1679,1667,2144,2144,2144,2144,2144,2144,2144,2144,2144,2144,2144,2144,2144,2144,2270,2245,2252,2245,2252,2252,2252,2218,2237,2235,2228,2215,2174,2166,2578,2578,2578,2578,2578,2578,2578,2578,2578,2578,2578,2578,2578,2578,2701,2699,2695,2699,2695,2697,2695,2671,2695,2675,2662,2662,2604,2581,2270,2270,2270,2270,2270,2270,2270,2270,2270,2270,2270,2270,2270,2270,2435,2413,2413,2413,2413,2413,2413,2400,2413,2392,2396,2375,2328,2317,4413,4413,4413,4413,4413,4413,4413,4413,4413,4413,4413,4413,4413,4413,4652,4652,4652,4652,4652,4652,4652,4663,4652,4652,4618,4562,4512,4410,4423,4423,4423,4423,4423,4423,4423,4423,4423,4423,4423,4423,4423,4423,4697,4625,4625,4625,4625,4625,4625,4625,4625,4625,4596,4524,4496,4414,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2154,2154,2140,2154,2133,2140,2140,2127,2140,2140,2113,2113,2063,2031,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2668,2668,2651,2668,2639,2651,2651,2637,2651,2651,2622,2606,2540,2529,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,3180,3180,3153,3180,3180,3153,3153,3146,3153,3153,3099,3114,3057,3027,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,4159,4159,4159,4159,4159,4159,4159,4162,4159,4159,4120,4060,4021,3936,698,698,674,698,698,674,674,593,674,674,593,545,393,393,632,604,589,671,657,610,578,595,589,633,614,649,499,412,928,928,909,928,901,909,909,871,909,904,864,744,565,565,904,901,887,892,883,916,884,825,887,863,814,811,747,618,987,987,999,987,987,999,999,947,999,987,880,803,607,607,962,978,950,957,957,978,971,882,949,939,859,886,684,615,1170,1170,1185,1185,1170,1185,1185,1156,1185,1185,1053,951,738,707,1179,1182,1150,1215,1171,1176,1159,1151,1167,1157,1050,1015,840,801,877,877,877,877,877,877,877,837,877,877,837,752,567,567,834,814,795,845,780,832,783,787,814,805,821,801,618,656,1021,1021,1021,1021,1021,1021,1021,1021,1021,1021,1021,1021,742,742,1048,1034,1021,1041,1020,1036,1020,961,1026,992,1025,942,870,826,1102,1102,1102,1102,1102,1102,1102,1102,1102,1102,1102,1075,736,736,1125,1110,1085,1117,1103,1109,1103,1095,1110,1063,1079,1052,887,833,1337,1337,1337,1337,1337,1337,1337,1368,1337,1337,1306,1177,856,850,1375,1361,1361,1370,1355,1361,1355,1320,1374,1350,1306,1302,1092,953,1337,1337,1337,1337,1337,1337,1337,1368,1337,1337,1306,1177,856,850,1375,1361,1361,1370,1355,1361,1355,1320,1374,1350,1306,1302,1092,953,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,2152,2152,2137,2152,2152,2152,2131,2125,2152,2131,2125,2107,2062,2045,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2665,2665,2649,2665,2665,2665,2637,2635,2665,2637,2621,2621,2566,2537,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,3179,3179,3146,3179,3179,3146,3146,3146,3146,3146,3135,3114,3057,3027,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,4159,4159,4159,4159,4159,4159,4159,4162,4159,4159,4120,4060,4021,3936,859,859,845,859,859,859,859,803,845,859,803,766,578,578,859,816,796,843,793,843,790,827,816,797,798,823,641,655,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1019,919,708,708,1031,1005,1033,1040,998,1009,1012,994,1003,994,979,1002,820,799,1095,1095,1102,1095,1095,1102,1102,1107,1102,1102,1090,1004,705,705,1108,1105,1121,1112,1081,1123,1081,1045,1098,1081,1053,1019,757,863,1438,1438,1438,1438,1438,1438,1438,1468,1438,1438,1404,1330,949,941,1500,1506,1469,1479,1466,1497,1445,1395,1459,1448,1404,1352,1222,1210,1438,1438,1438,1438,1438,1438,1438,1468,1438,1438,1404,1330,949,941,1500,1506,1469,1479,1466,1497,1445,1395,1459,1448,1404,1352,1222,1210,686,686,686,686,686,686,686,622,686,686,622,548,427,427,696,648,652,670,656,689,682,595,664,633,585,593,536,415,850,850,850,850,850,850,850,690,850,850,690,642,464,464,800,790,712,789,828,837,802,734,831,820,712,710,505,572,908,908,884,908,880,884,884,827,884,884,740,702,525,525,887,874,876,876,868,834,870,786,833,810,830,780,589,632,1142,1142,1098,1142,1142,1098,1098,960,1098,1098,844,748,597,597,1134,1095,965,1095,1074,1157,1119,1012,1026,1051,1106,921,938,598,1105,1105,1110,1105,1105,1110,1110,1013,1110,1110,893,826,611,592,1089,1081,1060,1057,1040,1068,1073,982,1032,1017,895,887,692,932,755,755,750,750,755,750,750,743,750,750,700,679,475,475,732,743,724,730,732,708,718,690,743,706,742,686,589,582,921,921,918,921,921,918,918,825,918,918,825,704,582,550,883,901,852,932,895,882,908,808,878,835,847,844,549,567,958,958,958,958,958,958,958,974,958,958,924,821,604,604,963,973,968,971,963,968,937,926,965,924,879,929,808,641,1192,1192,1192,1192,1192,1192,1192,1164,1192,1192,1032,978,734,734,1212,1207,1175,1175,1210,1205,1192,1168,1165,1167,1070,1048,1071,902,666,666,666,666,666,666,666,657,666,666,626,615,451,451,662,636,676,637,646,655,645,622,636,628,653,612,465,558,819,819,819,819,819,819,819,801,819,819,762,745,528,528,818,804,827,824,818,805,835,810,795,785,814,814,642,569,898,898,901,898,898,901,901,782,901,901,694,649,502,502,895,839,860,890,875,863,878,746,881,796,804,776,535,503,1074,1074,1085,1085,1074,1085,1085,1058,1085,1085,929,852,641,610,1088,1135,1046,1112,1092,1135,1074,1048,1103,1078,1010,918,903,897,1595,1595,1595,1595,1595,1595,1595,1595,1595,1595,1595,1595,1595,1595,1719,1716,1702,1719,1702,1705,1702,1686,1702,1712,1680,1682,1604,1594,1969,1969,1969,1969,1969,1969,1969,1969,1969,1969,1969,1969,1969,1970,2111,2111,2086,2111,2086,2111,2091,2055,2078,2087,2054,2022,2012,1947,2073,2073,2073,2073,2073,2073,2073,2073,2073,2073,2073,2073,2073,2073,2251,2234,2231,2236,2234,2231,2229,2210,2246,2216,2181,2160,2087,2080,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2623,2608,2603,2592,2590,2603,2615,2573,2603,2605,2551,2494,2436,2428,2917,2917,2917,2917,2917,2917,2917,2917,2917,2917,2917,2917,2917,2918,3068,3055,3045,3055,3076,3081,3032,3030,3032,3032,2988,2967,2857,2837,941,941,941,941,941,941,941,941,941,941,941,940,937,934,1045,1036,1036,1031,1028,1036,1028,1017,1022,1004,1005,1014,939,932,1216,1216,1216,1216,1216,1216,1216,1216,1216,1216,1216,1216,634,611,1305,1305,1293,1305,1293,1302,1293,1271,1293,1283,1256,1256,681,675,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,904,871,1558,1533,1527,1544,1533,1537,1527,1514,1527,1527,1499,1466,1234,1152,1672,1672,1672,1672,1672,1672,1672,1668,1672,1672,1341,1256,904,871,1727,1691,1724,1702,1723,1687,1694,1613,1720,1675,1517,1449,1234,1152,1898,1898,1898,1898,1898,1898,1898,1898,1898,1898,1898,1898,991,957,2006,2006,1993,2006,2006,2006,1979,1959,1985,1979,1931,1880,1209,1006,2280,2280,2280,2280,2280,2280,2280,2280,2280,2280,1341,1256,904,871,2451,2457,2448,2484,2448,2448,2430,2410,2448,2412,1980,1776,1264,959,1381,1381,1253,1381,1381,1280,1280,1058,1248,1248,906,870,641,641,1421,1479,1409,1506,1429,1367,1530,1428,1453,1440,1336,1103,681,677,1732,1732,1732,1732,1732,1732,1732,1732,1732,1732,1664,1477,1155,983,1779,1811,1762,1812,1758,1776,1758,1754,1764,1731,1676,1709,1420,1127,1901,1901,1700,1901,1901,1700,1700,1391,1700,1700,1191,1097,815,801,1966,2008,2214,1916,2222,2170,2119,2247,2080,1792,1629,1526,954,861,2869,2869,2608,2869,2869,2666,2666,2217,2666,2666,1724,1556,1153,1099,2598,2453,2810,2830,2970,2906,2807,2490,2856,2856,2179,2134,2169,1130],"flag":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,0,0,1,0,0,1,1,1,0,1,1,1,0,1,0,0,1,0,0,1,1,1,0,1,1,1,0,1,1,1,0,1,0,1,1,1,1,1,1,1,0,1,1,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"inst":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,0,0,1,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,1],"beta":[968,968,968,968,968,968,968,968,968,968,968,968,968,968,1153,1153,1153,1153,1153,1153,1113,1109,1153,1113,1088,1038,963,933,577,577,577,577,577,577,577,577,577,577,577,577,577,577,724,705,705,724,705,705,705,685,705,688,647,647,600,566,536,536,536,536,536,536,536,536,536,536,536,536,536,536,676,660,660,660,644,660,644,629,660,644,610,594,551,535,386,386,386,386,386,386,386,386,386,386,386,386,386,386,482,472,468,472,463,468,459,447,468,450,450,446,408,403,886,886,886,886,886,886,886,886,886,886,886,886,886,886,1066,1031,1038,1066,1031,1038,1038,1015,1038,1038,995,980,900,875,901,901,901,901,901,901,901,901,901,901,901,901,901,901,1106,1106,1098,1106,1069,1098,1062,1049,1062,1062,1007,989,919,857,830,830,830,830,830,830,830,830,830,830,830,830,830,830,999,999,999,999,999,999,999,955,999,968,949,911,842,808,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1468,1468,1468,1468,1468,1468,1468,1425,1468,1408,1356,1316,1236,1128,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1318,1318,1304,1318,1318,1304,1304,1255,1304,1304,1236,1206,1089,1043,561,561,561,561,561,561,561,561,561,561,561,561,561,561,676,676,662,668,659,662,662,646,662,646,645,625,582,573,695,695,695,695,695,695,695,695,695,695,695,695,695,695,832,832,832,832,832,832,809,801,832,809,786,765,718,687,968,968,968,968,968,968,968,968,968,968,968,968,968,968,1153,1153,1153,1153,1153,1153,1113,1109,1153,1113,1088,1038,963,933,337,337,337,337,337,337,337,337,337,337,337,337,337,337,416,401,408,408,394,408,401,394,401,394,391,391,362,352,716,716,716,716,716,716,716,716,716,716,716,716,716,716,828,828,815,828,828,838,815,792,815,815,797,779,732,709,481,481,481,481,481,481,481,481,481,481,481,481,481,481,579,579,566,579,566,579,566,547,566,554,554,542,500,490,707,707,707,707,707,707,707,707,707,707,707,707,707,707,839,815,809,815,815,809,809,787,809,809,789,763,722,696,386,386,386,386,386,386,386,386,386,386,386,386,386,386,487,468,472,477,468,472,463,451,472,454,449,449,410,403,614,614,614,614,614,614,614,614,614,614,614,614,614,614,738,738,738,738,719,738,719,701,719,719,693,678,630,615,831,831,831,831,831,831,831,831,831,831,831,831,831,831,994,994,963,994,963,963,963,937,963,963,926,898,837,816,532,532,532,532,532,532,532,532,532,532,532,532,532,532,662,646,639,646,631,639,639,624,639,624,609,589,554,540,674,674,674,674,674,674,674,674,674,674,674,674,674,674,811,811,811,811,811,811,789,778,811,789,762,762,694,679,819,819,819,819,819,819,819,819,819,819,819,819,819,819,1002,971,968,971,971,968,968,928,968,968,923,900,826,797,510,510,510,510,510,510,510,510,510,510,510,510,510,510,669,653,653,653,637,653,637,607,637,622,571,567,516,498,985,985,985,985,985,985,985,985,985,985,985,985,985,985,1232,1232,1188,1232,1188,1188,1188,1146,1188,1188,1092,1071,989,900,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1370,1370,1370,1370,1370,1370,1317,1314,1370,1317,1232,1177,1092,1001,739,739,739,739,739,739,739,739,739,739,739,739,739,739,858,858,844,858,858,844,844,820,844,844,810,797,758,733,1618,1618,1618,1618,1618,1618,1618,1618,1618,1618,1618,1618,1618,1618,1865,1865,1838,1865,1865,1838,1838,1750,1838,1838,1707,1704,1608,1560,383,383,383,383,383,383,383,383,383,383,383,383,383,383,469,459,459,469,451,459,451,442,459,442,451,443,384,378,345,345,345,345,345,345,345,345,345,345,345,345,345,345,420,412,409,417,404,416,401,392,409,394,405,405,359,352,465,465,465,465,465,465,465,465,465,465,465,465,465,465,532,521,525,532,521,525,525,514,525,514,516,516,483,475,573,573,573,573,573,573,573,573,573,573,573,573,573,573,643,643,643,643,628,643,628,628,643,628,622,625,589,580,875,875,875,875,875,875,875,875,875,875,875,875,875,875,962,962,962,962,962,962,962,946,962,962,941,915,892,876,1097,1097,1097,1097,1097,1097,1097,1097,1097,1097,1097,1097,1097,1097,1207,1207,1194,1207,1207,1194,1194,1194,1194,1194,1170,1170,1094,1071,426,426,426,426,426,426,426,426,426,426,426,426,426,426,532,521,517,521,510,521,510,495,521,499,505,495,447,439,337,337,337,337,337,337,337,337,337,337,337,337,335,335,386,378,379,384,371,379,371,365,378,365,377,375,343,337,259,259,259,259,259,259,259,259,259,259,259,259,259,259,315,300,305,305,291,305,296,292,300,291,306,306,271,266,693,693,693,693,693,693,693,693,693,693,693,693,693,693,829,829,829,829,829,829,806,798,829,806,783,762,716,685,968,968,968,968,968,968,968,968,968,968,968,968,968,968,1158,1158,1130,1158,1158,1158,1118,1113,1118,1118,1083,1040,964,932,532,532,532,532,532,532,532,532,532,532,532,532,458,422,618,612,604,623,608,605,597,560,600,586,590,586,517,507,343,343,343,343,343,343,343,343,343,343,343,343,343,343,404,388,395,397,382,395,388,380,388,380,390,386,356,351,486,486,486,486,486,486,486,486,486,486,486,486,486,486,552,541,546,547,540,546,540,529,541,535,530,527,494,489,598,598,598,598,598,598,598,598,598,598,598,598,598,598,669,668,659,668,659,659,659,649,659,652,643,643,606,591,579,579,579,579,579,579,579,579,579,579,579,579,579,579,672,656,656,656,656,656,656,646,656,640,643,628,594,587,1298,1298,1298,1298,1298,1298,1298,1298,1298,1298,1298,1298,1298,1298,1435,1435,1435,1435,1435,1435,1435,1444,1435,1435,1408,1364,1326,1250,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1215,1385,1331,1331,1331,1331,1331,1331,1331,1331,1331,1310,1257,1237,1179,652,652,652,652,652,652,652,652,652,652,652,652,652,652,761,761,747,761,741,747,747,735,747,747,721,721,676,648,757,757,757,757,757,757,757,757,757,757,757,757,757,757,869,869,855,869,845,855,855,843,855,855,831,817,762,754,871,871,871,871,871,871,871,871,871,871,871,871,871,871,993,993,971,993,993,971,971,965,971,971,928,940,894,871,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1314,1314,1314,1314,1314,1314,1314,1316,1314,1314,1282,1234,1203,1138,304,304,290,304,304,290,290,243,290,290,243,214,134,134,312,285,280,331,310,294,264,272,276,292,296,315,205,155,386,386,382,386,384,382,382,361,382,383,347,295,200,200,428,418,409,416,399,427,403,364,409,386,368,365,302,233,423,423,422,423,423,422,422,396,422,423,367,323,215,215,463,463,446,455,445,463,454,396,445,430,390,404,270,232,541,541,536,536,541,536,536,521,536,536,466,411,283,274,594,590,567,613,576,582,565,556,577,564,497,477,352,327,286,286,286,286,286,286,286,265,286,286,265,234,152,152,306,288,283,307,267,300,271,270,288,275,296,290,187,198,355,355,355,355,355,355,355,355,355,355,355,355,225,225,408,396,390,401,383,398,383,352,390,365,388,351,293,271,394,394,394,394,394,394,394,394,394,394,394,380,229,229,447,431,422,439,423,434,423,414,431,399,414,400,301,274,518,518,518,518,518,518,518,515,518,518,488,432,290,276,576,562,562,567,552,562,552,528,562,550,524,520,394,326,518,518,518,518,518,518,518,515,518,518,488,432,290,276,576,562,562,567,552,562,552,528,562,550,524,520,394,326,631,631,631,631,631,631,631,631,631,631,631,631,631,631,730,730,717,730,730,730,711,706,730,711,706,690,651,636,731,731,731,731,731,731,731,731,731,731,731,731,731,731,835,835,822,835,835,835,812,810,835,812,799,799,754,732,867,867,867,867,867,867,867,867,867,867,867,867,867,867,987,987,959,987,987,959,959,959,959,959,951,934,889,866,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1314,1314,1314,1314,1314,1314,1314,1316,1314,1314,1282,1234,1203,1138,286,286,276,286,286,286,286,255,276,286,255,234,157,157,318,289,284,305,273,305,274,288,289,271,287,299,197,197,358,358,358,358,358,358,358,358,358,358,355,305,215,215,400,380,394,401,373,385,379,368,378,367,368,377,272,259,401,401,400,401,401,400,400,393,400,400,388,345,215,215,440,430,437,438,413,438,413,393,426,409,403,385,245,287,515,515,515,515,515,515,515,513,515,515,491,448,297,295,579,576,562,569,555,573,546,516,554,542,521,495,413,403,515,515,515,515,515,515,515,513,515,515,491,448,297,295,579,576,562,569,555,573,546,516,554,542,521,495,413,403,302,302,302,302,302,302,302,255,302,302,255,223,150,150,353,314,320,332,311,343,330,275,323,294,283,289,226,157,397,397,397,397,397,397,397,299,397,397,299,265,172,172,419,404,357,408,422,437,407,358,429,413,355,354,210,241,425,425,421,425,423,421,421,383,421,421,335,300,207,207,472,459,460,460,450,434,451,392,428,406,425,392,256,274,569,569,552,569,569,552,552,465,552,552,388,333,240,240,641,608,519,608,588,649,617,536,558,567,599,478,455,255,553,553,552,553,553,552,552,498,552,552,429,383,258,240,610,597,581,581,563,589,586,516,559,543,463,459,313,447,297,297,293,293,297,293,293,281,293,293,259,248,151,151,328,324,318,321,312,310,306,289,324,294,326,300,223,214,393,393,388,393,393,388,388,326,388,388,326,272,204,184,414,418,390,438,406,408,416,355,401,369,384,382,204,207,418,418,418,418,418,418,418,414,418,418,388,337,214,214,460,457,457,459,446,457,432,420,453,420,401,426,333,244,537,537,537,537,537,537,537,529,537,537,446,410,281,281,611,600,579,586,595,599,583,564,573,568,509,494,475,379,295,295,295,295,295,295,295,290,295,295,259,254,158,158,332,306,334,312,305,322,307,291,306,291,319,299,189,232,378,378,378,378,378,378,378,364,378,378,339,326,209,209,430,412,427,428,414,415,424,403,404,390,413,413,283,239,427,427,419,427,427,419,419,350,419,419,305,274,190,190,479,435,450,470,450,452,452,365,459,398,409,392,226,204,541,541,536,536,541,536,536,523,536,536,452,394,270,257,607,626,569,618,595,626,582,558,603,578,534,475,432,424,639,639,639,639,639,639,639,639,639,639,639,639,639,639,758,746,738,758,738,740,738,719,738,734,712,699,638,621,831,831,831,831,831,831,831,831,831,831,831,831,831,828,969,969,954,969,954,969,942,921,949,939,901,882,837,784,897,897,897,897,897,897,897,897,897,897,897,897,897,897,1049,1038,1030,1040,1038,1030,1022,999,1032,1014,972,960,886,858,995,995,995,995,995,995,995,995,995,995,995,995,995,995,1163,1134,1140,1145,1124,1140,1130,1095,1140,1124,1070,1039,978,948,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1321,1536,1528,1506,1528,1508,1530,1499,1466,1499,1499,1413,1387,1285,1226,474,474,474,474,474,474,474,474,474,474,474,472,466,457,590,577,577,579,564,577,564,548,566,546,545,543,465,456,595,595,595,595,595,595,595,595,595,595,595,595,272,254,719,719,701,719,701,708,701,670,701,685,648,648,304,296,704,704,704,704,704,704,704,704,704,704,704,704,386,358,846,827,817,834,827,825,817,793,817,817,779,755,565,512,822,822,822,822,822,822,822,815,822,822,619,578,386,358,934,909,921,917,917,907,897,837,915,884,770,724,565,512,996,996,996,996,996,996,996,996,996,996,996,996,378,362,1184,1184,1153,1184,1162,1162,1143,1108,1147,1143,1071,1035,495,389,1203,1203,1203,1203,1203,1203,1203,1203,1203,1203,619,578,386,358,1422,1398,1392,1418,1392,1392,1379,1337,1392,1366,1062,921,582,408,714,714,634,714,714,655,655,519,645,645,428,396,266,266,823,865,816,885,828,782,900,806,836,825,740,584,304,295,844,844,844,844,844,844,844,844,844,844,817,708,507,423,973,980,950,981,943,959,943,920,951,925,866,875,697,499,947,947,828,947,947,828,828,656,828,828,542,487,330,326,1101,1125,1240,1065,1245,1210,1175,1252,1148,962,842,771,411,357,1433,1433,1270,1433,1433,1310,1310,1044,1310,1310,765,679,461,428,1571,1468,1486,1533,1589,1547,1484,1281,1515,1515,1071,1040,1017,515]},"params":[{"category":[5],"n":1024,"q":12289,"secret_distribution":"normal","claimed":255,"ring":"x^n+1","sd":2.8284271247461903},{"category":[2],"k":2,"n":624,"q":1024,"secret_distribution":"normal","claimed":152,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":1.0},{"category":[2],"k":2,"n":624,"q":1024,"secret_distribution":"normal","claimed":141,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.7905694150420949},{"category":[1],"n":512,"q":12289,"secret_distribution":"normal","claimed":101,"ring":"x^n+1","sd":2.0},{"category":[5],"n":1024,"q":12289,"secret_distribution":"normal","claimed":233,"ring":"x^n+1","sd":2.0},{"category":[5],"k":3,"n":936,"q":1024,"secret_distribution":"normal","claimed":237,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.9354143466934853},{"category":[4],"k":3,"n":936,"q":1024,"secret_distribution":"normal","claimed":219,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.7071067811865476},{"category":[5],"k":4,"n":1248,"q":1024,"secret_distribution":"normal","claimed":320,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.8660254037844386},{"category":[5],"k":4,"n":1248,"q":1024,"secret_distribution":"normal","claimed":292,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.6123724356957945},{"category":[4],"k":3,"n":768,"q":7681,"secret_distribution":"normal","claimed":147,"ring":"x^{n/k}+1","sd":1.0},{"category":[4],"k":3,"n":768,"q":7681,"secret_distribution":"normal","claimed":183,"ring":"x^{n/k}+1","sd":2.23606797749979},{"category":[1],"n":512,"q":120883,"secret_distribution":"normal","claimed":"","ring":"x^n+1","sd":4.19},{"category":[3,5],"n":1024,"q":120883,"secret_distribution":"normal","claimed":"","ring":"x^n+1","sd":2.6},{"category":[1],"n":640,"q":32768,"secret_distribution":"normal","claimed":103,"sd":2.75},{"category":[3],"n":976,"q":65536,"secret_distribution":"normal","claimed":150,"sd":2.3},{"category":[1],"k":2,"n":512,"q":7681,"secret_distribution":"normal","claimed":102,"ring":"x^{n/k}+1","sd":1.5811388300841898},{"category":[3],"k":3,"n":768,"q":7681,"secret_distribution":"normal","claimed":161,"ring":"x^{n/k}+1","sd":1.4142135623730951},{"category":[5],"k":4,"n":1024,"q":7681,"secret_distribution":"normal","claimed":218,"ring":"x^{n/k}+1","sd":1.224744871391589},{"category":[1,2],"n":576,"q":8192,"secret_distribution":"normal","claimed":"","sd":3.0},{"category":[3,4],"n":704,"q":8192,"secret_distribution":"normal","claimed":"","sd":3.0},{"category":[5],"n":832,"q":8192,"secret_distribution":"normal","claimed":"","sd":3.0},{"category":[1,2],"n":512,"q":251,"secret_distribution":"normal","claimed":128,"ring":"x^n+1","sd":0.7071067811865476},{"category":[3,4],"n":1024,"q":251,"secret_distribution":"normal","claimed":192,"ring":"x^n+1","sd":0.5},{"category":[5],"n":1024,"q":251,"secret_distribution":"normal","claimed":256,"ring":"x^n+1","sd":0.7071067811865476},{"category":[3],"n":1024,"q":133121,"secret_distribution":"normal","claimed":208,"ring":"x^n+1","sd":3.1622776601683795},{"category":[4],"n":2048,"q":184321,"secret_distribution":"normal","claimed":444,"ring":"x^n+1","sd":3.1622776601683795},{"category":[1],"n":512,"q":65536,"secret_distribution":"(-1, 1)","claimed":128,"ring":"x^n+1 \\text{ \\textdagger}","sd":25.0},{"category":[1],"n":512,"q":16384,"secret_distribution":"(-1, 1)","claimed":128,"ring":"x^n+1 \\text{ \\textdagger}","sd":3.0},{"category":[1],"n":1018,"q":12521473,"secret_distribution":"normal","claimed":139,"ring":"\\sum_{i=0}^n x^i","sd":3.1622776601683795},{"category":[2],"n":1306,"q":48181249,"secret_distribution":"normal","claimed":167,"ring":"\\sum_{i=0}^n x^i","sd":3.1622776601683795},{"category":[3],"n":1822,"q":44802049,"secret_distribution":"normal","claimed":247,"ring":"\\sum_{i=0}^n x^i","sd":3.1622776601683795},{"category":[4],"n":2062,"q":16900097,"secret_distribution":"normal","claimed":303,"ring":"\\sum_{i=0}^n x^i","sd":3.1622776601683795},{"category":[1],"k":2,"n":512,"q":8192,"secret_distribution":"normal","claimed":115,"ring":"x^{n/k} + 1","sd":2.29128784747792},{"category":[1],"n":770,"q":16777216,"secret_distribution":"(-1, 1)","claimed":128,"sd":25.0},{"category":[1],"n":611,"q":16777216,"secret_distribution":"(-2, 2)","claimed":128,"sd":25.0},{"category":[3],"k":3,"n":768,"q":8192,"secret_distribution":"normal","claimed":180,"ring":"x^{n/k} + 1","sd":2.29128784747792},{"category":[5],"k":4,"n":1024,"q":8192,"secret_distribution":"normal","claimed":245,"ring":"x^{n/k} + 1","sd":2.29128784747792},{"category":[5],"n":761,"q":4591,"secret_distribution":"((-1, 1), 250)","claimed":225,"ring":"x^n - x - 1","sd":0.816496580927726},{"category":[1],"k":3,"n":768,"q":8380417,"secret_distribution":"(-6, 6)","claimed":91,"ring":"x^{n/k}+1","sd":3.7416573867739413},{"category":[2],"k":4,"n":1024,"q":8380417,"secret_distribution":"(-5, 5)","claimed":125,"ring":"x^{n/k}+1","sd":3.1622776601683795},{"category":[3],"k":5,"n":1280,"q":8380417,"secret_distribution":"(-3, 3)","claimed":158,"ring":"x^{n/k}+1","sd":2.0},{"category":[1],"n":1024,"q":8058881,"secret_distribution":"normal","claimed":128,"ring":"x^n + 1","sd":8.493218002880191},{"category":[3],"n":2048,"q":12681217,"secret_distribution":"normal","claimed":192,"ring":"x^n + 1","sd":8.493218002880191},{"category":[5],"n":2048,"q":27627521,"secret_distribution":"normal","claimed":256,"ring":"x^n + 1","sd":8.493218002880191},{"category":[1],"n":1024,"q":86017,"secret_distribution":"normal","claimed":128,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[1],"n":1280,"q":301057,"secret_distribution":"normal","claimed":160,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[3],"n":1536,"q":737281,"secret_distribution":"normal","claimed":192,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[5],"n":2048,"q":1198081,"secret_distribution":"normal","claimed":256,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[1],"n":420,"q":1024,"secret_distribution":"((-1, 1), 62)","claimed":74,"ring":"\\sum_{i=0}^n x^i","sd":1.118033988749895},{"category":[2],"n":540,"q":8192,"secret_distribution":"((-1, 1), 96)","claimed":97,"ring":"\\sum_{i=0}^n x^i","sd":4.6097722286464435},{"category":[3],"n":586,"q":8192,"secret_distribution":"((-1, 1), 104)","claimed":107,"ring":"\\sum_{i=0}^n x^i","sd":4.6097722286464435},{"category":[4,5],"n":708,"q":32768,"secret_distribution":"((-1, 1), 140)","claimed":138,"ring":"\\sum_{i=0}^n x^i","sd":18.472953201911167},{"category":[1],"n":500,"q":16384,"secret_distribution":"((-1, 1), 74)","claimed":74,"sd":2.29128784747792},{"category":[2],"n":580,"q":32768,"secret_distribution":"((-1, 1), 116)","claimed":96,"sd":4.6097722286464435},{"category":[3],"n":630,"q":32768,"secret_distribution":"((-1, 1), 126)","claimed":106,"sd":4.6097722286464435},{"category":[4],"n":786,"q":32768,"secret_distribution":"((-1, 1), 156)","claimed":139,"sd":4.6097722286464435},{"category":[5],"n":786,"q":32768,"secret_distribution":"((-1, 1), 156)","claimed":138,"sd":4.6097722286464435},{"category":[1],"n":1024,"q":118273,"secret_distribution":"normal","claimed":128,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[1],"n":1280,"q":430081,"secret_distribution":"normal","claimed":160,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[3],"n":1536,"q":783361,"secret_distribution":"normal","claimed":192,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[1],"n":500,"q":32768,"secret_distribution":"((-1, 1), 74)","claimed":74,"sd":4.6097722286464435},{"category":[2],"n":585,"q":32768,"secret_distribution":"((-1, 1), 110)","claimed":96,"sd":4.6097722286464435},{"category":[3],"n":643,"q":32768,"secret_distribution":"((-1, 1), 114)","claimed":106,"sd":4.6097722286464435},{"category":[4],"n":835,"q":32768,"secret_distribution":"((-1, 1), 166)","claimed":138,"sd":2.29128784747792},{"category":[5],"n":835,"q":32768,"secret_distribution":"((-1, 1), 166)","claimed":138,"sd":2.29128784747792},{"category":[1],"n":418,"q":4096,"secret_distribution":"((-1, 1), 66)","claimed":75,"ring":"\\sum_{i=0}^n x^i","sd":4.6097722286464435},{"category":[2],"n":522,"q":32768,"secret_distribution":"((-1, 1), 78)","claimed":97,"ring":"\\sum_{i=0}^n x^i","sd":36.94928957368463},{"category":[3],"n":540,"q":16384,"secret_distribution":"((-1, 1), 96)","claimed":106,"ring":"\\sum_{i=0}^n x^i","sd":18.472953201911167},{"category":[4],"n":700,"q":32768,"secret_distribution":"((-1, 1), 112)","claimed":140,"ring":"\\sum_{i=0}^n x^i","sd":36.94928957368463},{"category":[5],"n":676,"q":32768,"secret_distribution":"((-1, 1), 120)","claimed":139,"ring":"\\sum_{i=0}^n x^i","sd":36.94928957368463},{"category":[1],"n":442,"q":2659,"secret_distribution":"((-1, 1), 74)","claimed":74,"ring":"\\sum_{i=0}^n x^i","sd":1.4711384933077167},{"category":[2],"n":556,"q":3343,"secret_distribution":"((-1, 1), 88)","claimed":97,"ring":"\\sum_{i=0}^n x^i","sd":1.8626083342516564},{"category":[3],"n":576,"q":2309,"secret_distribution":"((-1, 1), 108)","claimed":106,"ring":"\\sum_{i=0}^n x^i","sd":1.2694482394736055},{"category":[4,5],"n":708,"q":2837,"secret_distribution":"((-1, 1), 140)","claimed":138,"ring":"\\sum_{i=0}^n x^i","sd":1.5732888629792405},{"category":[1],"n":400,"q":3209,"secret_distribution":"((-1, 1), 72)","claimed":74,"ring":"\\sum_{i=0}^n x^i","sd":3.6070549183961935},{"category":[2],"n":486,"q":1949,"secret_distribution":"((-1, 1), 96)","claimed":97,"ring":"\\sum_{i=0}^n x^i","sd":2.1787238503231188},{"category":[3],"n":556,"q":3343,"secret_distribution":"((-1, 1), 88)","claimed":106,"ring":"\\sum_{i=0}^n x^i","sd":3.758621985155586},{"category":[4,5],"n":658,"q":1319,"secret_distribution":"((-1, 1), 130)","claimed":139,"ring":"\\sum_{i=0}^n x^i","sd":1.4590706550793462},{"category":[2],"k":3,"n":768,"q":16384,"secret_distribution":"(-4, 4)","claimed":164,"ring":"x^{n/k}+1","sd":2.29128784747792},{"category":[4],"k":2,"n":1024,"q":8192,"secret_distribution":"(-2, 2)","claimed":207,"ring":"x^{n/k}+1","sd":1.118033988749895},{"category":[4],"k":2,"n":1024,"q":16384,"secret_distribution":"(-4, 4)","claimed":232,"ring":"x^{n/k}+1","sd":2.29128784747792},{"category":[5],"k":5,"n":1280,"q":16384,"secret_distribution":"(-2, 2)","claimed":251,"ring":"x^{n/k}+1","sd":1.118033988749895},{"category":[5],"k":3,"n":1536,"q":8192,"secret_distribution":"(-2, 2)","claimed":330,"ring":"x^{n/k}+1","sd":1.118033988749895},{"category":[1],"n":1024,"q":2048,"secret_distribution":"((-1, 1), 140)","claimed":130,"sd":1.118033988749895},{"category":[1],"n":536,"q":2048,"secret_distribution":"((-1, 1), 268)","claimed":133,"sd":2.58555},{"category":[1],"n":1024,"q":1024,"secret_distribution":"((-1, 1), 128)","claimed":147,"sd":1.118033988749895},{"category":[1],"n":663,"q":1024,"secret_distribution":"((-1, 1), 497)","claimed":131,"sd":0.891},{"category":[3],"n":1024,"q":2048,"secret_distribution":"((-1, 1), 200)","claimed":195,"sd":1.118033988749895},{"category":[3],"n":816,"q":2048,"secret_distribution":"((-1, 1), 408)","claimed":193,"sd":1.3394},{"category":[3],"n":952,"q":2048,"secret_distribution":"((-1, 1), 714)","claimed":203,"sd":1.675967},{"category":[5],"n":2048,"q":4096,"secret_distribution":"((-1, 1), 200)","claimed":257,"sd":1.118033988749895},{"category":[5],"n":1088,"q":4096,"secret_distribution":"((-1, 1), 544)","claimed":266,"sd":3.11251},{"category":[5],"n":2048,"q":2048,"secret_distribution":"((-1, 1), 200)","claimed":291,"sd":1.118033988749895},{"category":[5],"n":1300,"q":2048,"secret_distribution":"((-1, 1), 975)","claimed":264,"sd":1.072223},{"category":[1],"n":1024,"q":1024,"secret_distribution":"((-1, 1), 128)","claimed":147,"ring":"x^n+1","sd":1.118033988749895},{"category":[1],"n":1024,"q":1024,"secret_distribution":"((-1, 1), 128)","claimed":153,"ring":"x^n+1","sd":1.069416},{"category":[3],"n":1024,"q":2048,"secret_distribution":"((-1, 1), 264)","claimed":195,"ring":"x^n+1","sd":1.118033988749895},{"category":[3],"n":1024,"q":2048,"secret_distribution":"((-1, 1), 256)","claimed":195,"ring":"x^n+1","sd":1.458989},{"category":[3],"n":2048,"q":2048,"secret_distribution":"((-1, 1), 164)","claimed":291,"ring":"x^n+1","sd":1.118033988749895},{"category":[3],"n":2048,"q":2048,"secret_distribution":"((-1, 1), 184)","claimed":304,"ring":"x^n+1","sd":2.002534},{"category":[5],"n":2048,"q":4096,"secret_distribution":"((-1, 1), 256)","claimed":348,"ring":"x^n+1","sd":1.118033988749895},{"category":[5],"n":2048,"q":4096,"secret_distribution":"((-1, 1), 256)","claimed":318,"ring":"x^n+1","sd":2.635593}],"ms":["2n"],"strings":["KCL\u2011RLWE","KEM","RLWE","primal","KCL\u2011RLWE-1024-2.83-12289","dual","BabyBear","ILWE","BabyBear-0624-1.00-1024","BabyBear-0624-0.79-1024","NewHope","PKE","NewHope-0512-2.00-12289","NewHope-1024-2.00-12289","MamaBear","MamaBear-0936-0.94-1024","MamaBear-0936-0.71-1024","PapaBear","PapaBear-1248-0.87-1024","PapaBear-1248-0.61-1024","KCL\u2011MLWE","MLWE","KCL\u2011MLWE-0768-1.00-7681","KCL\u2011MLWE-0768-2.24-7681","HILA5","KE","HILA5-1024-2.83-12289","Ding Key Exchange","Ding Key Exchange-0512-4.19-120883","Ding Key Exchange-1024-2.60-120883","Frodo","LWE","Frodo-0640-2.75-32768","Frodo-0976-2.30-65536","CRYSTALS\u2011Kyber","CRYSTALS\u2011Kyber-0512-1.58-7681","CRYSTALS\u2011Kyber-0768-1.41-7681","CRYSTALS\u2011Kyber-1024-1.22-7681","LOTUS","LOTUS-0576-3.00-8192","LOTUS-0704-3.00-8192","LOTUS-0832-3.00-8192","LAC","PLWE","LAC-0512-0.71-251","LAC-1024-0.50-251","LAC-1024-0.71-251","LIMA-2p","LIMA-2p-1024-3.16-133121","LIMA-2p-2048-3.16-184321","R EMBLEM","R EMBLEM-0512-25.00-65536","R EMBLEM-0512-3.00-16384","LIMA\u2011sp","LIMA\u2011sp-1018-3.16-12521473","LIMA\u2011sp-1306-3.16-48181249","LIMA\u2011sp-1822-3.16-44802049","LIMA\u2011sp-2062-3.16-16900097","LightSaber","MLWR","LightSaber-0512-2.29-8192","EMBLEM","EMBLEM-0770-25.00-16777216","EMBLEM-0611-25.00-16777216","Saber","Saber-0768-2.29-8192","FireSaber","FireSaber-1024-2.29-8192","NTRU LPrime","RLWR","NTRU LPrime-0761-0.82-4591","CRYSTALS\u2011Dilithium","SIG","CRYSTALS\u2011Dilithium-0768-3.74-8380417","CRYSTALS\u2011Dilithium-1024-3.16-8380417","CRYSTALS\u2011Dilithium-1280-2.00-8380417","qTESLA","qTESLA-1024-8.49-8058881","qTESLA-2048-8.49-12681217","qTESLA-2048-8.49-27627521","Titanium.PKE","Titanium.PKE-1024-1.41-86017","Titanium.PKE-1280-1.41-301057","Titanium.PKE-1536-1.41-737281","Titanium.PKE-2048-1.41-1198081","uRound2.PKE","uRound2.PKE-0420-1.12-1024","uRound2.PKE-0540-4.61-8192","uRound2.PKE-0586-4.61-8192","uRound2.PKE-0708-18.47-32768","uRound2.KEM","LWR","uRound2.KEM-0500-2.29-16384","uRound2.KEM-0580-4.61-32768","uRound2.KEM-0630-4.61-32768","uRound2.KEM-0786-4.61-32768","Titanium.KEM","Titanium.KEM-1024-1.41-118273","Titanium.KEM-1280-1.41-430081","Titanium.KEM-1536-1.41-783361","Titanium.KEM-2048-1.41-1198081","uRound2.PKE-0500-4.61-32768","uRound2.PKE-0585-4.61-32768","uRound2.PKE-0643-4.61-32768","uRound2.PKE-0835-2.29-32768","uRound2.KEM-0418-4.61-4096","uRound2.KEM-0522-36.95-32768","uRound2.KEM-0540-18.47-16384","uRound2.KEM-0700-36.95-32768","uRound2.KEM-0676-36.95-32768","nRound2.PKE","nRound2.PKE-0442-1.47-2659","nRound2.PKE-0556-1.86-3343","nRound2.PKE-0576-1.27-2309","nRound2.PKE-0708-1.57-2837","nRound2.KEM","nRound2.KEM-0400-3.61-3209","nRound2.KEM-0486-2.18-1949","nRound2.KEM-0556-3.76-3343","nRound2.KEM-0658-1.46-1319","KINDI","KINDI-0768-2.29-16384","KINDI-1024-1.12-8192","KINDI-1024-2.29-16384","KINDI-1280-1.12-16384","KINDI-1536-1.12-8192","Lizard","Lizard-1024-1.12-2048","Lizard-1024-1.12-1024","Lizard-2048-1.12-4096","Lizard-2048-1.12-2048","RLizard","RLizard-1024-1.12-1024","RLizard-1024-1.12-2048","RLizard-2048-1.12-2048","RLizard-2048-1.12-4096","0.265\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a016.4","0.2975\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)","0.292\u00a0\u03b2","292\u00a0\u03b2 +\u00a016.4","0.368\u00a0\u03b2","0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2","0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)","\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)","0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25","0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1","0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)"]});
\ No newline at end of file
@@ -0,0 +1 @@
+loadShard("lwe-n", {"rows":{"primitive":[[1],[1],[1],[1],[1],[1],[1,11],[1,11],[1,11],[1,11],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[25],[25],[1],[1],[1],[1],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[11,1,25],[11,1,25],[11,1,25],[11,1,25],[11,1,25],[11,1,25],[1,11],[1,11],[1,11],[1,11],[11,1],[11,1],[11,1],[11,1],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[1,11],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[1],[1],[72],[72],[72],[72],[72],[72],[72],[72],[72],[72],[72],[72],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[11],[11],[11],[11],[11],[11],[11],[11],[11],[11],[1],[1],[1],[1],[1],[1],[1],[1],[1],[1],[11],[11],[11],[11],[11],[11],[11],[11],[1],[1],[1],[1],[1],[1],[1],[1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1],[11,1]],"param":[[0],[0],[1],[1],[2],[2],[3],[3],[4],[4],[5],[5],[6],[6],[7],[7],[8],[8],[9],[9],[10],[10],[0],[0],[11],[11],[12],[12],[13],[13],[14],[14],[15],[15],[16],[16],[17],[17],[18],[18],[19],[19],[20],[20],[21],[21],[22],[22],[23],[23],[24],[24],[25],[25],[26],[26],[27],[27],[28],[28],[29],[29],[30],[30],[31],[31],[32],[32],[33],[33],[34],[34],[35],[35],[36],[36],[37],[37],[38],[38],[39],[39],[40],[40],[41],[41],[42],[42],[43],[43],[44],[44],[45],[45],[46],[46],[47],[47],[48],[48],[49],[49],[50],[50],[51],[51],[52],[52],[53],[53],[54],[54],[55],[55],[56],[56],[57],[57],[58],[58],[59],[59],[47],[47],[60],[60],[61],[61],[62],[62],[63],[63],[64],[64],[65],[65],[66],[66],[67],[67],[68],[68],[69],[69],[70],[70],[71],[71],[72],[72],[73],[73],[74],[74],[75],[75],[76],[76],[77],[77],[78],[78],[79],[79],[80],[80],[81],[81],[82],[82],[83,84],[83,84],[85,86],[85,86],[87,88],[87,88],[87,89],[87,89],[90,91],[90,91],[92,93],[92,93],[94,95],[94,95],[96,97],[96,97],[98,99],[98,99],[100,101],[100,101]],"attack":[3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5,3,5],"assumption":[[2],[2],[7],[7],[7],[7],[2],[2],[2],[2],[7],[7],[7],[7],[7],[7],[7],[7],[21],[21],[21],[21],[2],[2],[2],[2],[2],[2],[31],[31],[31],[31],[21],[21],[21],[21],[21],[21],[31],[31],[31],[31],[31],[31],[43],[43],[43],[43],[43],[43],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[2],[59],[59],[31],[31],[31],[31],[59],[59],[59],[59],[69],[69],[21],[21],[21],[21],[21],[21],[2],[2],[2],[2],[2],[2],[43],[43],[43],[43],[43],[43],[43],[43],[69],[69],[69],[69],[69],[69],[69],[69],[91],[91],[91],[91],[91],[91],[91],[91],[91],[91],[43],[43],[43],[43],[43],[43],[43],[43],[91],[91],[91],[91],[91],[91],[91],[91],[91],[91],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[69],[21],[21],[21],[21],[21],[21],[21],[21],[21],[21],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[91,31],[69,2],[69,2],[69,2],[69,2],[69,2],[69,2],[69,2],[69,2]],"key":[4,4,8,8,9,9,12,12,13,13,15,15,16,16,18,18,19,19,22,22,23,23,26,26,28,28,29,29,32,32,33,33,35,35,36,36,37,37,39,39,40,40,41,41,44,44,45,45,46,46,48,48,49,49,51,51,52,52,54,54,55,55,56,56,57,57,60,60,62,62,63,63,65,65,67,67,70,70,73,73,74,74,75,75,77,77,78,78,79,79,81,81,82,82,83,83,84,84,86,86,87,87,88,88,89,89,92,92,93,93,94,94,95,95,95,95,97,97,98,98,99,99,100,100,101,101,102,102,103,103,104,104,104,104,105,105,106,106,107,107,108,108,109,109,111,111,112,112,113,113,114,114,116,116,117,117,118,118,119,119,121,121,122,122,123,123,124,124,125,125,127,127,128,128,127,127,127,127,129,129,130,130,132,132,133,133,134,134,135,135],"scheme":[0,0,6,6,6,6,10,10,10,10,14,14,14,14,17,17,17,17,20,20,20,20,24,24,27,27,27,27,30,30,30,30,34,34,34,34,34,34,38,38,38,38,38,38,42,42,42,42,42,42,47,47,47,47,50,50,50,50,53,53,53,53,53,53,53,53,58,58,61,61,61,61,64,64,66,66,68,68,71,71,71,71,71,71,76,76,76,76,76,76,80,80,80,80,80,80,80,80,85,85,85,85,85,85,85,85,90,90,90,90,90,90,90,90,90,90,96,96,96,96,96,96,96,96,85,85,85,85,85,85,85,85,85,85,90,90,90,90,90,90,90,90,90,90,110,110,110,110,110,110,110,110,115,115,115,115,115,115,115,115,120,120,120,120,120,120,120,120,120,120,126,126,126,126,126,126,126,126,126,126,126,126,131,131,131,131,131,131,131,131]},"errors":{},"models":[136,137,138,139,140,141,142,143,144,145,146,147,148,149],"cost":{"rop":[258,274,289,268,288,284,300,358,294,314,416,471,832,1110,316,322,339,319,335,338,348,414,342,362,480,530,830,1052,153,170,172,163,183,169,185,213,178,199,210,227,420,487,193,206,211,202,218,207,223,253,216,231,297,297,442,553,143,159,160,152,172,157,173,198,166,187,190,204,380,436,180,192,197,186,205,193,206,232,203,218,257,289,409,473,103,119,115,111,132,113,130,143,122,143,122,125,244,273,137,144,143,138,155,141,154,169,148,165,169,169,289,290,235,252,264,245,266,259,276,327,269,290,369,416,738,955,280,295,313,289,309,307,323,371,317,333,429,475,755,936,239,256,269,249,269,264,280,332,273,294,378,425,755,982,294,310,327,304,321,321,331,387,331,341,436,483,774,994,220,237,247,230,251,243,259,306,253,273,339,380,678,859,273,282,298,275,295,292,309,352,302,317,404,432,691,823,324,340,363,334,354,356,373,449,367,387,558,641,1115,1627,390,406,437,400,420,429,446,525,440,456,639,710,1134,1579,293,309,329,303,323,323,339,407,333,353,491,561,981,1375,350,366,388,360,380,381,398,462,392,412,567,632,994,1291,149,166,167,158,179,164,181,207,173,194,202,218,404,467,180,195,198,190,206,194,210,239,203,220,242,259,425,482,185,201,208,194,215,204,220,257,213,234,269,297,538,650,227,243,250,237,250,245,262,300,255,269,321,344,554,683,258,274,289,268,288,284,300,358,294,314,416,471,832,1110,316,322,339,319,335,338,348,414,342,362,480,530,830,1052,92,108,103,100,121,101,118,127,110,131,105,105,210,234,116,129,128,123,140,126,139,150,132,149,154,163,229,250,191,207,214,200,221,210,227,265,220,241,281,310,561,683,227,238,247,237,251,243,259,297,253,273,320,350,579,673,129,145,145,138,159,142,159,179,151,172,167,176,333,377,159,172,174,168,185,172,187,208,180,197,207,234,353,390,188,204,211,197,218,207,223,261,216,237,275,304,549,666,225,235,245,233,249,241,257,295,250,271,316,353,568,657,103,119,115,111,132,113,130,143,122,143,122,125,244,273,137,144,143,138,155,141,154,169,148,165,169,169,289,290,163,180,183,172,193,180,196,226,189,210,228,248,456,535,198,214,217,207,222,217,228,260,221,242,269,299,470,537,221,237,248,230,251,243,260,306,253,273,340,381,679,861,265,280,288,275,287,283,300,348,293,314,391,429,685,836,143,159,160,152,172,157,174,198,166,187,191,205,381,437,182,194,200,188,204,196,207,234,203,220,265,297,417,473,180,197,203,190,210,199,215,250,208,229,261,287,521,625,225,238,246,235,248,241,258,295,251,265,313,337,554,674,219,235,246,229,249,241,258,304,251,271,336,376,672,849,270,281,298,275,295,293,307,348,302,313,400,429,682,813,136,152,152,145,165,149,166,188,158,179,178,190,356,405,178,190,195,183,199,191,203,231,197,213,272,288,423,487,262,278,294,271,292,288,305,363,298,318,424,481,847,1137,327,343,354,337,348,349,364,422,358,378,506,554,852,1297,293,310,329,303,323,323,340,407,333,353,492,562,983,1377,364,380,408,374,394,401,414,484,411,416,565,682,970,1482,198,214,222,207,228,218,234,274,227,248,294,326,587,722,237,246,258,240,260,253,269,310,263,281,340,366,609,713,430,446,482,440,461,473,490,596,484,505,800,933,1599,2665,493,510,554,504,525,544,560,652,554,575,861,987,1585,2493,102,118,114,111,131,112,129,141,121,142,121,123,242,270,126,139,138,133,150,135,149,164,143,160,152,155,255,275,92,108,103,100,121,101,118,127,110,131,105,105,210,234,113,126,123,120,136,122,135,146,129,146,132,133,220,239,125,141,140,133,155,137,154,173,146,168,159,167,317,358,143,159,160,152,170,157,170,191,164,184,185,193,331,371,153,169,171,162,183,168,185,212,177,199,209,225,417,484,174,187,190,183,200,188,203,234,196,218,235,257,436,488,233,249,261,243,264,257,273,323,266,288,364,410,728,940,259,275,290,269,290,285,301,350,295,316,403,445,750,937,291,308,327,302,323,321,338,405,331,353,488,557,975,1364,333,341,360,341,352,353,369,445,363,384,533,612,1002,1312,114,130,128,123,143,125,142,158,134,155,141,146,281,315,153,158,169,153,169,169,170,188,169,182,183,224,303,332,90,106,101,98,120,99,115,125,107,129,102,101,203,227,103,117,114,110,129,112,126,135,119,138,118,120,207,229,69,86,78,77,99,76,93,96,84,106,71,67,142,163,85,98,93,91,109,91,105,110,98,115,91,90,152,169,185,201,207,194,215,203,220,256,213,233,269,296,537,648,226,242,249,236,250,244,261,299,254,268,320,343,555,640,257,273,288,267,287,283,300,357,293,314,414,469,828,1105,308,325,339,318,339,338,347,413,341,361,478,528,829,1044,141,158,159,151,171,156,172,196,165,186,189,202,365,398,166,180,182,175,192,179,193,216,187,203,219,232,365,404,92,109,104,101,122,102,118,128,110,132,106,106,211,236,110,123,120,117,135,119,132,143,126,144,128,130,221,246,130,146,146,139,160,143,159,180,152,173,168,178,335,381,149,164,165,158,176,163,177,198,170,189,191,202,342,381,159,176,179,168,190,175,192,221,185,206,221,240,441,516,179,193,199,187,206,195,209,239,204,223,244,264,444,507,157,174,176,166,188,173,189,218,182,203,217,235,433,506,185,197,203,191,211,199,215,244,208,225,249,272,449,518,348,365,391,359,380,384,400,483,394,415,612,707,1224,1847,395,411,443,406,426,435,452,533,446,467,658,762,1235,1783,326,342,366,336,357,359,375,452,369,390,563,647,1125,1649,365,382,410,376,397,402,419,487,413,434,628,697,1154,1590,173,190,194,183,204,191,207,240,200,221,247,271,494,587,205,216,226,213,230,222,237,272,231,246,282,311,517,594,201,218,226,211,232,222,238,279,231,252,301,334,601,742,232,245,259,238,259,255,264,312,259,278,340,372,607,738,231,248,260,241,262,255,271,321,265,286,361,406,722,930,261,277,289,271,292,284,300,357,293,314,405,445,747,930,314,330,352,324,345,346,362,436,356,377,537,616,1073,1547,350,366,392,360,381,385,401,483,395,416,595,652,1096,1474,81,98,91,90,110,89,106,109,98,118,84,78,126,145,96,107,102,102,117,101,113,116,107,122,100,101,136,143,103,119,115,111,132,113,130,142,122,142,120,118,187,206,121,133,130,127,142,128,141,150,135,151,135,136,192,201,113,130,127,122,143,125,141,157,134,154,136,135,210,229,132,144,143,139,154,141,154,166,149,164,154,156,211,222,144,160,161,153,173,158,175,199,167,188,188,194,294,313,167,180,181,174,191,179,193,213,186,202,204,219,296,306,76,93,86,84,105,84,100,105,92,113,80,75,126,145,88,100,95,94,110,94,106,109,100,116,93,90,127,144,95,111,106,103,124,104,121,131,113,134,109,110,188,207,111,123,120,118,135,119,132,142,126,142,125,126,192,203,105,121,118,114,134,116,132,145,124,145,126,128,213,232,122,135,133,129,146,131,144,157,138,155,141,143,227,224,138,154,155,147,168,152,168,191,161,182,181,188,294,314,157,171,172,165,182,170,183,202,176,193,194,202,296,306,138,154,155,147,168,152,168,191,161,182,181,188,294,314,157,171,172,165,182,170,183,202,176,193,194,202,296,306,168,184,188,177,198,185,201,233,194,215,237,258,473,559,195,212,215,205,222,213,227,261,221,241,276,294,493,565,194,211,218,204,225,214,230,270,223,245,287,318,574,702,223,240,246,233,252,241,258,300,251,272,323,357,596,704,230,247,258,240,261,254,270,320,263,285,359,404,718,923,259,276,287,269,290,284,298,355,291,312,402,441,741,921,314,330,352,324,345,346,362,436,356,377,537,616,1073,1547,350,366,392,360,381,385,401,483,395,416,595,652,1096,1474,77,93,86,85,106,84,101,105,93,113,80,75,126,146,88,101,95,94,110,94,106,109,101,116,93,90,129,144,95,112,107,104,125,105,121,132,114,134,110,110,184,203,111,123,121,118,135,119,132,140,125,142,125,125,185,198,107,123,120,115,136,118,134,148,126,147,128,128,205,224,123,135,134,130,146,132,144,156,138,155,141,141,202,223,137,154,154,146,167,151,168,190,160,181,180,189,298,320,156,169,170,164,181,168,182,203,175,192,193,211,300,330,137,154,154,146,167,151,168,190,160,181,180,189,298,320,156,169,170,164,181,168,182,203,175,192,193,211,300,330,82,98,92,90,111,90,107,111,98,119,86,80,131,150,98,109,105,104,118,104,115,118,109,126,102,101,142,148,107,123,120,115,136,117,134,143,126,146,119,114,173,192,123,135,132,129,144,132,143,149,138,155,133,133,177,189,113,130,127,122,142,125,141,156,133,154,134,132,204,223,133,146,144,140,155,143,155,165,149,165,156,152,206,237,152,168,170,161,181,167,183,205,176,197,187,188,271,290,174,185,191,180,199,188,198,224,191,209,207,212,279,286,147,163,165,156,177,162,178,202,171,191,187,189,278,297,171,183,186,179,194,182,195,218,190,205,212,210,301,295,79,96,89,88,108,88,104,110,96,117,85,80,134,153,95,107,102,100,116,101,113,117,107,122,102,99,141,154,105,122,118,114,134,116,132,144,124,145,120,117,181,199,121,133,133,127,144,129,143,153,136,151,136,137,183,196,111,128,125,120,141,123,139,154,131,152,134,134,211,230,132,143,141,137,153,140,152,164,147,164,150,155,227,224,143,160,161,152,173,158,174,199,167,187,187,193,292,313,166,180,181,174,191,180,193,212,189,206,203,210,334,319,79,95,88,87,107,87,103,109,95,115,84,79,133,152,96,107,103,102,116,102,113,117,107,122,102,100,140,152,101,117,113,109,130,111,127,139,119,140,117,116,187,206,121,133,132,127,143,129,141,151,136,151,136,137,196,203,116,132,129,124,145,127,144,156,136,156,133,130,196,215,134,146,147,141,155,144,155,163,150,166,152,153,200,212,144,160,161,153,173,158,175,199,167,188,186,190,286,306,169,181,185,177,192,181,194,214,189,205,207,211,315,338,171,187,191,180,201,188,204,237,197,218,242,265,484,573,206,218,225,215,230,221,237,268,230,245,298,325,487,598,221,237,248,230,251,243,260,306,253,273,340,381,679,861,258,274,284,268,284,284,292,339,288,306,378,413,687,875,238,255,268,248,269,263,279,331,273,293,376,424,751,977,285,296,312,291,307,310,320,372,314,330,420,469,739,916,264,281,297,274,295,291,307,367,301,322,429,487,858,1156,309,319,340,314,329,333,350,404,344,360,472,519,839,1068,352,369,396,363,383,388,405,489,399,419,622,718,1243,1882,408,422,449,416,433,447,455,540,449,469,673,761,1192,1780,126,143,142,135,155,139,155,175,148,168,162,170,322,362,158,169,170,164,181,169,181,200,177,194,198,204,321,344,158,175,178,167,188,174,191,219,183,204,219,237,372,391,191,208,210,201,216,208,222,251,215,231,289,289,371,386,187,203,210,197,217,206,222,260,216,236,273,302,480,505,224,238,245,232,247,241,256,292,249,269,312,334,491,520,220,236,246,229,250,242,258,304,251,272,318,336,480,505,252,263,277,259,278,270,285,320,281,295,338,355,491,520,264,281,297,274,295,291,308,367,301,322,430,488,664,689,315,326,347,321,339,340,357,409,351,362,476,539,653,670,319,336,358,330,350,352,368,443,362,382,533,552,695,720,377,389,415,388,400,407,420,493,417,430,581,602,706,703,223,240,245,233,253,242,258,286,251,272,272,276,370,390,247,263,267,260,271,260,285,318,273,292,325,305,371,384,225,241,252,234,255,247,264,312,257,278,346,378,570,609,260,277,286,272,286,282,295,342,290,305,369,412,596,579,389,405,416,398,419,412,428,468,421,442,466,476,593,615,401,413,454,408,450,450,457,517,453,450,498,512,587,605,429,445,473,439,460,466,482,554,476,496,594,623,802,837,485,493,505,453,497,501,509,552,506,518,615,652,963,864],"dim":[2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1164,1248,1248,1248,1248,1248,1248,1248,1248,1248,1248,1238,1238,1204,1179,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1115,1248,1246,1246,1246,1235,1246,1235,1225,1246,1235,1212,1200,1168,1155,1022,1022,1022,1022,1022,1022,1022,1022,1022,1022,1022,1022,1022,1022,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1681,1852,1852,1847,1852,1828,1847,1823,1815,1823,1823,1787,1775,1727,1682,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1640,1782,1782,1782,1782,1782,1782,1782,1751,1782,1761,1748,1721,1671,1645,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2167,2385,2385,2385,2385,2385,2385,2385,2358,2385,2347,2313,2287,2232,2155,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2095,2288,2288,2278,2288,2288,2278,2278,2245,2278,2278,2232,2210,2126,2091,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1430,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1501,1492,1519,1519,1519,1519,1519,1519,1519,1519,1519,1519,1519,1519,1519,1519,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2033,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,1020,1020,1020,1020,1020,1020,1020,1020,1020,1020,1020,1020,1020,1020,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,2042,2042,2042,2042,2042,2042,2042,2042,2042,2042,2042,2042,2042,2042,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1276,1280,1280,1280,1280,1280,1280,1280,1280,1280,1280,1280,1280,1280,1280,1937,1937,1937,1937,1937,1937,1937,1937,1937,1937,1937,1937,1937,1937,1952,1952,1952,1952,1952,1952,1952,1952,1952,1952,1952,1952,1952,1952,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1018,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1501,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1532,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,1961,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2034,1981,1963,1147,1147,1147,1147,1147,1147,1147,1147,1147,1147,1147,1147,1147,1147,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1152,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1401,1408,1408,1408,1408,1408,1408,1408,1408,1408,1408,1408,1408,1408,1408,1658,1658,1658,1658,1658,1658,1658,1658,1658,1658,1658,1658,1658,1658,1664,1664,1664,1664,1664,1664,1664,1664,1664,1664,1664,1664,1664,1664,889,889,889,889,889,889,889,889,889,889,889,889,889,889,1013,1004,1004,1004,995,1004,995,978,995,987,957,954,923,911,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1637,1803,1803,1778,1803,1778,1778,1778,1753,1778,1778,1721,1708,1658,1600,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1683,1878,1878,1878,1878,1878,1878,1850,1848,1878,1850,1803,1771,1721,1666,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,4073,4073,4073,4073,4073,4073,4073,4073,4073,4073,4073,4073,4073,4073,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,954,954,954,954,954,954,954,954,954,954,954,954,954,954,1008,1008,1008,1008,1008,1008,1008,1008,1009,1008,1008,1008,976,970,947,947,947,947,947,947,947,947,947,947,947,947,947,947,1008,1008,1008,1008,1008,1008,1008,1008,1008,1008,1008,1008,986,978,2019,2019,2019,2019,2019,2019,2019,2019,2019,2019,2019,2019,2019,2019,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2036,2600,2600,2600,2600,2600,2600,2600,2600,2600,2600,2600,2600,2600,2600,2612,2612,2612,2612,2612,2612,2612,2612,2612,2612,2612,2612,2612,2612,3613,3613,3613,3613,3613,3613,3613,3613,3613,3613,3613,3613,3613,3613,3644,3644,3644,3644,3644,3644,3644,3644,3644,3644,3644,3644,3644,3644,4122,4122,4122,4122,4122,4122,4122,4122,4122,4122,4122,4122,4122,4122,4124,4124,4124,4124,4124,4124,4124,4124,4124,4124,4124,4124,4124,4124,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1462,1462,1462,1462,1462,1462,1462,1462,1462,1462,1462,1462,1495,1495,1518,1516,1516,1519,1516,1516,1516,1516,1516,1516,1516,1516,1493,1489,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1190,1213,1213,1213,1213,1213,1213,1213,1214,1213,1208,1213,1214,1203,1205,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,1536,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,1352,1352,1352,1352,1352,1352,1352,1352,1352,1352,1352,1352,1220,1127,1415,1416,1408,1434,1422,1404,1401,1339,1395,1383,1406,1403,1321,1313,1522,1522,1522,1522,1522,1522,1522,1522,1522,1522,1522,1522,1522,1522,1536,1524,1524,1536,1524,1536,1524,1524,1530,1524,1530,1527,1524,1524,2027,2027,2027,2027,2027,2027,2027,2027,2027,2027,2027,2027,2027,2027,2040,2034,2033,2040,2040,2036,2040,2040,2040,2032,2040,2034,2032,2034,2516,2516,2516,2516,2516,2516,2516,2516,2516,2516,2516,2516,2516,2516,2540,2550,2550,2550,2541,2550,2540,2540,2550,2540,2540,2550,2545,2540,2045,2045,2045,2045,2045,2045,2045,2045,2045,2045,2045,2045,2045,2045,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,4097,4097,4097,4097,4097,4097,4097,4097,4097,4097,4097,4097,4097,4097,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4095,4095,4095,4095,4095,4095,4095,4095,4095,4095,4095,4095,4095,4095,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2008,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2045,2031,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2464,2560,2560,2560,2560,2560,2560,2560,2560,2560,2560,2560,2560,2541,2529,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,2973,3072,3072,3072,3072,3072,3072,3072,3072,3072,3072,3072,3072,3057,3027,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4061,4021,3936,698,698,674,698,698,674,674,593,674,674,593,545,393,393,632,604,589,671,657,610,578,595,589,633,614,649,499,412,928,928,909,928,901,909,909,871,909,904,864,744,565,565,928,912,900,925,859,875,871,852,868,887,790,767,673,618,987,987,999,987,987,999,999,947,999,987,880,803,607,607,989,951,966,984,944,970,944,923,984,947,945,913,684,615,1170,1170,1185,1185,1170,1185,1185,1156,1185,1185,1053,951,738,707,1216,1188,1188,1209,1195,1139,1195,1141,1168,1157,1086,1148,839,801,877,877,877,877,877,877,877,837,877,877,837,752,567,567,828,839,819,821,803,821,807,780,839,806,822,801,618,656,1021,1021,1021,1021,1021,1021,1021,1021,1021,1021,1021,1021,742,742,1023,1030,1012,1009,1034,1019,1027,1016,1030,1001,984,943,870,826,1102,1102,1102,1102,1102,1102,1102,1102,1102,1102,1102,1075,736,736,1110,1112,1085,1087,1105,1102,1108,1097,1111,1100,1077,1026,1001,833,1337,1337,1337,1337,1337,1337,1337,1368,1337,1337,1306,1177,856,850,1377,1362,1362,1384,1352,1362,1359,1308,1330,1320,1273,1265,1092,953,1337,1337,1337,1337,1337,1337,1337,1368,1337,1337,1306,1177,856,850,1377,1362,1362,1384,1352,1362,1359,1308,1330,1320,1273,1265,1092,953,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,1980,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2048,2045,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2473,2560,2560,2560,2560,2560,2560,2560,2560,2560,2560,2560,2560,2541,2537,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,2940,3072,3072,3072,3072,3072,3072,3072,3072,3072,3072,3072,3072,3057,3027,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,3914,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4096,4061,4021,3936,859,859,845,859,859,859,859,803,845,859,803,766,578,578,828,839,819,823,780,823,783,770,837,813,821,754,641,655,1035,1035,1035,1035,1035,1035,1035,1035,1035,1035,1019,919,708,708,1043,1011,1035,1039,1024,1009,1014,934,1013,995,947,975,820,799,1095,1095,1102,1095,1095,1102,1102,1107,1102,1102,1090,1004,705,705,1141,1107,1124,1128,1100,1126,1052,1074,1097,1078,1022,974,757,863,1438,1438,1438,1438,1438,1438,1438,1468,1438,1438,1404,1330,949,941,1483,1477,1473,1502,1484,1473,1462,1440,1450,1439,1393,1467,1222,1210,1438,1438,1438,1438,1438,1438,1438,1468,1438,1438,1404,1330,949,941,1483,1477,1473,1502,1484,1473,1462,1440,1450,1439,1393,1467,1222,1210,686,686,686,686,686,686,686,622,686,686,622,548,427,427,696,670,668,693,637,629,609,567,644,673,596,593,536,415,850,850,850,850,850,850,850,690,850,850,690,642,464,464,819,807,713,814,752,812,778,674,812,822,668,663,505,468,908,908,884,908,880,884,884,827,884,884,740,702,525,525,890,887,850,901,854,901,867,817,872,862,866,746,590,704,1142,1142,1098,1142,1142,1098,1098,960,1098,1098,844,748,597,597,1086,1061,1122,1100,1133,1122,1054,1101,1034,1045,959,916,728,598,1105,1105,1110,1105,1105,1110,1110,1013,1110,1110,893,826,611,592,1104,1040,1091,1117,1085,1065,1064,1075,1091,1036,1044,918,847,657,755,755,750,750,755,750,750,743,750,750,700,679,475,475,733,742,745,708,733,705,713,690,728,718,742,686,589,582,921,921,918,921,921,918,918,825,918,918,825,704,582,550,887,890,927,878,897,882,892,886,872,835,847,844,549,567,958,958,958,958,958,958,958,974,958,958,924,821,604,604,1009,966,968,979,958,968,937,926,965,979,879,929,808,641,1192,1192,1192,1192,1192,1192,1192,1164,1192,1192,1032,978,734,734,1203,1210,1186,1175,1212,1203,1198,1149,1230,1220,1070,1048,1071,902,666,666,666,666,666,666,666,657,666,666,626,615,451,451,672,631,654,678,643,659,654,627,634,623,654,638,465,451,819,819,819,819,819,819,819,801,819,819,762,745,528,528,814,807,845,809,813,823,791,760,818,807,773,747,642,569,898,898,901,898,898,901,901,782,901,901,694,649,502,502,901,859,911,888,855,888,858,768,889,870,800,782,535,503,1074,1074,1085,1085,1074,1085,1085,1058,1085,1085,929,852,641,610,1091,1081,1106,1113,1087,1081,1076,1048,1087,1087,1010,918,903,897,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1527,1524,1524,1524,1536,1524,1524,1524,1524,1524,1524,1527,1527,1524,1524,1969,1969,1969,1969,1969,1969,1969,1969,1969,1969,1969,1969,1969,1970,2032,2032,2018,2032,2020,2032,2032,2016,2016,2032,2032,2016,2012,1947,2046,2046,2046,2046,2046,2046,2046,2046,2046,2046,2046,2046,2046,2046,2040,2041,2048,2041,2032,2032,2040,2032,2040,2032,2032,2040,2016,2036,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2428,2540,2550,2540,2521,2540,2540,2540,2550,2540,2560,2550,2494,2436,2428,2917,2917,2917,2917,2917,2917,2917,2917,2917,2917,2917,2917,2917,2918,3030,3024,3030,3024,3060,3048,3024,3030,3024,3024,2988,2967,2857,2837,941,941,941,941,941,941,941,941,941,941,941,940,937,934,1042,1026,1022,1042,1033,1034,1014,998,1034,1026,1020,998,950,918,1216,1216,1216,1216,1216,1216,1216,1216,1216,1216,1216,1216,634,611,1305,1312,1293,1305,1293,1302,1293,1271,1293,1283,1256,1256,681,675,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,1436,904,871,1544,1538,1527,1543,1527,1533,1527,1513,1527,1535,1499,1466,1234,1152,1672,1672,1672,1672,1672,1672,1672,1668,1672,1672,1341,1256,904,871,1727,1691,1724,1702,1723,1687,1694,1613,1720,1675,1517,1449,1234,1152,1898,1898,1898,1898,1898,1898,1898,1898,1898,1898,1898,1898,991,957,2022,1996,1993,2000,1993,1993,1993,1942,1993,1949,1936,1943,1209,1006,2280,2280,2280,2280,2280,2280,2280,2280,2280,2280,1341,1256,904,871,2451,2457,2448,2484,2448,2448,2430,2410,2448,2412,1980,1776,1264,959,1381,1381,1253,1381,1381,1280,1280,1058,1248,1248,906,870,641,641,1421,1479,1409,1506,1429,1367,1530,1428,1453,1440,1336,1103,681,677,1732,1732,1732,1732,1732,1732,1732,1732,1732,1732,1664,1477,1155,983,1779,1811,1762,1812,1758,1776,1758,1754,1764,1731,1676,1709,1420,1127,1901,1901,1700,1901,1901,1700,1700,1391,1700,1700,1191,1097,815,801,1966,2008,2214,1916,2222,2170,2119,2247,2080,1792,1629,1526,954,861,2869,2869,2608,2869,2869,2666,2666,2217,2666,2666,1724,1556,1153,1099,2598,2453,2810,2830,2970,2906,2807,2490,2856,2856,2179,2134,2169,1130],"flag":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,0,1,0,1,1,1,1,1,1,1,1,0,1,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"inst":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,1,0,0,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,1,0,0,1,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,1],"beta":[971,971,971,971,971,971,971,971,971,971,971,971,971,971,1191,1149,1135,1149,1149,1135,1135,1123,1135,1135,1085,1058,968,931,577,577,577,577,577,577,577,577,577,577,577,577,577,577,726,707,707,726,707,707,707,685,707,689,647,647,600,566,536,536,536,536,536,536,536,536,536,536,536,536,536,536,676,660,660,660,644,660,644,629,660,644,610,594,551,535,386,386,386,386,386,386,386,386,386,386,386,386,386,386,480,480,480,480,471,480,471,454,471,462,454,454,402,402,886,886,886,886,886,886,886,886,886,886,886,886,886,886,1049,1049,1049,1049,1049,1049,1049,1007,1049,1015,970,977,901,875,901,901,901,901,901,901,901,901,901,901,901,901,901,901,1106,1106,1098,1106,1069,1098,1062,1049,1062,1062,1007,989,919,857,830,830,830,830,830,830,830,830,830,830,830,830,830,830,999,999,999,999,999,999,999,955,999,968,949,911,842,808,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1219,1468,1468,1468,1468,1468,1468,1468,1425,1468,1408,1356,1316,1236,1128,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1104,1318,1318,1304,1318,1318,1304,1304,1255,1304,1304,1236,1206,1089,1043,561,561,561,561,561,561,561,561,561,561,561,561,561,561,677,661,663,679,661,663,663,647,663,647,641,625,582,573,696,696,696,696,696,696,696,696,696,696,696,696,696,696,854,854,838,854,829,838,838,814,838,814,795,773,712,679,971,971,971,971,971,971,971,971,971,971,971,971,971,971,1191,1149,1135,1149,1149,1135,1135,1123,1135,1135,1085,1058,968,931,345,345,345,345,345,345,345,345,345,345,345,345,345,345,436,420,428,428,412,428,412,405,420,405,401,392,368,362,718,718,718,718,718,718,718,718,718,718,718,718,718,718,854,830,830,854,830,830,830,807,830,830,790,780,736,710,485,485,485,485,485,485,485,485,485,485,485,485,485,485,597,584,583,597,584,583,583,558,583,570,570,543,507,497,707,707,707,707,707,707,707,707,707,707,707,707,707,707,846,822,822,822,822,822,822,799,822,822,780,787,725,699,386,386,386,386,386,386,386,386,386,386,386,386,386,386,480,480,480,480,471,480,471,454,471,462,454,454,402,402,614,614,614,614,614,614,614,614,614,614,614,614,614,614,744,744,724,744,724,724,724,706,724,724,694,679,628,615,831,831,831,831,831,831,831,831,831,831,831,831,831,831,998,967,968,998,967,968,968,945,968,968,926,899,837,816,537,537,537,537,537,537,537,537,537,537,537,537,537,537,685,669,669,669,652,669,652,634,652,652,609,593,550,536,679,679,679,679,679,679,679,679,679,679,679,679,679,679,847,823,825,847,823,825,825,800,825,803,780,759,685,660,824,824,824,824,824,824,824,824,824,824,824,824,824,824,997,997,1000,997,997,1000,968,944,1000,968,916,907,834,802,510,510,510,510,510,510,510,510,510,510,510,510,510,510,669,653,653,653,637,653,637,607,637,622,571,567,516,498,985,985,985,985,985,985,985,985,985,985,985,985,985,985,1232,1232,1188,1232,1188,1188,1188,1146,1188,1188,1092,1071,989,900,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1105,1370,1370,1370,1370,1370,1370,1317,1314,1370,1317,1232,1177,1092,1001,744,744,744,744,744,744,744,744,744,744,744,744,744,744,891,865,865,865,865,865,865,841,865,840,831,808,765,738,1619,1619,1619,1619,1619,1619,1619,1619,1619,1619,1619,1619,1619,1619,1860,1860,1860,1860,1860,1860,1860,1771,1860,1860,1716,1674,1608,1559,383,383,383,383,383,383,383,383,383,383,383,383,383,383,474,455,461,464,447,461,453,444,457,444,452,444,398,388,345,345,345,345,345,345,345,345,345,345,345,345,345,345,424,409,412,416,401,412,405,395,405,397,402,402,357,350,468,468,468,468,468,468,468,468,468,468,468,468,468,468,536,536,536,536,525,536,525,514,525,525,525,516,483,479,574,574,574,574,574,574,574,574,574,574,574,574,574,574,654,638,638,654,638,638,638,635,638,638,621,628,594,577,877,877,877,877,877,877,877,877,877,877,877,877,877,877,974,974,974,974,974,974,974,950,974,974,947,918,897,875,1098,1098,1098,1098,1098,1098,1098,1098,1098,1098,1098,1098,1098,1098,1253,1207,1207,1207,1207,1207,1207,1207,1207,1207,1177,1177,1122,1073,428,428,428,428,428,428,428,428,428,428,428,428,428,428,534,534,520,534,523,520,520,509,520,520,520,479,453,444,337,337,337,337,337,337,337,337,337,337,337,337,335,335,387,379,381,381,373,381,375,365,375,368,375,375,342,338,260,260,260,260,260,260,260,260,260,260,260,260,260,260,315,306,310,310,296,310,301,295,306,288,309,310,272,268,695,695,695,695,695,695,695,695,695,695,695,695,695,695,851,851,835,851,827,835,835,812,835,812,793,771,703,689,968,968,968,968,968,968,968,968,968,968,968,968,968,968,1161,1161,1132,1161,1161,1132,1132,1120,1132,1132,1082,1055,965,930,532,532,532,532,532,532,532,532,532,532,532,532,458,422,618,612,604,623,608,605,597,560,600,586,590,586,517,507,347,347,347,347,347,347,347,347,347,347,347,347,347,347,408,398,398,408,391,402,391,384,396,384,396,394,358,352,488,488,488,488,488,488,488,488,488,488,488,488,488,488,557,552,551,557,545,554,545,534,545,539,536,532,495,488,599,599,599,599,599,599,599,599,599,599,599,599,599,599,674,665,665,665,659,665,658,648,665,658,646,638,602,592,591,591,591,591,591,591,591,591,591,591,591,591,591,591,696,679,679,679,679,679,679,661,679,662,656,643,607,591,1312,1312,1312,1312,1312,1312,1312,1312,1312,1312,1312,1312,1312,1312,1489,1489,1489,1489,1489,1489,1489,1446,1489,1489,1388,1388,1321,1250,1228,1228,1228,1228,1228,1228,1228,1228,1228,1228,1228,1228,1228,1228,1376,1376,1376,1376,1376,1376,1376,1323,1376,1376,1338,1298,1253,1177,652,652,652,652,652,652,652,652,652,652,652,652,652,652,771,751,758,764,751,758,738,738,758,738,719,719,660,648,757,757,757,757,757,757,757,757,757,757,757,757,757,757,859,859,846,859,859,871,846,846,846,846,832,818,763,754,871,871,871,871,871,871,871,871,871,871,871,871,871,871,982,982,968,982,982,968,968,968,968,968,951,931,894,871,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1317,1317,1317,1317,1317,1317,1317,1268,1317,1317,1282,1235,1203,1138,304,304,290,304,304,290,290,243,290,290,243,214,134,134,312,285,280,331,310,294,264,272,276,292,296,315,205,155,386,386,382,386,384,382,382,361,382,383,347,295,200,200,442,423,419,436,388,406,396,380,398,399,353,342,265,233,423,423,422,423,423,422,422,396,422,423,367,323,215,215,478,447,458,470,439,460,439,421,465,436,438,419,270,232,541,541,536,536,541,536,536,521,536,536,466,411,283,274,618,591,591,606,590,564,590,547,578,564,519,552,351,327,286,286,286,286,286,286,286,265,286,286,265,234,152,152,304,300,294,295,277,295,281,267,300,277,297,290,187,198,355,355,355,355,355,355,355,355,355,355,355,355,225,225,398,393,387,386,389,391,388,378,393,371,370,351,293,271,394,394,394,394,394,394,394,394,394,394,394,380,229,229,441,434,422,426,426,432,427,417,433,419,414,390,351,274,518,518,518,518,518,518,518,515,518,518,488,432,290,276,579,564,564,576,552,564,556,523,546,534,509,502,394,326,518,518,518,518,518,518,518,515,518,518,488,432,290,276,579,564,564,576,552,564,556,523,546,534,509,502,394,326,631,631,631,631,631,631,631,631,631,631,631,631,631,631,735,735,721,735,716,721,721,709,721,721,709,691,651,636,731,731,731,731,731,731,731,731,731,731,731,731,731,731,840,840,825,840,816,825,825,813,825,825,800,793,735,732,867,867,867,867,867,867,867,867,867,867,867,867,867,867,976,976,962,976,976,962,962,962,962,962,945,925,889,866,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1183,1317,1317,1317,1317,1317,1317,1317,1268,1317,1317,1282,1235,1203,1138,286,286,276,286,286,286,286,255,276,286,255,234,157,157,304,300,294,296,267,296,271,263,298,280,296,270,197,197,358,358,358,358,358,358,358,358,358,358,355,305,215,215,405,385,396,399,384,386,381,340,384,368,354,366,272,259,401,401,400,401,401,400,400,393,400,400,388,345,215,215,455,432,441,446,424,442,401,406,426,408,389,366,245,287,515,515,515,515,515,515,515,513,515,515,491,448,297,295,574,564,563,578,563,563,551,534,551,539,516,545,413,403,515,515,515,515,515,515,515,513,515,515,491,448,297,295,574,564,563,578,563,563,551,534,551,539,516,545,413,403,302,302,302,302,302,302,302,255,302,302,255,223,150,150,352,327,328,345,300,307,285,258,311,319,289,290,226,157,397,397,397,397,397,397,397,299,397,397,299,265,172,172,430,413,357,422,374,421,392,321,417,414,330,328,210,185,425,425,421,425,423,421,421,383,421,421,335,300,207,207,477,467,443,478,440,478,447,411,456,440,447,373,256,315,569,569,552,569,569,552,552,465,552,552,388,333,240,240,606,584,622,615,626,622,573,591,563,560,505,474,332,255,553,553,552,553,553,552,552,498,552,552,429,383,258,240,621,570,601,626,592,588,580,578,601,555,557,477,402,287,297,297,293,293,297,293,293,281,293,293,259,248,151,151,329,325,329,310,313,308,304,289,315,302,326,300,223,214,393,393,388,393,393,388,388,326,388,388,326,272,204,184,417,411,433,407,410,408,406,398,397,369,384,382,204,207,418,418,418,418,418,418,418,414,418,418,388,337,214,214,485,453,457,464,443,457,432,420,453,450,401,426,333,244,537,537,537,537,537,537,537,529,537,537,446,410,281,281,605,603,587,587,597,599,588,552,610,596,509,494,475,379,295,295,295,295,295,295,295,290,295,295,259,254,158,158,338,303,320,335,304,324,313,293,305,288,320,313,189,175,378,378,378,378,378,378,378,364,378,378,339,326,209,209,427,414,438,419,411,426,399,374,419,403,389,374,283,239,427,427,419,427,427,419,419,350,419,419,305,274,190,190,484,448,483,470,441,470,443,380,465,443,406,394,226,204,541,541,536,536,541,536,536,523,536,536,452,394,270,257,609,595,606,619,593,595,584,558,593,585,534,475,432,424,642,642,642,642,642,642,642,642,642,642,642,642,642,642,774,753,753,771,753,753,753,726,753,733,706,694,645,619,831,831,831,831,831,831,831,831,831,831,831,831,831,828,971,971,953,971,956,971,941,921,950,941,901,882,837,784,898,898,898,898,898,898,898,898,898,898,898,898,898,898,1070,1051,1047,1051,1038,1058,1035,1009,1035,1023,978,967,887,863,995,995,995,995,995,995,995,995,995,995,995,995,995,995,1165,1136,1140,1142,1124,1140,1140,1095,1140,1124,1070,1039,978,948,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1328,1321,1536,1528,1506,1528,1508,1530,1499,1466,1499,1499,1413,1387,1285,1226,474,474,474,474,474,474,474,474,474,474,474,472,466,457,584,572,566,584,571,573,554,538,573,561,552,534,470,447,595,595,595,595,595,595,595,595,595,595,595,595,272,254,720,716,701,720,701,709,701,670,701,685,648,648,304,296,704,704,704,704,704,704,704,704,704,704,704,704,386,358,842,833,818,833,818,822,818,791,818,812,779,755,565,512,822,822,822,822,822,822,822,815,822,822,619,578,386,358,934,909,921,917,917,907,897,837,915,884,770,724,565,512,996,996,996,996,996,996,996,996,996,996,996,996,378,362,1187,1166,1164,1169,1164,1164,1164,1109,1164,1130,1078,1064,495,389,1203,1203,1203,1203,1203,1203,1203,1203,1203,1203,619,578,386,358,1422,1398,1392,1418,1392,1392,1379,1337,1392,1366,1062,921,582,408,714,714,634,714,714,655,655,519,645,645,428,396,266,266,823,865,816,885,828,782,900,806,836,825,740,584,304,295,844,844,844,844,844,844,844,844,844,844,817,708,507,423,973,980,950,981,943,959,943,920,951,925,866,875,697,499,947,947,828,947,947,828,828,656,828,828,542,487,330,326,1101,1125,1240,1065,1245,1210,1175,1252,1148,962,842,771,411,357,1433,1433,1270,1433,1433,1310,1310,1044,1310,1310,765,679,461,428,1571,1468,1486,1533,1589,1547,1484,1281,1515,1515,1071,1040,1017,515]},"params":[{"category":[5],"n":1024,"q":12289,"secret_distribution":"normal","claimed":255,"ring":"x^n+1","sd":2.8284271247461903},{"category":[2],"k":2,"n":624,"q":1024,"secret_distribution":"normal","claimed":152,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":1.0},{"category":[2],"k":2,"n":624,"q":1024,"secret_distribution":"normal","claimed":141,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.7905694150420949},{"category":[1],"n":512,"q":12289,"secret_distribution":"normal","claimed":101,"ring":"x^n+1","sd":2.0},{"category":[5],"n":1024,"q":12289,"secret_distribution":"normal","claimed":233,"ring":"x^n+1","sd":2.0},{"category":[5],"k":3,"n":936,"q":1024,"secret_distribution":"normal","claimed":237,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.9354143466934853},{"category":[4],"k":3,"n":936,"q":1024,"secret_distribution":"normal","claimed":219,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.7071067811865476},{"category":[5],"k":4,"n":1248,"q":1024,"secret_distribution":"normal","claimed":320,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.8660254037844386},{"category":[5],"k":4,"n":1248,"q":1024,"secret_distribution":"normal","claimed":292,"ring":"q^{n/k} - q^{n/(2k)} - 1","sd":0.6123724356957945},{"category":[4],"k":3,"n":768,"q":7681,"secret_distribution":"normal","claimed":147,"ring":"x^{n/k}+1","sd":1.0},{"category":[4],"k":3,"n":768,"q":7681,"secret_distribution":"normal","claimed":183,"ring":"x^{n/k}+1","sd":2.23606797749979},{"category":[1],"n":512,"q":120883,"secret_distribution":"normal","claimed":"","ring":"x^n+1","sd":4.19},{"category":[3,5],"n":1024,"q":120883,"secret_distribution":"normal","claimed":"","ring":"x^n+1","sd":2.6},{"category":[1],"n":640,"q":32768,"secret_distribution":"normal","claimed":103,"sd":2.75},{"category":[3],"n":976,"q":65536,"secret_distribution":"normal","claimed":150,"sd":2.3},{"category":[1],"k":2,"n":512,"q":7681,"secret_distribution":"normal","claimed":102,"ring":"x^{n/k}+1","sd":1.5811388300841898},{"category":[3],"k":3,"n":768,"q":7681,"secret_distribution":"normal","claimed":161,"ring":"x^{n/k}+1","sd":1.4142135623730951},{"category":[5],"k":4,"n":1024,"q":7681,"secret_distribution":"normal","claimed":218,"ring":"x^{n/k}+1","sd":1.224744871391589},{"category":[1,2],"n":576,"q":8192,"secret_distribution":"normal","claimed":"","sd":3.0},{"category":[3,4],"n":704,"q":8192,"secret_distribution":"normal","claimed":"","sd":3.0},{"category":[5],"n":832,"q":8192,"secret_distribution":"normal","claimed":"","sd":3.0},{"category":[1,2],"n":512,"q":251,"secret_distribution":"normal","claimed":128,"ring":"x^n+1","sd":0.7071067811865476},{"category":[3,4],"n":1024,"q":251,"secret_distribution":"normal","claimed":192,"ring":"x^n+1","sd":0.5},{"category":[5],"n":1024,"q":251,"secret_distribution":"normal","claimed":256,"ring":"x^n+1","sd":0.7071067811865476},{"category":[3],"n":1024,"q":133121,"secret_distribution":"normal","claimed":208,"ring":"x^n+1","sd":3.1622776601683795},{"category":[4],"n":2048,"q":184321,"secret_distribution":"normal","claimed":444,"ring":"x^n+1","sd":3.1622776601683795},{"category":[1],"n":512,"q":65536,"secret_distribution":"(-1, 1)","claimed":128,"ring":"x^n+1 \\text{ \\textdagger}","sd":25.0},{"category":[1],"n":512,"q":16384,"secret_distribution":"(-1, 1)","claimed":128,"ring":"x^n+1 \\text{ \\textdagger}","sd":3.0},{"category":[1],"n":1018,"q":12521473,"secret_distribution":"normal","claimed":139,"ring":"\\sum_{i=0}^n x^i","sd":3.1622776601683795},{"category":[2],"n":1306,"q":48181249,"secret_distribution":"normal","claimed":167,"ring":"\\sum_{i=0}^n x^i","sd":3.1622776601683795},{"category":[3],"n":1822,"q":44802049,"secret_distribution":"normal","claimed":247,"ring":"\\sum_{i=0}^n x^i","sd":3.1622776601683795},{"category":[4],"n":2062,"q":16900097,"secret_distribution":"normal","claimed":303,"ring":"\\sum_{i=0}^n x^i","sd":3.1622776601683795},{"category":[1],"k":2,"n":512,"q":8192,"secret_distribution":"normal","claimed":115,"ring":"x^{n/k} + 1","sd":2.29128784747792},{"category":[1],"n":770,"q":16777216,"secret_distribution":"(-1, 1)","claimed":128,"sd":25.0},{"category":[1],"n":611,"q":16777216,"secret_distribution":"(-2, 2)","claimed":128,"sd":25.0},{"category":[3],"k":3,"n":768,"q":8192,"secret_distribution":"normal","claimed":180,"ring":"x^{n/k} + 1","sd":2.29128784747792},{"category":[5],"k":4,"n":1024,"q":8192,"secret_distribution":"normal","claimed":245,"ring":"x^{n/k} + 1","sd":2.29128784747792},{"category":[5],"n":761,"q":4591,"secret_distribution":"((-1, 1), 250)","claimed":225,"ring":"x^n - x - 1","sd":0.816496580927726},{"category":[1],"k":3,"n":768,"q":8380417,"secret_distribution":"(-6, 6)","claimed":91,"ring":"x^{n/k}+1","sd":3.7416573867739413},{"category":[2],"k":4,"n":1024,"q":8380417,"secret_distribution":"(-5, 5)","claimed":125,"ring":"x^{n/k}+1","sd":3.1622776601683795},{"category":[3],"k":5,"n":1280,"q":8380417,"secret_distribution":"(-3, 3)","claimed":158,"ring":"x^{n/k}+1","sd":2.0},{"category":[1],"n":1024,"q":8058881,"secret_distribution":"normal","claimed":128,"ring":"x^n + 1","sd":8.493218002880191},{"category":[3],"n":2048,"q":12681217,"secret_distribution":"normal","claimed":192,"ring":"x^n + 1","sd":8.493218002880191},{"category":[5],"n":2048,"q":27627521,"secret_distribution":"normal","claimed":256,"ring":"x^n + 1","sd":8.493218002880191},{"category":[1],"n":1024,"q":86017,"secret_distribution":"normal","claimed":128,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[1],"n":1280,"q":301057,"secret_distribution":"normal","claimed":160,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[3],"n":1536,"q":737281,"secret_distribution":"normal","claimed":192,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[5],"n":2048,"q":1198081,"secret_distribution":"normal","claimed":256,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[1],"n":420,"q":1024,"secret_distribution":"((-1, 1), 62)","claimed":74,"ring":"\\sum_{i=0}^n x^i","sd":1.118033988749895},{"category":[2],"n":540,"q":8192,"secret_distribution":"((-1, 1), 96)","claimed":97,"ring":"\\sum_{i=0}^n x^i","sd":4.6097722286464435},{"category":[3],"n":586,"q":8192,"secret_distribution":"((-1, 1), 104)","claimed":107,"ring":"\\sum_{i=0}^n x^i","sd":4.6097722286464435},{"category":[4,5],"n":708,"q":32768,"secret_distribution":"((-1, 1), 140)","claimed":138,"ring":"\\sum_{i=0}^n x^i","sd":18.472953201911167},{"category":[1],"n":500,"q":16384,"secret_distribution":"((-1, 1), 74)","claimed":74,"sd":2.29128784747792},{"category":[2],"n":580,"q":32768,"secret_distribution":"((-1, 1), 116)","claimed":96,"sd":4.6097722286464435},{"category":[3],"n":630,"q":32768,"secret_distribution":"((-1, 1), 126)","claimed":106,"sd":4.6097722286464435},{"category":[4],"n":786,"q":32768,"secret_distribution":"((-1, 1), 156)","claimed":139,"sd":4.6097722286464435},{"category":[5],"n":786,"q":32768,"secret_distribution":"((-1, 1), 156)","claimed":138,"sd":4.6097722286464435},{"category":[1],"n":1024,"q":118273,"secret_distribution":"normal","claimed":128,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[1],"n":1280,"q":430081,"secret_distribution":"normal","claimed":160,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[3],"n":1536,"q":783361,"secret_distribution":"normal","claimed":192,"ring":"x^n + \\sum^{n-1}_{i=1} f_i x^i + f_0 \\text{ *}","sd":1.4142135623730951},{"category":[1],"n":500,"q":32768,"secret_distribution":"((-1, 1), 74)","claimed":74,"sd":4.6097722286464435},{"category":[2],"n":585,"q":32768,"secret_distribution":"((-1, 1), 110)","claimed":96,"sd":4.6097722286464435},{"category":[3],"n":643,"q":32768,"secret_distribution":"((-1, 1), 114)","claimed":106,"sd":4.6097722286464435},{"category":[4],"n":835,"q":32768,"secret_distribution":"((-1, 1), 166)","claimed":138,"sd":2.29128784747792},{"category":[5],"n":835,"q":32768,"secret_distribution":"((-1, 1), 166)","claimed":138,"sd":2.29128784747792},{"category":[1],"n":418,"q":4096,"secret_distribution":"((-1, 1), 66)","claimed":75,"ring":"\\sum_{i=0}^n x^i","sd":4.6097722286464435},{"category":[2],"n":522,"q":32768,"secret_distribution":"((-1, 1), 78)","claimed":97,"ring":"\\sum_{i=0}^n x^i","sd":36.94928957368463},{"category":[3],"n":540,"q":16384,"secret_distribution":"((-1, 1), 96)","claimed":106,"ring":"\\sum_{i=0}^n x^i","sd":18.472953201911167},{"category":[4],"n":700,"q":32768,"secret_distribution":"((-1, 1), 112)","claimed":140,"ring":"\\sum_{i=0}^n x^i","sd":36.94928957368463},{"category":[5],"n":676,"q":32768,"secret_distribution":"((-1, 1), 120)","claimed":139,"ring":"\\sum_{i=0}^n x^i","sd":36.94928957368463},{"category":[1],"n":442,"q":2659,"secret_distribution":"((-1, 1), 74)","claimed":74,"ring":"\\sum_{i=0}^n x^i","sd":1.4711384933077167},{"category":[2],"n":556,"q":3343,"secret_distribution":"((-1, 1), 88)","claimed":97,"ring":"\\sum_{i=0}^n x^i","sd":1.8626083342516564},{"category":[3],"n":576,"q":2309,"secret_distribution":"((-1, 1), 108)","claimed":106,"ring":"\\sum_{i=0}^n x^i","sd":1.2694482394736055},{"category":[4,5],"n":708,"q":2837,"secret_distribution":"((-1, 1), 140)","claimed":138,"ring":"\\sum_{i=0}^n x^i","sd":1.5732888629792405},{"category":[1],"n":400,"q":3209,"secret_distribution":"((-1, 1), 72)","claimed":74,"ring":"\\sum_{i=0}^n x^i","sd":3.6070549183961935},{"category":[2],"n":486,"q":1949,"secret_distribution":"((-1, 1), 96)","claimed":97,"ring":"\\sum_{i=0}^n x^i","sd":2.1787238503231188},{"category":[3],"n":556,"q":3343,"secret_distribution":"((-1, 1), 88)","claimed":106,"ring":"\\sum_{i=0}^n x^i","sd":3.758621985155586},{"category":[4,5],"n":658,"q":1319,"secret_distribution":"((-1, 1), 130)","claimed":139,"ring":"\\sum_{i=0}^n x^i","sd":1.4590706550793462},{"category":[2],"k":3,"n":768,"q":16384,"secret_distribution":"(-4, 4)","claimed":164,"ring":"x^{n/k}+1","sd":2.29128784747792},{"category":[4],"k":2,"n":1024,"q":8192,"secret_distribution":"(-2, 2)","claimed":207,"ring":"x^{n/k}+1","sd":1.118033988749895},{"category":[4],"k":2,"n":1024,"q":16384,"secret_distribution":"(-4, 4)","claimed":232,"ring":"x^{n/k}+1","sd":2.29128784747792},{"category":[5],"k":5,"n":1280,"q":16384,"secret_distribution":"(-2, 2)","claimed":251,"ring":"x^{n/k}+1","sd":1.118033988749895},{"category":[5],"k":3,"n":1536,"q":8192,"secret_distribution":"(-2, 2)","claimed":330,"ring":"x^{n/k}+1","sd":1.118033988749895},{"category":[1],"n":1024,"q":2048,"secret_distribution":"((-1, 1), 140)","claimed":130,"sd":1.118033988749895},{"category":[1],"n":536,"q":2048,"secret_distribution":"((-1, 1), 268)","claimed":133,"sd":2.58555},{"category":[1],"n":1024,"q":1024,"secret_distribution":"((-1, 1), 128)","claimed":147,"sd":1.118033988749895},{"category":[1],"n":663,"q":1024,"secret_distribution":"((-1, 1), 497)","claimed":131,"sd":0.891},{"category":[3],"n":1024,"q":2048,"secret_distribution":"((-1, 1), 200)","claimed":195,"sd":1.118033988749895},{"category":[3],"n":816,"q":2048,"secret_distribution":"((-1, 1), 408)","claimed":193,"sd":1.3394},{"category":[3],"n":952,"q":2048,"secret_distribution":"((-1, 1), 714)","claimed":203,"sd":1.675967},{"category":[5],"n":2048,"q":4096,"secret_distribution":"((-1, 1), 200)","claimed":257,"sd":1.118033988749895},{"category":[5],"n":1088,"q":4096,"secret_distribution":"((-1, 1), 544)","claimed":266,"sd":3.11251},{"category":[5],"n":2048,"q":2048,"secret_distribution":"((-1, 1), 200)","claimed":291,"sd":1.118033988749895},{"category":[5],"n":1300,"q":2048,"secret_distribution":"((-1, 1), 975)","claimed":264,"sd":1.072223},{"category":[1],"n":1024,"q":1024,"secret_distribution":"((-1, 1), 128)","claimed":147,"ring":"x^n+1","sd":1.118033988749895},{"category":[1],"n":1024,"q":1024,"secret_distribution":"((-1, 1), 128)","claimed":153,"ring":"x^n+1","sd":1.069416},{"category":[3],"n":1024,"q":2048,"secret_distribution":"((-1, 1), 264)","claimed":195,"ring":"x^n+1","sd":1.118033988749895},{"category":[3],"n":1024,"q":2048,"secret_distribution":"((-1, 1), 256)","claimed":195,"ring":"x^n+1","sd":1.458989},{"category":[3],"n":2048,"q":2048,"secret_distribution":"((-1, 1), 164)","claimed":291,"ring":"x^n+1","sd":1.118033988749895},{"category":[3],"n":2048,"q":2048,"secret_distribution":"((-1, 1), 184)","claimed":304,"ring":"x^n+1","sd":2.002534},{"category":[5],"n":2048,"q":4096,"secret_distribution":"((-1, 1), 256)","claimed":348,"ring":"x^n+1","sd":1.118033988749895},{"category":[5],"n":2048,"q":4096,"secret_distribution":"((-1, 1), 256)","claimed":318,"ring":"x^n+1","sd":2.635593}],"ms":["n"],"strings":["KCL\u2011RLWE","KEM","RLWE","primal","KCL\u2011RLWE-1024-2.83-12289","dual","BabyBear","ILWE","BabyBear-0624-1.00-1024","BabyBear-0624-0.79-1024","NewHope","PKE","NewHope-0512-2.00-12289","NewHope-1024-2.00-12289","MamaBear","MamaBear-0936-0.94-1024","MamaBear-0936-0.71-1024","PapaBear","PapaBear-1248-0.87-1024","PapaBear-1248-0.61-1024","KCL\u2011MLWE","MLWE","KCL\u2011MLWE-0768-1.00-7681","KCL\u2011MLWE-0768-2.24-7681","HILA5","KE","HILA5-1024-2.83-12289","Ding Key Exchange","Ding Key Exchange-0512-4.19-120883","Ding Key Exchange-1024-2.60-120883","Frodo","LWE","Frodo-0640-2.75-32768","Frodo-0976-2.30-65536","CRYSTALS\u2011Kyber","CRYSTALS\u2011Kyber-0512-1.58-7681","CRYSTALS\u2011Kyber-0768-1.41-7681","CRYSTALS\u2011Kyber-1024-1.22-7681","LOTUS","LOTUS-0576-3.00-8192","LOTUS-0704-3.00-8192","LOTUS-0832-3.00-8192","LAC","PLWE","LAC-0512-0.71-251","LAC-1024-0.50-251","LAC-1024-0.71-251","LIMA-2p","LIMA-2p-1024-3.16-133121","LIMA-2p-2048-3.16-184321","R EMBLEM","R EMBLEM-0512-25.00-65536","R EMBLEM-0512-3.00-16384","LIMA\u2011sp","LIMA\u2011sp-1018-3.16-12521473","LIMA\u2011sp-1306-3.16-48181249","LIMA\u2011sp-1822-3.16-44802049","LIMA\u2011sp-2062-3.16-16900097","LightSaber","MLWR","LightSaber-0512-2.29-8192","EMBLEM","EMBLEM-0770-25.00-16777216","EMBLEM-0611-25.00-16777216","Saber","Saber-0768-2.29-8192","FireSaber","FireSaber-1024-2.29-8192","NTRU LPrime","RLWR","NTRU LPrime-0761-0.82-4591","CRYSTALS\u2011Dilithium","SIG","CRYSTALS\u2011Dilithium-0768-3.74-8380417","CRYSTALS\u2011Dilithium-1024-3.16-8380417","CRYSTALS\u2011Dilithium-1280-2.00-8380417","qTESLA","qTESLA-1024-8.49-8058881","qTESLA-2048-8.49-12681217","qTESLA-2048-8.49-27627521","Titanium.PKE","Titanium.PKE-1024-1.41-86017","Titanium.PKE-1280-1.41-301057","Titanium.PKE-1536-1.41-737281","Titanium.PKE-2048-1.41-1198081","uRound2.PKE","uRound2.PKE-0420-1.12-1024","uRound2.PKE-0540-4.61-8192","uRound2.PKE-0586-4.61-8192","uRound2.PKE-0708-18.47-32768","uRound2.KEM","LWR","uRound2.KEM-0500-2.29-16384","uRound2.KEM-0580-4.61-32768","uRound2.KEM-0630-4.61-32768","uRound2.KEM-0786-4.61-32768","Titanium.KEM","Titanium.KEM-1024-1.41-118273","Titanium.KEM-1280-1.41-430081","Titanium.KEM-1536-1.41-783361","Titanium.KEM-2048-1.41-1198081","uRound2.PKE-0500-4.61-32768","uRound2.PKE-0585-4.61-32768","uRound2.PKE-0643-4.61-32768","uRound2.PKE-0835-2.29-32768","uRound2.KEM-0418-4.61-4096","uRound2.KEM-0522-36.95-32768","uRound2.KEM-0540-18.47-16384","uRound2.KEM-0700-36.95-32768","uRound2.KEM-0676-36.95-32768","nRound2.PKE","nRound2.PKE-0442-1.47-2659","nRound2.PKE-0556-1.86-3343","nRound2.PKE-0576-1.27-2309","nRound2.PKE-0708-1.57-2837","nRound2.KEM","nRound2.KEM-0400-3.61-3209","nRound2.KEM-0486-2.18-1949","nRound2.KEM-0556-3.76-3343","nRound2.KEM-0658-1.46-1319","KINDI","KINDI-0768-2.29-16384","KINDI-1024-1.12-8192","KINDI-1024-2.29-16384","KINDI-1280-1.12-16384","KINDI-1536-1.12-8192","Lizard","Lizard-1024-1.12-2048","Lizard-1024-1.12-1024","Lizard-2048-1.12-4096","Lizard-2048-1.12-2048","RLizard","RLizard-1024-1.12-1024","RLizard-1024-1.12-2048","RLizard-2048-1.12-2048","RLizard-2048-1.12-4096","0.265\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a016.4","0.2975\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)","0.292\u00a0\u03b2","292\u00a0\u03b2 +\u00a016.4","0.368\u00a0\u03b2","0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2","0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)","\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)","0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25","0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1","0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)"]});
\ No newline at end of file
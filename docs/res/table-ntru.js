@@ -0,0 +1 @@
+loadShard("ntru", {"rows":{"primitive":[[1],[1],[1],[8],[8,11],[8,11],[8,11],[8],[1]],"param":[[0],[1],[2],[3],[4],[5],[6],[7],[8]],"attack":[3,3,3,3,3,3,3,3,3],"assumption":[[2],[2],[2],[2],[2],[2],[2],[2],[2]],"key":[4,5,6,9,12,13,14,16,18],"scheme":[0,0,0,7,10,10,10,15,17]},"errors":{},"models":[19,20,21,22,23,24,25,26,27,28,29,30,31,32],"cost":{"rop":[128,145,144,137,158,141,158,178,150,171,165,175,330,373,193,210,217,203,223,213,229,268,223,243,286,316,571,697,259,275,291,269,289,285,302,359,295,316,418,474,836,1118,123,140,138,132,153,136,152,171,145,165,157,165,313,350,85,101,95,93,114,93,109,117,101,123,93,92,186,208,159,176,179,169,189,175,192,221,185,205,221,240,441,516,248,265,279,258,279,274,290,345,283,304,396,448,792,1043,140,157,158,149,170,155,171,195,164,184,187,200,370,410,152,169,171,162,183,168,184,211,177,198,208,225,416,480],"dim":[1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1023,1532,1532,1532,1532,1532,1532,1532,1532,1532,1532,1532,1532,1532,1532,2041,2041,2041,2041,2041,2041,2041,2041,2041,2041,2041,2041,2041,2041,1286,1286,1286,1286,1286,1286,1286,1286,1286,1286,1286,1286,1286,1308,812,812,816,812,812,816,816,816,816,812,816,816,816,816,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,1345,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,2049,1327,1327,1327,1327,1327,1327,1327,1327,1327,1327,1327,1327,1323,1177,1861,1861,1861,1861,1861,1861,1861,1861,1861,1861,1861,1861,1861,1851],"flag":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"inst":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"beta":[482,482,482,482,482,482,482,482,482,482,482,482,482,482,728,728,728,728,728,728,728,728,728,728,728,728,728,728,975,975,975,975,975,975,975,975,975,975,975,975,975,975,463,463,463,463,463,463,463,463,463,463,463,463,463,461,319,319,316,319,319,316,316,316,316,319,316,316,316,316,599,599,599,599,599,599,599,599,599,599,599,599,599,599,935,935,935,935,935,935,935,935,935,935,935,935,935,935,528,528,528,528,528,528,528,528,528,528,528,528,518,447,573,573,573,573,573,573,573,573,573,573,573,573,573,569]},"params":[{"category":[1],"n":512,"q":12289,"norm_g":91.7126275384148,"norm_f":91.7126275384148,"secret_distribution":"normal","claimed":103,"ring":"x^n + 1","sd":4.053163803303075},{"category":[2,3],"n":768,"q":18433,"norm_g":112.32304683367524,"norm_f":112.32304683367524,"secret_distribution":"normal","claimed":172,"ring":"x^n - x^{n/2} + 1","sd":4.053108832851334},{"category":[4,5],"n":1024,"q":12289,"norm_g":91.7126275384148,"norm_f":91.7126275384148,"secret_distribution":"normal","claimed":230,"ring":"x^n + 1","sd":2.8660196105754623},{"category":[1],"n":700,"q":8192,"norm_g":20.91650066335189,"norm_f":20.91650066335189,"secret_distribution":"((-1, 1), 437)","claimed":123,"ring":"\\sum_{i=0}^{n-1} x^i","sd":0.7905694150420949},{"category":[1],"n":443,"q":2048,"norm_g":16.941074346097416,"norm_f":16.941074346097416,"secret_distribution":"((-1, 1), 287)","claimed":84,"ring":"x^n - 1","sd":0.8048947325421136},{"category":[1,2,3,4,5],"n":743,"q":2048,"norm_g":22.24859546128699,"norm_f":22.24859546128699,"secret_distribution":"((-1, 1), 495)","claimed":159,"ring":"x^n - 1","sd":0.8162218050219381},{"category":[4,5],"n":1024,"q":1073750017,"norm_g":23168.0,"norm_f":23168.0,"secret_distribution":"normal","claimed":198,"ring":"x^n - 1","sd":724.0},{"category":[5],"n":761,"q":4591,"norm_g":22.524061208701536,"norm_f":16.911534525287763,"secret_distribution":"((-1, 1), 286)","claimed":248,"ring":"x^n - x - 1","sd":0.816496580927726},{"category":[1,2,3,4,5],"n":1024,"q":65537,"norm_g":22.38302928559939,"norm_f":22.38302928559939,"secret_distribution":"((-1, 1), 501)","claimed":149,"ring":"x^n - 1","sd":0.699469665174981}],"ms":["n"],"strings":["Falcon","SIG","NTRU","primal","Falcon-0512-4.05-12289","Falcon-0768-4.05-18433","Falcon-1024-2.87-12289","NTRU HRSS","KEM","NTRU HRSS-0700-0.79-8192","NTRUEncrypt","PKE","NTRUEncrypt-0443-0.80-2048","NTRUEncrypt-0743-0.82-2048","NTRUEncrypt-1024-724.00-1073750017","SNTRU Prime","SNTRU Prime-0761-0.82-4591","pqNTRUsign","pqNTRUsign-1024-0.70-65537","0.265\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a016.4","0.2975\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2","0.265\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)","0.292\u00a0\u03b2","292\u00a0\u03b2 +\u00a016.4","0.368\u00a0\u03b2","0.292\u00a0\u03b2 +\u00a0\u33d2\u00a0\u03b2","0.292\u00a0\u03b2 +\u00a016.4 +\u00a0\u33d2\u00a0(8d)","\u00bd\u00a0(\u00a00.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1\u00a0)","0.125\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a00.755\u00a0\u03b2 +\u00a02.25","0.187\u00a0\u03b2\u00a0\u33d2\u00a0\u03b2 -\u00a01.019\u00a0\u03b2 +\u00a016.1","0.000784\u00a0\u03b2\u00b2 +\u00a00.366\u00a0\u03b2 -\u00a00.9 +\u00a0\u33d2\u00a0(8d)"]});
\ No newline at end of file
@@ -24,9 +24,19 @@ AUTHOR:
 from sage.all import *
 import estimator as est
 from schemes import LWE_SCHEMES, NTRU_SCHEMES
-from cost_asymptotics import BKZ_COST_ASYMPTOTICS
-from html import generate_json
-from inspect import getsource
+from cost_asymptotics import BKZ_COST_ASYMPTOTICS, log_domain, log2_costs
+from html import generate_json, stream_estimates, save_model_catalogue, RESULTSPATH
+from cache import fingerprint, estimator_fingerprint, cache_get, cache_put, cache_evict
+from journal import JOURNALPATH, replay_journal, journal_open, journal_write, journal_close
+from progress import progress_start, progress_update, progress_report, progress_watch, progress_unwatch, \
+    task_started, task_finished
+from profiling import PROFILEPATH, profiled, profile_clear, merge_profiles, profile_report
+from workqueue import QUEUEPATH, QUEUEHEARTBEAT, queue_init, queue_claim, queue_done, queue_requeue, queue_results, \
+    queue_status, queue_task_id, queue_heartbeats
+from glob import glob
+from fnmatch import fnmatch
+import os
+import time
 try:
     from config import NCPUS
 except ImportError:
@@ -35,6 +45,33 @@ try:
     from config import SOBJPATH
 except ImportError:
     SOBJPATH = "all_the_schemes.sobj"
+try:
+    from config import PROFILE_REDUCTION
+except ImportError:
+    PROFILE_REDUCTION = False
+try:
+    from config import PROFILE_CURVE_STEP
+except ImportError:
+    PROFILE_CURVE_STEP = 4
+try:
+    from config import LOG_COST_MODELS
+except ImportError:
+    LOG_COST_MODELS = False
+try:
+    from config import TASKTIMEOUT
+except ImportError:
+    TASKTIMEOUT = 3600
+try:
+    from config import TASKRETRIES
+except ImportError:
+    TASKRETRIES = 1
+
+
+# cost models indexed by name, tasks only carry the name around
+COST_MODELS = dict((cost_model["name"], cost_model) for cost_model in BKZ_COST_ASYMPTOTICS)
+
+# version of the estimator, part of every cache key
+ESTIMATOR_FINGERPRINT = estimator_fingerprint()
 
 
 def flatten(l):
@@ -48,40 +85,49 @@ def flatten(l):
     return [item for sublist in l for item in sublist]
 
 
-@parallel(ncpus=NCPUS)
-def para_cost_scheme(scheme):
-    """ Utility function for running LWE costing in parallel.
+def instances(scheme):
+    """ Lists the instances of a scheme, each as a list of parameter sets.
 
-    :param scheme:      list containing an LWE scheme object
+    :params scheme:     LWE scheme object
+
+    :return:            list of instances
     """
-    return cost_scheme(scheme[0], dual_use_lll=True) # false worsens it
+    # always consider param objects as part of a list
+    return [instance if type(instance) == list else [instance] for instance in scheme["params"]]
 
 
-def cost_scheme(scheme, debug=False, dual_use_lll=True):
-    """ Costs LWE scheme by calling the [APS15] estimator.
-        Costing is done against primal and dual attacks, and considers the distribution
-        of the secret vector to apply scaling and dropping of columns.
+def can_drop(secret_distribution):
+    """ Returns True if the secret distribution allows guessing secret entries
+        via drop_and_solve.
 
-        :params scheme:         LWE scheme object
-        :params debug:          Boolean value, if set to True, catched exceptions are re-raised.
-
-        :returns estimates:     list of estimated costs for the primal and dual attack
+    :params secret_distribution:    secret distribution of an LWE parameter set
     """
-    sname = scheme["name"]
-    params = scheme["params"]
+    if est.SDis.is_bounded_uniform(secret_distribution) or type(secret_distribution) == dict:
+        a, b = est.SDis.bounds(secret_distribution)
+        return -a == b
+    return False
 
-    # verbose output
-    print "Costing lwe scheme: %s"%(sname)
 
-    # loop parametrisations
-    estimates = []
-    for instance in params:
-        instance_estimates = {"primal": [], "dual": []}
-        if type(instance) != list:
-            # always consider param objects as part of a list
-            instance = [instance]
-        for param in instance:
-            # cast everything to python type so we can json.dump it
+def cost_tasks(sid, scheme, dual_use_lll=True):
+    """ Splits the costing of an LWE scheme into independent estimator calls.
+        There is one task per instance, parameter set, cost model, number of
+        samples, attack and choice of dropping columns or not.
+        If PROFILE_REDUCTION is set, a single task with model None covers all
+        cost models for the primal attack without dropping, see profile_costs.
+
+    :params sid:            index of the scheme in LWE_SCHEMES + NTRU_SCHEMES
+    :params scheme:         LWE scheme object
+    :params dual_use_lll:   passed to the dual attack
+
+    :return tasks:          list of tasks, each identified by its "key" and
+                            with the content hash of its inputs as "id"
+    """
+    is_ntru = "NTRU" in scheme["assumption"]
+    attacks = ["primal"] if is_ntru else ["primal", "dual"]
+
+    tasks = []
+    for i, instance in enumerate(instances(scheme)):
+        for j, param in enumerate(instance):
             n = param["n"]
             sd = param["sd"]
             q = param["q"]
@@ -101,85 +147,875 @@ def cost_scheme(scheme, debug=False, dual_use_lll=True):
             #     }
             #     secret_distribution = sec_dist
             alpha = sqrt(2*pi) * sd / RR(q)
+            samples = [n] if is_ntru else [n, 2*n]
+            # try guessing secret entries via drop_and_solve
+            drops = [False, True] if can_drop(secret_distribution) else [False]
+
+            for m in samples:
+                for atk in attacks:
+                    for drop in drops:
+                        if PROFILE_REDUCTION and atk == "primal" and not drop:
+                            cnames = [None]
+                        else:
+                            cnames = [cost_model["name"] for cost_model in BKZ_COST_ASYMPTOTICS]
+                        for cname in cnames:
+                            task = {
+                                "key": (sid, i, j, cname, "n" if m == n else "2n", atk, drop),
+                                "n": n,
+                                "alpha": alpha,
+                                "q": q,
+                                "secret_distribution": secret_distribution,
+                                "m": m,
+                                "model": cname,
+                                "attack": atk,
+                                "drop": drop,
+                                "ntru": is_ntru,
+                                "dual_use_lll": dual_use_lll,
+                            }
+                            # tasks with the same id cost the same thing
+                            task["id"] = task_cache_key(task)
+                            tasks += [task]
+    return tasks
+
+
+def plan_tasks(tasks):
+    """ Deduplicates tasks costing the same instance in the same way, such as
+        those of schemes that differ only in their primitive.
+
+    :params tasks:      list of tasks generated by cost_tasks
+
+    :returns unique:    list containing the first task with each id
+    :returns copies:    dictionary mapping task ids to all the tasks with that id
+    """
+    unique = []
+    copies = {}
+    for task in tasks:
+        if task["id"] not in copies:
+            copies[task["id"]] = []
+            unique += [task]
+        copies[task["id"]] += [task]
+    return unique, copies
+
+
+def task_weight(task):
+    """ Rough relative running time of a task, used for scheduling the
+        longest-expected tasks first.
+
+    :params task:       task generated by cost_tasks
+
+    :return:            expected cost, in arbitrary units
+    """
+    weight = task["m"] * task["n"]
+    if task["model"] is None:
+        weight *= 2
+    if task["attack"] == "dual":
+        weight *= 2
+    if task["drop"]:
+        weight *= 4
+    return weight
+
+
+def model_definition(cost_model):
+    """ Returns everything the estimates under a cost model depend on.
+
+    :params cost_model:     entry of BKZ_COST_ASYMPTOTICS
+
+    :returns:               specification of the cost model and its success probability
+    """
+    return {
+        "cost": cost_model["cost"],
+        "success_probability": cost_model["success_probability"],
+    }
+
+
+def reduction_cost_model(cost_model):
+    """ Returns the cost model passed to the estimator. If LOG_COST_MODELS is set
+        this is the log-domain model, adapted to the estimator's interface.
+
+    :params cost_model:     entry of BKZ_COST_ASYMPTOTICS
+    """
+    if LOG_COST_MODELS:
+        return log_domain(cost_model["log_reduction_cost_model"])
+    return cost_model["reduction_cost_model"]
+
+
+def instance_fingerprint(scheme, instance):
+    """ Returns a stable fingerprint of the parameters an instance is costed on.
+        Metadata such as claimed security or ring is left out, since it does
+        not affect the estimates.
+
+    :params scheme:         LWE scheme object
+    :params instance:       list of parameter sets
+
+    :returns:               hex digest
+    """
+    return fingerprint({
+        "param": [dict((k, param[k]) for k in ["n", "sd", "q", "secret_distribution"]) for param in instance],
+        "ntru": "NTRU" in scheme["assumption"],
+        "estimator": ESTIMATOR_FINGERPRINT,
+    })
+
+
+def model_fingerprint(cost_model):
+    """ Returns a stable fingerprint of a cost model.
+
+    :params cost_model:     entry of BKZ_COST_ASYMPTOTICS
+
+    :returns:               hex digest
+    """
+    return fingerprint(model_definition(cost_model))
+
+
+def reusable_costs(scheme, previous):
+    """ Finds the costs of a scheme that can be reused verbatim from a previous
+        run, since neither the instance nor the cost model changed.
+
+    :params scheme:         LWE scheme object
+    :params previous:       list of estimates saved by a previous run
+
+    :returns reused:        dictionary mapping (instance index, cost model name)
+                            to the previous costs of each attack
+    """
+    # index previous estimates by scheme name, instance fingerprint and attack
+    index = {}
+    for estimate in previous:
+        if "fingerprint" in estimate:
+            index[(estimate["scheme"]["name"], estimate["fingerprint"]["param"], estimate["attack"])] = estimate
+
+    is_ntru = "NTRU" in scheme["assumption"]
+    reused = {}
+    for i, instance in enumerate(instances(scheme)):
+        ifp = instance_fingerprint(scheme, instance)
+        prev = {}
+        for atk in ["primal"] if is_ntru else ["primal", "dual"]:
+            if (scheme["name"], ifp, atk) in index:
+                prev[atk] = index[(scheme["name"], ifp, atk)]
+        if len(prev) < (1 if is_ntru else 2):
+            continue
+
+        for cost_model in BKZ_COST_ASYMPTOTICS:
+            cname = cost_model["name"]
+            mfp = model_fingerprint(cost_model)
+            # primal and dual costs of a model are reused together, since they
+            # share the drop flag
+            # failed estimates are never reused
+            if all(prev[atk]["fingerprint"]["models"].get(cname) == mfp and cname in prev[atk]["cost"]
+                   and not any("error" in cell for cell in prev[atk]["cost"][cname].values()) for atk in prev):
+                reused[(i, cname)] = dict((atk, prev[atk]["cost"][cname]) for atk in prev)
+    return reused
+
+
+def task_needed(task, reused):
+    """ Returns False if the results of a task can be reused from a previous run.
+
+    :params task:       task generated by cost_tasks
+    :params reused:     costs of the task's scheme, as returned by reusable_costs
+    """
+    sid, i, j, cname, m, atk, drop = task["key"]
+    if cname is None:
+        return any((i, cost_model["name"]) not in reused for cost_model in BKZ_COST_ASYMPTOTICS)
+    return (i, cname) not in reused
+
+
+def _normalise(name):
+    # scheme and model names use non-breaking hyphens
+    return name.replace("\xe2\x80\x91", "-").lower()
+
+
+def name_selected(name, patterns):
+    """ Returns True if a scheme or cost model name matches any of a list of
+        shell-style patterns, ignoring case and the kind of hyphens.
+
+    :params name:       scheme or cost model name
+    :params patterns:   list of patterns, or None to match every name
+    """
+    return patterns is None or any(fnmatch(_normalise(name), _normalise(p)) for p in patterns)
+
+
+def scheme_selected(scheme, selection):
+    """ Returns True if a scheme is costed by a selective run.
+
+    :params scheme:     LWE scheme object
+    :params selection:  selection, see task_selected
+    """
+    if selection is None:
+        return True
+    assumptions = selection.get("assumption")
+    return (name_selected(scheme["name"], selection.get("scheme"))
+            and (assumptions is None or any(a.lower() in [b.lower() for b in assumptions] for a in scheme["assumption"])))
+
+
+def task_selected(task, scheme, selection):
+    """ Returns True if a task is run by a selective run.
+
+    :params task:       task generated by cost_tasks
+    :params scheme:     LWE scheme object of the task
+    :params selection:  None, or dictionary restricting the run with any of
+                        "scheme"        list of scheme name patterns
+                        "assumption"    list of assumptions
+                        "model"         list of cost model name patterns
+                        "attack"        list of attacks
+                        "m"             list of numbers of samples, "n" or "2n"
+                        "drop"          False to never drop columns
+    """
+    if selection is None:
+        return True
+    sid, i, j, cname, m, atk, drop = task["key"]
+    # tasks covering all cost models are kept if any is selected
+    cnames = [cname] if cname is not None else [cost_model["name"] for cost_model in BKZ_COST_ASYMPTOTICS]
+    return (scheme_selected(scheme, selection)
+            and any(name_selected(c, selection.get("model")) for c in cnames)
+            and atk in selection.get("attack", [atk])
+            and m in selection.get("m", [m])
+            and (selection.get("drop", True) or not drop))
+
+
+def instance_key(sname, instance):
+    """ Returns the key identifying the estimates of an instance.
+
+    :params sname:      scheme name
+    :params instance:   list of parameter sets
+    """
+    # NOTE: for the uuid of an instance we just look at the first parameter set
+    n = instance[0]["n"]
+    sd = instance[0]["sd"]
+    q = instance[0]["q"]
+    return "%s-%04d-%.2f-%d"%(sname,n,sd,q)
+
+
+def scheme_identity(scheme):
+    """ Identifies a scheme across runs. Names are not enough, some schemes
+        have variants based on different assumptions.
+
+    :params scheme:     LWE scheme object, or the "scheme" entry of an estimate
+    """
+    return (scheme["name"], tuple(scheme["primitive"]), tuple(scheme["assumption"]))
+
+
+def estimate_identity(scheme, instance, atk):
+    """ Identifies the estimate of an attack on an instance across runs. Keys
+        are not enough, since they only depend on the first parameter set, and
+        neither are the LWE parameters, since instances of a scheme may only
+        differ in their claimed security or category.
+
+    :params scheme:     LWE scheme object, or the "scheme" entry of an estimate
+    :params instance:   list of parameter sets
+    :params atk:        attack
+    """
+    return (scheme_identity(scheme), atk, fingerprint(list(instance)))
+
+
+def previous_estimates(scheme, previous):
+    """ Finds the estimates of a scheme saved by a previous run, as they were
+        saved.
+
+    :params scheme:     LWE scheme object
+    :params previous:   list of estimates saved by a previous run
+
+    :returns:           list of estimates, in the order they were saved
+    """
+    return [e for e in previous if scheme_identity(e["scheme"]) == scheme_identity(scheme)]
+
+
+def merge_cell(cell, prev, selection):
+    """ Merges a cell costed by a selective run into the one saved by a
+        previous run. A run that never drops columns did not cost dropping, so
+        a saved estimate obtained by dropping is only replaced if it is more
+        costly.
+
+    :params cell:       cell costed by the selective run
+    :params prev:       cell saved by a previous run, or None
+    :params selection:  selection of the run, see task_selected
+
+    :returns:           merged cell
+    """
+    if (selection.get("drop", True) or prev is None or "error" in prev or not prev.get("drop")
+            or "error" in cell):
+        return cell
+    return cell if cell["rop"] < prev["rop"] else prev
+
+
+def merge_estimates(estimates, previous, selection):
+    """ Merges the estimates of a selective run of a scheme into those saved
+        by a previous run. Costs that were not selected are kept from the
+        previous estimates, or are marked as not estimated if there are none.
+        The selection only decides what is costed: saved estimates are not
+        replaced by ones obtained under fewer options, see merge_cell.
+
+    :params estimates:  estimates of a scheme, as returned by assemble_estimates
+    :params previous:   list of estimates saved by a previous run
+    :params selection:  selection of the run, see task_selected
+
+    :returns:           list of merged estimates
+    """
+    # identical instances of a scheme are matched in order
+    index = {}
+    for e in previous:
+        index.setdefault(estimate_identity(e["scheme"], e["param"], e["attack"]), []).append(e)
+    # a cost model whose costs were only partly recomputed keeps its previous fingerprint
+    complete = "m" not in selection and selection.get("drop", True)
+
+    merged = []
+    for estimate in estimates:
+        matches = index.get(estimate_identity(estimate["scheme"], estimate["param"], estimate["attack"]))
+        prev = matches.pop(0) if matches else None
+        ms = ["n"] if "NTRU" in estimate["scheme"]["assumption"] else ["n", "2n"]
+        cost = {}
+        models = {}
+        if prev is not None:
+            cost = dict((cname, dict(cells)) for cname, cells in prev["cost"].items())
+            if prev.get("fingerprint", {}).get("param") == estimate["fingerprint"]["param"]:
+                models = dict(prev["fingerprint"]["models"])
+        for cname, cells in estimate["cost"].items():
+            cells = dict((m, cells[m]) for m in ms if cells.get(m))
+            saved = cost.setdefault(cname, {})
+            for m in cells:
+                saved[m] = merge_cell(cells[m], saved.get(m), selection)
+            if complete and len(cells) == len(ms):
+                models[cname] = estimate["fingerprint"]["models"][cname]
+            elif cells:
+                models.pop(cname, None)
+        for cost_model in BKZ_COST_ASYMPTOTICS:
+            cells = cost.setdefault(cost_model["name"], {})
+            for m in ms:
+                if not cells.get(m):
+                    cells[m] = {"name": cost_model["name"], "inst": 0, "error": "not estimated", "type": "NotSelected"}
+        merged += [dict(estimate, cost=cost, fingerprint={"param": estimate["fingerprint"]["param"], "models": models})]
+    return merged
+
+
+def task_results(task, result):
+    """ Lists the results of every cost model covered by a task.
+
+    :params task:       task generated by cost_tasks
+    :params result:     result returned by run_task
+
+    :returns:           list of (key, result) pairs, one per cost model.
+                        Results of profile tasks carry the curve of the
+                        success probability of their cost model.
+    """
+    sid, i, j, cname, m, atk, drop = task["key"]
+    if cname is not None:
+        return [(task["key"], result)]
+    if "models" not in result:
+        return [((sid, i, j, cost_model["name"], m, atk, drop), result) for cost_model in BKZ_COST_ASYMPTOTICS]
+    curves = dict((curve["success_probability"], curve) for curve in result.get("curves", []))
+    pairs = []
+    for cost_model in BKZ_COST_ASYMPTOTICS:
+        cost = result["models"][cost_model["name"]]
+        if cost_model["success_probability"] in curves:
+            cost = dict(cost, curve=curves[cost_model["success_probability"]])
+        pairs += [((sid, i, j, cost_model["name"], m, atk, drop), cost)]
+    return pairs
+
+
+def task_cache_key(task):
+    """ Returns the key under which the result of a task is cached.
+
+    :params task:       task generated by cost_tasks
+
+    :returns:           hex digest
+    """
+    return fingerprint({
+        "n": task["n"],
+        "alpha": task["alpha"],
+        "q": task["q"],
+        "secret_distribution": task["secret_distribution"],
+        "m": task["m"],
+        "attack": task["attack"],
+        "drop": task["drop"],
+        "rotations": task["ntru"] if task["attack"] == "primal" and task["drop"] else None,
+        "use_lll": task["dual_use_lll"] if task["attack"] == "dual" else None,
+        "model": model_definition(COST_MODELS[task["model"]]) if task["model"] is not None else
+                 [model_definition(cost_model) for cost_model in BKZ_COST_ASYMPTOTICS],
+        # profile tasks also return their curves, over the full range since they were exported
+        "profile": ("full curves", PROFILE_CURVE_STEP) if task["model"] is None else False,
+        "log_domain": LOG_COST_MODELS,
+        "estimator": ESTIMATOR_FINGERPRINT,
+    })
+
+
+def cost_result(cost):
+    """ Keeps the entries of an estimator cost we report.
+
+    :params cost:       cost returned by the estimator
+
+    :returns:           dictionary with the lattice dimension, block size and
+                        ⌈log_2⌉ of the cost of the attack
+    """
+    return {
+        "dim": int(cost["d"]),
+        "beta": int(cost["beta"]),
+        "rop": int(ceil(log(cost["rop"], 2))),
+        # unrounded cost, for comparing dropping against not dropping
+        "lrop": float(log(cost["rop"], 2)),
+    }
+
+
+def primal_usvp_kwds(task, success_probability):
+    """ Returns the arguments est.primal_usvp passes to the estimator's
+        _primal_usvp for every block size it tries.
+
+    :params task:                   task generated by cost_tasks
+    :params success_probability:    target success probability
+
+    :returns:                       dictionary of keyword arguments
+    """
+    from estimator.estimator import Param, _primal_scale_factor
+    n, alpha, q, success_probability = Param.preprocess(task["n"], task["alpha"], task["q"], success_probability)
+    return {
+        "n": n,
+        "alpha": alpha,
+        "q": q,
+        "m": task["m"],
+        "success_probability": success_probability,
+        "scale": _primal_scale_factor(task["secret_distribution"], alpha, q, n),
+    }
+
+
+def primal_profile(task, success_probability, cost_models, patience=8):
+    """ Computes the lattice geometry of the primal uSVP attack, which does not
+        depend on the BKZ cost model: for feasible block sizes, the lattice
+        dimension used by the estimator.
+
+        The success condition is monotone in the block size, so the smallest
+        feasible one is found by binary search. Every block size is then
+        recorded upwards until the cost under every cost model has passed its
+        minimum and kept above it for a number of block sizes. Like the
+        estimator's search, this assumes costs are unimodal in the block size,
+        in which case the minimum over the profile is the one est.primal_usvp
+        finds. So that other cost models can be minimised over the profile,
+        it goes on up to 2n, the largest block size est.primal_usvp
+        considers, every PROFILE_CURVE_STEP block sizes.
+
+    :params task:                   task generated by cost_tasks
+    :params success_probability:    target success probability
+    :params cost_models:            entries of BKZ_COST_ASYMPTOTICS whose
+                                    minimum the profile must include
+    :params patience:               number of block sizes the cost of every
+                                    cost model must stay above its minimum for
+
+    :returns profile:               dictionary with lists "block_size", "beta"
+                                    and "d" of the arguments the cost model is
+                                    called with, the bitsize "B", the log_2
+                                    of the factor "repeat" the estimator
+                                    multiplies the reduction cost by, and the
+                                    number of leading block sizes "dense"
+                                    recorded without gaps
+    """
+    from estimator.estimator import _primal_usvp
+    kwds = primal_usvp_kwds(task, success_probability)
+    profile = {"block_size": [], "beta": [], "d": [], "B": None, "repeat": 0., "dense": 0}
+
+    def probe(beta, d, B):
+        # records the arguments, the cost itself is irrelevant
+        profile["B"] = float(B)
+        probe.args = (float(beta), float(d))
+        return RR(1)
+
+    def feasible(block_size):
+        return _primal_usvp(block_size, reduction_cost_model=probe, **kwds)["rop"] != oo
+
+    start, stop = 32, 2*task["n"]
+    if not feasible(stop):
+        return profile
+    while start < stop:
+        mid = (start + stop) // 2
+        if feasible(mid):
+            stop = mid
+        else:
+            start = mid + 1
+    # the reduction cost is 1 when probing, what is left is the repetitions
+    profile["repeat"] = float(log(_primal_usvp(start, reduction_cost_model=probe, **kwds)["rop"], 2))
+
+    def record(block_size):
+        if not feasible(block_size):
+            return False
+        profile["block_size"] += [block_size]
+        profile["beta"] += [probe.args[0]]
+        profile["d"] += [probe.args[1]]
+        return True
+
+    best = [oo for cost_model in cost_models]
+    rising = [0 for cost_model in cost_models]
+    block_size = start
+    while block_size <= 2*task["n"] and min(rising) < patience:
+        if record(block_size):
+            costs = log2_costs([probe.args[0]], [probe.args[1]], profile["B"], models=cost_models)[:, 0]
+            for k, cost in enumerate(costs):
+                if cost < best[k]:
+                    best[k] = cost
+                    rising[k] = 0
+                else:
+                    rising[k] += 1
+        block_size += 1
+    profile["dense"] = len(profile["block_size"])
+
+    # the rest of the range, ending on 2n
+    tail = range(block_size, 2*task["n"], PROFILE_CURVE_STEP)
+    if block_size <= 2*task["n"]:
+        tail += [2*task["n"]]
+    for block_size in tail:
+        record(block_size)
+    return profile
+
+
+def profile_curve(profile, success_probability):
+    """ Exports a primal profile, for cost models to be minimised over it
+        without the estimator, see docs/js/custom.js. Past its first "dense"
+        points, which reach a little beyond the minima of the cost models of
+        BKZ_COST_ASYMPTOTICS, the profile only has every "step"-th block size,
+        so a minimum found there is approximate.
+
+    :params profile:                profile returned by primal_profile
+    :params success_probability:    success probability of the profile
+
+    :returns:                       dictionary ready for JSON encoding
+    """
+    return {
+        "success_probability": float(success_probability),
+        "beta": [round(beta, 2) for beta in profile["beta"]],
+        "d": [round(d, 2) for d in profile["d"]],
+        "B": profile["B"],
+        "repeat": round(profile["repeat"], 4),
+        "dense": profile["dense"],
+        "step": PROFILE_CURVE_STEP,
+    }
+
+
+def minimise_over_profile(profile, cost_models):
+    """ Finds the block sizes minimising several cost models over a primal
+        profile, evaluating all of them at once. Only the block sizes recorded
+        without gaps are considered, as est.primal_usvp would.
+
+    :params profile:        profile returned by primal_profile
+    :params cost_models:    list of entries of BKZ_COST_ASYMPTOTICS
+
+    :returns:               list of optimal block sizes, one per cost model
+    """
+    dense = profile["dense"]
+    costs = log2_costs(profile["beta"][:dense], profile["d"][:dense], profile["B"], models=cost_models)
+    return [profile["block_size"][i] for i in costs.argmin(axis=1)]
+
+
+def profile_costs(task):
+    """ Costs the primal attack without dropping under every cost model at once.
+        The lattice geometry is computed once per success probability, and the
+        cost models sharing it are minimised over it together, see
+        primal_profile.
+
+    :params task:       task generated by cost_tasks, with model None
+
+    :returns costs:     dictionary mapping cost model names to results
+    :returns curves:    list of the profiles exported by profile_curve, one per
+                        success probability
+    """
+    from estimator.estimator import _primal_usvp
+    costs = {}
+    curves = []
+    for success_probability in set(cost_model["success_probability"] for cost_model in BKZ_COST_ASYMPTOTICS):
+        cost_models = [cost_model for cost_model in BKZ_COST_ASYMPTOTICS
+                       if cost_model["success_probability"] == success_probability]
+        profile = primal_profile(task, success_probability, cost_models)
+        if not profile["block_size"]:
+            raise ValueError("primal attack infeasible for block sizes up to %d"%(2*task["n"]))
+        curves += [profile_curve(profile, success_probability)]
+
+        kwds = primal_usvp_kwds(task, success_probability)
+        for cost_model, block_size in zip(cost_models, minimise_over_profile(profile, cost_models)):
+            cost = _primal_usvp(block_size, reduction_cost_model=reduction_cost_model(cost_model), **kwds)
+            costs[cost_model["name"]] = cost_result(cost)
+    return costs, curves
+
+
+def run_task(task, debug=False, use_cache=True):
+    """ Runs the estimator call described by a task.
+
+    :params task:       task generated by cost_tasks
+    :params debug:      Boolean value, if set to True, catched exceptions are re-raised.
+    :params use_cache:  Boolean value, if set to False, the estimator cache
+                        is neither read nor written
+
+    :returns result:    dictionary with the lattice dimension, block size and
+                        ⌈log_2⌉ of the cost of the attack, or with the message
+                        and type of the error raised.
+                        Tasks covering all cost models return the results of
+                        each under "models", and the profiles they were
+                        minimised over under "curves".
+    """
+    cache_key = task["id"] if use_cache else None
+    result = cache_get(cache_key) if use_cache else None
+    if result is not None:
+        return result
+
+    if task["model"] is None:
+        try:
+            costs, curves = profile_costs(task)
+            result = {"models": costs, "curves": curves}
+        except Exception, e:
+            if debug:
+                raise
+            return {"error": str(e), "type": type(e).__name__}
+        if use_cache:
+            cache_put(cache_key, result)
+        return result
+
+    cost_model = COST_MODELS[task["model"]]
+    kwds = {
+        "secret_distribution": task["secret_distribution"],
+        "m": task["m"],
+        "success_probability": cost_model["success_probability"],
+        "reduction_cost_model": reduction_cost_model(cost_model),
+    }
+
+    if task["attack"] == "primal":
+        if task["drop"]:
+            attack = est.partial(est.drop_and_solve, est.primal_usvp, postprocess=False, decision=False)
+            kwds["rotations"] = task["ntru"]
+        else:
+            # Estimate standard attacks. The estimator will apply any possible scaling
+            attack = est.primal_usvp
+    else:
+        if task["drop"]:
+            attack = est.partial(est.drop_and_solve, est.dual_scale, postprocess=True)
+        else:
+            attack = est.dual_scale
+        kwds["use_lll"] = task["dual_use_lll"]
+
+    try:
+        cost = attack(task["n"], task["alpha"], task["q"], **kwds)
+        result = cost_result(cost)
+    except Exception, e:
+        if debug:
+            raise
+        return {"error": str(e), "type": type(e).__name__}
+
+    # errors are not cached, they are retried on the next run
+    if use_cache:
+        cache_put(cache_key, result)
+    return result
+
+
+def task_label(task):
+    """ Describes a task in progress reports.
+
+    :params task:       task generated by cost_tasks
+
+    :returns:           string
+    """
+    sid, i, j, cname, m, atk, drop = task["key"]
+    return "%s, instance %d, parameter set %d, %s, %s, m = %s%s"%(
+        "/".join(task.get("names", [])[:2]) or "scheme %d"%sid, i, j,
+        cname or "all cost models", atk, m, ", dropping columns" if drop else "")
+
+
+@parallel(ncpus=NCPUS, timeout=TASKTIMEOUT)
+def para_run_task(task):
+    """ Utility function for running costing tasks in parallel.
+        Each task is killed after TASKTIMEOUT seconds. Tasks marked with
+        "profile" bypass the cache and run under cProfile, tasks with "cache"
+        set to False bypass the cache, and tasks marked with "track" are
+        recorded in RUNNINGPATH while they run, see progress.py.
+
+    :param task:        list containing a task
+
+    :returns:           the result of the task, with its wall time under "meta"
+    """
+    start = time.time()
+    track = task[0].get("track", False)
+    if track:
+        task_started(task_label(task[0]))
+    try:
+        if task[0].get("profile"):
+            result = profiled(task[0]["id"], run_task, task[0], use_cache=False)
+        else:
+            result = run_task(task[0], use_cache=task[0].get("cache", True))
+    finally:
+        if track:
+            task_finished()
+    return dict(result, meta={"time": time.time() - start})
+
+
+def failure(cost, what):
+    """ Describes a failed part of an estimate.
+
+    :params cost:       error record of the failed task
+    :params what:       what the task was costing
+
+    :returns:           string
+    """
+    return "%s: %s: %s"%(what, cost.get("type", "Error"), cost["error"])
+
+
+def cheapest_result(res, key):
+    """ Picks the cheaper of costing an attack with and without dropping
+        columns, among the runs that completed. Sometimes drop_and_solve
+        results in a more costly attack, and either may have failed. If only
+        one failed, the result of the other is marked "partial" with the
+        failure, so that it is not mistaken for a complete estimate.
+
+    :params res:        dictionary mapping keys of tasks of a parameter set,
+                        without their first three entries, to their results
+    :params key:        (cost model name, m, attack)
+
+    :returns:           the result, and whether it was obtained by dropping
+    """
+    runs = [(res[key + (drop,)], drop) for drop in [False, True] if key + (drop,) in res]
+    completed = [(cost, drop) for cost, drop in runs if "error" not in cost]
+    if not completed:
+        return runs[0]
+    # ties go to not dropping
+    cost, dropped = min(completed, key=lambda run: run[0]["lrop"])
+    failed = [failure(run, "dropping columns" if drop else "without dropping") for run, drop in runs if "error" in run]
+    if failed:
+        cost = dict(cost, partial=cost.get("partial", []) + failed)
+    return cost, dropped
+
+
+def estimate_cell(cname, cost, dropped, inst):
+    """ Formats the result of costing an attack under a cost model as it is
+        saved in the estimates.
+
+    :params cname:      cost model name
+    :params cost:       task result
+    :params dropped:    Boolean value, True if columns were dropped
+    :params inst:       index of the parameter set in its instance
+
+    :returns:           the estimate, or the error record if costing failed.
+                        Estimates some part of which failed list the
+                        failures under "partial".
+    """
+    if "error" in cost:
+        cell = {"name": cname, "inst": inst}
+        for entry in ["error", "type", "attempts"]:
+            if entry in cost:
+                cell[entry] = cost[entry]
+        return cell
+    cell = {
+        "name": cname,
+        "dim":  cost["dim"],
+        "beta": cost["beta"],
+        "rop":  cost["rop"],
+        "drop": dropped,
+        "inst": inst,
+    }
+    if cost.get("partial"):
+        cell["partial"] = cost["partial"]
+    return cell
+
+
+def cheapest_cell(cells):
+    """ Picks the cheapest estimate of an attack among the parameter sets of an
+        instance, among those that could be costed. If any parameter set
+        failed, the estimate is marked "partial" with its failures, since the
+        failed one may have been cheaper.
+
+    :params cells:      list of cells returned by estimate_cell, one per
+                        parameter set that has results
+
+    :returns:           the cell, or None if there are none
+    """
+    completed = [cell for cell in cells if "error" not in cell]
+    if not completed:
+        return cells[0] if cells else None
+    cheapest = min(completed, key=lambda cell: cell["rop"])
+    failed = [failure(cell, "parameter set %d"%cell["inst"]) for cell in cells if "error" in cell]
+    if len(cells) > 1:
+        # failures within the other parameter sets matter as well
+        failed += ["parameter set %d, %s"%(cell["inst"], part)
+                   for cell in completed if cell is not cheapest for part in cell.get("partial", [])]
+    if failed:
+        cheapest = dict(cheapest, partial=cheapest.get("partial", []) + failed)
+    return cheapest
+
+
+def instance_curves(param_results, i, instance, ms):
+    """ Collects the curves the primal attack without dropping was minimised
+        over for the parameter sets of an instance, see profile_curve.
+
+    :params param_results:  dictionary mapping (i, j) to the results of the
+                            parameter set, as grouped by assemble_estimates
+    :params i:              index of the instance
+    :params instance:       list of parameter sets
+    :params ms:             numbers of samples
+
+    :returns:               dictionary mapping numbers of samples to a curve or
+                            None per parameter set, empty if no task
+                            returned curves
+    """
+    curves = {}
+    for m in ms:
+        curves[m] = []
+        for j in range(len(instance)):
+            res = param_results.get((i, j), {})
+            # cost models with the same success probability share their curve
+            curve = None
+            for cost_model in BKZ_COST_ASYMPTOTICS:
+                cost = res.get((cost_model["name"], m, "primal", False), {})
+                if "curve" in cost:
+                    curve = cost["curve"]
+                    break
+            curves[m] += [curve]
+    if all(curve is None for m in ms for curve in curves[m]):
+        return {}
+    return curves
+
+
+def assemble_estimates(sid, scheme, results, reused={}):
+    """ Puts the results of the tasks of a scheme back together into its list
+        of estimates.
+
+        :params sid:            index of the scheme in LWE_SCHEMES + NTRU_SCHEMES
+        :params scheme:         LWE scheme object
+        :params results:        dictionary mapping task keys to task results
+        :params reused:         costs reused from a previous run, as returned by reusable_costs
+
+        :returns estimates:     list of estimated costs for the primal and dual attack
+    """
+    sname = scheme["name"]
+    is_ntru = "NTRU" in scheme["assumption"]
+
+    # group the results by parameter set
+    param_results = {}
+    for key, result in results.items():
+        if key[0] == sid:
+            param_results.setdefault(key[1:3], {})[key[3:]] = result
+
+    estimates = []
+    for i, instance in enumerate(instances(scheme)):
+        instance_estimates = {"primal": [], "dual": []}
+        for j, param in enumerate(instance):
+            res = param_results.get((i, j), {})
             primal_estimate_cost = {}
             dual_estimate_cost = {}
 
-            is_ntru = "NTRU" in scheme["assumption"]
-            samples = [n] if is_ntru else [n, 2*n]
+            # loop cost models
+            for cost_model in BKZ_COST_ASYMPTOTICS:
+                cname = cost_model["name"]
+                if (i, cname) in reused:
+                    continue
+                primal_results = {"n": {}, "2n": {}}
+                if not is_ntru:
+                    dual_results = {"n": {}, "2n": {}}
 
-            try:
-                # loop cost models
-                for cost_model in BKZ_COST_ASYMPTOTICS:
-                    cname = cost_model["name"]
-                    reduction_cost_model = cost_model["reduction_cost_model"]
-                    success_probability = cost_model["success_probability"]
-                    primal_results = {"n": {}, "2n": {}}
-                    if not is_ntru:
-                        dual_results = {"n": {}, "2n": {}}
-
-                    for m in samples:
-                        dropped = False
-                        # Estimate standard attacks. The estimator will apply any possible scaling
-                        cost_primal = est.primal_usvp(n, alpha, q, secret_distribution=secret_distribution,
-                                                        m=m,  success_probability=success_probability,
-                                                        reduction_cost_model=reduction_cost_model)
-                        if not is_ntru:
-                            cost_dual = est.dual_scale(n, alpha, q, secret_distribution=secret_distribution,
-                                                            m=m, success_probability=success_probability,
-                                                            reduction_cost_model=reduction_cost_model, use_lll=dual_use_lll)
-
-                        if est.SDis.is_bounded_uniform(secret_distribution) or type(secret_distribution) == dict:
-                            a, b = est.SDis.bounds(secret_distribution)
-                            if -a == b:
-                                # Try guessing secret entries via drop_and_solve
-                                primald = est.partial(est.drop_and_solve, est.primal_usvp, postprocess=False, decision=False)
-                                cost_primal_dropped = primald(n, alpha, q, secret_distribution=secret_distribution,
-                                                        m=m,  success_probability=success_probability,
-                                                        reduction_cost_model=reduction_cost_model, rotations=is_ntru)
-                                if not is_ntru:
-                                    duald = est.partial(est.drop_and_solve, est.dual_scale, postprocess=True)
-                                    cost_dual_dropped = duald(n, alpha, q, secret_distribution=secret_distribution,
-                                                            m=m,  success_probability=success_probability,
-                                                            reduction_cost_model=reduction_cost_model, use_lll=dual_use_lll)
-
-                                # Sometimes drop_and_solve results in a more costly attack
-                                if cost_primal_dropped["rop"] < cost_primal["rop"]:
-                                    cost_primal = cost_primal_dropped
-                                    dropped = True
-                                if not is_ntru:
-                                    if cost_dual_dropped["rop"] < cost_dual["rop"]:
-                                        cost_dual = cost_dual_dropped
-                                        dropped = True
-
-                        # save results
-                        primal_results["n" if m == n else "2n"] = {
-                            "name": cname,
-                            "dim":  int(cost_primal["d"]),
-                            "beta": int(cost_primal["beta"]),
-                            "rop":  int(ceil(log(cost_primal["rop"], 2))),
-                            "drop": dropped,
-                            "inst": instance.index(param),
-                        }
-                        if not is_ntru:
-                            dual_results["n" if m == n else "2n"] = {
-                                "name": cname,
-                                "dim": int(cost_dual["d"]),
-                                "beta": int(cost_dual["beta"]),
-                                "rop": int(ceil(log(cost_dual["rop"], 2))),
-                                "drop": dropped,
-                                "inst": instance.index(param),
-                            }
+                for m in ["n"] if is_ntru else ["n", "2n"]:
+                    # attacks, m or cost models left out of a selective run have no results
+                    costs = {}
+                    dropped = False
+                    for atk in ["primal"] if is_ntru else ["primal", "dual"]:
+                        if (cname, m, atk, False) in res:
+                            costs[atk], atk_dropped = cheapest_result(res, (cname, m, atk))
+                            dropped = dropped or atk_dropped
 
-                    primal_estimate_cost[cname] = primal_results
-                    if not is_ntru:
-                        dual_estimate_cost[cname] = dual_results
+                    # save results
+                    if "primal" in costs:
+                        primal_results[m] = estimate_cell(cname, costs["primal"], dropped, instance.index(param))
+                    if "dual" in costs:
+                        dual_results[m] = estimate_cell(cname, costs["dual"], dropped, instance.index(param))
 
-            except Exception, e:
-                primal_estimate_cost["error"] = str(e)
+                primal_estimate_cost[cname] = primal_results
                 if not is_ntru:
-                    dual_estimate_cost["error"] = str(e)
-                if debug:
-                    raise
+                    dual_estimate_cost[cname] = dual_results
 
             instance_estimates["primal"] += [primal_estimate_cost]
             if not is_ntru:
@@ -187,27 +1023,31 @@ def cost_scheme(scheme, debug=False, dual_use_lll=True):
 
         # there may be complexity swaps for an instance based on multiple problems
         # here we choose the cheapest problem always
-        
+
         # TODO: for each attack choose the cheapest cost
         cheapest_parameters = {}
-        for atk in instance_estimates:
+        for atk in ["primal"] if is_ntru else ["primal", "dual"]:
             cheapest_parameters[atk] = {}
             for cost_model in BKZ_COST_ASYMPTOTICS:
                 cname = cost_model["name"]
+                if (i, cname) in reused:
+                    cheapest_parameters[atk][cname] = reused[(i, cname)].get(atk, {})
+                    continue
                 cheapest_parameters[atk][cname] = {}
                 for m in ["n"] if is_ntru else ["n", "2n"]:
-                    cheapest_parameters[atk][cname][m] = { "rop": infinity }
-                    for inst_est in instance_estimates[atk]:
-                        # pick the cheapest attack based on the instance's parameters
-                        if inst_est[cname][m]["rop"] < cheapest_parameters[atk][cname][m]["rop"]:
-                            cheapest_parameters[atk][cname][m] = inst_est[cname][m]
+                    # pick the cheapest attack based on the instance's parameters
+                    cheapest = cheapest_cell([inst_est[cname][m] for inst_est in instance_estimates[atk]
+                                              if inst_est[cname][m]])
+                    if cheapest is not None:
+                        cheapest_parameters[atk][cname][m] = cheapest
 
         # prepare json data structure
-        # NOTE: for the uuid of an instance we just look at the first parameter set
-        n = instance[0]["n"]
-        sd = instance[0]["sd"]
-        q = instance[0]["q"]
-        key = "%s-%04d-%.2f-%d"%(sname,n,sd,q)
+        key = instance_key(sname, instance)
+        # fingerprints allow later runs to reuse these costs
+        fp = {
+            "param": instance_fingerprint(scheme, instance),
+            "models": dict((cost_model["name"], model_fingerprint(cost_model)) for cost_model in BKZ_COST_ASYMPTOTICS),
+        }
         primal_estimate = {
             "attack": "primal",
             "key": key,
@@ -218,8 +1058,13 @@ def cost_scheme(scheme, debug=False, dual_use_lll=True):
             },
             "param": instance,
             "cost": cheapest_parameters["primal"],
+            "fingerprint": fp,
         }
 
+        curves = instance_curves(param_results, i, instance, ["n"] if is_ntru else ["n", "2n"])
+        if curves:
+            primal_estimate["curves"] = curves
+
         if not is_ntru:
             dual_estimate = {
                 "attack": "dual",
@@ -231,31 +1076,340 @@ def cost_scheme(scheme, debug=False, dual_use_lll=True):
                 },
                 "param": instance,
                 "cost": cheapest_parameters["dual"],
+                "fingerprint": fp,
             }
 
         estimates += [primal_estimate]
         if not is_ntru:
             estimates += [dual_estimate]
-        
+
     return estimates
 
 
-def main():
+def cost_scheme(scheme, debug=False, dual_use_lll=True):
+    """ Costs LWE scheme by calling the [APS15] estimator.
+        Costing is done against primal and dual attacks, and considers the distribution
+        of the secret vector to apply scaling and dropping of columns.
+        Tasks are run sequentially, see main() for the parallel version.
+
+        :params scheme:         LWE scheme object
+        :params debug:          Boolean value, if set to True, catched exceptions are re-raised.
+
+        :returns estimates:     list of estimated costs for the primal and dual attack
+    """
+    # verbose output
+    print "Costing lwe scheme: %s"%(scheme["name"])
+
+    unique, copies = plan_tasks(cost_tasks(0, scheme, dual_use_lll=dual_use_lll))
+    results = {}
+    for task in unique:
+        result = run_task(task, debug=debug)
+        for copy in copies[task["id"]]:
+            results.update(task_results(copy, result))
+    return assemble_estimates(0, scheme, results)
+
+
+def plan_run(incremental=False, selection=None):
+    """ Plans the tasks costing all LWE and NTRU schemes. The plan only depends
+        on the schemes, the cost models and SOBJPATH, so every host running
+        part of it plans the same tasks.
+
+    :params incremental:    if True, costs of instances and cost models that
+                            did not change since the estimates saved in
+                            SOBJPATH are reused
+    :params selection:      if not None, only the selected tasks are planned,
+                            see task_selected
+
+    :returns:               the schemes, the costs reused for each, the tasks,
+                            the unique tasks, longest-expected first, and
+                            the copies of each unique task
+    """
+    schemes = LWE_SCHEMES + NTRU_SCHEMES
+
+    reused = [{} for scheme in schemes]
+    if incremental and os.path.exists(SOBJPATH):
+        previous = load(SOBJPATH)
+        reused = [reusable_costs(scheme, previous) for scheme in schemes]
+        print "Reusing %d of %d costs from %s"%(
+            sum(len(r) for r in reused),
+            sum(len(instances(scheme)) for scheme in schemes) * len(BKZ_COST_ASYMPTOTICS),
+            SOBJPATH
+        )
+
+    tasks = flatten([cost_tasks(sid, scheme, dual_use_lll=True) for sid, scheme in enumerate(schemes)]) # false worsens it
+    tasks = [task for task in tasks if task_needed(task, reused[task["key"][0]])
+             and task_selected(task, schemes[task["key"][0]], selection)]
+    unique, copies = plan_tasks(tasks)
+    unique.sort(key=task_weight, reverse=True)
+    for task in unique:
+        task["names"] = [schemes[copy["key"][0]]["name"] for copy in copies[task["id"]]]
+    print "Costing %d schemes in %d unique tasks out of %d, saving %.1f%% of the work"%(
+        len(schemes), len(unique), len(tasks),
+        100. * (1 - sum(task_weight(t) for t in unique) / float(max(1, sum(task_weight(t) for t in tasks))))
+    )
+    return schemes, reused, tasks, unique, copies
+
+
+def execute_tasks(unique, journal=None, done=None, progress=None, verbose=True):
+    """ Runs tasks in parallel, retrying failed or timed out ones TASKRETRIES
+        times.
+
+    :params unique:     list of tasks
+    :params journal:    journal the successful results are recorded in, or None
+    :params done:       function called with every task and its final result
+    :params progress:   progress object updated with every task, or None.
+                        Only if given, the running tasks are recorded in
+                        RUNNINGPATH, so other callers write no files
+    :params verbose:    if False, nothing is printed
+    """
+    for task in unique:
+        task["track"] = progress is not None
+    for attempt in range(1 + TASKRETRIES):
+        failed = []
+        for (args, kwds), result in para_run_task([[task] for task in unique]):
+            task = args[0][0]
+            if type(result) != dict:
+                # @parallel returns a string if the worker timed out or died
+                result = {"error": str(result), "type": "Timeout" if "timed out" in str(result) else "WorkerError"}
+            meta = result.pop("meta", None)
+            if "error" in result:
+                result["attempts"] = attempt + 1
+                if attempt < TASKRETRIES:
+                    failed += [task]
+                    continue
+            elif journal is not None:
+                # failed tasks are run again when resuming
+                journal_write(journal, task["id"], result)
+            if done is not None:
+                done(task, result)
+            if progress is not None:
+                progress_update(progress, task, task["names"], meta, failed="error" in result)
+                progress_report(progress)
+
+        unique = failed
+        if not unique:
+            break
+        if verbose:
+            print "Retrying %d failed tasks"%len(unique)
+
+
+def shard_journal(shard):
+    """ Returns the path of the journal of a shard.
+
+    :params shard:      pair (i, N), shard i of N
+    """
+    return "%s.shard-%d-of-%d"%(JOURNALPATH, shard[0], shard[1])
+
+
+def run_shard(shard, incremental=False, resume=False, selection=None):
+    """ Runs one shard of the tasks costing all schemes, recording their results
+        in the shard journal. The shards are put back together by main(merge=True).
+
+    :params shard:          pair (i, N), the i-th of N shards, 0 <= i < N
+    :params incremental:    as in plan_run, it must be the same for all shards
+    :params selection:      as in plan_run, it must be the same for all shards
+    :params resume:         if True, the tasks recorded in the shard journal
+                            by an interrupted run are skipped
+
+    :returns:               number of tasks run
+    """
+    i, n = shard
+    unique = plan_run(incremental, selection)[3]
+    # longest-expected first round robin, so shards get similar work
+    unique = unique[i::n]
+    path = shard_journal(shard)
+    if resume:
+        journaled = replay_journal(path)
+        unique = [task for task in unique if task["id"] not in journaled]
+    print "Running shard %d of %d, %d tasks"%(i, n, len(unique))
+
+    journal = journal_open(path, resume=resume)
+    progress = progress_start(unique, task_weight, NCPUS)
+    progress_watch(progress)
+    execute_tasks(unique, journal=journal, progress=progress)
+    progress_unwatch(progress)
+    journal_close(journal)
+    progress_report(progress, force=True)
+    return len(unique)
+
+
+def fill_queue(incremental=False, selection=None):
+    """ Adds the tasks costing all schemes to the work queue at QUEUEPATH.
+
+    :params incremental:    as in plan_run, it must be the same for the workers
+    :params selection:      as in plan_run, it must be the same for the workers
+
+    :returns:               number of tasks queued
+    """
+    unique = plan_run(incremental, selection)[3]
+    queued = queue_init([task["id"] for task in unique])
+    print "Queued %d tasks in %s, %d already done or running"%(queued, QUEUEPATH, len(unique) - queued)
+    return queued
+
+
+def run_worker(incremental=False, selection=None):
+    """ Runs tasks from the work queue at QUEUEPATH until it is empty. Any
+        number of workers, on any host sharing the queue directory, can run at
+        once. Each claims NCPUS tasks at a time and writes a heartbeat into
+        its claims while running them. Claims without a heartbeat for ten
+        heartbeat intervals are assumed to belong to dead workers and are
+        queued again, so workers wait for the tasks still claimed by others
+        before stopping.
+
+    :params incremental:    as in plan_run, it must be the same for all workers
+    :params selection:      as in plan_run, it must be the same for all workers
+
+    :returns:               number of tasks run
+    """
+    tasks = dict((task["id"], task) for task in plan_run(incremental, selection)[3])
+    stale = 10 * QUEUEHEARTBEAT
+    run = 0
+    while True:
+        requeued = queue_requeue(stale)
+        if requeued:
+            print "Queued again %d stale tasks"%requeued
+        names = queue_claim(NCPUS)
+        if not names:
+            if not queue_status()["claimed"]:
+                break
+            time.sleep(QUEUEHEARTBEAT)
+            continue
+        batch = []
+        for name in names:
+            task_id = queue_task_id(name)
+            if task_id not in tasks:
+                # queued by a host with different schemes, cost models or estimator
+                queue_done(name, {"error": "unknown task", "type": "WorkerError"})
+                continue
+            tasks[task_id]["queue_name"] = name
+            batch += [tasks[task_id]]
+        heartbeats = queue_heartbeats([task["queue_name"] for task in batch])
+        execute_tasks(batch, done=lambda task, result: queue_done(task["queue_name"], result))
+        heartbeats.set()
+        run += len(batch)
+        status = queue_status()
+        print "Worker %d: %d tasks run, %d left in the queue, %d running, %d done"%(
+            os.getpid(), run, status["todo"], status["claimed"], status["done"])
+    return run
+
+
+def main(incremental=False, resume=False, profile=False, merge=False, selection=None):
     """ Main function costing LWE and NTRU schemes.
-        Runs each scheme costing in parallel.
-        Results are saved as a Sage object and as an HTML table.
+        The costing of every scheme is split into independent tasks, which are
+        run in parallel longest-expected first and then put back together.
+        Identical tasks across schemes are run once, and tasks whose result
+        is in the estimator cache are not recomputed.
+        Finished tasks are recorded in the journal at JOURNALPATH. Failed or
+        timed out tasks are retried TASKRETRIES times, and only the estimates
+        depending on them are replaced by an error record.
+        The estimates of each scheme are streamed to RESULTSPATH as soon as
+        they are complete, and at the end all are saved as a Sage object and
+        as an HTML table.
+
+    :params incremental:        if True, costs of instances and cost models
+                                that did not change since the estimates saved
+                                in SOBJPATH are reused
+    :params resume:             if True, the results recorded in the journal by
+                                an interrupted run are replayed, and only the
+                                missing tasks are run
+    :params profile:            if True, every task is run under cProfile,
+                                bypassing the estimator cache, and a report of
+                                where the time went is written to PROFILEPATH
+    :params merge:              if True, the results of the shard journals and
+                                of the work queue are replayed, and only the
+                                tasks missing from them are run
+    :params selection:          if not None, only the selected schemes, cost
+                                models, attacks and samples are costed, see
+                                task_selected, and their costs are merged into
+                                the estimates saved in SOBJPATH, which must
+                                exist
 
     :return estimates_list:     list containing scheme costs
     """
+    if selection is not None and not os.path.exists(SOBJPATH):
+        # the estimates of everything left out would be lost
+        raise ValueError("a selective run merges into %s, which does not exist"%SOBJPATH)
+
+    schemes, reused, tasks, unique, copies = plan_run(incremental, selection)
+    previous = []
+    if selection is not None:
+        previous = load(SOBJPATH)
+
+    results = {}
+    # a scheme is put back together and streamed as soon as its last task is done
+    pending = [0 for scheme in schemes]
+    for task in tasks:
+        pending[task["key"][0]] += 1
+    assembled = {}
+    stream = open(RESULTSPATH, "w")
+
+    def finish(sid):
+        estimates = assemble_estimates(sid, schemes[sid], results, reused[sid])
+        if selection is not None:
+            estimates = merge_estimates(estimates, previous, selection)
+        assembled[sid] = estimates
+        stream_estimates(stream, estimates)
 
-    lwe_estimates = list(para_cost_scheme([[s] for s in LWE_SCHEMES + NTRU_SCHEMES]))
-    estimates_list = flatten([x[1] for x in lwe_estimates])
+    def resolve(task, result):
+        # fan the result out to every scheme costing the same instance
+        for copy in copies[task["id"]]:
+            results.update(task_results(copy, result))
+            sid = copy["key"][0]
+            pending[sid] -= 1
+            if pending[sid] == 0:
+                finish(sid)
+
+    for sid, scheme in enumerate(schemes):
+        if not scheme_selected(scheme, selection):
+            # schemes left out of a selective run keep their previous estimates
+            assembled[sid] = previous_estimates(scheme, previous)
+            stream_estimates(stream, assembled[sid])
+        elif pending[sid] == 0:
+            finish(sid)
+
+    journaled = replay_journal(JOURNALPATH) if resume else {}
+    if merge:
+        for path in sorted(glob("%s.shard-*"%JOURNALPATH)):
+            journaled.update(replay_journal(path))
+        journaled.update(queue_results())
+    for task in unique:
+        if task["id"] in journaled:
+            resolve(task, journaled[task["id"]])
+    unique = [task for task in unique if task["id"] not in journaled]
+    if resume or merge:
+        print "Replayed %d results, %d tasks left"%(len(journaled), len(unique))
+
+    if profile:
+        profile_clear()
+        for task in unique:
+            task["profile"] = True
+
+    journal = journal_open(JOURNALPATH, resume=resume)
+    progress = progress_start(unique, task_weight, NCPUS)
+    progress_watch(progress)
+    execute_tasks(unique, journal=journal, done=resolve, progress=progress)
+    progress_unwatch(progress)
+    journal_close(journal)
+    stream.close()
+    progress_report(progress, force=True)
+
+    if profile:
+        stats = merge_profiles()
+        if stats is not None:
+            split = profile_report(stats)
+            print "Profile written to %s:"%PROFILEPATH, ", ".join("%s %.1fs"%(name, split[name]) for name in sorted(split))
+
+    estimates_list = flatten([assembled[sid] for sid in range(len(schemes))])
+
+    # keep the estimator cache within its size cap
+    cache_evict()
 
     # save estimates as sage object
     save(estimates_list, SOBJPATH)
 
     try:
         print "Generating html"
+        save_model_catalogue(BKZ_COST_ASYMPTOTICS)
         generate_json(estimates_list)
 
     except Exception, e:
@@ -278,5 +1432,61 @@ def debug_call():
 """
 import __main__
 if __name__ == "__main__" and hasattr(__main__, '__file__'):
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Estimate all the LWE and NTRU schemes.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only cost schemes, instances and cost models that changed since the last run")
+    parser.add_argument("--resume", action="store_true",
+                        help="resume an interrupted run from its journal")
+    parser.add_argument("--profile", action="store_true",
+                        help="run every task under cProfile and report where the time goes")
+    parser.add_argument("--shard", metavar="I/N",
+                        help="only run the I-th of N shards of the tasks, 0 <= I < N, and record them in a shard journal")
+    parser.add_argument("--queue", action="store_true",
+                        help="add the tasks to the work queue at %s"%QUEUEPATH)
+    parser.add_argument("--worker", action="store_true",
+                        help="run tasks from the work queue until it is empty")
+    parser.add_argument("--merge", action="store_true",
+                        help="put together the results of the shards and of the work queue")
+    group = parser.add_argument_group("selection",
+                                      "only cost what is selected, and merge the costs into the saved estimates")
+    group.add_argument("--scheme", action="append",
+                       help="scheme name, or shell-style pattern such as '*Round2*' (repeatable)")
+    group.add_argument("--assumption", action="append",
+                       help="assumption, such as RLWE or NTRU (repeatable)")
+    group.add_argument("--model", action="append",
+                       help="cost model name, or shell-style pattern (repeatable)")
+    group.add_argument("--attack", action="append", choices=["primal", "dual"])
+    group.add_argument("--m", action="append", choices=["n", "2n"],
+                       help="number of samples")
+    group.add_argument("--no-drop", action="store_true",
+                       help="never guess secret entries by dropping columns")
+    args = parser.parse_args()
+
+    selection = dict((k, getattr(args, k)) for k in ["scheme", "assumption", "model", "attack", "m"]
+                     if getattr(args, k) is not None)
+    if args.no_drop:
+        selection["drop"] = False
+    for pattern in selection.get("scheme", []):
+        if not any(name_selected(scheme["name"], [pattern]) for scheme in LWE_SCHEMES + NTRU_SCHEMES):
+            parser.error("no scheme matches %s"%pattern)
+    for pattern in selection.get("model", []):
+        if not any(name_selected(cost_model["name"], [pattern]) for cost_model in BKZ_COST_ASYMPTOTICS):
+            parser.error("no cost model matches %s"%pattern)
+    selection = selection or None
+    if selection is not None and not (args.shard or args.queue or args.worker) and not os.path.exists(SOBJPATH):
+        parser.error("selective runs merge into %s, run without a selection first"%SOBJPATH)
+
+    if args.shard:
+        i, n = [int(x) for x in args.shard.split("/")]
+        if not 0 <= i < n:
+            parser.error("--shard I/N needs 0 <= I < N")
+        run_shard((i, n), incremental=args.incremental, resume=args.resume, selection=selection)
+    elif args.queue:
+        fill_queue(incremental=args.incremental, selection=selection)
+    elif args.worker:
+        run_worker(incremental=args.incremental, selection=selection)
+    else:
+        main(incremental=args.incremental, resume=args.resume, profile=args.profile, merge=args.merge,
+             selection=selection)
     # debug_call()
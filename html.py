@@ -2,6 +2,16 @@
 """
 Generate readable HTML table for comparing estimates.
 
+This module does not import Sage nor the estimator, so the website can be
+regenerated from the results stream and the cost model catalogue with plain
+Python, see generate_json_from_stream. The catalogue at MODELSPATH is checked
+in, the stream at RESULTSPATH is not: it is written by every run of
+estimates.py, which needs Sage, on the host that ran it.
+
+USAGE:
+
+    python html.py
+
 AUTHOR:
 
     Fernando Virdia - 2018
@@ -9,113 +19,382 @@ AUTHOR:
 """
 
 
+from hashlib import sha1
 from math import log, ceil
-from cost_asymptotics import BKZ_COST_ASYMPTOTICS
-from inspect import getsource
 from string import lower
 import json
+import os
 
 try:
     from config import JSONPATH
 except ImportError:
-    JSONPATH = "docs/res/full_table.js"
+    JSONPATH = "docs/res/manifest.js"
+try:
+    from config import RESULTSPATH
+except ImportError:
+    RESULTSPATH = "all_the_schemes.jsonl"
+try:
+    from config import MODELSPATH
+except ImportError:
+    MODELSPATH = "cost_models.json"
 
 
-def generate_costs_json():
-    """ Generates a JSON string from the BKZ_COST_ASYMPTOTICS list.
+def model_catalogue(cost_models):
+    """ Lists what the website shows of each cost model.
 
-    :returns:   the generated string
+    :params cost_models:    BKZ_COST_ASYMPTOTICS
+    :returns:               list of dictionaries
     """
     models = []
-    for model in BKZ_COST_ASYMPTOTICS:
+    for model in cost_models:
         models += [{
             "name": model["name"],
-            "lambda": "%s"%getsource(model["reduction_cost_model"]).split('":')[1][:-2],
+            "lambda": model["source"],
+            "js": model["js"],
             "human": model["human_friendly"],
             "group": model["group"]
         }]
-    return json.dumps(models)
+    return models
 
-def generate_table_json(estimates_list):
-    """ Generates a JSON string from the estimates list.
 
-    :params estimates_list:         list of estimates generated by estimates.py
-    :returns:                       the generated string
+def save_model_catalogue(cost_models, path=MODELSPATH):
+    """ Saves the cost model catalogue the website is generated from.
+
+    :params cost_models:    BKZ_COST_ASYMPTOTICS
+    :params path:           path of the catalogue
+    """
+    with open(path, "w") as f:
+        json.dump(model_catalogue(cost_models), f, indent=2, separators=(",", ": "), sort_keys=True)
+        f.write("\n")
+
+
+def generate_costs_json(path=MODELSPATH):
+    """ Generates a JSON string from the cost model catalogue.
+
+    :params path:   path of the catalogue, as saved by save_model_catalogue
+    :returns:       the generated string
+    """
+    with open(path) as f:
+        return json.dumps(json.load(f))
+
+def sanitise_estimate(scheme):
+    """ Given a Sagemath object, it sanitises its entries for enabling JSON
+        dumping.
+
+    :params scheme:     estimate generated by estimates.py
+    :returns:           the sanitised object
     """
+    # work on a copy, fingerprints are only used by estimates.py
+    scheme = dict(scheme)
+    scheme["param"] = list(scheme["param"])
+    scheme.pop("fingerprint", None)
+    for i in range(len(scheme["param"])):
+        params = scheme["param"][i]
+        # sanitise secret_distribution
+        secret_distribution = False
+        if "secret_distribution" in params:
+            secret_distribution = params["secret_distribution"]
+            if type(secret_distribution) != str:
+                if type(secret_distribution[0]) == tuple:
+                    a = int(secret_distribution[0][0])
+                    b = int(secret_distribution[0][1])
+                    h = int(secret_distribution[1])
+                    secret_distribution = ((a, b), h)
+                else:
+                    a = int(secret_distribution[0])
+                    b = int(secret_distribution[1])
+                    secret_distribution = (a, b)
+        
+        ring = False
+        if "ring" in params:
+            ring = params["ring"]
+
+        if "NTRU" in scheme["scheme"]["assumption"]:
+            params = {
+                "n": int(params["n"]),
+                "sd": float(params["sd"]),
+                "q": int(params["q"]),
+                "norm_f": float(params["norm_f"]),
+                "norm_g": float(params["norm_g"]),
+                "claimed": "" if not params["claimed"] else int(params["claimed"]),
+                "category": map(int, params["category"]),
+            }
+        else:
+            # sanitise param object
+            k = None if "k" not in params else params["k"]
+            params = {
+                "n": int(params["n"]),
+                "sd": float(params["sd"]),
+                "q": int(params["q"]),
+                "claimed": "" if not params["claimed"] else int(params["claimed"]),
+                "category": map(int, params["category"]),
+            }
+            if k:
+                params["k"] = k
+
+        if secret_distribution:
+            params["secret_distribution"] = str(secret_distribution)
+
+        if ring:
+            params["ring"] = ring
+
+        # save sanitised param set
+        scheme["param"][i] = params
+    return scheme
+
+
+# numbers of samples of the cost arrays, and flags of their cells
+TABLE_MS = ["n", "2n"]
+CELL_ESTIMATE, CELL_DROP, CELL_ERROR, CELL_MISSING = 0, 1, 2, 3
+
+# tables of the website, as (table id, True for NTRU schemes, number of samples)
+SITE_TABLES = [("lwe-n", False, "n"), ("lwe-2n", False, "2n"), ("ntru", True, "n")]
+
+# templates of the Sage snippets reproducing an estimate, filled in by
+# reproduceSnippet in docs/js/table.js when an estimate is clicked
+SNIPPET_TEMPLATES = {
+    "header": "# To reproduce the estimate run this snippet on http://aleph.sagemath.org/\n"
+              "# Ring ops: {rop}\n"
+              "# Block size: {beta}\n"
+              "# Dimension: {dim}\n",
+    "multiple": "# NOTE: This scheme relies on different hard problem instances for key recovery and message recovery.\n"
+                "# The code below gives the cost of the cheaper of the two attacks under the chosen cost model.\n",
+    "setup": "load('https://bitbucket.org/malb/lwe-estimator/raw/HEAD/estimator.py')\n"
+             "n = {n}\n"
+             "sd = {sd}\n"
+             "q = {q}\n"
+             "alpha = sqrt(2*pi)*sd/RR(q)\n"
+             "m = {m}\n"
+             "secret_distribution = {secret_distribution}\n"
+             "success_probability = 0.99\n"
+             "reduction_cost_model = {lambda}\n",
+    "primal": "primal_usvp(n, alpha, q, secret_distribution=secret_distribution, m=m, "
+              "success_probability=success_probability, reduction_cost_model=reduction_cost_model)",
+    "primal-drop": "primald = partial(drop_and_solve, primal_usvp, postprocess=False, decision=False)\n"
+                   "primald(n, alpha, q, secret_distribution=secret_distribution, "
+                   "m=m,  success_probability=success_probability, reduction_cost_model=reduction_cost_model{rotations})",
+    "dual": "dual_scale(n, alpha, q, secret_distribution=secret_distribution, "
+            "m=m, success_probability=success_probability, reduction_cost_model=reduction_cost_model)",
+    "dual-drop": "duald = partial(drop_and_solve, dual_scale, postprocess=True)\n"
+                 "duald(n, alpha, q, secret_distribution=secret_distribution, "
+                 "m=m, success_probability=success_probability, reduction_cost_model=reduction_cost_model)",
+}
+
+
+def columnar_start(model_names, ms=TABLE_MS):
+    """ Starts encoding sanitised estimates in the columnar format decoded by
+        decodeTable in docs/js/rows.js. Strings are stored once in a table,
+        parameter sets are stored once and referenced by index, and costs are
+        stored in flat arrays. The cost of row r under model j with ms[k]
+        samples is at index (r * len(models) + j) * len(ms) + k. The details
+        of failed cells, and the failures left out of partial estimates, are
+        stored by index. Estimates are added one at a time by columnar_add,
+        so they need not all be in memory.
+
+    :params model_names:    list of the names of the cost models, in column order
+    :params ms:             numbers of samples whose costs are stored
+    :returns:               table being encoded
+    """
+    return {
+        "model_names": model_names,
+        "ms": ms,
+        "strings": [],
+        "string_index": {},
+        "params": [],
+        "param_index": {},
+        "rows": {"scheme": [], "primitive": [], "assumption": [], "attack": [], "key": [], "param": []},
+        "cost": {"flag": [], "rop": [], "beta": [], "dim": [], "inst": []},
+        "errors": {},
+        "partial": {},
+    }
+
+
+def _string(table, s):
+    if s not in table["string_index"]:
+        table["string_index"][s] = len(table["strings"])
+        table["strings"].append(s)
+    return table["string_index"][s]
+
+
+def _param(table, p):
+    key = json.dumps(p, sort_keys=True)
+    if key not in table["param_index"]:
+        table["param_index"][key] = len(table["params"])
+        table["params"].append(p)
+    return table["param_index"][key]
 
-    def sanitise_param(scheme):
-        """ Given a Sagemath object, it sanitises its entries for enabling JSON
-            dumping.
-
-        :returns:           the sanitised object
-        """
-        for i in range(len(scheme["param"])):
-            params = scheme["param"][i]
-            # sanitise secret_distribution
-            secret_distribution = False
-            if "secret_distribution" in params:
-                secret_distribution = params["secret_distribution"]
-                if type(secret_distribution) != str:
-                    if type(secret_distribution[0]) == tuple:
-                        a = int(secret_distribution[0][0])
-                        b = int(secret_distribution[0][1])
-                        h = int(secret_distribution[1])
-                        secret_distribution = ((a, b), h)
-                    else:
-                        a = int(secret_distribution[0])
-                        b = int(secret_distribution[1])
-                        secret_distribution = (a, b)
-            
-            ring = False
-            if "ring" in params:
-                ring = params["ring"]
-
-            if "NTRU" in scheme["scheme"]["assumption"]:
-                params = {
-                    "n": int(params["n"]),
-                    "sd": float(params["sd"]),
-                    "q": int(params["q"]),
-                    "norm_f": float(params["norm_f"]),
-                    "norm_g": float(params["norm_g"]),
-                    "claimed": "" if not params["claimed"] else int(params["claimed"]),
-                    "category": map(int, params["category"]),
-                }
+
+def columnar_add(table, estimate):
+    """ Adds a sanitised estimate to a table started by columnar_start.
+
+    :params table:          table being encoded
+    :params estimate:       sanitised estimate
+    """
+    rows = table["rows"]
+    cost = table["cost"]
+    rows["scheme"].append(_string(table, estimate["scheme"]["name"]))
+    rows["primitive"].append([_string(table, s) for s in estimate["scheme"]["primitive"]])
+    rows["assumption"].append([_string(table, s) for s in estimate["scheme"]["assumption"]])
+    rows["attack"].append(_string(table, estimate["attack"]))
+    rows["key"].append(_string(table, estimate.get("key", "")))
+    rows["param"].append([_param(table, p) for p in estimate["param"]])
+    for name in table["model_names"]:
+        for m in table["ms"]:
+            cell = estimate["cost"].get(name, {}).get(m)
+            if not cell:
+                flag = CELL_MISSING
+            elif "error" in cell:
+                flag = CELL_ERROR
+                table["errors"][len(cost["flag"])] = [_string(table, cell.get("type", "Error")),
+                                                      _string(table, cell["error"]), cell.get("attempts", 0)]
             else:
-                # sanitise param object
-                k = None if "k" not in params else params["k"]
-                params = {
-                    "n": int(params["n"]),
-                    "sd": float(params["sd"]),
-                    "q": int(params["q"]),
-                    "claimed": "" if not params["claimed"] else int(params["claimed"]),
-                    "category": map(int, params["category"]),
-                }
-                if k:
-                    params["k"] = k
-
-            if secret_distribution:
-                params["secret_distribution"] = str(secret_distribution)
-
-            if ring:
-                params["ring"] = ring
-
-            # save sanitised param set
-            scheme["param"][i] = params
-        return scheme
-
-    return json.dumps(map(sanitise_param, estimates_list))
+                flag = CELL_DROP if cell["drop"] else CELL_ESTIMATE
+                if cell.get("partial"):
+                    table["partial"][len(cost["flag"])] = [_string(table, s) for s in cell["partial"]]
+            cost["flag"].append(flag)
+            ok = flag in [CELL_ESTIMATE, CELL_DROP]
+            for entry in ["rop", "beta", "dim"]:
+                cost[entry].append(cell[entry] if ok else 0)
+            cost["inst"].append(cell["inst"] if cell else 0)
+
+
+def columnar_finish(table):
+    """ Finishes a table started by columnar_start.
+
+    :params table:          table being encoded
+    :returns:               dictionary ready for JSON encoding
+    """
+    return {
+        "strings": table["strings"],
+        "models": [_string(table, name) for name in table["model_names"]],
+        "ms": table["ms"],
+        "params": table["params"],
+        "rows": table["rows"],
+        "cost": table["cost"],
+        "errors": table["errors"],
+        "partial": table["partial"],
+    }
+
+
+def write_site(estimates, models, model_names, path=JSONPATH):
+    """ Writes the data of the website: a data shard per table, holding the
+        costs of its schemes in columnar format, and a small manifest with the
+        cost model catalogue, the scheme list, the hashes of the shards and
+        the templates of the reproduce snippets. Shards are written next to
+        the manifest and loaded by table.js when their table is first shown.
+        Tables whose estimates carry the curves of the primal attack get a
+        second shard with them, aligned with the rows of the first, which is
+        only loaded when a custom cost model is tried.
+
+    :params estimates:              iterable of sanitised estimates, each
+                                    encoded as it comes
+    :params models:                 JSON string of the cost model catalogue
+    :params model_names:            list of the names of the cost models
+    :params path:                   path of the manifest
+
+    :returns:                       number of estimates written
+    """
+    manifest = {"schemes": [], "shards": {}, "snippets": SNIPPET_TEMPLATES}
+    tables = dict((table, columnar_start(model_names, [m])) for table, ntru, m in SITE_TABLES)
+    table_curves = dict((table, []) for table, ntru, m in SITE_TABLES)
+    seen = set()
+    count = 0
+    for estimate in estimates:
+        count += 1
+        for table, ntru, m in SITE_TABLES:
+            if (estimate["scheme"]["assumption"][0] == "NTRU") == ntru:
+                columnar_add(tables[table], estimate)
+                table_curves[table].append(estimate.get("curves", {}).get(m))
+        name = estimate["scheme"]["name"]
+        if name not in seen:
+            seen.add(name)
+            manifest["schemes"].append({
+                "name": name,
+                "assumption": estimate["scheme"]["assumption"],
+                "primitive": estimate["scheme"]["primitive"],
+            })
+
+    for table, ntru, m in SITE_TABLES:
+        rows = len(tables[table]["rows"]["scheme"])
+        data = json.dumps(columnar_finish(tables[table]), separators=(",", ":"))
+        content = "loadShard(\"%s\", %s);"%(table, data)
+        shard = "table-%s.js"%table
+        with open(os.path.join(os.path.dirname(path), shard), "w") as f:
+            f.write(content)
+        manifest["shards"][table] = {"file": shard, "hash": sha1(content).hexdigest()[:12], "rows": rows}
+
+        curves = table_curves[table]
+        # rows of instances without curves have none, or a list of None
+        if any(curve for row in curves if row for curve in row):
+            content = "loadCurves(\"%s\", %s);"%(table, json.dumps(curves, separators=(",", ":")))
+            shard = "curves-%s.js"%table
+            with open(os.path.join(os.path.dirname(path), shard), "w") as f:
+                f.write(content)
+            manifest["shards"][table]["curves"] = {"file": shard, "hash": sha1(content).hexdigest()[:12]}
+
+    # written last, so it never points to shards not yet written
+    with open(path, "w") as f:
+        f.write("var models = %s;\nvar manifest = %s;"%(models, json.dumps(manifest, separators=(",", ":"))))
+    return count
+
+
+def stream_estimates(f, estimates_list):
+    """ Appends estimates to a JSONL results stream, one sanitised estimate
+        per line, and flushes it.
+
+    :params f:                      file object of the stream
+    :params estimates_list:         list of estimates generated by estimates.py
+    """
+    for estimate in estimates_list:
+        f.write(json.dumps(sanitise_estimate(estimate)) + "\n")
+    f.flush()
+
 
 def generate_json(estimates_list):
-    """ Generates a JSON string from the estimates and asymptotics list, and add
-        it to the website.
+    """ Generates the data of the website from the estimates and asymptotics
+        list, see write_site.
 
     :params estimates_list:         list of estimates generated by estimates.py
     """
 
-    json = "var models = %s;\nvar estimates = %s;"%(
-        generate_costs_json(),
-        generate_table_json(estimates_list)
-    )
+    models = generate_costs_json()
+    # names as utf-8 strings, like those in the estimates
+    model_names = [model["name"].encode("utf-8") for model in json.loads(models)]
+    write_site(map(sanitise_estimate, estimates_list), models, model_names, JSONPATH)
+
 
-    with open(JSONPATH, "w") as f:
-        f.write(json)
+def read_stream(stream):
+    """ Reads the estimates of a JSONL results stream one at a time, skipping
+        partially written lines.
+
+    :params stream:                 file object of the stream
+    """
+    for line in stream:
+        line = line.strip()
+        if not line.endswith("}"):
+            # empty or partially written line
+            continue
+        yield json.loads(line)
+
+
+def generate_json_from_stream(path=RESULTSPATH):
+    """ Writes the website from the estimates in a JSONL results stream, which
+        may be partial. Estimates are encoded as they are read, so the stream
+        is never held in memory.
+
+    :params path:                   path of the results stream
+    :returns:                       number of estimates written
+    """
+    models = generate_costs_json()
+    model_names = [model["name"] for model in json.loads(models)]
+    with open(path) as stream:
+        return write_site(read_stream(stream), models, model_names, JSONPATH)
+
+
+""" Regenerate the website from the results stream if executed as a script.
+"""
+import __main__
+if __name__ == "__main__" and hasattr(__main__, '__file__'):
+    if not os.path.exists(RESULTSPATH):
+        raise SystemExit("%s not found, it is written by running estimates.py with Sage"%RESULTSPATH)
+    print "Wrote %d estimates from %s to %s"%(generate_json_from_stream(), RESULTSPATH, JSONPATH)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only journal of finished costing tasks, for resuming interrupted runs.
+
+Every line of the journal is a JSON object with the id of a task and its
+result. Lines are flushed to disk in batches of JOURNALBATCH, so a crash loses
+at most the last batch, and a truncated last line is ignored on replay.
+
+"""
+
+
+from cache import from_json
+import json
+import os
+
+try:
+    from config import JOURNALPATH
+except ImportError:
+    JOURNALPATH = "all_the_schemes.journal"
+try:
+    from config import JOURNALBATCH
+except ImportError:
+    JOURNALBATCH = 32
+
+
+def replay_journal(path=JOURNALPATH):
+    """ Reads the results recorded in a journal.
+
+    :params path:       path of the journal
+
+    :returns results:   dictionary mapping task ids to results
+    """
+    results = {}
+    if not os.path.exists(path):
+        return results
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = from_json(line)
+            except ValueError:
+                # partially written line
+                continue
+            results[entry["id"]] = entry["result"]
+    return results
+
+
+def journal_open(path=JOURNALPATH, resume=False):
+    """ Opens a journal for appending.
+
+    :params path:       path of the journal
+    :params resume:     if False, previous entries are discarded
+
+    :returns journal:   journal object
+    """
+    f = open(path, "a+" if resume else "w")
+    if resume and os.path.getsize(path) > 0:
+        # terminate a partially written last line
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != "\n":
+            f.write("\n")
+    return {
+        "file": f,
+        "pending": 0,
+    }
+
+
+def journal_flush(journal):
+    """ Forces the entries written so far to disk.
+
+    :params journal:    journal object
+    """
+    journal["file"].flush()
+    os.fsync(journal["file"].fileno())
+    journal["pending"] = 0
+
+
+def journal_write(journal, task_id, result):
+    """ Appends the result of a task to a journal.
+
+    :params journal:    journal object
+    :params task_id:    id of the task
+    :params result:     JSON serialisable result
+    """
+    journal["file"].write(json.dumps({"id": task_id, "result": result}) + "\n")
+    journal["pending"] += 1
+    if journal["pending"] >= JOURNALBATCH:
+        journal_flush(journal)
+
+
+def journal_close(journal):
+    """ Flushes and closes a journal.
+
+    :params journal:    journal object
+    """
+    journal_flush(journal)
+    journal["file"].close()
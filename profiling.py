@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Per-task profiling of estimate runs.
+
+Every profiled task dumps its cProfile statistics to PROFILEPATH. At the end of
+the run these are merged into a single report, splitting the time between the
+estimator's attacks, the cost models and Sage arithmetic, and into a file of
+collapsed stacks that flame graph tools can read.
+
+"""
+
+
+import cProfile
+import pstats
+import glob
+import os
+import re
+
+try:
+    from config import PROFILEPATH
+except ImportError:
+    PROFILEPATH = "profiles"
+
+
+def function_module(func):
+    """ Returns the dotted name of the module of a profiled function, as far as
+        cProfile records it. Cython and other compiled functions have no file,
+        their module is read from the name cProfile gives them.
+
+    :params func:       (filename, line, function name)
+
+    :returns:           module name, or "" if unknown
+    """
+    filename, line, name = func
+    if filename == "~":
+        # "<method 'f' of 'sage.rings.real_mpfr.RealNumber' objects>" or "<sage.arith.misc.gcd>"
+        match = re.match(r"<method '\w+' of '([\w.]+)\.\w+' objects>$", name) or re.match(r"<([\w.]+)\.\w+>$", name)
+        return match.group(1) if match else ""
+    parts = os.path.splitext(filename)[0].split(os.sep)
+    if "site-packages" in parts:
+        parts = parts[len(parts) - parts[::-1].index("site-packages"):]
+    elif os.path.isabs(filename):
+        return ""
+    return ".".join(parts)
+
+
+# categories of functions the report splits time between, as
+# (name, predicate on (filename, line, function name), inclusive time)
+CATEGORIES = [
+    ("primal_usvp", lambda f: f[2] in ["primal_usvp", "_primal_usvp"], True),
+    ("dual_scale", lambda f: f[2] in ["dual_scale", "_dual"], True),
+    ("drop_and_solve", lambda f: f[2] == "drop_and_solve", True),
+    ("cost models", lambda f: f[0].startswith("<cost model"), False),
+    ("Sage arithmetic", lambda f: function_module(f).startswith("sage."), False),
+]
+
+
+def profile_clear(path=PROFILEPATH):
+    """ Removes the statistics of a previous profiled run.
+
+    :params path:       directory of the statistics
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    for name in glob.glob(os.path.join(path, "*.prof")):
+        os.remove(name)
+
+
+def profiled(name, func, *args, **kwds):
+    """ Calls a function under cProfile, dumping the statistics to PROFILEPATH.
+
+    :params name:       name of the statistics file
+    :params func:       function to call
+
+    :returns:           the return value of func
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwds)
+    finally:
+        profiler.dump_stats(os.path.join(PROFILEPATH, "%s.prof"%name))
+
+
+def merge_profiles(path=PROFILEPATH):
+    """ Merges the statistics of all profiled tasks.
+
+    :params path:       directory of the statistics
+
+    :returns:           pstats.Stats object, or None if there are no statistics
+    """
+    names = glob.glob(os.path.join(path, "*.prof"))
+    if not names:
+        return None
+    stats = pstats.Stats(names[0])
+    for name in names[1:]:
+        stats.add(name)
+    return stats
+
+
+def _label(func):
+    filename, line, name = func
+    return ("%s:%s"%(os.path.basename(filename), name)).replace(";", ",").replace(" ", "_")
+
+
+def collapsed_stacks(stats, max_depth=64, max_stacks=100000, min_time=1e-4):
+    """ Reconstructs collapsed stacks from caller/callee statistics. cProfile
+        only records single call edges, so the self time of a function is
+        split between its callers in proportion to the time spent under each.
+        The number of call paths can grow exponentially with the depth, so
+        subtrees below max_depth, taking less than min_time or past the first
+        max_stacks stacks are not expanded: their inclusive time is counted
+        as the self time of their root.
+
+    :params stats:      pstats.Stats object
+    :params max_depth:  stacks are cut at this depth
+    :params max_stacks: maximum number of stacks expanded
+    :params min_time:   seconds below which a subtree is not expanded
+
+    :returns:           dictionary mapping ";"-separated stacks to seconds
+    """
+    callees = {}
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+
+    stacks = {}
+
+    def walk(func, stack, share):
+        cc, nc, tt, ct, callers = stats.stats[func]
+        stack = stack + [func]
+        key = ";".join(_label(f) for f in stack)
+        if len(stack) >= max_depth or ct * share < min_time or len(stacks) >= max_stacks:
+            stacks[key] = stacks.get(key, 0.) + ct * share
+            return
+        stacks[key] = stacks.get(key, 0.) + tt * share
+        for callee, edge_time in callees.get(func, []):
+            callee_time = stats.stats[callee][3]
+            if callee in stack or callee_time <= 0:
+                continue
+            walk(callee, stack, share * min(1., edge_time / callee_time))
+
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        if not callers:
+            walk(func, [], 1.)
+    return stacks
+
+
+def profile_report(stats, path=PROFILEPATH, top=40):
+    """ Writes the aggregated report and the collapsed stacks of a profiled run.
+
+    :params stats:      pstats.Stats object, as returned by merge_profiles
+    :params path:       directory the report.txt and stacks.folded files are written to
+    :params top:        number of functions listed by self time
+
+    :returns:           dictionary mapping categories to seconds
+    """
+    total = max(ct for cc, nc, tt, ct, callers in stats.stats.values())
+    split = {}
+    for name, predicate, inclusive in CATEGORIES:
+        split[name] = sum(ct if inclusive else tt
+                          for func, (cc, nc, tt, ct, callers) in stats.stats.items() if predicate(func))
+
+    with open(os.path.join(path, "report.txt"), "w") as f:
+        f.write("Time split (estimator attacks are inclusive of what they call, and overlap)\n\n")
+        for name, predicate, inclusive in CATEGORIES:
+            f.write("    %-20s %12.2fs %6.1f%%\n"%(name, split[name], 100. * split[name] / total if total else 0))
+        f.write("\n")
+        stats.stream = f
+        stats.sort_stats("tottime").print_stats(top)
+        stats.sort_stats("cumulative").print_stats(top)
+
+    with open(os.path.join(path, "stacks.folded"), "w") as f:
+        for stack, seconds in sorted(collapsed_stacks(stats).items()):
+            if seconds > 0:
+                f.write("%s %d\n"%(stack, round(seconds * 1e6)))
+    return split
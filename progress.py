@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Progress, throughput and ETA reporting for long estimate runs.
+
+The state of a run is printed every PROGRESSINTERVAL seconds and written as
+JSON to STATUSPATH, so that it can be monitored from another process. Workers
+record the task they are running and since when in RUNNINGPATH, so the report
+shows what is actually running, including the task running the longest.
+
+"""
+
+
+from collections import deque
+from glob import glob
+import json
+import os
+import threading
+import time
+
+try:
+    from config import STATUSPATH
+except ImportError:
+    STATUSPATH = "status.json"
+try:
+    from config import PROGRESSINTERVAL
+except ImportError:
+    PROGRESSINTERVAL = 30
+try:
+    from config import RUNNINGPATH
+except ImportError:
+    RUNNINGPATH = "status.running"
+
+
+def _running_file(parent, worker):
+    return os.path.join(RUNNINGPATH, "%d-%d.json"%(parent, worker))
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def task_started(label):
+    """ Records in RUNNINGPATH that the calling worker started a task.
+
+    :params label:      description of the task
+    """
+    if not os.path.isdir(RUNNINGPATH):
+        try:
+            os.makedirs(RUNNINGPATH)
+        except OSError:
+            # created by another worker meanwhile
+            pass
+    path = _running_file(os.getppid(), os.getpid())
+    tmp = "%s.tmp"%path
+    with open(tmp, "w") as f:
+        json.dump({"task": label, "worker": os.getpid(), "start": time.time()}, f)
+    os.rename(tmp, path)
+
+
+def task_finished():
+    """ Records in RUNNINGPATH that the calling worker finished its task.
+    """
+    try:
+        os.remove(_running_file(os.getppid(), os.getpid()))
+    except OSError:
+        pass
+
+
+def task_finished_by(worker):
+    """ Removes the record of a worker of this process from RUNNINGPATH.
+
+    :params worker:     pid of the worker
+    """
+    try:
+        os.remove(_running_file(os.getpid(), worker))
+    except OSError:
+        pass
+
+
+def running_tasks():
+    """ Lists the tasks running in the workers of this process.
+
+    :returns:           list of dictionaries with the "task", the "worker"
+                        running it and its "start" time, longest running first
+    """
+    running = []
+    for path in glob(os.path.join(RUNNINGPATH, "%d-*.json"%os.getpid())):
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (IOError, ValueError):
+            # finished meanwhile
+            continue
+        # workers killed on timeout leave their record behind
+        if _alive(entry["worker"]):
+            running += [entry]
+        else:
+            task_finished_by(entry["worker"])
+    return sorted(running, key=lambda entry: entry["start"])
+
+
+def progress_start(tasks, weight, ncpus, window=200):
+    """ Starts tracking the progress of a run.
+
+    :params tasks:      list of tasks to run
+    :params weight:     function returning the expected relative running time of a task
+    :params ncpus:      number of parallel workers
+    :params window:     number of recent tasks the throughput is measured on
+
+    :returns progress:  progress object
+    """
+    now = time.time()
+    return {
+        "start": now,
+        "last_report": now,
+        "ncpus": ncpus,
+        "total": len(tasks),
+        "done": 0,
+        "failed": 0,
+        "weight": weight,
+        "remaining_weight": sum(weight(task) for task in tasks),
+        "recent": deque(maxlen=window),
+        "task_time": 0.,
+        "longest_task": 0.,
+        "schemes": {},
+        "lock": threading.Lock(),
+        "timer": None,
+    }
+
+
+def progress_update(progress, task, names, meta, failed=False):
+    """ Records a finished task.
+
+    :params progress:   progress object
+    :params task:       the finished task
+    :params names:      names of the schemes the task was run for
+    :params meta:       dictionary with the wall "time" the task took, or
+                        None if unknown
+    :params failed:     Boolean value, True if the task failed
+    """
+    weight = progress["weight"](task)
+    with progress["lock"]:
+        progress["done"] += 1
+        if failed:
+            progress["failed"] += 1
+        progress["remaining_weight"] -= weight
+        if meta:
+            progress["recent"].append((meta["time"], weight))
+            # @parallel forks a process per task, so there are no workers to account to
+            progress["task_time"] += meta["time"]
+            progress["longest_task"] = max(progress["longest_task"], meta["time"])
+            for name in set(names):
+                progress["schemes"][name] = progress["schemes"].get(name, 0.) + meta["time"]
+
+
+def progress_status(progress):
+    """ Summarises the state of a run.
+
+    :params progress:   progress object
+
+    :returns status:    JSON serialisable dictionary
+    """
+    now = time.time()
+    remaining = progress["total"] - progress["done"]
+    running = running_tasks()
+    for entry in running:
+        entry["seconds"] = now - entry["start"]
+
+    # seconds per unit of expected work over the recent tasks, since tasks are
+    # scheduled longest first their plain average would be misleading
+    eta = None
+    seconds = sum(t for t, w in progress["recent"])
+    work = sum(w for t, w in progress["recent"])
+    if work > 0:
+        eta = progress["remaining_weight"] * seconds / work / progress["ncpus"]
+
+    return {
+        "pid": os.getpid(),
+        "updated": now,
+        "elapsed": now - progress["start"],
+        "total": progress["total"],
+        "done": progress["done"],
+        "failed": progress["failed"],
+        "running": len(running),
+        "queued": max(0, remaining - len(running)),
+        "running_tasks": running,
+        "recent_task_time": seconds / len(progress["recent"]) if progress["recent"] else None,
+        "eta": eta,
+        "task_time": progress["task_time"],
+        "longest_task": progress["longest_task"],
+        "slowest_schemes": sorted(progress["schemes"].items(), key=lambda x: -x[1])[:10],
+    }
+
+
+def progress_report(progress, force=False):
+    """ Prints the state of a run and writes it to STATUSPATH, at most every
+        PROGRESSINTERVAL seconds.
+
+    :params progress:   progress object
+    :params force:      if True, report regardless of the time of the last report
+    """
+    with progress["lock"]:
+        now = time.time()
+        if not force and now - progress["last_report"] < PROGRESSINTERVAL:
+            return
+        progress["last_report"] = now
+        status = progress_status(progress)
+
+        print "[%s] %d/%d tasks done (%d failed), %d running, %d queued, ETA %s"%(
+            time.strftime("%H:%M:%S"),
+            status["done"],
+            status["total"],
+            status["failed"],
+            status["running"],
+            status["queued"],
+            "unknown" if status["eta"] is None else "%dh%02dm"%(status["eta"] // 3600, status["eta"] % 3600 // 60),
+        )
+        if status["running_tasks"]:
+            longest = status["running_tasks"][0]
+            print "    running longest: %s (%ds, worker %d)"%(longest["task"], longest["seconds"], longest["worker"])
+        if status["slowest_schemes"]:
+            print "    slowest schemes: %s"%", ".join("%s (%ds)"%(name, t) for name, t in status["slowest_schemes"][:3])
+
+        tmp = "%s.tmp"%STATUSPATH
+        with open(tmp, "w") as f:
+            json.dump(status, f, indent=2)
+        os.rename(tmp, STATUSPATH)
+
+
+def progress_watch(progress):
+    """ Reports the state of a run every PROGRESSINTERVAL seconds from a
+        background thread, so that runs stuck on long tasks are reported too,
+        until progress_unwatch is called.
+
+    :params progress:   progress object
+    """
+    stop = threading.Event()
+
+    def watch():
+        while not stop.wait(PROGRESSINTERVAL):
+            progress_report(progress)
+
+    thread = threading.Thread(target=watch)
+    thread.daemon = True
+    thread.start()
+    progress["timer"] = stop
+
+
+def progress_unwatch(progress):
+    """ Stops the reports started by progress_watch.
+
+    :params progress:   progress object
+    """
+    if progress["timer"] is not None:
+        progress["timer"].set()
+        progress["timer"] = None
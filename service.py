@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+Local estimation service.
+
+A long-running HTTP server answering JSON requests, so that queries do not pay
+for starting Sage and importing the estimator. Estimator calls are run each in
+its own process, at most NCPUS at once, and are killed after TASKTIMEOUT
+seconds. Their results are kept in an in-memory memo of MEMOSIZE entries, and
+concurrent requests needing the same call wait for a single run of it.
+
+    POST /estimate  {"params": [{"n": 512, "sd": 1.5, "q": 7681}, ...],
+                     "models": [...], "attacks": [...], "ms": [...], "drop": true}
+                    -> {"estimates": [{"param": 0, "model": ..., "lrop": ...}, ...]}
+    POST /scheme    {"scheme": {"name": ..., "params": [...], "assumption": [...], "primitive": [...]}}
+                    -> {"estimates": [...]}, as saved by estimates.py
+    GET  /status    -> counters of the memo, the calls and the requests
+
+Optional request entries are "cache", to use the estimator cache at CACHEPATH,
+and "timeout", the seconds to wait for the estimates, SERVICETIMEOUT by
+default. Calls still running when a request times out keep running for later
+requests.
+
+USAGE:
+
+    sage -python service.py [--host HOST] [--port PORT]
+
+"""
+
+
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
+from collections import OrderedDict
+from multiprocessing import Pipe, Process
+from api import estimate_tasks, task_estimates
+from cache import from_json
+from estimates import NCPUS, TASKTIMEOUT, cost_tasks, plan_tasks, task_results, run_task, assemble_estimates
+from html import sanitise_estimate
+import json
+import threading
+import time
+
+try:
+    from config import SERVICEHOST
+except ImportError:
+    SERVICEHOST = "127.0.0.1"
+try:
+    from config import SERVICEPORT
+except ImportError:
+    SERVICEPORT = 8642
+try:
+    from config import MEMOSIZE
+except ImportError:
+    MEMOSIZE = 100000
+try:
+    from config import SERVICETIMEOUT
+except ImportError:
+    SERVICETIMEOUT = 60
+
+
+def process_run_task(task, conn):
+    """ Runs a task in a child process, sending its result back.
+
+    :params task:       task generated by cost_tasks
+    :params conn:       end of a pipe to send the result to
+    """
+    try:
+        result = run_task(task, use_cache=task.get("cache", False))
+    except Exception, e:
+        result = {"error": str(e), "type": type(e).__name__}
+    conn.send(result)
+    conn.close()
+
+
+def call_process(task, timeout):
+    """ Runs a task in its own process, killing it if it takes too long.
+
+    :params task:       task generated by cost_tasks
+    :params timeout:    seconds after which the process is killed
+
+    :returns:           the result of the task, or an error record if the
+                        process was killed or died
+    """
+    reader, writer = Pipe(duplex=False)
+    process = Process(target=process_run_task, args=(task, writer))
+    process.daemon = True
+    process.start()
+    writer.close()
+    result = None
+    try:
+        if reader.poll(timeout):
+            result = reader.recv()
+    except EOFError:
+        pass
+    if process.is_alive():
+        process.terminate()
+    process.join()
+    reader.close()
+    if result is not None:
+        return result
+    if process.exitcode == -15:
+        return {"error": "killed after %d seconds"%timeout, "type": "Timeout"}
+    return {"error": "process exited with code %s"%process.exitcode, "type": "WorkerError"}
+
+
+class Call(object):
+    """ Estimator call in flight, which any number of requests can wait for.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+
+    def finish(self, result):
+        self.result = result
+        self.event.set()
+
+
+def _tuples(obj):
+    # JSON has no tuples, but the estimator tells secret distributions apart by them
+    if isinstance(obj, list):
+        return tuple(_tuples(x) for x in obj)
+    return obj
+
+
+def request_params(params):
+    """ Converts the parameter sets of a request into estimator inputs.
+
+    :params params:     list of decoded parameter sets
+
+    :returns:           list of parameter sets
+    """
+    params = [dict(param) for param in params]
+    for param in params:
+        if "secret_distribution" in param:
+            param["secret_distribution"] = _tuples(param["secret_distribution"])
+    return params
+
+
+class EstimateService(object):
+    """ Runs estimator calls for concurrent requests, sharing their results.
+    """
+
+    def __init__(self, ncpus=NCPUS, memo_size=MEMOSIZE, task_timeout=TASKTIMEOUT):
+        """
+        :params ncpus:          maximum number of calls running at once
+        :params memo_size:      maximum number of results kept in memory
+        :params task_timeout:   seconds after which a call is killed
+        """
+        self.slots = threading.BoundedSemaphore(ncpus)
+        self.task_timeout = task_timeout
+        self.memo = OrderedDict()
+        self.memo_size = memo_size
+        self.inflight = {}
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "tasks": 0, "memo hits": 0, "batched": 0, "run": 0, "errors": 0,
+                      "timeouts": 0}
+        self.start = time.time()
+
+    def execute(self, task, call):
+        """ Runs a call once a process slot is free, then memoises its result
+            and removes it from the calls in flight, whether it finished,
+            failed, was killed or its process died.
+
+        :params task:       task generated by cost_tasks
+        :params call:       Call waited for by the requests needing the task
+        """
+        with self.slots:
+            result = call_process(task, self.task_timeout)
+        with self.lock:
+            if self.inflight.get(task["id"]) is call:
+                del self.inflight[task["id"]]
+            if "error" in result:
+                self.stats["errors"] += 1
+            else:
+                self.memo[task["id"]] = result
+                while len(self.memo) > self.memo_size:
+                    self.memo.popitem(last=False)
+        call.finish(result)
+
+    def run(self, unique, copies, cache=False, timeout=SERVICETIMEOUT):
+        """ Runs tasks, reusing memoised results and calls already in flight.
+
+        :params unique:     list of unique tasks
+        :params copies:     dictionary mapping task ids to all the tasks with that id
+        :params cache:      if True, the estimator cache is used
+        :params timeout:    seconds after which the tasks still running are
+                            reported as timed out
+
+        :returns:           dictionary mapping task keys to results
+        """
+        results = {}
+        waiting = {}
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["tasks"] += len(unique)
+            for task in unique:
+                if task["id"] in self.memo:
+                    result = self.memo.pop(task["id"])
+                    # most recently used last
+                    self.memo[task["id"]] = result
+                    for copy in copies[task["id"]]:
+                        results.update(task_results(copy, result))
+                    self.stats["memo hits"] += 1
+                elif task["id"] in self.inflight:
+                    waiting[task["id"]] = self.inflight[task["id"]]
+                    self.stats["batched"] += 1
+                else:
+                    task["cache"] = cache
+                    call = Call()
+                    self.inflight[task["id"]] = call
+                    thread = threading.Thread(target=self.execute, args=(task, call))
+                    thread.daemon = True
+                    thread.start()
+                    waiting[task["id"]] = call
+                    self.stats["run"] += 1
+
+        deadline = time.time() + timeout
+        for task_id, call in waiting.items():
+            if call.event.wait(max(0, deadline - time.time())):
+                result = call.result
+            else:
+                # the call keeps running, later requests can still use it
+                result = {"error": "timed out", "type": "Timeout"}
+                with self.lock:
+                    self.stats["timeouts"] += 1
+            for copy in copies[task_id]:
+                results.update(task_results(copy, result))
+        return results
+
+    def estimate(self, request):
+        """ Answers an /estimate request, see api.estimate.
+        """
+        models = request.get("models")
+        unique, copies = estimate_tasks(request_params(request["params"]), models,
+                                        request.get("attacks"), request.get("ms"), request.get("drop", True))
+        results = self.run(unique, copies, request.get("cache", False), request.get("timeout", SERVICETIMEOUT))
+        return {"estimates": [e._asdict() for e in task_estimates(results, models)]}
+
+    def scheme(self, request):
+        """ Answers a /scheme request, costing a scheme as cost_scheme does.
+        """
+        scheme = dict(request["scheme"])
+        scheme["params"] = [request_params(instance) if type(instance) == list else request_params([instance])[0]
+                            for instance in scheme["params"]]
+        unique, copies = plan_tasks(cost_tasks(0, scheme))
+        results = self.run(unique, copies, request.get("cache", False), request.get("timeout", SERVICETIMEOUT))
+        return {"estimates": [sanitise_estimate(e) for e in assemble_estimates(0, scheme, results)]}
+
+    def status(self):
+        """ Answers a /status request.
+        """
+        with self.lock:
+            status = dict(self.stats)
+            status["memo"] = len(self.memo)
+            status["in flight"] = len(self.inflight)
+        status["uptime"] = time.time() - self.start
+        return status
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """ Routes HTTP requests to the EstimateService of the server.
+    """
+
+    def reply(self, code, body):
+        body = json.dumps(body)
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/status":
+            self.reply(200, self.server.service.status())
+        else:
+            self.reply(404, {"error": "unknown path %s"%self.path})
+
+    def do_POST(self):
+        routes = {"/estimate": self.server.service.estimate, "/scheme": self.server.service.scheme}
+        if self.path not in routes:
+            self.reply(404, {"error": "unknown path %s"%self.path})
+            return
+        try:
+            request = from_json(self.rfile.read(int(self.headers.getheader("Content-Length", 0))))
+        except ValueError, e:
+            self.reply(400, {"error": "invalid JSON: %s"%e})
+            return
+        try:
+            self.reply(200, routes[self.path](request))
+        except (KeyError, TypeError, ValueError), e:
+            self.reply(400, {"error": "%s: %s"%(type(e).__name__, e)})
+        except Exception, e:
+            self.reply(500, {"error": "%s: %s"%(type(e).__name__, e)})
+
+
+class ServiceServer(ThreadingMixIn, HTTPServer):
+    """ HTTP server answering every request in its own thread.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, service):
+        HTTPServer.__init__(self, address, ServiceHandler)
+        self.service = service
+
+
+def serve(host=SERVICEHOST, port=SERVICEPORT, ncpus=NCPUS):
+    """ Runs the service until interrupted.
+
+    :params host:       address to listen on
+    :params port:       port to listen on
+    :params ncpus:      maximum number of estimator calls running at once
+    """
+    service = EstimateService(ncpus)
+    server = ServiceServer((host, port), service)
+    print "Serving estimates on http://%s:%d with %d processes"%(host, port, ncpus)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve estimates over HTTP.")
+    parser.add_argument("--host", default=SERVICEHOST)
+    parser.add_argument("--port", type=int, default=SERVICEPORT)
+    parser.add_argument("--ncpus", type=int, default=NCPUS)
+    args = parser.parse_args()
+    serve(args.host, args.port, args.ncpus)
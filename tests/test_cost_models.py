@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Checks that the log-domain cost models agree with the reduction cost models
+they replace, see compile_cost_model and LOG_COST_MODELS in estimates.py.
+
+USAGE:
+
+    sage -python -m unittest discover tests
+
+"""
+
+
+import os
+import sys
+import unittest
+
+# run from the repository root or from tests/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sage.all import RR, ceil, log, pi, sqrt
+import estimator as est
+from cost_asymptotics import BKZ_COST_ASYMPTOTICS, log_domain, log2_costs
+
+# (n, sd, q, secret distribution) of the parameter sets the attacks are costed on
+PARAMETER_SETS = [
+    (512, 3.192, 12289, "normal"),
+    (640, 2.75, 32768, "normal"),
+    (1024, 1.0, 12289, (-1, 1)),
+]
+
+
+class TestCostModels(unittest.TestCase):
+
+    def test_log_cost_models(self, betas=range(40, 1001, 10), ds=[100, 500, 1000, 2000], B=12, eps=1e-8):
+        """ The scalar and NumPy log-domain versions of every cost model give
+            log_2 of its reduction cost model.
+        """
+        for model in BKZ_COST_ASYMPTOTICS:
+            for beta in betas:
+                for d in ds:
+                    expected = float(log(model["reduction_cost_model"](beta, d, B), 2))
+                    computed = model["log_reduction_cost_model"](beta, d, B)
+                    self.assertAlmostEqual(expected, computed, delta=eps, msg=(model["name"], beta, d))
+                    computed = log2_costs([beta], [d], B, models=[model])[0, 0]
+                    self.assertAlmostEqual(expected, computed, delta=eps, msg=(model["name"], beta, d))
+
+    def test_same_estimates(self):
+        """ The primal and dual attacks find the same block size and cost with
+            the log-domain cost models as with the reduction cost models.
+        """
+        for n, sd, q, secret_distribution in PARAMETER_SETS:
+            alpha = sqrt(2*pi) * sd / RR(q)
+            for attack in [est.primal_usvp, est.dual_scale]:
+                for model in BKZ_COST_ASYMPTOTICS:
+                    kwds = {"secret_distribution": secret_distribution, "m": 2*n,
+                            "success_probability": model["success_probability"]}
+                    expected = attack(n, alpha, q, reduction_cost_model=model["reduction_cost_model"], **kwds)
+                    computed = attack(n, alpha, q, reduction_cost_model=log_domain(model["log_reduction_cost_model"]),
+                                      **kwds)
+                    msg = (attack.__name__, model["name"], n, sd, q)
+                    self.assertEqual(expected["beta"], computed["beta"], msg=msg)
+                    self.assertEqual(ceil(log(expected["rop"], 2)), ceil(log(computed["rop"], 2)), msg=msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Checks that selective runs of estimates.py only change what they select.
+The estimator is not called, every task gets a made up result.
+
+USAGE:
+
+    sage -python -m unittest discover tests
+
+"""
+
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# run from the repository root or from tests/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sage.all import load
+import estimates
+from html import sanitise_estimate
+import json
+
+
+def fake_execute_tasks(offset):
+    """ Returns a replacement of execute_tasks giving every task a made up
+        result, shifted by offset so that runs can be told apart.
+    """
+    def execute_tasks(unique, journal=None, done=None, progress=None, verbose=True):
+        for task in unique:
+            beta = int(task["id"][:3], 16) % 500 + 100 + offset
+            result = {"dim": 2*beta, "beta": beta, "rop": beta, "lrop": float(beta)}
+            if task["model"] is None:
+                result = {"models": dict((cost_model["name"], result) for cost_model in estimates.BKZ_COST_ASYMPTOTICS),
+                          "curves": []}
+            if done is not None:
+                done(task, result)
+    return execute_tasks
+
+
+def encoded(estimate):
+    return json.dumps([sanitise_estimate(estimate), estimate.get("fingerprint")], sort_keys=True)
+
+
+class TestSelectiveRuns(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.mkdtemp()
+        os.chdir(self.tmp)
+        self.saved = dict((name, getattr(estimates, name)) for name in ["execute_tasks", "generate_json"])
+        estimates.generate_json = lambda estimates_list: None
+
+    def tearDown(self):
+        for name, value in self.saved.items():
+            setattr(estimates, name, value)
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp)
+
+    def run_estimates(self, offset, selection=None):
+        estimates.execute_tasks = fake_execute_tasks(offset)
+        estimates.main(selection=selection)
+        return load(estimates.SOBJPATH)
+
+    def test_refused_without_saved_estimates(self):
+        self.assertRaises(ValueError, estimates.main, selection={"scheme": ["Frodo*"]})
+
+    def test_unselected_estimates_unchanged(self):
+        before = self.run_estimates(0)
+        after = self.run_estimates(7, {"scheme": ["Frodo*"]})
+        self.assertEqual(len(before), len(after))
+        unselected = [e for e in before if not estimates.name_selected(e["scheme"]["name"], ["Frodo*"])]
+        self.assertEqual([encoded(e) for e in unselected],
+                         [encoded(e) for e in after if not estimates.name_selected(e["scheme"]["name"], ["Frodo*"])])
+        # instances that only differ in their claims keep their own
+        round2 = [e for e in after if e["scheme"]["name"] == "uRound2.KEM"]
+        self.assertEqual([e["param"] for e in round2], [e["param"] for e in before if e["scheme"]["name"] == "uRound2.KEM"])
+
+    def test_unselected_models_unchanged(self):
+        before = self.run_estimates(0)
+        after = self.run_estimates(7, {"scheme": ["uRound2.KEM"], "model": ["Lotus"]})
+        pairs = [(b, a) for b, a in zip(before, after) if b["scheme"]["name"] == "uRound2.KEM"]
+        self.assertTrue(pairs)
+        for b, a in pairs:
+            self.assertEqual(b["param"], a["param"])
+            for cname in b["cost"]:
+                if cname != "Lotus":
+                    self.assertEqual(b["cost"][cname], a["cost"][cname], msg=(cname, b["key"]))
+                else:
+                    self.assertNotEqual(b["cost"][cname], a["cost"][cname], msg=(cname, b["key"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
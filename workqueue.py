@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Work queue for running estimate tasks on several hosts.
+
+The queue is a directory on a shared filesystem, no broker is needed. Every
+task is an empty file named after its rank and id, which moves between
+subdirectories as it is run:
+
+    todo/       tasks waiting to be run
+    claimed/    tasks being run, claimed by atomically renaming them from todo/,
+                holding the worker and the time of its last heartbeat
+    done/       results of finished tasks, as JSON files named after the task id
+    failed/     tasks that failed on every attempt, queued again by queue_init
+
+Workers plan the same tasks as the host filling the queue, so only task ids
+are exchanged. While running tasks they write a heartbeat into their claims
+every QUEUEHEARTBEAT seconds, claims whose heartbeat stops are queued again.
+Hosts need not agree on the time: whether a heartbeat stopped is decided on
+the clock of the host requeueing, from when it last saw the claim change.
+
+"""
+
+
+from cache import from_json
+import json
+import os
+import socket
+import threading
+import time
+
+try:
+    from config import QUEUEPATH
+except ImportError:
+    QUEUEPATH = "queue"
+try:
+    from config import QUEUEHEARTBEAT
+except ImportError:
+    QUEUEHEARTBEAT = 60
+
+# serialises writing heartbeats with finishing tasks, which run on different threads
+_claims_lock = threading.Lock()
+# contents of the claims and local time they were first seen with them, by queue_requeue
+_claims_seen = {}
+
+
+def _dir(path, state):
+    return os.path.join(path, state)
+
+
+def queue_task_id(name):
+    """ Returns the id of a queued task.
+
+    :params name:       name of the task, as returned by queue_claim
+    """
+    return name.split("-", 1)[1]
+
+
+def _write_claim(claim):
+    # written in place, a claim removed in the meantime is not created again
+    try:
+        with open(claim, "r+") as f:
+            f.truncate()
+            json.dump({"host": socket.gethostname(), "pid": os.getpid(), "heartbeat": time.time()}, f)
+    except IOError:
+        pass
+
+
+def queue_init(ids, path=QUEUEPATH):
+    """ Fills the queue with tasks. Tasks that are finished or being run are
+        left alone, failed ones are queued again.
+
+    :params ids:        ids of the tasks, in the order they should be run
+    :params path:       directory of the queue
+
+    :returns:           number of tasks queued
+    """
+    for state in ["todo", "claimed", "done", "failed"]:
+        if not os.path.isdir(_dir(path, state)):
+            os.makedirs(_dir(path, state))
+
+    done = set(name[:-len(".json")] for name in os.listdir(_dir(path, "done")) if name.endswith(".json"))
+    claimed = set(queue_task_id(name) for name in os.listdir(_dir(path, "claimed")))
+    # the waiting tasks are replaced, in case the plan changed
+    for state in ["todo", "failed"]:
+        for name in os.listdir(_dir(path, state)):
+            os.remove(os.path.join(_dir(path, state), name))
+
+    queued = 0
+    for rank, task_id in enumerate(ids):
+        if task_id in done or task_id in claimed:
+            continue
+        open(os.path.join(_dir(path, "todo"), "%08d-%s"%(rank, task_id)), "w").close()
+        queued += 1
+    return queued
+
+
+def queue_claim(count, path=QUEUEPATH):
+    """ Claims the first tasks of the queue. Claims are atomic, each task is
+        claimed by a single worker.
+
+    :params count:      maximum number of tasks claimed
+    :params path:       directory of the queue
+
+    :returns:           list of names of the claimed tasks
+    """
+    claimed = []
+    for name in sorted(os.listdir(_dir(path, "todo"))):
+        if len(claimed) == count:
+            break
+        target = os.path.join(_dir(path, "claimed"), name)
+        try:
+            os.rename(os.path.join(_dir(path, "todo"), name), target)
+        except OSError:
+            # claimed by another worker
+            continue
+        _write_claim(target)
+        claimed += [name]
+    return claimed
+
+
+def queue_done(name, result, path=QUEUEPATH):
+    """ Records the result of a claimed task. Failed tasks are moved to failed/.
+
+    :params name:       name of the task, as returned by queue_claim
+    :params result:     result of the task
+    :params path:       directory of the queue
+    """
+    claim = os.path.join(_dir(path, "claimed"), name)
+    if "error" in result:
+        with _claims_lock:
+            try:
+                os.rename(claim, os.path.join(_dir(path, "failed"), name))
+            except OSError:
+                # the claim went stale and the task was queued again
+                pass
+        return
+    target = os.path.join(_dir(path, "done"), "%s.json"%queue_task_id(name))
+    tmp = "%s.%d.tmp"%(target, os.getpid())
+    with open(tmp, "w") as f:
+        json.dump(result, f)
+    os.rename(tmp, target)
+    with _claims_lock:
+        try:
+            os.remove(claim)
+        except OSError:
+            pass
+
+
+def queue_heartbeat(names, path=QUEUEPATH):
+    """ Writes a heartbeat into the claims of tasks being run.
+
+    :params names:      names of the tasks, as returned by queue_claim
+    :params path:       directory of the queue
+    """
+    for name in names:
+        # claims of finished tasks, or that went stale, are not written back
+        with _claims_lock:
+            _write_claim(os.path.join(_dir(path, "claimed"), name))
+
+
+def queue_heartbeats(names, path=QUEUEPATH):
+    """ Writes a heartbeat into the claims of tasks being run every
+        QUEUEHEARTBEAT seconds from a background thread, until the returned
+        event is set.
+
+    :params names:      names of the tasks, as returned by queue_claim
+    :params path:       directory of the queue
+
+    :returns:           threading.Event stopping the heartbeats
+    """
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(QUEUEHEARTBEAT):
+            queue_heartbeat(names, path)
+
+    thread = threading.Thread(target=beat)
+    thread.daemon = True
+    thread.start()
+    return stop
+
+
+def queue_requeue(age, path=QUEUEPATH):
+    """ Puts back in the queue the tasks whose last heartbeat is more than age
+        seconds old, whose worker is assumed to have died. Neither the time
+        written into the claim by the worker nor the modification time the
+        shared filesystem reports are compared with the local clock: a claim
+        is stale once its contents have not changed for age seconds since
+        they were first seen here. Claims are only found stale by hosts that
+        saw them at least age seconds apart.
+
+    :params age:        seconds after which a claim is stale
+    :params path:       directory of the queue
+
+    :returns:           number of tasks put back
+    """
+    requeued = 0
+    now = time.time()
+    names = os.listdir(_dir(path, "claimed"))
+    # forget the claims that are gone
+    for key in [key for key in _claims_seen if key[0] == path and key[1] not in names]:
+        del _claims_seen[key]
+    for name in names:
+        source = os.path.join(_dir(path, "claimed"), name)
+        try:
+            # possibly being written, or empty if its worker died claiming it
+            with open(source) as f:
+                contents = f.read()
+        except IOError:
+            continue
+        key = (path, name)
+        if key not in _claims_seen or _claims_seen[key][0] != contents:
+            _claims_seen[key] = (contents, now)
+        if now - _claims_seen[key][1] < age:
+            continue
+        try:
+            os.rename(source, os.path.join(_dir(path, "todo"), name))
+        except OSError:
+            # finished or requeued in the meantime
+            continue
+        del _claims_seen[key]
+        requeued += 1
+    return requeued
+
+
+def queue_results(path=QUEUEPATH):
+    """ Reads the results of the finished tasks.
+
+    :params path:       directory of the queue
+
+    :returns:           dictionary mapping task ids to results
+    """
+    results = {}
+    if not os.path.isdir(_dir(path, "done")):
+        return results
+    for name in os.listdir(_dir(path, "done")):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(_dir(path, "done"), name)) as f:
+                results[name[:-len(".json")]] = from_json(f.read())
+        except (IOError, ValueError):
+            continue
+    return results
+
+
+def queue_status(path=QUEUEPATH):
+    """ Counts the tasks in every state.
+
+    :params path:       directory of the queue
+
+    :returns:           dictionary mapping states to numbers of tasks
+    """
+    return dict((state, len(os.listdir(_dir(path, state))) if os.path.isdir(_dir(path, state)) else 0)
+                for state in ["todo", "claimed", "done", "failed"])